@@ -8,12 +8,26 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 # Fetch ASGI application before importing dependencies that require ORM models.
 django_asgi_app = get_asgi_application()
 
+from django.conf import settings  # noqa: E402
+
+if settings.TEMPLATE_WARMUP:
+    from webAMG.services.template_service import TemplateService
+
+    TemplateService.warm()
+
 
 from channels.routing import ProtocolTypeRouter, URLRouter  # noqa: E402
+from channels.security.websocket import AllowedHostsOriginValidator  # noqa: E402
+from channels.sessions import SessionMiddlewareStack  # noqa: E402
 
 from reactpy_django import REACTPY_WEBSOCKET_ROUTE  # noqa: E402
 
+from webAMG.routing import websocket_urlpatterns  # noqa: E402
+
+# La sesión (cookie session_token) autentica los WebSocket igual que las páginas
 application = ProtocolTypeRouter({
     "http": django_asgi_app,
-    "websocket": URLRouter([REACTPY_WEBSOCKET_ROUTE]),
+    "websocket": AllowedHostsOriginValidator(
+        SessionMiddlewareStack(URLRouter([REACTPY_WEBSOCKET_ROUTE, *websocket_urlpatterns]))
+    ),
 })
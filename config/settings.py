@@ -30,16 +30,33 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'webAMG.apps.WebamgConfig',
 ]
 ASGI_APPLICATION = "config.asgi.application"
 
+# Capa de Channels del bus de eventos de proyectos (webAMG.consumers). La capa
+# en memoria solo reparte eventos dentro de un proceso; con varios workers
+# se usa Redis (requiere channels_redis)
+CHANNEL_REDIS_URL = os.getenv('CHANNEL_REDIS_URL', '')
+if CHANNEL_REDIS_URL:
+    CHANNEL_LAYERS = {
+        'default': {
+            'BACKEND': 'channels_redis.core.RedisChannelLayer',
+            'CONFIG': {'hosts': [CHANNEL_REDIS_URL]},
+        },
+    }
+else:
+    CHANNEL_LAYERS = {
+        'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'},
+    }
+
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'webAMG.middleware.SessionAuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'webAMG.middleware.TimezoneMiddleware',
@@ -49,17 +66,29 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = 'config.urls'
 
+# Plantillas: el cargador en caché compila cada plantilla una sola vez por
+# proceso (en desarrollo el autoreload lo vacía al editar una plantilla).
+# Con TEMPLATE_WARMUP, wsgi.py y asgi.py precompilan al arrancar las
+# plantillas del proyecto para que la primera petición no pague la compilación
+TEMPLATE_LOADERS = [
+    'django.template.loaders.filesystem.Loader',
+    'django.template.loaders.app_directories.Loader',
+]
+TEMPLATE_WARMUP = os.getenv('TEMPLATE_WARMUP', str(not DEBUG)) == 'True'
+
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [BASE_DIR / 'templates'],
-        'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
             ],
+            'loaders': [
+                ('django.template.loaders.cached.Loader', TEMPLATE_LOADERS),
+            ],
         },
     },
 ]
@@ -94,6 +123,50 @@ AUTHENTICATION_BACKENDS = [
     'webAMG.authentication.CustomUserBackend',
 ]
 
+# Costo de bcrypt; al cambiarlo, los hashes se actualizan en el siguiente login
+PASSWORD_HASH_ROUNDS = int(os.getenv('PASSWORD_HASH_ROUNDS', '10'))
+
+# Hilos dedicados a bcrypt; limita cuántos logins se verifican a la vez
+PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', '4'))
+
+# Escritura por lotes de LoginLog/AuditLog (webAMG.services.audit_service)
+AUDIT_BATCH_SIZE = int(os.getenv('AUDIT_BATCH_SIZE', '100'))
+AUDIT_FLUSH_INTERVAL_MS = int(os.getenv('AUDIT_FLUSH_INTERVAL_MS', '500'))
+AUDIT_QUEUE_MAXSIZE = int(os.getenv('AUDIT_QUEUE_MAXSIZE', '10000'))
+AUDIT_SPILL_FILE = BASE_DIR / 'logs' / 'audit_spill.jsonl'
+AUDIT_DEAD_LETTER_FILE = BASE_DIR / 'logs' / 'audit_dead_letter.jsonl'
+
+# Particiones mensuales de audit_log/login_log (comando log_partitions)
+LOG_PARTITION_MONTHS_AHEAD = int(os.getenv('LOG_PARTITION_MONTHS_AHEAD', '3'))
+LOG_RETENTION_MONTHS = int(os.getenv('LOG_RETENTION_MONTHS', '12'))
+LOG_ARCHIVE_DIR = os.getenv('LOG_ARCHIVE_DIR', str(BASE_DIR / 'logs' / 'archive'))
+
+# Días que se conservan las sesiones expiradas antes de borrarlas (comando sweep_sessions)
+SESSION_RETENTION_DAYS = int(os.getenv('SESSION_RETENTION_DAYS', '30'))
+
+# Sesiones de páginas y API en la misma fila de user_sessions (webAMG.sessions)
+SESSION_ENGINE = 'webAMG.sessions'
+SESSION_COOKIE_NAME = 'session_token'
+SESSION_COOKIE_AGE = 8 * 60 * 60
+SESSION_COOKIE_SAMESITE = 'Lax'
+# Segundos que una sesión con su usuario queda en caché; con LocMemCache un
+# logout tarda hasta este tiempo en verse en otros procesos
+SESSION_CACHE_TTL = int(os.getenv('SESSION_CACHE_TTL', '30'))
+
+# Segundos que project_detail conserva en caché las secciones de beneficiarios,
+# fases y evidencias; la clave incluye project.updated_at, que las señales
+# actualizan al cambiar cualquiera de sus filas
+PROJECT_DETAIL_CACHE_TTL = int(os.getenv('PROJECT_DETAIL_CACHE_TTL', '600'))
+
+# Segundos que las estadísticas del dashboard (componentes de ReactPy) quedan
+# en caché, compartidas por todas las conexiones
+DASHBOARD_CACHE_TTL = int(os.getenv('DASHBOARD_CACHE_TTL', '60'))
+
+# Headers de seguridad (webAMG.middleware.SecurityHeadersMiddleware). Con el
+# nonce activo, los <script> en línea necesitan nonce="{{ request.csp_nonce }}"
+SECURITY_CSP_NONCE = os.getenv('SECURITY_CSP_NONCE', 'False') == 'True'
+SECURITY_STATIC_MAX_AGE = int(os.getenv('SECURITY_STATIC_MAX_AGE', '86400'))
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 
@@ -208,4 +281,10 @@ REACTPY_REGISTERED_COMPONENTS = {
     'loading_spinner': 'webAMG.core.components.loading_spinner',
     'empty_state': 'webAMG.core.components.empty_state',
     'confirm_dialog': 'webAMG.core.components.confirm_dialog',
+
+    # Componentes del Dashboard con datos (webAMG.core.loaders)
+    'dashboard_stats': 'webAMG.core.components.dashboard_stats',
+    'recent_projects': 'webAMG.core.components.recent_projects',
+    'project_row_by_id': 'webAMG.core.components.project_row_by_id',
+    'pending_duplicates_badge': 'webAMG.core.components.pending_duplicates_badge',
 }
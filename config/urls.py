@@ -75,6 +75,9 @@ urlpatterns = [
     path("api/v1/auth/me/", api_v1.current_user, name="api_v1_current_user"),
     path("api/v1/users/", api_v1.list_users, name="api_v1_list_users"),
     path("api/v1/users/create/", api_v1.create_user, name="api_v1_create_user"),
+    path("api/v1/users/bulk/create/", api_v1.bulk_create_users, name="api_v1_bulk_create_users"),
+    path("api/v1/users/bulk/update/", api_v1.bulk_update_users, name="api_v1_bulk_update_users"),
+    path("api/v1/users/bulk/delete/", api_v1.bulk_delete_users, name="api_v1_bulk_delete_users"),
     path("api/v1/users/<int:user_id>/", api_v1.user_detail, name="api_v1_user_detail"),
     path("api/v1/users/<int:user_id>/update/", api_v1.update_user, name="api_v1_update_user"),
     path("api/v1/users/<int:user_id>/delete/", api_v1.delete_user, name="api_v1_delete_user"),
@@ -82,6 +85,16 @@ urlpatterns = [
     path("api/v1/projects/", api_v1.list_projects, name="api_v1_list_projects"),
     path("api/v1/projects/<int:project_id>/deactivate/", api_v1.deactivate_project, name="api_v1_deactivate_project"),
     path("api/v1/projects/<int:project_id>/activate/", api_v1.activate_project, name="api_v1_activate_project"),
+    # Búsqueda global
+    path("api/v1/search/", api_v1.global_search, name="api_v1_search"),
+    # Beneficiarios - Perfil de censo
+    path("api/v1/beneficiaries/census/", api_v1.list_census_profiles, name="api_v1_census_profiles"),
+    path("api/v1/beneficiaries/census/export/", api_v1.export_census_profiles, name="api_v1_census_export"),
+    path("api/v1/beneficiaries/census/import/", api_v1.import_census, name="api_v1_census_import"),
+    # Beneficiarios - Duplicados
+    path("api/v1/beneficiaries/duplicates/", api_v1.list_duplicate_candidates, name="api_v1_duplicate_candidates"),
+    path("api/v1/beneficiaries/duplicates/<int:candidate_id>/merge/", api_v1.merge_duplicate_candidate, name="api_v1_merge_duplicate"),
+    path("api/v1/beneficiaries/duplicates/<int:candidate_id>/dismiss/", api_v1.dismiss_duplicate_candidate, name="api_v1_dismiss_duplicate"),
 ]
 
 # Media files (User uploaded files) - Solo en desarrollo
@@ -30,6 +30,8 @@ from webAMG.api.security import (
     InputSanitizer,
     RateLimiter,
     SecurityHeaders,
+    HeaderPolicy,
+    CSPNonce,
     get_client_ip,
     get_request_fingerprint
 )
@@ -39,15 +41,22 @@ from webAMG.api.validators import (
     LoginRequest,
     CreateUserRequest,
     UpdateUserRequest,
+    BulkUpdateUserRequest,
+    BulkDeleteUsersRequest,
+    MAX_BULK_USERS,
     ProjectCreateRequest,
     ProjectUpdateRequest,
     BeneficiaryCreateRequest,
+    CensusRowRequest,
     BaseResponseModel,
     ErrorResponseModel,
     SuccessResponseModel,
     PaginatedResponseModel,
     APIResponse,
-    validate_request_data
+    APIJsonResponse,
+    dumps_json,
+    validate_request_data,
+    validate_request_list
 )
 
 __all__ = [
@@ -74,6 +83,8 @@ __all__ = [
     'InputSanitizer',
     'RateLimiter',
     'SecurityHeaders',
+    'HeaderPolicy',
+    'CSPNonce',
     'get_client_ip',
     'get_request_fingerprint',
     # Validators
@@ -81,13 +92,20 @@ __all__ = [
     'LoginRequest',
     'CreateUserRequest',
     'UpdateUserRequest',
+    'BulkUpdateUserRequest',
+    'BulkDeleteUsersRequest',
+    'MAX_BULK_USERS',
     'ProjectCreateRequest',
     'ProjectUpdateRequest',
     'BeneficiaryCreateRequest',
+    'CensusRowRequest',
     'BaseResponseModel',
     'ErrorResponseModel',
     'SuccessResponseModel',
     'PaginatedResponseModel',
     'APIResponse',
-    'validate_request_data'
+    'APIJsonResponse',
+    'dumps_json',
+    'validate_request_data',
+    'validate_request_list'
 ]
@@ -4,7 +4,6 @@ Proveen autenticación, autorización, rate limiting y validación de seguridad.
 """
 import functools
 from typing import Callable, Optional, List, Set
-from django.http import JsonResponse
 from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import csrf_exempt
 from webAMG.api.exceptions import (
@@ -13,7 +12,9 @@ from webAMG.api.exceptions import (
     RateLimitExceededError,
     BadRequestError
 )
+from webAMG.api.validators import APIJsonResponse
 from webAMG.services.auth_service import AuthService
+from webAMG.sessions import SessionStore
 
 
 def api_require_auth(f: Optional[Callable] = None) -> Callable:
@@ -44,16 +45,21 @@ def api_require_auth(f: Optional[Callable] = None) -> Callable:
                     error_code="AUTH_REQUIRED"
                 )
             
-            result = AuthService.verify_session(session_token)
+            # Si la cookie es la misma sesión de la página, se reutiliza la ya cargada
+            session = getattr(request, 'session', None)
+            if not isinstance(session, SessionStore) or session.session_key != session_token:
+                session = SessionStore(session_token)
             
-            if not result.get('valid'):
+            user = session.get_user()
+            
+            if user is None:
                 raise UnauthorizedError(
-                    result.get('error', 'Sesión inválida'),
+                    'Sesión no válida o expirada',
                     error_code="INVALID_SESSION"
                 )
             
-            request.user_data = result['user']
-            request.user = AuthService.get_user_from_session(session_token)
+            request.user_data = AuthService.user_payload(user)
+            request.user = user
             
             return view_func(request, *args, **kwargs)
         
@@ -83,7 +89,7 @@ def api_require_roles(roles: Set[str]) -> Callable:
         @api_require_auth
         @api_require_roles({'administrador'})
         def admin_endpoint(request):
-            return JsonResponse({'success': True})
+            return APIJsonResponse({'success': True})
     """
     def decorator(view_func):
         @functools.wraps(view_func)
@@ -124,7 +130,7 @@ def api_require_admin(f: Optional[Callable] = None) -> Callable:
     Example:
         @api_require_admin
         def sensitive_operation(request):
-            return JsonResponse({'success': True})
+            return APIJsonResponse({'success': True})
     """
     def decorator(view_func):
         return api_require_auth(
@@ -154,7 +160,7 @@ def api_require_methods(methods: List[str]) -> Callable:
     Example:
         @api_require_methods(['GET', 'POST'])
         def endpoint(request):
-            return JsonResponse({'success': True})
+            return APIJsonResponse({'success': True})
     """
     def decorator(view_func):
         @functools.wraps(view_func)
@@ -182,7 +188,7 @@ def api_csrf_exempt(f: Callable) -> Callable:
         @api_csrf_exempt
         @api_require_methods(['POST'])
         def public_api(request):
-            return JsonResponse({'success': True})
+            return APIJsonResponse({'success': True})
     """
     return csrf_exempt(f)
 
@@ -212,7 +218,7 @@ def handle_api_errors(f: Callable) -> Callable:
             from webAMG.api.exceptions import APIError
             
             if isinstance(e, APIError):
-                return JsonResponse(
+                return APIJsonResponse(
                     e.to_dict(),
                     status=e.status_code
                 )
@@ -225,14 +231,14 @@ def handle_api_errors(f: Callable) -> Callable:
                     "Permiso denegado",
                     error_code="PERMISSION_DENIED"
                 )
-                return JsonResponse(error.to_dict(), status=error.status_code)
+                return APIJsonResponse(error.to_dict(), status=error.status_code)
             
             if isinstance(e, DjangoHttp404):
                 error = NotFoundError(
                     "Recurso no encontrado",
                     error_code="NOT_FOUND"
                 )
-                return JsonResponse(error.to_dict(), status=error.status_code)
+                return APIJsonResponse(error.to_dict(), status=error.status_code)
             
             from webAMG.api.exceptions import InternalServerError
             from django.conf import settings
@@ -241,7 +247,7 @@ def handle_api_errors(f: Callable) -> Callable:
                 "Error interno del servidor",
                 details={'error': str(e)} if settings.DEBUG else None
             )
-            return JsonResponse(error.to_dict(), status=error.status_code)
+            return APIJsonResponse(error.to_dict(), status=error.status_code)
     
     return wrapped_view
 
@@ -268,11 +274,11 @@ def api_endpoint(
     Example:
         @api_endpoint(methods=['GET'], auth_required=True)
         def protected_get(request):
-            return JsonResponse({'success': True})
+            return APIJsonResponse({'success': True})
         
         @api_endpoint(methods=['POST'], auth_required=True, roles={'administrador'})
         def admin_post(request):
-            return JsonResponse({'success': True})
+            return APIJsonResponse({'success': True})
     """
     def decorator(view_func):
         decorated = view_func
@@ -5,39 +5,81 @@ Proporciona funciones para sanitización, validación y rate limiting.
 import re
 import hashlib
 import secrets
-from typing import Optional, List, Dict, Any
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple
 from django.core.cache import cache
 from django.conf import settings
+from django.http.response import ResponseHeaders
 from webAMG.api.exceptions import BadRequestError, RateLimitExceededError
 
 
+@lru_cache(maxsize=None)
+def _compile_alternation(patterns: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """Une varios patrones en una sola expresión compilada (una pasada por el texto)."""
+    if not patterns:
+        return None
+    return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns), re.IGNORECASE)
+
+
+def _select_patterns(groups, value: str) -> Optional[re.Pattern]:
+    """
+    Alternación compilada con los grupos de patrones que pueden coincidir en value.
+
+    Cada grupo declara un carácter sin el cual ninguno de sus patrones coincide
+    (None si no hay). Buscar un carácter con "in" es mucho más rápido que
+    probar cada patrón en cada posición del texto, y una alternación con
+    patrones que no pueden coincidir pierde la búsqueda rápida por prefijo
+    del motor de re.
+    """
+    return _compile_alternation(tuple(
+        pattern
+        for required, patterns in groups
+        if required is None or required in value
+        for pattern in patterns
+    ))
+
+
 class InputSanitizer:
     """
     Clase para sanitizar y validar inputs de usuario.
     Previene ataques como XSS, SQL Injection, etc.
     """
     
-    XSS_PATTERNS = [
-        r'<script[^>]*>.*?</script>',
-        r'javascript:',
-        r'on\w+\s*=',
-        r'<iframe[^>]*>.*?</iframe>',
-        r'<object[^>]*>.*?</object>',
-        r'<embed[^>]*>.*?</embed>',
-    ]
-    
-    SQL_INJECTION_PATTERNS = [
-        r"(\bor\b|\band\b)\s+\w+\s*=",
-        r";\s*drop\b",
-        r";\s*delete\b",
-        r";\s*insert\b",
-        r";\s*update\b",
-        r"union\s+select",
-        r"'\s*or\s*'",
-        r'"\s*or\s*"',
-        r"'\s*--",
-        r'"\s*--',
-    ]
+    # (carácter requerido, patrones)
+    XSS_PATTERN_GROUPS = (
+        ('<', (
+            r'<script[^>]*>.*?</script>',
+            r'<iframe[^>]*>.*?</iframe>',
+            r'<object[^>]*>.*?</object>',
+            r'<embed[^>]*>.*?</embed>',
+        )),
+        (':', (r'javascript:',)),
+        ('=', (r'on\w+\s*=',)),
+    )
+    
+    SQL_INJECTION_PATTERN_GROUPS = (
+        ('=', (r"(\bor\b|\band\b)\s+\w+\s*=",)),
+        (';', (
+            r";\s*drop\b",
+            r";\s*delete\b",
+            r";\s*insert\b",
+            r";\s*update\b",
+        )),
+        ("'", (r"'\s*or\s*'", r"'\s*--")),
+        ('"', (r'"\s*or\s*"', r'"\s*--')),
+        (None, (r"union\s+select",)),
+    )
+    
+    # Pasadas de limpieza de XSS antes de rechazar el texto
+    MAX_XSS_PASSES = 3
+    
+    XSS_PATTERNS = [pattern for _, patterns in XSS_PATTERN_GROUPS for pattern in patterns]
+    SQL_INJECTION_PATTERNS = [pattern for _, patterns in SQL_INJECTION_PATTERN_GROUPS for pattern in patterns]
+    
+    EMAIL_REGEX = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+    USERNAME_REGEX = re.compile(r'^[a-zA-Z0-9_-]{3,30}$')
+    PHONE_STRIP_REGEX = re.compile(r'[^\d+]')
+    PHONE_REGEX = re.compile(r'^(\+502)?[2-9]\d{7}$')
     
     @staticmethod
     def sanitize_string(value: str, allow_html: bool = False) -> str:
@@ -55,15 +97,31 @@ class InputSanitizer:
             return str(value)
         
         if not allow_html:
-            for pattern in InputSanitizer.XSS_PATTERNS:
-                value = re.sub(pattern, '', value, flags=re.IGNORECASE)
-        
-        for pattern in InputSanitizer.SQL_INJECTION_PATTERNS:
-            if re.search(pattern, value, flags=re.IGNORECASE):
-                raise BadRequestError(
-                    "Input contains potentially malicious content",
-                    error_code="MALICIOUS_INPUT"
-                )
+            # Quitar un bloque puede formar otro ("<scr<script></script>ipt>").
+            # Cada pasada quita un nivel de anidamiento, así que se limita a
+            # MAX_XSS_PASSES y lo que aún coincida se rechaza: sin límite, un
+            # anidamiento profundo hace el costo cuadrático en el tamaño
+            regex = _select_patterns(InputSanitizer.XSS_PATTERN_GROUPS, value)
+            for _ in range(InputSanitizer.MAX_XSS_PASSES):
+                if regex is None:
+                    break
+                value, removed = regex.subn('', value)
+                if not removed:
+                    break
+                regex = _select_patterns(InputSanitizer.XSS_PATTERN_GROUPS, value)
+            else:
+                if regex is not None and regex.search(value):
+                    raise BadRequestError(
+                        "Input contains potentially malicious content",
+                        error_code="MALICIOUS_INPUT"
+                    )
+        
+        regex = _select_patterns(InputSanitizer.SQL_INJECTION_PATTERN_GROUPS, value)
+        if regex is not None and regex.search(value):
+            raise BadRequestError(
+                "Input contains potentially malicious content",
+                error_code="MALICIOUS_INPUT"
+            )
         
         return value.strip()
     
@@ -82,9 +140,7 @@ class InputSanitizer:
             BadRequestError: Si el email no es válido
         """
         email = email.strip().lower()
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        
-        if not re.match(email_pattern, email):
+        if not InputSanitizer.EMAIL_REGEX.match(email):
             raise BadRequestError(
                 "Email inválido",
                 error_code="INVALID_EMAIL"
@@ -108,9 +164,7 @@ class InputSanitizer:
             BadRequestError: Si el nombre de usuario no es válido
         """
         username = username.strip().lower()
-        username_pattern = r'^[a-zA-Z0-9_-]{3,30}$'
-        
-        if not re.match(username_pattern, username):
+        if not InputSanitizer.USERNAME_REGEX.match(username):
             raise BadRequestError(
                 "Nombre de usuario inválido. Debe tener 3-30 caracteres y solo puede contener letras, números, guiones y guiones bajos",
                 error_code="INVALID_USERNAME"
@@ -133,10 +187,9 @@ class InputSanitizer:
         Raises:
             BadRequestError: Si el número de teléfono no es válido
         """
-        phone = re.sub(r'[^\d+]', '', phone)
-        guatemala_pattern = r'^(\+502)?[2-9]\d{7}$'
+        phone = InputSanitizer.PHONE_STRIP_REGEX.sub('', phone)
         
-        if not re.match(guatemala_pattern, phone):
+        if not InputSanitizer.PHONE_REGEX.match(phone):
             raise BadRequestError(
                 "Número de teléfono inválido. Formato válido: +502XXXXXXX o XXXXXXXX",
                 error_code="INVALID_PHONE"
@@ -312,11 +365,103 @@ class RateLimiter:
         }
 
 
+class CSPNonce:
+    """
+    Nonce de CSP de una petición. Se genera solo si la plantilla lo usa
+    ({{ request.csp_nonce }}); si nadie lo pidió, la respuesta lleva la CSP sin nonce.
+    """
+    
+    __slots__ = ('value',)
+    
+    def __init__(self):
+        self.value = None
+    
+    def __str__(self) -> str:
+        if self.value is None:
+            self.value = secrets.token_urlsafe(16)
+        return self.value
+    
+    __html__ = __str__
+
+
+class HeaderPolicy:
+    """
+    Headers de seguridad precalculados para un tipo de respuesta.
+    
+    Los headers se validan y convierten una sola vez al construir la política;
+    aplicarlos a una respuesta es una asignación por header con la API pública
+    de response.headers.
+    """
+    
+    def __init__(self, headers: Dict[str, str], csp: Optional[str] = None,
+                 nonce_csp: Optional[str] = None, cache_control: Optional[str] = None):
+        """
+        Args:
+            headers: Headers que se agregan a todas las respuestas
+            csp: Content-Security-Policy sin nonce
+            nonce_csp: CSP para cuando se usó el nonce; '{nonce}' marca dónde va
+            cache_control: Cache-Control para las respuestas 200 sin uno propio
+        """
+        if csp is not None:
+            headers = {**headers, 'Content-Security-Policy': csp}
+        self.headers = tuple(ResponseHeaders(headers).items())
+        # Partes de la CSP con nonce: antes + nonce + después
+        self.nonce_csp = tuple(nonce_csp.split('{nonce}', 1)) if nonce_csp else None
+        self.cache_control = ResponseHeaders({'Cache-Control': cache_control})['Cache-Control'] if cache_control else None
+    
+    def apply(self, response, nonce: Optional[CSPNonce] = None) -> None:
+        """
+        Aplica los headers a una respuesta HTTP de Django.
+        
+        Args:
+            response: Objeto de respuesta HTTP de Django
+            nonce: Nonce de la petición, si la plantilla lo usó
+        """
+        response_headers = response.headers
+        for name, value in self.headers:
+            response_headers[name] = value
+        if self.nonce_csp is not None and nonce is not None and nonce.value is not None:
+            response_headers['Content-Security-Policy'] = self.nonce_csp[0] + nonce.value + self.nonce_csp[1]
+        if self.cache_control is not None and response.status_code == 200 and 'Cache-Control' not in response_headers:
+            response_headers['Cache-Control'] = self.cache_control
+
+
 class SecurityHeaders:
     """
     Clase para generar headers de seguridad HTTP.
     """
     
+    HEADERS = {
+        'X-Content-Type-Options': 'nosniff',
+        'X-Frame-Options': 'DENY',
+        'X-XSS-Protection': '1; mode=block',
+        'Strict-Transport-Security': 'max-age=31536000; includeSubDomains',
+        'Referrer-Policy': 'strict-origin-when-cross-origin',
+        'Permissions-Policy': (
+            'geolocation=(), microphone=(), camera=(), '
+            'payment=(), usb=(), magnetometer=(), gyroscope=()'
+        )
+    }
+    
+    CSP = (
+        "default-src 'self'; "
+        "script-src 'self' 'unsafe-inline' 'unsafe-eval'; "
+        "style-src 'self' 'unsafe-inline' https://fonts.googleapis.com https://cdnjs.cloudflare.com; "
+        "img-src 'self' data: https:; "
+        "font-src 'self' data: https://fonts.gstatic.com https://cdnjs.cloudflare.com; "
+        "connect-src 'self'; "
+        "frame-ancestors 'none'"
+    )
+    
+    # Un navegador con soporte de nonce ignora 'unsafe-inline' cuando hay un
+    # nonce en script-src, así que los scripts y atributos on* sin nonce dejan
+    # de ejecutarse: por eso el nonce se activa con SECURITY_CSP_NONCE.
+    NONCE_CSP = CSP.replace("script-src 'self'", "script-src 'self' 'nonce-{nonce}'", 1)
+    
+    DEFAULT_STATIC_MAX_AGE = 86400
+    
+    _default_policy = None
+    
     @staticmethod
     def get_headers() -> Dict[str, str]:
         """
@@ -325,26 +470,30 @@ class SecurityHeaders:
         Returns:
             Diccionario con headers de seguridad
         """
-        return {
-            'X-Content-Type-Options': 'nosniff',
-            'X-Frame-Options': 'DENY',
-            'X-XSS-Protection': '1; mode=block',
-            'Strict-Transport-Security': 'max-age=31536000; includeSubDomains',
-            'Content-Security-Policy': (
-                "default-src 'self'; "
-                "script-src 'self' 'unsafe-inline' 'unsafe-eval'; "
-                "style-src 'self' 'unsafe-inline' https://fonts.googleapis.com https://cdnjs.cloudflare.com; "
-                "img-src 'self' data: https:; "
-                "font-src 'self' data: https://fonts.gstatic.com https://cdnjs.cloudflare.com; "
-                "connect-src 'self'; "
-                "frame-ancestors 'none'"
-            ),
-            'Referrer-Policy': 'strict-origin-when-cross-origin',
-            'Permissions-Policy': (
-                'geolocation=(), microphone=(), camera=(), '
-                'payment=(), usb=(), magnetometer=(), gyroscope=()'
-            )
-        }
+        return {**SecurityHeaders.HEADERS, 'Content-Security-Policy': SecurityHeaders.CSP}
+    
+    @staticmethod
+    def build_policies() -> List[tuple]:
+        """
+        Políticas por prefijo de ruta, de la más específica a la general:
+        la API (respuestas JSON) no lleva CSP, los archivos estáticos llevan
+        Cache-Control y el resto lleva la CSP (con nonce si SECURITY_CSP_NONCE).
+        
+        Returns:
+            Lista de (prefijo, HeaderPolicy); el prefijo '' aplica a todo
+        """
+        nonce_csp = SecurityHeaders.NONCE_CSP if getattr(settings, 'SECURITY_CSP_NONCE', False) else None
+        max_age = getattr(settings, 'SECURITY_STATIC_MAX_AGE', SecurityHeaders.DEFAULT_STATIC_MAX_AGE)
+        static_url = '/' + settings.STATIC_URL.lstrip('/') if settings.STATIC_URL else None
+        
+        policies = [('/api/', HeaderPolicy(SecurityHeaders.HEADERS))]
+        if static_url:
+            policies.append((static_url, HeaderPolicy(
+                SecurityHeaders.HEADERS, SecurityHeaders.CSP, cache_control=f'public, max-age={max_age}'
+            )))
+        policies.sort(key=lambda policy: len(policy[0]), reverse=True)
+        policies.append(('', HeaderPolicy(SecurityHeaders.HEADERS, SecurityHeaders.CSP, nonce_csp)))
+        return policies
     
     @staticmethod
     def apply_headers(response) -> None:
@@ -354,9 +503,9 @@ class SecurityHeaders:
         Args:
             response: Objeto de respuesta HTTP de Django
         """
-        headers = SecurityHeaders.get_headers()
-        for key, value in headers.items():
-            response[key] = value
+        if SecurityHeaders._default_policy is None:
+            SecurityHeaders._default_policy = HeaderPolicy(SecurityHeaders.HEADERS, SecurityHeaders.CSP)
+        SecurityHeaders._default_policy.apply(response)
 
 
 def get_client_ip(request) -> str:
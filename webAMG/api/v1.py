@@ -5,7 +5,6 @@ Estas APIs siguen los estándares RESTful y las mejores prácticas de seguridad.
 import json
 import logging
 from typing import Optional, Dict, Any
-from django.http import JsonResponse
 from django.views.decorators.http import require_http_methods
 from django.contrib.auth import get_user_model
 from webAMG.api import (
@@ -15,6 +14,7 @@ from webAMG.api import (
     InputSanitizer,
     RateLimiter,
     APIResponse,
+    APIJsonResponse,
     validate_request_data,
     LoginRequest,
     CreateUserRequest,
@@ -24,6 +24,7 @@ from webAMG.api import (
     NotFoundError
 )
 from webAMG.services.auth_service import AuthService
+from webAMG.sessions import SessionStore
 
 logger = logging.getLogger(__name__)
 User = get_user_model()
@@ -36,7 +37,7 @@ def health_check(request):
     
     GET /api/v1/health/
     """
-    return JsonResponse(APIResponse.success(
+    return APIJsonResponse(APIResponse.success(
         data={
             'status': 'healthy',
             'version': '1.0.0',
@@ -53,7 +54,7 @@ def api_info(request):
     
     GET /api/v1/info/
     """
-    return JsonResponse(APIResponse.success(
+    return APIJsonResponse(APIResponse.success(
         data={
             'name': 'WebAMG API',
             'version': '1.0.0',
@@ -71,7 +72,19 @@ def api_info(request):
                     'create': '/api/v1/users/',
                     'detail': '/api/v1/users/{id}/',
                     'update': '/api/v1/users/{id}/',
-                    'delete': '/api/v1/users/{id}/'
+                    'delete': '/api/v1/users/{id}/',
+                    'bulk_create': '/api/v1/users/bulk/create/',
+                    'bulk_update': '/api/v1/users/bulk/update/',
+                    'bulk_delete': '/api/v1/users/bulk/delete/'
+                },
+                'search': '/api/v1/search/',
+                'beneficiaries': {
+                    'census': '/api/v1/beneficiaries/census/',
+                    'census_export': '/api/v1/beneficiaries/census/export/',
+                    'census_import': '/api/v1/beneficiaries/census/import/',
+                    'duplicates': '/api/v1/beneficiaries/duplicates/',
+                    'merge_duplicate': '/api/v1/beneficiaries/duplicates/{id}/merge/',
+                    'dismiss_duplicate': '/api/v1/beneficiaries/duplicates/{id}/dismiss/'
                 }
             }
         }
@@ -112,7 +125,7 @@ def login(request):
         )
         
         if result['success']:
-            response = JsonResponse(APIResponse.success(
+            response = APIJsonResponse(APIResponse.success(
                 data={
                     'user': result['user'],
                     'expires_at': result['expires_at']
@@ -120,6 +133,10 @@ def login(request):
                 message='Login exitoso'
             ))
             
+            # session_token es también la cookie de sesión de Django; sin esto,
+            # SessionMiddleware borraría la cookie si la petición traía una sesión vencida
+            request.session = SessionStore(result['session_token'])
+            
             response.set_cookie(
                 'session_token',
                 result['session_token'],
@@ -168,7 +185,7 @@ def logout(request):
     result = AuthService.logout(session_token)
     
     if result['success']:
-        response = JsonResponse(APIResponse.success(message='Logout exitoso'))
+        response = APIJsonResponse(APIResponse.success(message='Logout exitoso'))
         response.delete_cookie('session_token')
         
         logger.info(f"User {request.user.username if hasattr(request, 'user') else 'unknown'} logged out")
@@ -199,7 +216,7 @@ def verify_session(request):
     result = AuthService.verify_session(session_token)
     
     if result.get('valid'):
-        return JsonResponse(APIResponse.success(
+        return APIJsonResponse(APIResponse.success(
             data={'user': result['user']},
             message='Sesión válida'
         ))
@@ -225,7 +242,7 @@ def current_user(request):
         'last_login': request.user.last_login.isoformat() if request.user.last_login else None
     }
     
-    return JsonResponse(APIResponse.success(data={'user': user_data}))
+    return APIJsonResponse(APIResponse.success(data={'user': user_data}))
 
 
 @api_endpoint(methods=['GET'], auth_required=True)
@@ -242,56 +259,16 @@ def list_users(request):
         role: str (optional: 'administrador', 'usuario')
         is_active: bool (optional)
     """
-    from django.core.paginator import Paginator
-    
-    page = int(request.GET.get('page', 1))
-    page_size = min(int(request.GET.get('page_size', 20)), 100)
-    search = request.GET.get('search', '').strip()
-    role = request.GET.get('role', '').strip()
-    is_active = request.GET.get('is_active')
-    
-    queryset = User.objects.all()
-    
-    if search:
-        queryset = queryset.filter(
-            username__icontains=search
-        ) | queryset.filter(
-            email__icontains=search
-        ) | queryset.filter(
-            full_name__icontains=search
-        )
-    
-    if role:
-        queryset = queryset.filter(role=role)
+    from webAMG.services.user_service import UserService
     
-    if is_active is not None:
-        is_active_bool = is_active.lower() == 'true'
-        queryset = queryset.filter(is_active=is_active_bool)
+    users_page = UserService.list_users(request.GET)
+    users_data = [UserService.serialize(user) for user in users_page]
     
-    queryset = queryset.order_by('-created_at')
-    
-    paginator = Paginator(queryset, page_size)
-    users_page = paginator.get_page(page)
-    
-    users_data = [
-        {
-            'id': user.id,
-            'username': user.username,
-            'email': user.email,
-            'full_name': user.full_name,
-            'role': user.role,
-            'is_active': user.is_active,
-            'created_at': user.created_at.isoformat() if user.created_at else None,
-            'last_login': user.last_login.isoformat() if user.last_login else None
-        }
-        for user in users_page
-    ]
-    
-    return JsonResponse(APIResponse.paginated(
+    return APIJsonResponse(APIResponse.paginated(
         items=users_data,
-        page=page,
-        page_size=page_size,
-        total=paginator.count,
+        page=users_page.number,
+        page_size=users_page.paginator.per_page,
+        total=users_page.paginator.count,
         message=f'{len(users_data)} usuarios encontrados'
     ))
 
@@ -313,26 +290,24 @@ def create_user(request):
     data = json.loads(request.body)
     validated = validate_request_data(data, CreateUserRequest)
     
-    if User.objects.filter(username=validated.username).exists():
-        from webAMG.api import ConflictError
-        raise ConflictError('El nombre de usuario ya existe')
-    
-    if User.objects.filter(email=validated.email).exists():
-        from webAMG.api import ConflictError
-        raise ConflictError('El email ya está registrado')
-    
-    user = User.objects.create_user(
-        username=validated.username,
-        email=validated.email,
-        password=validated.password,
-        full_name=validated.full_name,
-        role=validated.role,
-        is_active=True
-    )
+    from webAMG.api import ConflictError
+    from webAMG.services.user_service import DuplicateUserError, UserService
+    
+    try:
+        user = UserService.create_user(
+            username=validated.username,
+            email=validated.email,
+            password=validated.password,
+            full_name=validated.full_name,
+            role=validated.role,
+            is_active=True
+        )
+    except DuplicateUserError as e:
+        raise ConflictError(str(e))
     
     logger.info(f"User {validated.username} created by {request.user.username}")
     
-    return JsonResponse(
+    return APIJsonResponse(
         APIResponse.success(
             data={
                 'user': {
@@ -374,7 +349,7 @@ def user_detail(request, user_id: int):
         'last_login': user.last_login.isoformat() if user.last_login else None
     }
     
-    return JsonResponse(APIResponse.success(data={'user': user_data}))
+    return APIJsonResponse(APIResponse.success(data={'user': user_data}))
 
 
 @api_endpoint(methods=['PUT', 'PATCH'], auth_required=True, roles={'administrador'})
@@ -400,20 +375,19 @@ def update_user(request, user_id: int):
     data = json.loads(request.body)
     validated = validate_request_data(data, UpdateUserRequest)
     
-    if validated.email and User.objects.exclude(id=user_id).filter(email=validated.email).exists():
-        from webAMG.api import ConflictError
-        raise ConflictError('El email ya está registrado')
+    from webAMG.api import ConflictError
+    from webAMG.services.user_service import DuplicateUserError, UserService
     
-    if validated.email is not None:
-        user.email = validated.email
-    if validated.full_name is not None:
-        user.full_name = validated.full_name
-    if validated.role is not None:
-        user.role = validated.role
-    if validated.is_active is not None:
-        user.is_active = validated.is_active
+    fields = {
+        field: getattr(validated, field)
+        for field in ('email', 'full_name', 'role', 'is_active')
+        if getattr(validated, field) is not None
+    }
     
-    user.save()
+    try:
+        UserService.update_user(user, **fields)
+    except DuplicateUserError as e:
+        raise ConflictError(str(e))
     
     logger.info(f"User {user_id} updated by {request.user.username}")
     
@@ -426,7 +400,7 @@ def update_user(request, user_id: int):
         'is_active': user.is_active
     }
     
-    return JsonResponse(APIResponse.success(
+    return APIJsonResponse(APIResponse.success(
         data={'user': user_data},
         message='Usuario actualizado exitosamente'
     ))
@@ -454,11 +428,121 @@ def delete_user(request, user_id: int):
     
     logger.info(f"User {username} (ID: {user_id}) deleted by {request.user.username}")
     
-    return JsonResponse(
+    return APIJsonResponse(
         APIResponse.success(message=f'Usuario {username} eliminado exitosamente')
     )
 
 
+def _bulk_response(results, action: str):
+    """Respuesta común de las operaciones masivas de usuarios."""
+    succeeded = sum(1 for result in results if result['success'])
+    return APIJsonResponse(APIResponse.success(
+        data={
+            'results': results,
+            'succeeded': succeeded,
+            'failed': len(results) - succeeded
+        },
+        message=f'{succeeded} de {len(results)} usuarios {action}'
+    ))
+
+
+def _load_bulk_items(request, key: str, model_class):
+    """Lee request.body[key] y valida cada elemento; devuelve (válidos, errores por elemento)."""
+    from webAMG.api import MAX_BULK_USERS, validate_request_list
+    
+    try:
+        data = json.loads(request.body)
+    except json.JSONDecodeError:
+        raise BadRequestError('JSON inválido')
+    if not isinstance(data, dict):
+        raise BadRequestError(f'Se esperaba un objeto con la lista "{key}"')
+    
+    return validate_request_list(data.get(key), model_class, max_items=MAX_BULK_USERS)
+
+
+@api_endpoint(methods=['POST'], auth_required=True, roles={'administrador'})
+def bulk_create_users(request):
+    """
+    Endpoint para crear varios usuarios en una sola petición (solo administradores).
+    
+    POST /api/v1/users/bulk/create/
+    
+    Body:
+        users: list (máximo 100) con los mismos campos de create_user
+    
+    Las contraseñas se hashean en paralelo y los usuarios válidos se insertan
+    en una sola transacción. La respuesta trae un resultado por elemento.
+    """
+    from webAMG.api import ConflictError
+    from webAMG.services.user_service import DuplicateUserError, UserService
+    
+    valid, errors = _load_bulk_items(request, 'users', CreateUserRequest)
+    
+    try:
+        results = UserService.bulk_create_users(valid) if valid else []
+    except DuplicateUserError as e:
+        raise ConflictError(f'{e}; ningún usuario fue creado')
+    
+    results = sorted(results + [dict(error, success=False) for error in errors], key=lambda r: r['index'])
+    
+    logger.info(f"{sum(r['success'] for r in results)} users bulk created by {request.user.username}")
+    
+    return _bulk_response(results, 'creados')
+
+
+@api_endpoint(methods=['POST'], auth_required=True, roles={'administrador'})
+def bulk_update_users(request):
+    """
+    Endpoint para actualizar varios usuarios en una sola petición (solo administradores).
+    
+    POST /api/v1/users/bulk/update/
+    
+    Body:
+        users: list (máximo 100) de {id, email?, full_name?, role?, is_active?}
+    """
+    from webAMG.api import BulkUpdateUserRequest, ConflictError
+    from webAMG.services.user_service import DuplicateUserError, UserService
+    
+    valid, errors = _load_bulk_items(request, 'users', BulkUpdateUserRequest)
+    
+    try:
+        results = UserService.bulk_update_users(valid) if valid else []
+    except DuplicateUserError as e:
+        raise ConflictError(f'{e}; ningún usuario fue actualizado')
+    
+    results = sorted(results + [dict(error, success=False) for error in errors], key=lambda r: r['index'])
+    
+    logger.info(f"{sum(r['success'] for r in results)} users bulk updated by {request.user.username}")
+    
+    return _bulk_response(results, 'actualizados')
+
+
+@api_endpoint(methods=['POST'], auth_required=True, roles={'administrador'})
+def bulk_delete_users(request):
+    """
+    Endpoint para eliminar varios usuarios en una sola petición (solo administradores).
+    
+    POST /api/v1/users/bulk/delete/
+    
+    Body:
+        ids: list[int] (máximo 100)
+    """
+    from webAMG.api import BulkDeleteUsersRequest
+    from webAMG.services.user_service import UserService
+    
+    try:
+        data = json.loads(request.body)
+    except json.JSONDecodeError:
+        raise BadRequestError('JSON inválido')
+    validated = validate_request_data(data, BulkDeleteUsersRequest)
+    
+    results = UserService.bulk_delete_users(validated.ids, acting_user_id=request.user.id)
+    
+    logger.info(f"{sum(r['success'] for r in results)} users bulk deleted by {request.user.username}")
+    
+    return _bulk_response(results, 'eliminados')
+
+
 @api_endpoint(methods=['POST'], auth_required=True, roles={'administrador'})
 def deactivate_project(request, project_id):
     """
@@ -469,8 +553,9 @@ def deactivate_project(request, project_id):
     Solo los administradores pueden desactivar proyectos.
     """
     from webAMG.models import Project
+    from webAMG.services.soft_delete_service import ProjectStateError, SoftDeleteService
     
-    project = Project.objects.filter(id=project_id).first()
+    project = Project.all_objects.filter(id=project_id).first()
     
     if not project:
         raise NotFoundError('Proyecto no encontrado')
@@ -478,12 +563,14 @@ def deactivate_project(request, project_id):
     if not project.is_active:
         raise BadRequestError('El proyecto ya está inactivo')
     
-    project.is_active = False
-    project.save()
+    try:
+        SoftDeleteService.deactivate_project(project.id)
+    except ProjectStateError as e:
+        raise BadRequestError(str(e))
     
     logger.info(f"Project {project.project_name} (ID: {project_id}) deactivated by {request.user.username}")
     
-    return JsonResponse(
+    return APIJsonResponse(
         APIResponse.success(message='Proyecto desactivado exitosamente')
     )
 
@@ -498,8 +585,9 @@ def activate_project(request, project_id):
     Solo los administradores pueden reactivar proyectos.
     """
     from webAMG.models import Project
+    from webAMG.services.soft_delete_service import ProjectStateError, SoftDeleteService
     
-    project = Project.objects.filter(id=project_id).first()
+    project = Project.all_objects.filter(id=project_id).first()
     
     if not project:
         raise NotFoundError('Proyecto no encontrado')
@@ -507,12 +595,14 @@ def activate_project(request, project_id):
     if project.is_active:
         raise BadRequestError('El proyecto ya está activo')
     
-    project.is_active = True
-    project.save()
+    try:
+        SoftDeleteService.activate_project(project.id)
+    except ProjectStateError as e:
+        raise BadRequestError(str(e))
     
     logger.info(f"Project {project.project_name} (ID: {project_id}) activated by {request.user.username}")
     
-    return JsonResponse(
+    return APIJsonResponse(
         APIResponse.success(message='Proyecto reactivado exitosamente')
     )
 
@@ -536,36 +626,298 @@ def list_projects(request):
     
     show_inactive = request.GET.get('show_inactive', 'false').lower() == 'true'
     
-    projects_queryset = Project.objects.all()
-    
     if show_inactive:
-        projects_queryset = projects_queryset.filter(is_active=False)
+        projects_queryset = Project.all_objects.filter(is_active=False)
     else:
-        projects_queryset = projects_queryset.filter(is_active=True)
-    
-    logger.info(f"API: Buscando proyectos con show_inactive={show_inactive}, total={projects_queryset.count()}")
-    
-    projects_data = []
-    for project in projects_queryset:
-        logger.info(f"API: Proyecto encontrado - ID={project.id}, nombre={project.project_name}, is_active={project.is_active}, deactivated_at={project.deactivated_at}")
-        projects_data.append({
-            'id': project.id,
-            'project_name': project.project_name,
-            'project_code': project.project_code,
-            'department': project.department,
-            'municipality': project.municipality,
-            'status': project.status,
-            'start_date': project.start_date.strftime('%Y-%m-%d') if project.start_date else None,
-            'end_date': project.end_date.strftime('%Y-%m-%d') if project.end_date else None,
-            'is_active': project.is_active,
-            'created_at': project.created_at.strftime('%Y-%m-%d') if project.created_at else None,
-            'updated_at': project.updated_at.strftime('%Y-%m-%d') if project.updated_at else None,
-            'deactivated_at': project.deactivated_at.strftime('%Y-%m-%d %H:%M:%S') if project.deactivated_at else None
-        })
-    
-    return JsonResponse(
+        projects_queryset = Project.objects.all()
+    
+    # Fechas como date/datetime: APIJsonResponse las serializa en ISO 8601
+    projects_data = list(projects_queryset.values(
+        'id',
+        'project_name',
+        'project_code',
+        'department',
+        'municipality',
+        'status',
+        'start_date',
+        'end_date',
+        'is_active',
+        'created_at',
+        'updated_at',
+        'deactivated_at',
+    ))
+    
+    logger.info(f"API: Proyectos listados con show_inactive={show_inactive}, total={len(projects_data)}")
+    
+    return APIJsonResponse(
         APIResponse.success(
             data={'projects': projects_data},
             message=f'Se encontraron {len(projects_data)} proyectos'
         )
-    )
\ No newline at end of file
+    )
+
+@api_endpoint(methods=['GET'], auth_required=True)
+def list_census_profiles(request):
+    """
+    Endpoint para listar perfiles de censo de beneficiarios.
+    Cada página se obtiene con una sola consulta (beneficiario + 4 satélites).
+    
+    GET /api/v1/beneficiaries/census/
+    
+    Query params:
+        after: int (último id de la página anterior, default: 0)
+        page_size: int (default: 50, max: 200)
+        department: str (optional)
+        municipality: str (optional)
+        community: str (optional)
+        include_inactive: bool (optional)
+    """
+    from webAMG.services.census_service import CensusService
+    
+    try:
+        after_id = int(request.GET.get('after', 0))
+        page_size = int(request.GET.get('page_size', 50))
+    except ValueError:
+        raise BadRequestError('Parámetros de paginación inválidos')
+    
+    result = CensusService.list_profiles(
+        after_id=after_id,
+        page_size=page_size,
+        filters=request.GET,
+        include_inactive=request.GET.get('include_inactive', 'false').lower() == 'true'
+    )
+    
+    return APIJsonResponse(APIResponse.success(
+        data={
+            'profiles': result['items'],
+            'next_after': result['next_after'],
+            'has_next': result['has_next']
+        },
+        message=f"{len(result['items'])} perfiles encontrados"
+    ))
+
+
+@api_endpoint(methods=['GET'], auth_required=True)
+def export_census_profiles(request):
+    """
+    Endpoint para exportar perfiles de censo en CSV.
+    Lee la vista beneficiary_census_profiles por páginas y transmite el archivo
+    sin cargarlo completo en memoria (iterador asíncrono para ASGI).
+    
+    GET /api/v1/beneficiaries/census/export/
+    
+    Query params:
+        department: str (optional)
+        municipality: str (optional)
+        community: str (optional)
+        include_inactive: bool (optional)
+    """
+    from django.http import StreamingHttpResponse
+    from webAMG.services.census_service import CensusService
+    
+    response = StreamingHttpResponse(
+        CensusService.aiter_export_csv(
+            filters=request.GET,
+            include_inactive=request.GET.get('include_inactive', 'false').lower() == 'true'
+        ),
+        content_type='text/csv; charset=utf-8'
+    )
+    response['Content-Disposition'] = 'attachment; filename="censo_beneficiarios.csv"'
+    
+    logger.info(f"Census export requested by {request.user.username}")
+    
+    return response
+
+
+@api_endpoint(methods=['POST'], auth_required=True, roles={'administrador'})
+def import_census(request):
+    """
+    Endpoint para importar una hoja de censo (solo administradores).
+    El archivo se lee por lotes; las filas inválidas o con CUI/DPI repetido
+    se reportan sin detener la importación.
+    
+    POST /api/v1/beneficiaries/census/import/
+    
+    Form data:
+        file: archivo CSV o XLSX
+        dry_run: bool (optional, solo validar)
+    """
+    from webAMG.services.census_import_service import CensusImportService
+    
+    upload = request.FILES.get('file')
+    if upload is None:
+        raise BadRequestError('Debe adjuntar un archivo CSV o XLSX')
+    
+    try:
+        rows = CensusImportService.iter_file_rows(upload.file, upload.name)
+        result = CensusImportService.import_rows(
+            rows,
+            created_by=request.user,
+            dry_run=request.POST.get('dry_run', 'false').lower() == 'true'
+        )
+    except ValueError as e:
+        raise BadRequestError(str(e))
+    
+    logger.info(
+        f"Census import '{upload.name}' by {request.user.username}: "
+        f"{result['created']} created, {result['error_count']} errors"
+    )
+    
+    return APIJsonResponse(APIResponse.success(
+        data={
+            'total': result['total'],
+            'created': result['created'],
+            'duplicates': result['duplicates'],
+            'error_count': result['error_count'],
+            # Se limita la respuesta; el comando import_census lista todos los errores
+            'errors': result['errors'][:CensusImportService.MAX_REPORTED_ERRORS]
+        },
+        message=f"{result['created']} beneficiarios importados"
+    ))
+
+
+@api_endpoint(methods=['GET'], auth_required=True, roles={'administrador'})
+def list_duplicate_candidates(request):
+    """
+    Endpoint con la cola de revisión de beneficiarios duplicados.
+    Los pares se generan con el comando find_duplicates.
+    
+    GET /api/v1/beneficiaries/duplicates/
+    
+    Query params:
+        page: int (default: 1)
+        page_size: int (default: 20, max: 100)
+        status: str (default: 'pendiente', options: 'pendiente', 'fusionado', 'descartado')
+    """
+    from django.core.paginator import Paginator
+    from webAMG.models import DuplicateCandidate, DuplicateStatus
+    from webAMG.services.duplicate_service import DuplicateService
+    
+    try:
+        page = int(request.GET.get('page', 1))
+        page_size = min(int(request.GET.get('page_size', 20)), 100)
+    except ValueError:
+        raise BadRequestError('Parámetros de paginación inválidos')
+    
+    status = request.GET.get('status', DuplicateStatus.PENDIENTE)
+    if status not in DuplicateStatus.values:
+        raise BadRequestError('Estado inválido')
+    
+    queryset = DuplicateCandidate.objects.filter(status=status).select_related(
+        'beneficiary_a', 'beneficiary_b'
+    ).order_by('-score', 'id')
+    
+    paginator = Paginator(queryset, page_size)
+    candidates_page = paginator.get_page(page)
+    items = [DuplicateService.serialize_candidate(candidate) for candidate in candidates_page]
+    
+    return APIJsonResponse(APIResponse.paginated(
+        items=items,
+        page=candidates_page.number,
+        page_size=page_size,
+        total=paginator.count,
+        message=f'{len(items)} posibles duplicados'
+    ))
+
+
+@api_endpoint(methods=['POST'], auth_required=True, roles={'administrador'})
+def merge_duplicate_candidate(request, candidate_id: int):
+    """
+    Endpoint para fusionar un par de beneficiarios duplicados.
+    Las asignaciones a proyectos, fases y evidencias pasan al beneficiario conservado.
+    
+    POST /api/v1/beneficiaries/duplicates/{id}/merge/
+    
+    Body:
+        keep_id: int (id del beneficiario que se conserva)
+    """
+    from webAMG.models import DuplicateCandidate, DuplicateStatus
+    from webAMG.services.duplicate_service import DuplicateService
+    
+    candidate = DuplicateCandidate.objects.filter(id=candidate_id).first()
+    if not candidate:
+        raise NotFoundError('Par de duplicados no encontrado')
+    
+    if candidate.status != DuplicateStatus.PENDIENTE:
+        raise BadRequestError('El par ya fue revisado')
+    
+    data = json.loads(request.body or '{}')
+    try:
+        keep = DuplicateService.merge(candidate, int(data.get('keep_id', 0)), request.user)
+    except (TypeError, ValueError) as e:
+        raise BadRequestError(str(e))
+    
+    logger.info(f"Duplicate candidate {candidate_id} merged into {keep.id} by {request.user.username}")
+    
+    return APIJsonResponse(APIResponse.success(
+        data={'beneficiary_id': keep.id},
+        message='Beneficiarios fusionados exitosamente'
+    ))
+
+
+@api_endpoint(methods=['POST'], auth_required=True, roles={'administrador'})
+def dismiss_duplicate_candidate(request, candidate_id: int):
+    """
+    Endpoint para marcar un par como personas distintas.
+    
+    POST /api/v1/beneficiaries/duplicates/{id}/dismiss/
+    """
+    from webAMG.models import DuplicateCandidate, DuplicateStatus
+    from webAMG.services.duplicate_service import DuplicateService
+    
+    candidate = DuplicateCandidate.objects.filter(id=candidate_id).first()
+    if not candidate:
+        raise NotFoundError('Par de duplicados no encontrado')
+    
+    if candidate.status != DuplicateStatus.PENDIENTE:
+        raise BadRequestError('El par ya fue revisado')
+    
+    DuplicateService.dismiss(candidate, request.user)
+    
+    logger.info(f"Duplicate candidate {candidate_id} dismissed by {request.user.username}")
+    
+    return APIJsonResponse(APIResponse.success(message='Par descartado'))
+
+
+@api_endpoint(methods=['GET'], auth_required=True)
+def global_search(request):
+    """
+    Endpoint de búsqueda global en proyectos, fases, evidencias, actividades
+    y beneficiarios. Usa los índices de texto completo y ordena por relevancia.
+    
+    GET /api/v1/search/?q=agua
+    
+    Query params:
+        q: str (texto a buscar, se buscan prefijos de cada palabra)
+        types: str (optional, separados por coma: project, phase, project_evidence,
+               phase_evidence, activity, beneficiary)
+        limit: int (default: 20, max: 100)
+        include_inactive: bool (optional)
+    """
+    from webAMG.services.search_service import SearchService
+    
+    query = request.GET.get('q', '').strip()
+    if not query:
+        raise BadRequestError('Debe indicar el texto a buscar')
+    
+    types = [t.strip() for t in request.GET.get('types', '').split(',') if t.strip()]
+    invalid = [t for t in types if t not in SearchService.TYPES]
+    if invalid:
+        raise BadRequestError(f'Tipos inválidos: {", ".join(invalid)}')
+    
+    try:
+        limit = int(request.GET.get('limit', SearchService.DEFAULT_LIMIT))
+    except ValueError:
+        raise BadRequestError('Límite inválido')
+    
+    results = SearchService.search(
+        query,
+        types=types or None,
+        include_inactive=request.GET.get('include_inactive', 'false').lower() == 'true',
+        limit=limit
+    )
+    
+    return APIJsonResponse(APIResponse.success(
+        data={'results': results},
+        message=f'{len(results)} resultados encontrados'
+    ))
@@ -2,9 +2,14 @@
 Validadores de input usando Pydantic para las APIs del sistema WebAMG.
 Proporcionan validación robusta y tipado de datos.
 """
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
+from decimal import Decimal
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, field_validator, constr
+import orjson
+from django.http import HttpResponse
+from django.utils.duration import duration_iso_string
+from django.utils.functional import Promise
+from pydantic import BaseModel, Field, field_validator, model_validator, constr
 from webAMG.api.exceptions import ValidationError
 
 
@@ -105,6 +110,24 @@ class UpdateUserRequest(BaseRequestModel):
         return v
 
 
+# Máximo de usuarios por operación masiva
+MAX_BULK_USERS = 100
+
+
+class BulkUpdateUserRequest(UpdateUserRequest):
+    """
+    Modelo de request para actualizar un usuario dentro de una operación masiva.
+    """
+    id: int = Field(gt=0)
+
+
+class BulkDeleteUsersRequest(BaseRequestModel):
+    """
+    Modelo de request para eliminar varios usuarios.
+    """
+    ids: List[int] = Field(min_length=1, max_length=MAX_BULK_USERS)
+
+
 class ProjectCreateRequest(BaseRequestModel):
     """
     Modelo de request para crear proyecto.
@@ -200,6 +223,188 @@ class BeneficiaryCreateRequest(BaseRequestModel):
         return v
 
 
+# Valores aceptados como booleanos en las hojas de censo
+CENSUS_TRUE_VALUES = {'1', 'si', 'sí', 's', 'x', 'true', 'verdadero', 'yes'}
+CENSUS_FALSE_VALUES = {'0', 'no', 'n', 'false', 'falso'}
+
+# Campos de opción del censo y sus valores permitidos
+CENSUS_CHOICE_FIELDS = {
+    'civil_status': ['soltero', 'casado', 'unido', 'separado', 'divorciado', 'viudo'],
+    'ethnicity': ['maya', 'garifuna', 'xinca', 'afrodescendiente', 'mestizo', 'extranjero'],
+    'household_type': ['unipersonal_nuclear', 'extensa', 'compuesta', 'co_residentes'],
+    'education_level': ['ninguno', 'primaria', 'basico', 'diversificado', 'universitario', 'otro'],
+    'school_attendance': ['si', 'no', 'a_veces'],
+    'education_language': ['espanol', 'materno', 'ambos', 'otro'],
+    'housing_tenure': ['propia', 'alquilada', 'cedida_prestada', 'propiedad_comunal', 'otra'],
+    'housing_type': [
+        'casa_formal', 'apartamento', 'cuarto_vecindad', 'rancho',
+        'improvisada', 'colectiva_temporal', 'otra'
+    ],
+}
+
+
+class CensusRowRequest(BaseRequestModel):
+    """
+    Modelo de una fila de la hoja de censo.
+    Las columnas usan los nombres de la exportación del censo, así que un
+    archivo exportado puede volver a importarse. Las columnas desconocidas
+    (id, created_at, ...) se ignoran y las celdas vacías quedan en None.
+    """
+
+    model_config = {
+        'extra': 'ignore',
+        'str_strip_whitespace': True
+    }
+
+    # Ubicación territorial
+    department: constr(min_length=1, max_length=100)
+    municipality: constr(min_length=1, max_length=100)
+    address: Optional[str] = None
+    community: Optional[constr(max_length=150)] = None
+
+    # Información general
+    first_name: constr(min_length=1, max_length=100)
+    last_name: constr(min_length=1, max_length=100)
+    birth_place: Optional[constr(max_length=150)] = None
+    birth_date: Optional[date] = None
+    age: Optional[int] = Field(default=None, ge=0, le=130)
+    cui_dpi: Optional[constr(min_length=13, max_length=13, pattern=r'^\d{13}$')] = None
+    gender: Optional[constr(max_length=20)] = None
+    civil_status: Optional[str] = None
+    ethnicity: Optional[str] = None
+    linguistic_community: Optional[constr(max_length=100)] = None
+    household_type: Optional[str] = None
+    total_household_members: Optional[int] = Field(default=None, ge=0)
+    male_members: Optional[int] = Field(default=None, ge=0)
+    female_members: Optional[int] = Field(default=None, ge=0)
+    phone: Optional[constr(max_length=20)] = None
+    mobile_phone: Optional[constr(max_length=20)] = None
+    email: Optional[constr(max_length=100)] = None
+    notes: Optional[str] = None
+
+    # Salud
+    is_pregnant: Optional[bool] = None
+    is_breastfeeding: Optional[bool] = None
+    has_diabetes: Optional[bool] = None
+    has_high_blood_pressure: Optional[bool] = None
+    has_low_blood_pressure: Optional[bool] = None
+    has_heart_disease: Optional[bool] = None
+    has_kidney_disease: Optional[bool] = None
+    has_cancer: Optional[bool] = None
+    has_respiratory_disease: Optional[bool] = None
+    has_language_disability: Optional[bool] = None
+    has_hearing_disability: Optional[bool] = None
+    has_visual_disability: Optional[bool] = None
+    has_physical_disability: Optional[bool] = None
+    has_intellectual_disability: Optional[bool] = None
+    has_psychosocial_disability: Optional[bool] = None
+    health_notes: Optional[str] = None
+
+    # Educación
+    education_level: Optional[str] = None
+    school_attendance: Optional[str] = None
+    education_language: Optional[str] = None
+    can_read_write: Optional[bool] = None
+    years_of_study: Optional[int] = Field(default=None, ge=0)
+    current_grade: Optional[constr(max_length=50)] = None
+    school_name: Optional[constr(max_length=200)] = None
+    has_cellphone: Optional[bool] = None
+    has_computer: Optional[bool] = None
+    has_internet: Optional[bool] = None
+    education_notes: Optional[str] = None
+
+    # Vivienda
+    housing_tenure: Optional[str] = None
+    housing_type: Optional[str] = None
+    number_of_rooms: Optional[int] = Field(default=None, ge=0)
+    floor_material: Optional[constr(max_length=100)] = None
+    wall_material: Optional[constr(max_length=100)] = None
+    roof_material: Optional[constr(max_length=100)] = None
+    has_electricity: Optional[bool] = None
+    has_piped_water: Optional[bool] = None
+    has_sewage: Optional[bool] = None
+    water_source: Optional[constr(max_length=100)] = None
+    drinking_water_source: Optional[constr(max_length=100)] = None
+    toilet_type: Optional[constr(max_length=100)] = None
+    waste_disposal: Optional[constr(max_length=100)] = None
+    housing_notes: Optional[str] = None
+
+    # Economía
+    economically_active_employed: Optional[bool] = None
+    economically_active_independent: Optional[bool] = None
+    economically_active_entrepreneur: Optional[bool] = None
+    economically_active_day_laborer: Optional[bool] = None
+    homemaker: Optional[bool] = None
+    unemployed: Optional[bool] = None
+    job_seeker: Optional[bool] = None
+    student_only: Optional[bool] = None
+    pensioner_rentier: Optional[bool] = None
+    retired: Optional[bool] = None
+    caregiver: Optional[bool] = None
+    community_position: Optional[bool] = None
+    monthly_income: Optional[Decimal] = Field(default=None, ge=0, max_digits=10, decimal_places=2)
+    receives_social_aid: Optional[bool] = None
+    social_aid_type: Optional[constr(max_length=200)] = None
+    occupation: Optional[constr(max_length=150)] = None
+    workplace: Optional[constr(max_length=200)] = None
+    economy_notes: Optional[str] = None
+
+    @model_validator(mode='before')
+    @classmethod
+    def blank_cells_to_none(cls, data: Any) -> Any:
+        if isinstance(data, dict):
+            return {
+                key: (None if isinstance(value, str) and not value.strip() else value)
+                for key, value in data.items()
+            }
+        return data
+
+    @field_validator('cui_dpi', mode='before')
+    @classmethod
+    def normalize_cui_dpi(cls, v: Any) -> Any:
+        # Las hojas suelen traer el CUI con espacios o guiones, o como número
+        if v is None:
+            return v
+        if isinstance(v, float) and v.is_integer():
+            v = int(v)
+        return str(v).replace(' ', '').replace('-', '')
+
+    @field_validator(
+        'is_pregnant', 'is_breastfeeding', 'has_diabetes', 'has_high_blood_pressure',
+        'has_low_blood_pressure', 'has_heart_disease', 'has_kidney_disease', 'has_cancer',
+        'has_respiratory_disease', 'has_language_disability', 'has_hearing_disability',
+        'has_visual_disability', 'has_physical_disability', 'has_intellectual_disability',
+        'has_psychosocial_disability', 'can_read_write', 'has_cellphone', 'has_computer',
+        'has_internet', 'has_electricity', 'has_piped_water', 'has_sewage',
+        'economically_active_employed', 'economically_active_independent',
+        'economically_active_entrepreneur', 'economically_active_day_laborer', 'homemaker',
+        'unemployed', 'job_seeker', 'student_only', 'pensioner_rentier', 'retired',
+        'caregiver', 'community_position', 'receives_social_aid',
+        mode='before'
+    )
+    @classmethod
+    def parse_census_bool(cls, v: Any) -> Any:
+        if v is None or isinstance(v, bool):
+            return v
+        value = str(v).strip().lower()
+        if value in CENSUS_TRUE_VALUES:
+            return True
+        if value in CENSUS_FALSE_VALUES:
+            return False
+        raise ValueError('Valor booleano inválido (use sí/no)')
+
+    @field_validator(*CENSUS_CHOICE_FIELDS.keys())
+    @classmethod
+    def validate_choice(cls, v: Optional[str], info) -> Optional[str]:
+        if v is None:
+            return v
+        allowed = CENSUS_CHOICE_FIELDS[info.field_name]
+        value = v.lower().replace(' ', '_')
+        if value not in allowed:
+            raise ValueError(f'Debe ser uno de: {", ".join(allowed)}')
+        return value
+
+
 class BaseResponseModel(BaseModel):
     """
     Modelo base para respuestas de API.
@@ -364,6 +569,99 @@ class APIResponse:
         return response
 
 
+# orjson serializa date, datetime, time y UUID de forma nativa (ISO 8601);
+# OPT_NON_STR_KEYS acepta claves int como json.dumps
+JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _json_default(value: Any) -> Any:
+    """Tipos que orjson no conoce, con la misma salida que DjangoJSONEncoder."""
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, timedelta):
+        return duration_iso_string(value)
+    if isinstance(value, Promise):
+        return str(value)
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+def dumps_json(data: Any) -> bytes:
+    """Serializa data a JSON (bytes UTF-8) con orjson."""
+    return orjson.dumps(data, default=_json_default, option=JSON_OPTIONS)
+
+
+class APIJsonResponse(HttpResponse):
+    """
+    Respuesta JSON serializada con orjson; reemplaza a JsonResponse en las APIs
+    y vistas AJAX. Acepta date, datetime, Decimal y UUID sin convertirlos antes.
+    
+    Args:
+        data: Datos a serializar (dict salvo que safe=False)
+        safe: Si solo se permiten diccionarios, como en JsonResponse
+    """
+    
+    def __init__(self, data: Any, safe: bool = True, **kwargs):
+        if safe and not isinstance(data, dict):
+            raise TypeError('In order to allow non-dict objects to be serialized set the safe parameter to False.')
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(content=dumps_json(data), **kwargs)
+
+
+def validate_request_list(
+    items: Any,
+    model_class: type,
+    max_items: Optional[int] = None
+):
+    """
+    Valida una lista de elementos con un solo TypeAdapter(List[model_class]).
+    Los elementos inválidos se separan con sus errores y el resto se vuelve a
+    validar, así un error no descarta toda la lista.
+    
+    Args:
+        items: Lista de diccionarios a validar
+        model_class: Clase de modelo Pydantic de cada elemento
+        max_items: Máximo de elementos permitidos
+    
+    Returns:
+        Tupla (lista de (índice, modelo) válidos, lista de {'index', 'errors'})
+    
+    Raises:
+        ValidationError: Si items no es una lista o excede max_items
+    """
+    from pydantic import TypeAdapter, ValidationError as PydanticValidationError
+    
+    if not isinstance(items, list) or not items:
+        raise ValidationError(
+            'Se requiere una lista con al menos un elemento',
+            details={'validation_errors': {'items': 'Lista vacía o inválida'}}
+        )
+    if max_items is not None and len(items) > max_items:
+        raise ValidationError(
+            f'Máximo {max_items} elementos por petición',
+            details={'validation_errors': {'items': 'Demasiados elementos'}}
+        )
+    
+    adapter = TypeAdapter(List[model_class])
+    errors: Dict[int, Dict[str, str]] = {}
+    pending = list(enumerate(items))
+    models = []
+    while pending:
+        try:
+            models = adapter.validate_python([item for _, item in pending])
+            break
+        except PydanticValidationError as e:
+            failed = set()
+            for error in e.errors():
+                position = error['loc'][0]
+                field = '.'.join(str(loc) for loc in error['loc'][1:]) or 'general'
+                failed.add(position)
+                errors.setdefault(pending[position][0], {})[field] = error['msg']
+            pending = [item for position, item in enumerate(pending) if position not in failed]
+    
+    valid = [(index, model) for (index, _), model in zip(pending, models)]
+    return valid, [{'index': index, 'errors': errs} for index, errs in sorted(errors.items())]
+
+
 def validate_request_data(
     data: Dict[str, Any],
     model_class: type
@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class WebamgConfig(AppConfig):
     name = 'webAMG'
+
+    def ready(self):
+        # Registrar las señales de la aplicación
+        from webAMG import signals  # noqa: F401
@@ -4,9 +4,54 @@ Compatible con el esquema PostgreSQL de BasedeDatos.txt.
 """
 from django.contrib.auth.backends import BaseBackend
 from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.db.models import Q
 from .models import User
 
 
+# Columnas que se cargan para request.user; password_hash queda diferido.
+# Van en el orden de _meta.concrete_fields: User.from_db asigna los valores
+# en ese orden cuando faltan columnas, no en el de la lista de nombres.
+USER_FIELDS = tuple(
+    field.attname for field in User._meta.concrete_fields if field.attname != 'password_hash'
+)
+
+# Segundos que un usuario permanece en la caché compartida entre peticiones
+USER_CACHE_TTL = 30
+
+
+def user_cache_key(user_id):
+    """Llave de caché del usuario cargado por get_user."""
+    return f'auth_user:{user_id}'
+
+
+def invalidate_cached_user(user_id):
+    """Descarta el usuario de la caché (se llama al guardar o eliminar)."""
+    cache.delete(user_cache_key(user_id))
+
+
+def _lookup_queryset(username):
+    """
+    Una sola consulta por username o email, sin distinguir mayúsculas.
+    Usa los índices funcionales UPPER(username) y UPPER(email).
+    """
+    return User.objects.filter(Q(username__iexact=username) | Q(email__iexact=username))[:3]
+
+
+def _pick_user(users, username):
+    """
+    Elige el usuario entre las coincidencias: primero el username exacto,
+    luego cualquier username y por último el email.
+    """
+    for user in users:
+        if user.username == username:
+            return user
+    for user in users:
+        if user.username.lower() == username.lower():
+            return user
+    return users[0] if users else None
+
+
 class CustomUserBackend(BaseBackend):
     """
     Backend de autenticación personalizado que usa el modelo User
@@ -15,35 +60,59 @@ class CustomUserBackend(BaseBackend):
 
     def authenticate(self, request, username=None, password=None, **kwargs):
         """
-        Autentica un usuario usando username y password.
+        Autentica un usuario usando username (o email) y password.
         Verifica el password contra password_hash usando bcrypt.
         """
         if username is None:
             username = kwargs.get(User.USERNAME_FIELD)
+        if not username:
+            return None
 
-        try:
-            # Buscar usuario por username
-            user = User.objects.get(username=username)
-        except User.DoesNotExist:
-            # Buscar usuario por email como alternativa
-            try:
-                user = User.objects.get(email=username)
-            except User.DoesNotExist:
-                return None
+        user = _pick_user(list(_lookup_queryset(username)), username)
+        if user is None:
+            return None
 
         # Verificar la contraseña
         if user.check_password(password) and user.is_active:
             return user
         return None
 
+    async def aauthenticate(self, request, username=None, password=None, **kwargs):
+        """
+        Versión asíncrona de authenticate para vistas async.
+        La consulta usa el ORM asíncrono y bcrypt corre en el pool de
+        PasswordService, así que el login no bloquea otras peticiones.
+        """
+        if username is None:
+            username = kwargs.get(User.USERNAME_FIELD)
+        if not username:
+            return None
+
+        user = _pick_user([user async for user in _lookup_queryset(username)], username)
+        if user is None:
+            return None
+
+        # Verificar la contraseña
+        if await user.acheck_password(password) and user.is_active:
+            return user
+        return None
+
     def get_user(self, user_id):
         """
         Retorna el usuario con el ID proporcionado.
+        Django ya guarda el resultado en la petición (request.user); entre
+        peticiones se usa una caché corta con las columnas de USER_FIELDS,
+        que se invalida cuando cambia el usuario (updated_at).
         """
-        try:
-            return User.objects.get(pk=user_id)
-        except User.DoesNotExist:
-            return None
+        key = user_cache_key(user_id)
+        values = cache.get(key)
+        if values is not None:
+            return User.from_db('default', USER_FIELDS, values)
+
+        user = User.objects.filter(pk=user_id).only(*USER_FIELDS).first()
+        if user is not None:
+            cache.set(key, [getattr(user, field) for field in USER_FIELDS], USER_CACHE_TTL)
+        return user
 
     def has_perm(self, user_obj, perm, obj=None):
         """
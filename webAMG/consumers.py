@@ -0,0 +1,53 @@
+"""
+Consumers de WebSocket (Channels) de la aplicación webAMG.
+"""
+from channels.db import database_sync_to_async
+from channels.generic.websocket import AsyncJsonWebsocketConsumer
+from webAMG.api.validators import dumps_json
+from webAMG.models import Project
+from webAMG.services.project_event_service import ProjectEventService
+
+
+class ProjectEventsConsumer(AsyncJsonWebsocketConsumer):
+    """
+    Eventos en tiempo real de un proyecto (ws/projects/<project_id>/).
+
+    Solo acepta usuarios con sesión válida (misma cookie session_token que las
+    páginas) y proyectos activos. El cliente no envía mensajes; recibe los
+    eventos que publica ProjectEventService.
+    """
+
+    @database_sync_to_async
+    def _authorize(self, project_id: int) -> bool:
+        session = self.scope.get('session')
+        if session is None or session.get_user() is None:
+            return False
+        return Project.objects.filter(pk=project_id).exists()
+
+    async def connect(self):
+        self.project_id = self.scope['url_route']['kwargs']['project_id']
+        self.group_name = ProjectEventService.group_name(self.project_id)
+        if not await self._authorize(self.project_id):
+            # Cerrar antes de aceptar responde 403 y el navegador solo ve 1006;
+            # aceptando primero, el cliente recibe 4403 y deja de reintentar
+            await self.accept()
+            await self.close(code=4403)
+            return
+        await self.channel_layer.group_add(self.group_name, self.channel_name)
+        await self.accept()
+
+    async def disconnect(self, code):
+        if self.channel_layer is not None and getattr(self, 'group_name', None):
+            await self.channel_layer.group_discard(self.group_name, self.channel_name)
+
+    async def receive_json(self, content, **kwargs):
+        # Canal de solo lectura: los cambios se hacen por las vistas HTTP
+        pass
+
+    async def project_event(self, message):
+        """Reenvía al navegador un evento del grupo del proyecto."""
+        await self.send_json(message['event'])
+
+    @classmethod
+    async def encode_json(cls, content):
+        return dumps_json(content).decode()
@@ -2,6 +2,7 @@
 Componentes de ReactPy para el sistema WebAMG.
 """
 from reactpy import component, html, hooks
+from webAMG.core.loaders import use_dashboard_stats, use_project_row, use_recent_project_ids
 
 
 @component
@@ -336,3 +337,96 @@ def confirm_dialog(title: str, message: str, on_confirm, on_cancel):
             )
         )
     )
+
+
+# =====================================================
+# COMPONENTES CON DATOS (ver webAMG.core.loaders)
+# =====================================================
+
+@component
+def dashboard_stats():
+    """Tarjetas de estadísticas del dashboard con datos reales (en caché)."""
+    stats = use_dashboard_stats()
+
+    if stats.loading:
+        return loading_spinner()
+    if stats.error or stats.data is None:
+        return empty_state("No se pudieron cargar las estadísticas")
+
+    data = stats.data
+    cards = [
+        ("Proyectos Activos", f"{data['active_projects']:,}", "fa-project-diagram", "primary", f"+{data['new_projects']} este mes"),
+        ("Beneficiarios", f"{data['beneficiaries']:,}", "fa-users", "accent", f"+{data['new_beneficiaries']} este mes"),
+        ("Presupuesto Ejecutado", f"{data['budget_executed']}%", "fa-dollar-sign", "secondary", None),
+        ("Actividades", f"{data['activities']:,}", "fa-tasks", "primary", f"{data['activities_this_month']} este mes"),
+    ]
+    return html.div(
+        {"class_name": "grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-6 mb-8"},
+        [
+            dashboard_stat_card(title, value, f'<i class="fas {icon} text-xl"></i>', color, trend, key=title)
+            for title, value, icon, color, trend in cards
+        ]
+    )
+
+
+@component
+def pending_duplicates_badge():
+    """Badge con el número de posibles beneficiarios duplicados pendientes."""
+    stats = use_dashboard_stats()
+    count = stats.data['pending_duplicates'] if stats.data else 0
+    return notification_badge(count)
+
+
+@component
+def project_row_by_id(project_id: int):
+    """
+    Fila de proyecto que carga sus datos por id. Las filas de un mismo árbol
+    comparten una sola consulta (BatchLoader).
+
+    Args:
+        project_id: Id del proyecto
+    """
+    row = use_project_row(project_id)
+
+    if row.loading:
+        return html.tr(
+            html.td({"class_name": "py-4 px-4 text-sm text-gray-400", "col_span": 4}, "Cargando...")
+        )
+    if row.data is None:
+        return html.tr()
+    return project_row(**row.data)
+
+
+@component
+def recent_projects(limit: int = 5):
+    """
+    Tabla de los proyectos modificados más recientemente.
+
+    Args:
+        limit: Número de proyectos a mostrar
+    """
+    project_ids = use_recent_project_ids(limit)
+
+    if project_ids.loading:
+        return loading_spinner()
+    if project_ids.error:
+        return empty_state("No se pudieron cargar los proyectos")
+    if not project_ids.data:
+        return empty_state("No hay proyectos registrados")
+
+    header_class = "text-left py-3 px-4 text-sm font-semibold text-gray-600"
+    return html.table(
+        {"class_name": "w-full"},
+        html.thead(
+            html.tr(
+                {"class_name": "border-b border-gray-100"},
+                html.th({"class_name": header_class}, "Proyecto"),
+                html.th({"class_name": header_class}, "Estado"),
+                html.th({"class_name": header_class}, "Progreso"),
+                html.th({"class_name": header_class}, "Fecha"),
+            )
+        ),
+        html.tbody(
+            [project_row_by_id(project_id, key=project_id) for project_id in project_ids.data]
+        )
+    )
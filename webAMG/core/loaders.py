@@ -0,0 +1,146 @@
+"""
+Capa de datos de los componentes de ReactPy.
+
+Cada componente montado con {% component %} tiene su propio WebSocket. Los
+loaders se guardan en el scope de esa conexión (use_loaders), así todos los
+componentes de un mismo árbol comparten la memoización: varios project_row_by_id
+piden sus filas en el mismo ciclo del event loop y BatchLoader las resuelve
+con una sola consulta (pk__in) en lugar de una por fila.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+from django.core.exceptions import PermissionDenied
+from channels.db import database_sync_to_async
+from reactpy_django.hooks import use_query, use_scope
+from webAMG.services.dashboard_service import DashboardService
+
+LOADERS_SCOPE_KEY = 'webamg_loaders'
+
+
+class BatchLoader:
+    """
+    Agrupa en una llamada a batch_func las claves pedidas con load() en el
+    mismo ciclo del event loop y memoiza el resultado de cada clave.
+
+    batch_func recibe la lista de claves y devuelve un diccionario
+    clave -> valor; las claves ausentes se resuelven como None.
+    """
+
+    def __init__(self, batch_func: Callable[[List[Hashable]], Awaitable[Dict[Hashable, Any]]]):
+        self._batch_func = batch_func
+        self._futures: Dict[Hashable, asyncio.Future] = {}
+        self._pending: List[Tuple[Hashable, asyncio.Future]] = []
+        self._tasks: set = set()
+
+    async def load(self, key: Hashable) -> Any:
+        """Valor de una clave; la primera petición programa el lote."""
+        future = self._futures.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._futures[key] = loop.create_future()
+            self._pending.append((key, future))
+            if len(self._pending) == 1:
+                task = loop.create_task(self._dispatch())
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+        # shield: cancelar un componente no cancela el lote de los demás
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Iterable[Hashable]) -> List[Any]:
+        """Valores de varias claves en el mismo lote."""
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def clear(self, key: Optional[Hashable] = None) -> None:
+        """Olvida una clave (o todas) para que la próxima carga vuelva a consultar."""
+        if key is None:
+            self._futures.clear()
+        else:
+            self._futures.pop(key, None)
+
+    async def _dispatch(self) -> None:
+        # Un ciclo más para reunir las cargas de los componentes hermanos
+        await asyncio.sleep(0)
+        pending, self._pending = self._pending, []
+        keys = [key for key, _ in pending]
+        try:
+            results = await self._batch_func(keys)
+        except Exception as e:
+            # Sin memoizar el error: la próxima carga reintenta
+            for key, future in pending:
+                if self._futures.get(key) is future:
+                    del self._futures[key]
+                future.set_exception(e)
+        else:
+            for key, future in pending:
+                future.set_result(results.get(key))
+
+
+class DashboardLoaders:
+    """Loaders de una conexión de ReactPy; exigen una sesión válida."""
+
+    def __init__(self, scope: Dict[str, Any]):
+        self._scope = scope
+        self._authorized: Optional[asyncio.Future] = None
+        self.project_rows = BatchLoader(self._guard(DashboardService.project_rows))
+
+    @database_sync_to_async
+    def _has_user(self) -> bool:
+        session = self._scope.get('session')
+        return session is not None and session.get_user() is not None
+
+    async def authorize(self) -> None:
+        """Verifica la sesión una sola vez por conexión."""
+        if self._authorized is None:
+            self._authorized = asyncio.ensure_future(self._has_user())
+        if not await asyncio.shield(self._authorized):
+            raise PermissionDenied('Sesión no válida')
+
+    def _guard(self, query: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        async def guarded(*args, **kwargs):
+            await self.authorize()
+            return await query(*args, **kwargs)
+        return guarded
+
+    async def stats(self) -> Dict[str, Any]:
+        await self.authorize()
+        return await DashboardService.stats()
+
+    async def recent_project_ids(self, limit: int) -> List[int]:
+        await self.authorize()
+        return await DashboardService.recent_project_ids(limit)
+
+
+def use_loaders() -> DashboardLoaders:
+    """Loaders de la conexión actual (se crean con el primer componente)."""
+    scope = use_scope()
+    if LOADERS_SCOPE_KEY not in scope:
+        scope[LOADERS_SCOPE_KEY] = DashboardLoaders(scope)
+    return scope[LOADERS_SCOPE_KEY]
+
+
+# Funciones de consulta con identidad estable entre renders, como exige use_query
+async def _load_stats(loaders: DashboardLoaders) -> Dict[str, Any]:
+    return await loaders.stats()
+
+
+async def _load_recent_project_ids(loaders: DashboardLoaders, limit: int) -> List[int]:
+    return await loaders.recent_project_ids(limit)
+
+
+async def _load_project_row(loaders: DashboardLoaders, project_id: int) -> Optional[Dict[str, Any]]:
+    return await loaders.project_rows.load(project_id)
+
+
+def use_dashboard_stats():
+    """Estadísticas del panel (Query con data/loading/error)."""
+    return use_query(_load_stats, {'loaders': use_loaders()}, postprocessor=None)
+
+
+def use_recent_project_ids(limit: int):
+    """Ids de los proyectos recientes (Query con data/loading/error)."""
+    return use_query(_load_recent_project_ids, {'loaders': use_loaders(), 'limit': limit}, postprocessor=None)
+
+
+def use_project_row(project_id: int):
+    """Argumentos de project_row de un proyecto, cargados por lotes."""
+    return use_query(_load_project_row, {'loaders': use_loaders(), 'project_id': project_id}, postprocessor=None)
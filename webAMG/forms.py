@@ -1,6 +1,7 @@
 """
 Formularios de la aplicación webAMG.
 """
+from django.contrib.auth import aauthenticate
 from django.contrib.auth.forms import AuthenticationForm
 
 
@@ -23,3 +24,26 @@ class LoginForm(AuthenticationForm):
             'class': 'input-custom w-full pl-12 pr-12 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-[#8a4534]/20 transition-all',
             'placeholder': 'Ingrese su contraseña',
         })
+
+    async def ais_valid(self):
+        """
+        Valida el formulario desde una vista asíncrona.
+        La autenticación (bcrypt) se hace con aauthenticate antes de validar,
+        así clean() no vuelve a verificar la contraseña de forma síncrona.
+        """
+        username = self.data.get('username')
+        password = self.data.get('password')
+        if username and password:
+            self.user_cache = await aauthenticate(self.request, username=username, password=password)
+        self._authenticated_async = True
+        return self.is_valid()
+
+    def clean(self):
+        if not getattr(self, '_authenticated_async', False):
+            return super().clean()
+
+        if self.cleaned_data.get('username') is not None and self.cleaned_data.get('password'):
+            if self.user_cache is None:
+                raise self.get_invalid_login_error()
+            self.confirm_login_allowed(self.user_cache)
+        return self.cleaned_data
@@ -0,0 +1,128 @@
+"""
+Comando de gestión de Django para medir el costo de serializar respuestas
+grandes con JsonResponse (json + DjangoJSONEncoder, fechas con strftime por
+campo) frente a APIJsonResponse (orjson, fechas nativas):
+
+    python manage.py benchmark_json --rows 5000 --repeat 20
+
+Los datos son sintéticos, con la forma de list_projects y de la lista de
+beneficiarios; no se consulta la base de datos.
+"""
+import time
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from django.core.management.base import BaseCommand
+from django.http import JsonResponse
+from webAMG.api.validators import APIJsonResponse, APIResponse
+
+
+def build_projects(rows: int):
+    """Filas de proyecto como las devuelve values() en list_projects."""
+    start = date(2024, 1, 1)
+    created = datetime(2024, 1, 1, 8, 30, tzinfo=timezone.utc)
+    return [
+        {
+            'id': i,
+            'project_name': f'Proyecto de agua potable {i}',
+            'project_code': f'AMG-{i:05d}',
+            'department': 'Sololá',
+            'municipality': 'San Lucas Tolimán',
+            'status': 'en_progreso',
+            'start_date': start + timedelta(days=i % 365),
+            'end_date': start + timedelta(days=i % 365 + 90),
+            'is_active': True,
+            'created_at': created + timedelta(minutes=i),
+            'updated_at': created + timedelta(hours=i),
+            'deactivated_at': None,
+            'estimated_budget': Decimal('125000.50') + i,
+        }
+        for i in range(rows)
+    ]
+
+
+def build_beneficiaries(rows: int):
+    """Filas de beneficiario como las del censo."""
+    return [
+        {
+            'id': i,
+            'first_name': 'María José',
+            'last_name': f'García López {i}',
+            'cui_dpi': f'{2500000000000 + i}',
+            'birth_date': date(1980, 1, 1) + timedelta(days=i % 9000),
+            'community': 'Cerro de Oro',
+            'monthly_income': Decimal('1850.00') + i % 500,
+            'created_at': datetime(2025, 3, 1, tzinfo=timezone.utc) + timedelta(minutes=i),
+        }
+        for i in range(rows)
+    ]
+
+
+def legacy_format(rows):
+    """Implementación anterior: strftime por campo antes de JsonResponse."""
+    formatted = []
+    for row in rows:
+        item = dict(row)
+        for key, value in row.items():
+            if isinstance(value, datetime):
+                item[key] = value.strftime('%Y-%m-%d %H:%M:%S')
+            elif isinstance(value, date):
+                item[key] = value.strftime('%Y-%m-%d')
+        formatted.append(item)
+    return formatted
+
+
+class Command(BaseCommand):
+    help = 'Compara el costo de serialización de JsonResponse y APIJsonResponse en listas grandes'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=5000,
+            help='Filas por lista'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=20,
+            help='Respuestas serializadas por caso (se toma la mejor)'
+        )
+
+    def _best(self, function, repeat):
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            function()
+            best = min(best, time.perf_counter() - start)
+        return best * 1000
+
+    def handle(self, *args, **options):
+        rows = max(1, options['rows'])
+        repeat = max(1, options['repeat'])
+        cases = [
+            ('Proyectos', 'projects', build_projects(rows)),
+            ('Beneficiarios', 'beneficiaries', build_beneficiaries(rows)),
+        ]
+
+        lines = []
+        for label, key, data in cases:
+            def legacy():
+                return JsonResponse(APIResponse.success(data={key: legacy_format(data)}))
+
+            def current():
+                return APIJsonResponse(APIResponse.success(data={key: data}))
+
+            before = self._best(legacy, repeat)
+            after = self._best(current, repeat)
+            size = len(current().content) / 1024
+            lines.append(
+                f'  {label}: {before:.2f} ms -> {after:.2f} ms '
+                f'({before / after:.1f}x, {size:.0f} KiB)'
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Serialización por respuesta ({rows} filas, mejor de {repeat}):\n'
+                + '\n'.join(lines)
+            )
+        )
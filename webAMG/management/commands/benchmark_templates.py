@@ -0,0 +1,159 @@
+"""
+Comando de gestión de Django que mide el tiempo de render de
+project_detail.html con datos en memoria (50 fases o 500 fotos), sin base de
+datos y sin la caché de fragmentos:
+
+    python manage.py benchmark_templates --repeat 20
+
+Compara el cargador en caché de settings.TEMPLATES (plantilla compilada una
+vez) con un Engine sin caché, que compila la plantilla en cada petición.
+"""
+import time
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.template import Engine, RequestContext, engines
+from django.test import RequestFactory
+from webAMG.models import Project, User
+
+PHASES = 50
+EVIDENCES = 50
+PHOTOS_PER_EVIDENCE = 10
+
+
+class FakeRelated(list):
+    """Lista con la interfaz de un related manager que usa la plantilla (all, count)."""
+
+    def all(self):
+        return self
+
+    def count(self):
+        return len(self)
+
+
+def build_context(has_phases: bool) -> dict:
+    """Contexto de project_detail_page con fases (50) o evidencias (500 fotos)."""
+    start = date(2025, 1, 6)
+    now = datetime(2025, 6, 1, 15, 0, tzinfo=timezone.utc)
+    creator = SimpleNamespace(full_name='Ana Pérez')
+    project = Project(
+        id=1,
+        project_name='Mejoramiento del sistema de agua potable',
+        project_code='AMG-00001',
+        description='Descripción del proyecto. ' * 20,
+        objectives='Objetivos del proyecto. ' * 10,
+        what_is_done='Trabajo realizado. ' * 10,
+        location='Aldea Cerro de Oro',
+        municipality='San Lucas Tolimán',
+        department='Sololá',
+        start_date=start,
+        end_date=start + timedelta(days=365),
+        estimated_budget=Decimal('250000.00'),
+        actual_budget=Decimal('180500.50'),
+        status='en_progreso',
+        has_phases=has_phases,
+        updated_at=now,
+    )
+    beneficiaries = [
+        SimpleNamespace(id=i, first_name='María', last_name=f'García {i}', cui_dpi=f'{2500000000000 + i}', community='Cerro de Oro')
+        for i in range(100)
+    ]
+    phases = [
+        SimpleNamespace(
+            id=i,
+            phase_name=f'Fase {i + 1}',
+            description='Descripción de la fase. ' * 5,
+            start_date=start + timedelta(days=7 * i),
+            end_date=start + timedelta(days=7 * i + 6),
+            status='en_progreso',
+            beneficiaries=FakeRelated(range(20)),
+            evidences=FakeRelated(range(10)),
+        )
+        for i in range(PHASES)
+    ] if has_phases else []
+    evidences = [
+        SimpleNamespace(
+            id=i,
+            start_date=start + timedelta(days=i),
+            end_date=start + timedelta(days=i + 2),
+            description='Descripción de la evidencia. ' * 5,
+            created_by=creator,
+            created_at=now,
+            updated_at=now,
+            photos=FakeRelated(
+                SimpleNamespace(id=i * PHOTOS_PER_EVIDENCE + j, photo_url=f'evidences/{i}/{j}.jpg', caption=f'Foto {j}')
+                for j in range(PHOTOS_PER_EVIDENCE)
+            ),
+        )
+        for i in range(EVIDENCES)
+    ] if not has_phases else []
+
+    return {
+        'project': project,
+        'project_beneficiaries': beneficiaries,
+        'evidences': evidences,
+        'phases': phases,
+        'phases_beneficiaries': {phase.id: list(range(20)) for phase in phases},
+        'all_beneficiaries': beneficiaries,
+        'fragment_cache_ttl': 0,
+    }
+
+
+class Command(BaseCommand):
+    help = 'Mide el render de project_detail.html con 50 fases o 500 fotos'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=20,
+            help='Renders por caso (se toma la mejor)'
+        )
+
+    def _best(self, function, repeat):
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            function()
+            best = min(best, time.perf_counter() - start)
+        return best * 1000
+
+    def handle(self, *args, **options):
+        repeat = max(1, options['repeat'])
+        request = RequestFactory().get('/dashboard/proyectos/1/')
+        request.user = User(id=1, username='benchmark', full_name='Usuario Benchmark', role='administrador')
+
+        cached = engines['django']
+        # Mismos directorios y context processors, sin cargador en caché
+        uncached = Engine(
+            dirs=cached.engine.dirs,
+            context_processors=cached.engine.context_processors,
+            libraries=cached.engine.libraries,
+            loaders=settings.TEMPLATE_LOADERS,
+        )
+        template_name = 'dashboard/project_detail.html'
+        cached.get_template(template_name)
+
+        lines = []
+        for label, has_phases in ((f'{PHASES} fases', True), (f'{EVIDENCES * PHOTOS_PER_EVIDENCE} fotos', False)):
+            context = build_context(has_phases)
+
+            def with_cache():
+                return cached.get_template(template_name).render(context, request)
+
+            def without_cache():
+                return uncached.get_template(template_name).render(RequestContext(request, context))
+
+            after = self._best(with_cache, repeat)
+            before = self._best(without_cache, repeat)
+            size = len(with_cache()) / 1024
+            lines.append(f'  {label}: {before:.2f} ms -> {after:.2f} ms ({size:.0f} KiB)')
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Render de {template_name} sin / con cargador en caché (mejor de {repeat}):\n'
+                + '\n'.join(lines)
+            )
+        )
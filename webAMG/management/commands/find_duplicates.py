@@ -0,0 +1,38 @@
+"""
+Comando de gestión de Django para detectar beneficiarios duplicados.
+Es incremental: solo procesa beneficiarios nuevos o modificados desde la
+última ejecución, por lo que puede programarse con frecuencia.
+"""
+from django.core.management.base import BaseCommand
+from webAMG.services.duplicate_service import DuplicateService
+
+
+class Command(BaseCommand):
+    help = 'Indexa beneficiarios nuevos o modificados y encola posibles duplicados'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DuplicateService.BATCH_SIZE,
+            help='Número de beneficiarios por lote'
+        )
+        parser.add_argument(
+            '--rebuild',
+            action='store_true',
+            help='Borra el índice y reindexa el censo completo'
+        )
+
+    def handle(self, *args, **options):
+        result = DuplicateService.index_pending(
+            batch_size=options['batch_size'],
+            rebuild=options['rebuild']
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Detección de duplicados completada:\n'
+                f'  Beneficiarios indexados: {result["indexed"]}\n'
+                f'  Pares sobre el umbral: {result["candidates"]}'
+            )
+        )
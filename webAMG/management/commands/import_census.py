@@ -0,0 +1,70 @@
+"""
+Comando de gestión de Django para importar una hoja de censo (CSV o XLSX).
+Las columnas usan los mismos nombres que la exportación del censo.
+"""
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.auth import get_user_model
+from webAMG.services.census_import_service import CensusImportService
+
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'Importa beneficiarios y sus datos de censo desde un archivo CSV o XLSX'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'path',
+            type=str,
+            help='Ruta del archivo CSV o XLSX'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=CensusImportService.BATCH_SIZE,
+            help='Número de filas por lote'
+        )
+        parser.add_argument(
+            '--user',
+            type=str,
+            help='Usuario registrado como creador de los beneficiarios'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Solo valida el archivo y detecta duplicados, sin guardar'
+        )
+
+    def handle(self, *args, **options):
+        created_by = None
+        if options['user']:
+            created_by = User.objects.filter(username=options['user']).first()
+            if created_by is None:
+                raise CommandError(f'El usuario "{options["user"]}" no existe')
+
+        try:
+            with open(options['path'], 'rb') as file_obj:
+                rows = CensusImportService.iter_file_rows(file_obj, options['path'])
+                result = CensusImportService.import_rows(
+                    rows,
+                    created_by=created_by,
+                    batch_size=options['batch_size'],
+                    dry_run=options['dry_run']
+                )
+        except (OSError, ValueError) as e:
+            raise CommandError(str(e))
+
+        for error in result['errors']:
+            details = '; '.join(f'{field}: {msg}' for field, msg in error['errors'].items())
+            self.stderr.write(f'Fila {error["row"]}: {details}')
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Importación {"validada" if options["dry_run"] else "completada"}:\n'
+                f'  Filas leídas: {result["total"]}\n'
+                f'  Beneficiarios creados: {result["created"]}\n'
+                f'  Duplicados: {result["duplicates"]}\n'
+                f'  Filas con errores: {result["error_count"]}'
+            )
+        )
@@ -0,0 +1,128 @@
+"""
+Comando de gestión de Django que repite con EXPLAIN las consultas más
+frecuentes de las vistas y muestra qué índice usa cada una:
+
+    python manage.py index_advisor --analyze --show-plans
+
+Con tablas pequeñas PostgreSQL prefiere Seq Scan aunque exista el índice;
+los resultados son significativos con datos de tamaño real.
+"""
+import re
+from typing import Dict, List
+from django.core.management.base import BaseCommand, CommandError
+from webAMG.models import (
+    Beneficiary,
+    EvidencePhoto,
+    PhaseEvidence,
+    PhaseEvidencePhoto,
+    Project,
+    ProjectEvidence,
+    ProjectPhase,
+)
+from webAMG.services.date_range_service import DateRangeService
+from webAMG.services.user_service import UserService
+
+INDEX_SCAN_RE = re.compile(r'Index (?:Only )?Scan (?:Backward )?using (\S+)')
+SEQ_SCAN_RE = re.compile(r'Seq Scan on (\S+)')
+SORT_RE = re.compile(r'^\s*(?:->\s*)?(?:Incremental )?Sort\s+\(', re.MULTILINE)
+
+
+def summarize_plan(plan: str) -> Dict[str, List[str]]:
+    """
+    Resume un plan de EXPLAIN (formato texto).
+
+    Returns:
+        Diccionario con 'indexes' (índices usados), 'seq_scans' (tablas
+        recorridas completas) y 'sorts' (nodos Sort)
+    """
+    return {
+        'indexes': list(dict.fromkeys(INDEX_SCAN_RE.findall(plan))),
+        'seq_scans': list(dict.fromkeys(SEQ_SCAN_RE.findall(plan))),
+        'sorts': SORT_RE.findall(plan),
+    }
+
+
+def _first_id(queryset) -> int:
+    return queryset.order_by('pk').values_list('pk', flat=True).first() or 0
+
+
+def query_patterns() -> Dict[str, object]:
+    """
+    Consultas de las vistas (nombre -> queryset), con los ids de las
+    primeras filas activas como parámetros de ejemplo.
+    """
+    project_id = _first_id(Project.objects.all())
+    phase_id = _first_id(ProjectPhase.objects.all())
+    evidence_id = _first_id(ProjectEvidence.objects.all())
+    phase_evidence_id = _first_id(PhaseEvidence.objects.all())
+
+    return {
+        'project_list': Project.objects.order_by('-created_at')[:20],
+        'project_list_inactive': Project.all_objects.filter(is_active=False).order_by('-updated_at')[:20],
+        'project_detail_phases': ProjectPhase.objects.filter(project_id=project_id).order_by('phase_number'),
+        'project_detail_evidences': ProjectEvidence.objects.filter(project_id=project_id).order_by('-start_date', '-created_at'),
+        'project_list_date_range': DateRangeService.in_year(Project.objects.all(), 2025).order_by('-created_at')[:20],
+        'project_detail_evidences_date_range': DateRangeService.in_year(
+            ProjectEvidence.objects.filter(project_id=project_id), 2025
+        ).order_by('-start_date', '-created_at'),
+        'phase_detail_evidences': PhaseEvidence.objects.filter(phase_id=phase_id).order_by('-start_date', '-created_at'),
+        'evidence_photos': EvidencePhoto.objects.filter(evidence_id=evidence_id).order_by('photo_order'),
+        'phase_evidence_photos': PhaseEvidencePhoto.objects.filter(phase_evidence_id=phase_evidence_id).order_by('photo_order'),
+        'beneficiary_selector': Beneficiary.objects.filter(is_active=True).order_by('first_name', 'last_name'),
+        'users_page': UserService.filter_users(is_active=True)[:UserService.DEFAULT_PAGE_SIZE],
+    }
+
+
+class Command(BaseCommand):
+    help = 'Ejecuta EXPLAIN sobre las consultas frecuentes de las vistas y resume los índices usados'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'patterns',
+            nargs='*',
+            help='Consultas a revisar (por defecto, todas)'
+        )
+        parser.add_argument(
+            '--analyze',
+            action='store_true',
+            help='Usa EXPLAIN ANALYZE (ejecuta las consultas)'
+        )
+        parser.add_argument(
+            '--show-plans',
+            action='store_true',
+            help='Muestra el plan completo de cada consulta'
+        )
+
+    def handle(self, *args, **options):
+        patterns = query_patterns()
+        names = options['patterns'] or list(patterns)
+        unknown = [name for name in names if name not in patterns]
+        if unknown:
+            raise CommandError(f'Consultas desconocidas: {", ".join(unknown)}. Disponibles: {", ".join(patterns)}')
+
+        warnings = 0
+        for name in names:
+            plan = patterns[name].explain(analyze=options['analyze'])
+            summary = summarize_plan(plan)
+
+            details = [f'índices: {", ".join(summary["indexes"]) or "ninguno"}']
+            if summary['seq_scans']:
+                details.append(f'Seq Scan en {", ".join(summary["seq_scans"])}')
+            if summary['sorts']:
+                details.append('Sort')
+            line = f'{name}: {"; ".join(details)}'
+
+            if summary['seq_scans'] or summary['sorts']:
+                warnings += 1
+                self.stdout.write(self.style.WARNING(line))
+            else:
+                self.stdout.write(line)
+            if options['show_plans']:
+                self.stdout.write(plan + '\n')
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Consultas revisadas: {len(names)}\n'
+                f'  Con Seq Scan o Sort: {warnings}'
+            )
+        )
@@ -0,0 +1,87 @@
+"""
+Comando de gestión de Django para mantener las particiones mensuales de
+audit_log y login_log. Pensado para ejecutarse a diario (cron):
+
+    python manage.py log_partitions rotate --archive-dir /respaldos/logs
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from webAMG.services.partition_service import PartitionService
+
+
+class Command(BaseCommand):
+    help = 'Crea, rota, elimina o archiva las particiones mensuales de audit_log y login_log'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'action',
+            choices=['create', 'rotate', 'drop', 'archive'],
+            help=(
+                'create: crea las particiones futuras; drop: elimina las vencidas; '
+                'archive: archiva y elimina las vencidas; rotate: create y luego drop '
+                '(o archive si se indica --archive-dir)'
+            )
+        )
+        parser.add_argument(
+            '--table',
+            choices=list(PartitionService.TABLES),
+            nargs='+',
+            dest='tables',
+            help='Tablas a procesar (por defecto, ambas)'
+        )
+        parser.add_argument(
+            '--months-ahead',
+            type=int,
+            help='Meses futuros con partición creada (default: LOG_PARTITION_MONTHS_AHEAD)'
+        )
+        parser.add_argument(
+            '--retention-months',
+            type=int,
+            help='Meses completos que se conservan (default: LOG_RETENTION_MONTHS)'
+        )
+        parser.add_argument(
+            '--archive-dir',
+            type=str,
+            help='Directorio para los archivos .csv.gz (default para archive: LOG_ARCHIVE_DIR)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Solo muestra lo que se haría'
+        )
+
+    def handle(self, *args, **options):
+        action = options['action']
+        archive_dir = options['archive_dir']
+        if action == 'archive' and not archive_dir:
+            archive_dir = str(getattr(settings, 'LOG_ARCHIVE_DIR', ''))
+            if not archive_dir:
+                raise CommandError('Indique --archive-dir o configure LOG_ARCHIVE_DIR')
+        if action == 'drop':
+            archive_dir = None
+
+        created, dropped, archived = [], [], []
+        for table in options['tables'] or PartitionService.TABLES:
+            if action in ('create', 'rotate'):
+                created += PartitionService.ensure_partitions(
+                    table, options['months_ahead'], dry_run=options['dry_run']
+                )
+            if action in ('rotate', 'drop', 'archive'):
+                result = PartitionService.expire_partitions(
+                    table, options['retention_months'], archive_dir, dry_run=options['dry_run']
+                )
+                dropped += result['dropped']
+                archived += result['archived']
+
+        for path in archived:
+            self.stdout.write(f'Archivado: {path}')
+
+        prefix = '[dry-run] ' if options['dry_run'] else ''
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'{prefix}Particiones procesadas:\n'
+                f'  Creadas: {", ".join(created) or "ninguna"}\n'
+                f'  Eliminadas: {", ".join(dropped) or "ninguna"}\n'
+                f'  Archivadas: {len(archived)}'
+            )
+        )
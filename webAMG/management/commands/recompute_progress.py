@@ -0,0 +1,40 @@
+"""
+Comando de gestión de Django para recalcular el avance de proyectos y fases.
+Útil para cargas iniciales y para ejecutarse a diario, ya que el avance de
+las fases en progreso depende de la fecha actual.
+"""
+from django.core.management.base import BaseCommand
+from webAMG.services.progress_service import ProgressService
+
+
+class Command(BaseCommand):
+    help = 'Recalcula progress_percentage de proyectos y fases por lotes'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--project',
+            type=int,
+            nargs='+',
+            dest='project_ids',
+            help='IDs de proyectos a recalcular (por defecto, todos)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=200,
+            help='Número de proyectos por lote'
+        )
+
+    def handle(self, *args, **options):
+        result = ProgressService.recompute_all(
+            project_ids=options['project_ids'],
+            batch_size=options['batch_size']
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Avance recalculado:\n'
+                f'  Proyectos actualizados: {result["projects"]}\n'
+                f'  Fases actualizadas: {result["phases"]}'
+            )
+        )
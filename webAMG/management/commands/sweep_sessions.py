@@ -0,0 +1,49 @@
+"""
+Comando de gestión de Django para limpiar user_sessions: desactiva las
+sesiones expiradas y elimina las antiguas, por lotes. Puede ejecutarse desde
+cron o quedarse corriendo con --interval.
+"""
+import time
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from webAMG.services.auth_service import AuthService, SESSION_SWEEP_BATCH_SIZE
+
+
+class Command(BaseCommand):
+    help = 'Desactiva sesiones expiradas y elimina las antiguas por lotes'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--retention-days',
+            type=int,
+            help='Días que se conservan las sesiones expiradas (default: SESSION_RETENTION_DAYS)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=SESSION_SWEEP_BATCH_SIZE,
+            help='Número de sesiones por lote'
+        )
+        parser.add_argument(
+            '--interval',
+            type=int,
+            help='Repetir cada N segundos hasta interrumpir el proceso'
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            close_old_connections()
+            result = AuthService.sweep_sessions(
+                retention_days=options['retention_days'],
+                batch_size=options['batch_size']
+            )
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f'Sesiones limpiadas:\n'
+                    f'  Desactivadas: {result["deactivated"]}\n'
+                    f'  Eliminadas: {result["deleted"]}'
+                )
+            )
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
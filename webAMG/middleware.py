@@ -1,12 +1,16 @@
 """
 Middleware para seguridad, zona horaria y logging de requests.
 """
+from functools import partial
+from django.conf import settings
+from django.contrib.auth.middleware import AuthenticationMiddleware
 from django.utils.deprecation import MiddlewareMixin
+from django.utils.functional import SimpleLazyObject
 from django.utils import timezone
 from django.http import JsonResponse
 import logging
 import time
-from webAMG.api.security import SecurityHeaders
+from webAMG.api.security import CSPNonce, SecurityHeaders
 
 
 logger = logging.getLogger(__name__)
@@ -37,16 +41,49 @@ class TimezoneMiddleware(MiddlewareMixin):
         return None
 
 
+class SessionAuthenticationMiddleware(AuthenticationMiddleware):
+    """
+    Reemplaza a AuthenticationMiddleware: arma request.user con el usuario que
+    webAMG.sessions carga junto con la sesión, sin pasar por el backend.
+    """
+
+    def process_request(self, request):
+        if not hasattr(getattr(request, 'session', None), 'get_user'):
+            return super().process_request(request)
+
+        from webAMG.sessions import aget_session_user, get_session_user
+        request.user = SimpleLazyObject(lambda: get_session_user(request))
+        request.auser = partial(aget_session_user, request)
+
+
 class SecurityHeadersMiddleware(MiddlewareMixin):
     """
     Middleware para agregar headers de seguridad HTTP a todas las respuestas.
+    Las políticas por ruta se arman una sola vez, al cargar el middleware.
     """
     
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.policies = SecurityHeaders.build_policies()
+        self.use_nonce = getattr(settings, 'SECURITY_CSP_NONCE', False)
+    
+    def process_request(self, request):
+        """
+        Deja disponible el nonce de CSP para las plantillas ({{ request.csp_nonce }}).
+        """
+        if self.use_nonce:
+            request.csp_nonce = CSPNonce()
+        return None
+    
     def process_response(self, request, response):
         """
         Aplica headers de seguridad a la respuesta.
         """
-        SecurityHeaders.apply_headers(response)
+        path = request.path
+        for prefix, policy in self.policies:
+            if path.startswith(prefix):
+                policy.apply(response, getattr(request, 'csp_nonce', None))
+                break
         return response
 
 
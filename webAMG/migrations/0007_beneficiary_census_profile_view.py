@@ -0,0 +1,116 @@
+# Vista de solo lectura con el perfil de censo completo de cada beneficiario
+
+from django.db import migrations
+
+
+CREATE_VIEW_SQL = """
+CREATE OR REPLACE VIEW beneficiary_census_profiles AS
+SELECT
+    b.id,
+    b.department,
+    b.municipality,
+    b.address,
+    b.community,
+    b.first_name,
+    b.last_name,
+    b.birth_place,
+    b.birth_date,
+    b.age,
+    b.cui_dpi,
+    b.gender,
+    b.civil_status,
+    b.ethnicity,
+    b.linguistic_community,
+    b.household_type,
+    b.total_household_members,
+    b.male_members,
+    b.female_members,
+    b.phone,
+    b.mobile_phone,
+    b.email,
+    b.notes,
+    b.is_active,
+    b.created_at,
+    b.updated_at,
+    -- Salud
+    h.is_pregnant,
+    h.is_breastfeeding,
+    h.has_diabetes,
+    h.has_high_blood_pressure,
+    h.has_low_blood_pressure,
+    h.has_heart_disease,
+    h.has_kidney_disease,
+    h.has_cancer,
+    h.has_respiratory_disease,
+    h.has_language_disability,
+    h.has_hearing_disability,
+    h.has_visual_disability,
+    h.has_physical_disability,
+    h.has_intellectual_disability,
+    h.has_psychosocial_disability,
+    h.health_notes,
+    -- Educación
+    e.education_level,
+    e.school_attendance,
+    e.education_language,
+    e.can_read_write,
+    e.years_of_study,
+    e.current_grade,
+    e.school_name,
+    e.has_cellphone,
+    e.has_computer,
+    e.has_internet,
+    e.education_notes,
+    -- Vivienda
+    v.housing_tenure,
+    v.housing_type,
+    v.number_of_rooms,
+    v.floor_material,
+    v.wall_material,
+    v.roof_material,
+    v.has_electricity,
+    v.has_piped_water,
+    v.has_sewage,
+    v.water_source,
+    v.drinking_water_source,
+    v.toilet_type,
+    v.waste_disposal,
+    v.housing_notes,
+    -- Economía
+    ec.economically_active_employed,
+    ec.economically_active_independent,
+    ec.economically_active_entrepreneur,
+    ec.economically_active_day_laborer,
+    ec.homemaker,
+    ec.unemployed,
+    ec.job_seeker,
+    ec.student_only,
+    ec.pensioner_rentier,
+    ec.retired,
+    ec.caregiver,
+    ec.community_position,
+    ec.monthly_income,
+    ec.receives_social_aid,
+    ec.social_aid_type,
+    ec.occupation,
+    ec.workplace,
+    ec.economy_notes
+FROM beneficiaries b
+LEFT JOIN beneficiary_health h ON h.beneficiary_id = b.id
+LEFT JOIN beneficiary_education e ON e.beneficiary_id = b.id
+LEFT JOIN beneficiary_housing v ON v.beneficiary_id = b.id
+LEFT JOIN beneficiary_economy ec ON ec.beneficiary_id = b.id;
+"""
+
+DROP_VIEW_SQL = "DROP VIEW IF EXISTS beneficiary_census_profiles;"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('webAMG', '0006_activityphoto_is_active_budgetexecution_is_active_and_more'),
+    ]
+
+    operations = [
+        migrations.RunSQL(sql=CREATE_VIEW_SQL, reverse_sql=DROP_VIEW_SQL),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 6.0.1 on 2026-10-19 14:45
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('webAMG', '0007_beneficiary_census_profile_view'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='deactivated_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name='BeneficiaryMatchKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('block_key', models.CharField(max_length=200)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('beneficiary', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='match_keys', to='webAMG.beneficiary')),
+            ],
+            options={
+                'verbose_name': 'Llave de Duplicados',
+                'verbose_name_plural': 'Llaves de Duplicados',
+                'db_table': 'beneficiary_match_keys',
+                'indexes': [models.Index(fields=['block_key'], name='beneficiary_block_k_b2f66d_idx')],
+                'unique_together': {('beneficiary', 'block_key')},
+            },
+        ),
+        migrations.CreateModel(
+            name='DuplicateCandidate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.DecimalField(decimal_places=3, max_digits=4)),
+                ('reasons', models.JSONField(blank=True, default=list)),
+                ('status', models.CharField(choices=[('pendiente', 'Pendiente'), ('fusionado', 'Fusionado'), ('descartado', 'Descartado')], default='pendiente', max_length=20)),
+                ('reviewed_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('beneficiary_a', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='webAMG.beneficiary')),
+                ('beneficiary_b', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='webAMG.beneficiary')),
+                ('reviewed_by', models.ForeignKey(blank=True, db_column='reviewed_by', null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Posible Duplicado',
+                'verbose_name_plural': 'Posibles Duplicados',
+                'db_table': 'beneficiary_duplicate_candidates',
+                'indexes': [models.Index(fields=['status', '-score'], name='beneficiary_status_3032c5_idx'), models.Index(fields=['beneficiary_b'], name='beneficiary_benefic_5d497c_idx')],
+                'unique_together': {('beneficiary_a', 'beneficiary_b')},
+            },
+        ),
+    ]
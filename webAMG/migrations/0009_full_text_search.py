@@ -0,0 +1,153 @@
+# Generated by Django 6.0.1 on 2026-10-19 15:10
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+# Configuración de búsqueda en español que además ignora tildes
+CREATE_CONFIG_SQL = """
+CREATE EXTENSION IF NOT EXISTS unaccent;
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'es_unaccent') THEN
+        CREATE TEXT SEARCH CONFIGURATION es_unaccent (COPY = spanish);
+        ALTER TEXT SEARCH CONFIGURATION es_unaccent
+            ALTER MAPPING FOR hword, hword_part, word WITH unaccent, spanish_stem;
+    END IF;
+END
+$$;
+"""
+
+DROP_CONFIG_SQL = "DROP TEXT SEARCH CONFIGURATION IF EXISTS es_unaccent;"
+
+# Tabla -> columnas por peso (A es el más relevante)
+SEARCH_DOCUMENTS = {
+    'projects': {
+        'A': ['project_name', 'project_code'],
+        'B': ['description', 'objectives', 'location', 'department', 'municipality', 'community'],
+        'C': ['what_is_done', 'notes'],
+    },
+    'project_phases': {
+        'A': ['phase_name'],
+        'B': ['description'],
+    },
+    'project_evidences': {
+        'A': ['description'],
+    },
+    'phase_evidences': {
+        'A': ['description'],
+    },
+    'daily_activities': {
+        'A': ['description'],
+        'B': ['activity_type', 'location'],
+        'C': ['notes'],
+    },
+    'beneficiaries': {
+        'A': ['first_name', 'last_name', 'cui_dpi'],
+        'B': ['department', 'municipality', 'community'],
+        'C': ['notes'],
+    },
+}
+
+
+def _vector_expression(weights):
+    parts = []
+    for weight, columns in weights.items():
+        text = " || ' ' || ".join(f"coalesce(NEW.{column}, '')" for column in columns)
+        parts.append(f"setweight(to_tsvector('es_unaccent', {text}), '{weight}')")
+    return ' || '.join(parts)
+
+
+def _trigger_sql(table, weights):
+    return f"""
+CREATE OR REPLACE FUNCTION {table}_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := {_vector_expression(weights)};
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS {table}_search_vector_trigger ON {table};
+CREATE TRIGGER {table}_search_vector_trigger
+    BEFORE INSERT OR UPDATE ON {table}
+    FOR EACH ROW EXECUTE FUNCTION {table}_search_vector_update();
+
+-- Llenar los registros existentes (el trigger calcula el vector)
+UPDATE {table} SET id = id;
+"""
+
+
+def _drop_trigger_sql(table):
+    return f"""
+DROP TRIGGER IF EXISTS {table}_search_vector_trigger ON {table};
+DROP FUNCTION IF EXISTS {table}_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('webAMG', '0008_beneficiary_duplicates'),
+    ]
+
+    operations = [
+        migrations.RunSQL(sql=CREATE_CONFIG_SQL, reverse_sql=DROP_CONFIG_SQL),
+        migrations.AddField(
+            model_name='beneficiary',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='dailyactivity',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='phaseevidence',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='projectevidence',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='projectphase',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='beneficiary',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='beneficiari_search__1ba4e3_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='dailyactivity',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='daily_activ_search__394741_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='phaseevidence',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='phase_evide_search__5f87d4_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='projects_search__42053c_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='projectevidence',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='project_evi_search__7807b7_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='projectphase',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='project_pha_search__fce492_gin'),
+        ),
+    ] + [
+        migrations.RunSQL(sql=_trigger_sql(table, weights), reverse_sql=_drop_trigger_sql(table))
+        for table, weights in SEARCH_DOCUMENTS.items()
+    ]
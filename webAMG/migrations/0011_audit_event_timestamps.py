@@ -0,0 +1,24 @@
+# Generated by Django 6.0.1 on 2026-10-19 11:20
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('webAMG', '0010_user_case_insensitive_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='auditlog',
+            name='performed_at',
+            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now),
+        ),
+        migrations.AlterField(
+            model_name='loginlog',
+            name='login_time',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
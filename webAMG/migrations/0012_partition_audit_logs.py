@@ -0,0 +1,115 @@
+# Generated by Django 6.0.1 on 2026-10-19 11:45
+
+from django.db import migrations
+
+
+# Tabla -> columna de partición (rango mensual en UTC)
+PARTITIONED_TABLES = {
+    'audit_log': 'performed_at',
+    'login_log': 'login_time',
+}
+
+# Meses futuros que se crean de una vez; el resto los crea log_partitions
+MONTHS_AHEAD = 3
+
+
+def _move_indexes_sql(source, target):
+    """Recrea en target los índices de source (con el mismo nombre), salvo los de constraints."""
+    return f"""
+DO $$
+DECLARE
+    idx record;
+BEGIN
+    FOR idx IN
+        SELECT indexname, indexdef FROM pg_indexes
+        WHERE schemaname = current_schema() AND tablename = '{source}'
+          AND indexname NOT IN (SELECT conname FROM pg_constraint WHERE conrelid = '{source}'::regclass)
+    LOOP
+        EXECUTE format('DROP INDEX %I', idx.indexname);
+        EXECUTE replace(idx.indexdef, '.{source} USING', '.{target} USING');
+    END LOOP;
+END
+$$;
+"""
+
+
+def _foreign_key_sql(table):
+    # Igual que Django: sin ON DELETE en la base (SET_NULL lo aplica el ORM)
+    return (
+        f"ALTER TABLE {table} ADD CONSTRAINT {table}_user_id_fk_users_id "
+        f"FOREIGN KEY (user_id) REFERENCES users (id) DEFERRABLE INITIALLY DEFERRED;"
+    )
+
+
+def _partition_sql(table, column):
+    """
+    Convierte la tabla en una tabla particionada por mes. La llave primaria
+    pasa a ser (id, columna) porque PostgreSQL exige la columna de partición;
+    id sigue siendo único porque viene de una secuencia.
+    """
+    old = f'{table}_unpartitioned'
+    return f"""
+ALTER TABLE {table} RENAME TO {old};
+CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS) PARTITION BY RANGE ({column});
+ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT;
+CREATE SEQUENCE {table}_id_part_seq OWNED BY {table}.id;
+SELECT setval('{table}_id_part_seq', COALESCE((SELECT MAX(id) FROM {old}), 0) + 1, false);
+ALTER TABLE {table} ALTER COLUMN id SET DEFAULT nextval('{table}_id_part_seq');
+
+CREATE TABLE {table}_default PARTITION OF {table} DEFAULT;
+DO $$
+DECLARE
+    month timestamp;
+BEGIN
+    FOR month IN
+        SELECT generate_series(
+            date_trunc('month', COALESCE((SELECT MIN({column}) FROM {old}), now()) AT TIME ZONE 'UTC'),
+            date_trunc('month', now() AT TIME ZONE 'UTC') + interval '{MONTHS_AHEAD} months',
+            interval '1 month'
+        )
+    LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF {table} FOR VALUES FROM (%L) TO (%L)',
+            '{table}_y' || to_char(month, 'YYYY') || 'm' || to_char(month, 'MM'),
+            to_char(month, 'YYYY-MM-DD') || ' 00:00:00+00',
+            to_char(month + interval '1 month', 'YYYY-MM-DD') || ' 00:00:00+00'
+        );
+    END LOOP;
+END
+$$;
+
+INSERT INTO {table} SELECT * FROM {old};
+{_move_indexes_sql(old, table)}
+DROP TABLE {old};
+ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id, {column});
+{_foreign_key_sql(table)}
+"""
+
+
+def _unpartition_sql(table, column):
+    """Vuelve a una tabla normal con todos los datos de las particiones."""
+    old = f'{table}_partitioned'
+    return f"""
+ALTER TABLE {table} RENAME TO {old};
+CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS);
+ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT;
+ALTER TABLE {table} ALTER COLUMN id ADD GENERATED BY DEFAULT AS IDENTITY;
+INSERT INTO {table} SELECT * FROM {old};
+SELECT setval(pg_get_serial_sequence('{table}', 'id'), COALESCE(MAX(id), 0) + 1, false) FROM {table};
+{_move_indexes_sql(old, table)}
+DROP TABLE {old} CASCADE;
+ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id);
+{_foreign_key_sql(table)}
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('webAMG', '0011_audit_event_timestamps'),
+    ]
+
+    operations = [
+        migrations.RunSQL(sql=_partition_sql(table, column), reverse_sql=_unpartition_sql(table, column))
+        for table, column in PARTITIONED_TABLES.items()
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 6.0.1 on 2026-10-19 12:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('webAMG', '0012_partition_audit_logs'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='usersession',
+            name='user_sessio_session_baddb8_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='usersession',
+            name='user_sessio_is_acti_1b3cb1_idx',
+        ),
+        migrations.AddIndex(
+            model_name='usersession',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['session_token'], include=('expires_at', 'user'), name='user_sessions_active_token_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 6.0.1 on 2026-10-19 12:40
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('webAMG', '0013_user_sessions_active_token_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='usersession',
+            name='session_data',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AlterField(
+            model_name='usersession',
+            name='user',
+            field=models.ForeignKey(blank=True, db_column='user_id', null=True, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 6.0.1 on 2026-10-19 15:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('webAMG', '0014_unified_user_sessions'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='activityphoto',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['activity'], name='activity_photos_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='budgetexecution',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['project'], name='budget_exec_project_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='budgetexecution',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['phase'], name='budget_exec_phase_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dailyactivity',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['project'], name='daily_act_project_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dailyactivity',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['phase'], name='daily_act_phase_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='evidencebeneficiary',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['evidence'], name='evidence_benef_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='evidencephoto',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['evidence'], name='evidence_photos_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='phasebeneficiary',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['phase'], name='phase_benef_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='phaseevidence',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['phase'], name='phase_evidences_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='phaseevidencebeneficiary',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['phase_evidence'], name='phase_ev_benef_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='phaseevidencephoto',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['phase_evidence'], name='phase_ev_photos_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projectbeneficiary',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['project'], name='project_benef_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projectevidence',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['project'], name='project_evidences_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projectmaterial',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['project'], name='project_materials_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projectphase',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['project'], name='project_phases_active_idx'),
+        ),
+    ]
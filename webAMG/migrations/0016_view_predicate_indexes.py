@@ -0,0 +1,121 @@
+# Generated by Django 6.0.1 on 2026-10-19 15:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('webAMG', '0015_soft_delete_active_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='activityphoto',
+            name='activity_ph_is_acti_d1849f_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='beneficiary',
+            name='beneficiari_is_acti_c9a840_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='budgetexecution',
+            name='budget_exec_is_acti_b77bea_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='dailyactivity',
+            name='daily_activ_is_acti_398ca4_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='evidencebeneficiary',
+            name='evidence_be_is_acti_799b85_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='evidencephoto',
+            name='evidence_ph_is_acti_2a7a5c_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='evidencephoto',
+            name='evidence_photos_active_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='phasebeneficiary',
+            name='phase_benef_is_acti_94afb2_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='phaseevidence',
+            name='phase_evide_is_acti_f9a630_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='phaseevidence',
+            name='phase_evidences_active_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='phaseevidencebeneficiary',
+            name='phase_evide_is_acti_7088ee_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='phaseevidencephoto',
+            name='phase_evide_is_acti_9c89cf_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='phaseevidencephoto',
+            name='phase_ev_photos_active_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='project',
+            name='projects_is_acti_3457d5_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='projectbeneficiary',
+            name='project_ben_is_acti_be09a1_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='projectevidence',
+            name='project_evi_is_acti_45168d_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='projectevidence',
+            name='project_evidences_active_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='projectmaterial',
+            name='project_mat_is_acti_bcff70_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='projectphase',
+            name='project_pha_is_acti_a782b7_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='user',
+            name='users_is_acti_847b48_idx',
+        ),
+        migrations.AddIndex(
+            model_name='beneficiary',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['first_name', 'last_name'], name='beneficiaries_active_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='evidencephoto',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['evidence', 'photo_order'], name='evidence_photos_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='phaseevidence',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['phase', '-start_date', '-created_at'], name='phase_ev_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='phaseevidencephoto',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['phase_evidence', 'photo_order'], name='phase_ev_photos_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-created_at'], name='projects_active_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('is_active', False)), fields=['-updated_at'], name='projects_inactive_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projectevidence',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['project', '-start_date', '-created_at'], name='project_ev_recent_idx'),
+        ),
+    ]
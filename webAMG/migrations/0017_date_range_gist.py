@@ -0,0 +1,70 @@
+# Generated by Django 6.0.1 on 2026-10-19 16:05
+
+import django.contrib.postgres.fields.ranges
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import BtreeGistExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('webAMG', '0016_view_predicate_indexes'),
+    ]
+
+    operations = [
+        # GiST sobre (project_id/phase_id, date_range) necesita btree_gist para la columna entera
+        BtreeGistExtension(),
+        migrations.RemoveIndex(
+            model_name='phaseevidence',
+            name='phase_evide_start_d_ddba2a_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='project',
+            name='projects_start_d_cb24a6_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='projectevidence',
+            name='project_evi_start_d_176268_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='projectphase',
+            name='project_pha_start_d_d6558b_idx',
+        ),
+        migrations.AddField(
+            model_name='phaseevidence',
+            name='date_range',
+            field=models.GeneratedField(db_persist=True, expression=models.Func(models.F('start_date'), models.Case(models.When(end_date__lt=models.F('start_date'), then=models.F('start_date')), default=models.F('end_date')), models.Value('[]'), function='daterange', output_field=django.contrib.postgres.fields.ranges.DateRangeField()), output_field=django.contrib.postgres.fields.ranges.DateRangeField()),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='date_range',
+            field=models.GeneratedField(db_persist=True, expression=models.Func(models.F('start_date'), models.Case(models.When(end_date__lt=models.F('start_date'), then=models.F('start_date')), default=models.F('end_date')), models.Value('[]'), function='daterange', output_field=django.contrib.postgres.fields.ranges.DateRangeField()), output_field=django.contrib.postgres.fields.ranges.DateRangeField()),
+        ),
+        migrations.AddField(
+            model_name='projectevidence',
+            name='date_range',
+            field=models.GeneratedField(db_persist=True, expression=models.Func(models.F('start_date'), models.Case(models.When(end_date__lt=models.F('start_date'), then=models.F('start_date')), default=models.F('end_date')), models.Value('[]'), function='daterange', output_field=django.contrib.postgres.fields.ranges.DateRangeField()), output_field=django.contrib.postgres.fields.ranges.DateRangeField()),
+        ),
+        migrations.AddField(
+            model_name='projectphase',
+            name='date_range',
+            field=models.GeneratedField(db_persist=True, expression=models.Func(models.F('start_date'), models.Case(models.When(end_date__lt=models.F('start_date'), then=models.F('start_date')), default=models.F('end_date')), models.Value('[]'), function='daterange', output_field=django.contrib.postgres.fields.ranges.DateRangeField()), output_field=django.contrib.postgres.fields.ranges.DateRangeField()),
+        ),
+        migrations.AddIndex(
+            model_name='phaseevidence',
+            index=django.contrib.postgres.indexes.GistIndex(condition=models.Q(('is_active', True)), fields=['phase', 'date_range'], name='phase_ev_range_gist'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=django.contrib.postgres.indexes.GistIndex(fields=['date_range'], name='projects_date_range_gist'),
+        ),
+        migrations.AddIndex(
+            model_name='projectevidence',
+            index=django.contrib.postgres.indexes.GistIndex(condition=models.Q(('is_active', True)), fields=['project', 'date_range'], name='project_ev_range_gist'),
+        ),
+        migrations.AddIndex(
+            model_name='projectphase',
+            index=django.contrib.postgres.indexes.GistIndex(condition=models.Q(('is_active', True)), fields=['project', 'date_range'], name='project_phases_range_gist'),
+        ),
+    ]
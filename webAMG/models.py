@@ -2,9 +2,14 @@
 Modelos de Django para el Sistema de Gestión de Proyectos - Maya Guatemala
 Basado en el esquema de base de datos PostgreSQL
 """
+from django.contrib.postgres.fields import DateRangeField
+from django.contrib.postgres.indexes import GinIndex, GistIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models import Case, F, Func, Value, When
+from django.db.models.functions import Upper
 from django.utils import timezone
-import bcrypt
+from webAMG.services.password_service import PasswordService
 
 
 # =====================================================
@@ -123,6 +128,12 @@ class EconomicStatus(models.TextChoices):
     CARGO_COMUNITARIO = 'cargo_comunitario', 'Cargo Comunitario'
 
 
+class DuplicateStatus(models.TextChoices):
+    PENDIENTE = 'pendiente', 'Pendiente'
+    FUSIONADO = 'fusionado', 'Fusionado'
+    DESCARTADO = 'descartado', 'Descartado'
+
+
 class InvoiceType(models.TextChoices):
     FACTURA = 'factura', 'Factura'
     RECIBO = 'recibo', 'Recibo'
@@ -135,6 +146,40 @@ class InvoiceType(models.TextChoices):
     OTRO = 'otro', 'Otro'
 
 
+# =====================================================
+# BORRADO LÓGICO
+# =====================================================
+
+class ActiveManager(models.Manager):
+    """
+    Manager por defecto de los modelos con borrado lógico: solo devuelve filas
+    con is_active=True. Las relaciones inversas (project.phases, ...) también
+    lo usan; all_objects incluye las filas inactivas.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().filter(is_active=True)
+
+
+def date_range_field():
+    """
+    Columna generada daterange(start_date, end_date, '[]') para filtrar por
+    rango con && y un índice GiST (ver DateRangeService). Un end_date nulo
+    deja el rango abierto; uno anterior a start_date se toma como start_date.
+    """
+    return models.GeneratedField(
+        expression=Func(
+            F('start_date'),
+            Case(When(end_date__lt=F('start_date'), then=F('start_date')), default=F('end_date')),
+            Value('[]'),
+            function='daterange',
+            output_field=DateRangeField(),
+        ),
+        output_field=DateRangeField(),
+        db_persist=True,
+    )
+
+
 # =====================================================
 # MODELO DE USUARIO PERSONALIZADO
 # =====================================================
@@ -186,19 +231,45 @@ class User(models.Model):
         """
         Encripta la contraseña usando bcrypt y la guarda en password_hash.
         """
-        salt = bcrypt.gensalt(rounds=10)
-        self.password_hash = bcrypt.hashpw(raw_password.encode('utf-8'), salt).decode('utf-8')
+        self.password_hash = PasswordService.run(PasswordService.hash_password, raw_password)
 
     def check_password(self, raw_password):
         """
         Verifica si la contraseña proporcionada coincide con el hash almacenado.
+        Si el hash usa un costo distinto a PASSWORD_HASH_ROUNDS, se regenera.
+        """
+        if raw_password is None:
+            return False
+        if not PasswordService.run(PasswordService.verify_password, raw_password, self.password_hash):
+            return False
+        if PasswordService.needs_rehash(self.password_hash):
+            self.set_password(raw_password)
+            if self.pk:
+                User.objects.filter(pk=self.pk).update(password_hash=self.password_hash)
+        return True
+
+    async def acheck_password(self, raw_password):
+        """
+        Versión asíncrona de check_password: bcrypt corre en el pool de
+        PasswordService sin bloquear el event loop.
         """
         if raw_password is None:
             return False
-        return bcrypt.checkpw(
-            raw_password.encode('utf-8'),
-            self.password_hash.encode('utf-8')
-        )
+        if 'password_hash' in self.get_deferred_fields():
+            # request.user (USER_FIELDS) no trae el hash; leerlo con el ORM
+            # asíncrono evita el refresh_from_db síncrono en el event loop
+            try:
+                stored = await User.objects.only('password_hash').aget(pk=self.pk)
+            except User.DoesNotExist:
+                return False
+            self.password_hash = stored.password_hash
+        if not await PasswordService.arun(PasswordService.verify_password, raw_password, self.password_hash):
+            return False
+        if PasswordService.needs_rehash(self.password_hash):
+            self.password_hash = await PasswordService.arun(PasswordService.hash_password, raw_password)
+            if self.pk:
+                await User.objects.filter(pk=self.pk).aupdate(password_hash=self.password_hash)
+        return True
 
     def is_admin(self):
         """Verifica si el usuario es administrador."""
@@ -223,8 +294,10 @@ class User(models.Model):
         indexes = [
             models.Index(fields=['username']),
             models.Index(fields=['email']),
+            # Búsqueda sin distinguir mayúsculas del backend de autenticación
+            models.Index(Upper('username'), name='users_username_upper_idx'),
+            models.Index(Upper('email'), name='users_email_upper_idx'),
             models.Index(fields=['role']),
-            models.Index(fields=['is_active']),
             models.Index(fields=['created_at']),
         ]
 
@@ -250,7 +323,8 @@ class AuditLog(models.Model):
     new_data = models.JSONField(blank=True, null=True)
     user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, db_column='user_id')
     ip_address = models.GenericIPAddressField(null=True, blank=True)
-    performed_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    # default en lugar de auto_now_add: AuditService guarda la hora del evento, no la del lote
+    performed_at = models.DateTimeField(default=timezone.now, db_index=True)
 
     class Meta:
         db_table = 'audit_log'
@@ -276,7 +350,8 @@ class LoginLog(models.Model):
     Registro de intentos de inicio de sesión.
     """
     user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, db_column='user_id')
-    login_time = models.DateTimeField(auto_now_add=True)
+    # default en lugar de auto_now_add: AuditService guarda la hora del intento, no la del lote
+    login_time = models.DateTimeField(default=timezone.now)
     ip_address = models.GenericIPAddressField(null=True, blank=True)
     user_agent = models.TextField(blank=True, null=True)
     success = models.BooleanField(default=False)
@@ -304,8 +379,10 @@ class UserSession(models.Model):
     """
     Sesiones activas de usuarios.
     """
-    user = models.ForeignKey(User, on_delete=models.CASCADE, db_column='user_id')
+    # Nulo en sesiones de páginas antes del login (webAMG.sessions)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, null=True, blank=True, db_column='user_id')
     session_token = models.CharField(max_length=255, unique=True)
+    session_data = models.JSONField(default=dict, blank=True)
     ip_address = models.GenericIPAddressField(null=True, blank=True)
     user_agent = models.TextField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -319,9 +396,14 @@ class UserSession(models.Model):
         verbose_name_plural = 'Sesiones de Usuarios'
         indexes = [
             models.Index(fields=['user']),
-            models.Index(fields=['session_token']),
             models.Index(fields=['expires_at']),
-            models.Index(fields=['is_active']),
+            # verify_session solo busca sesiones activas; las cerradas no engordan el índice
+            models.Index(
+                fields=['session_token'],
+                include=['expires_at', 'user'],
+                condition=models.Q(is_active=True),
+                name='user_sessions_active_token_idx'
+            ),
         ]
 
     def __str__(self):
@@ -365,6 +447,7 @@ class Project(models.Model):
     progress_percentage = models.DecimalField(max_digits=5, decimal_places=2, default=0.00)
     is_active = models.BooleanField(default=True)
     deactivated_at = models.DateTimeField(blank=True, null=True)
+    date_range = date_range_field()
     beneficiaries = models.ManyToManyField(
         'Beneficiary',
         blank=True,
@@ -377,6 +460,11 @@ class Project(models.Model):
     notes = models.TextField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Mantenido por un trigger de PostgreSQL (ver SearchService)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = ActiveManager()
+    all_objects = models.Manager()
 
     class Meta:
         db_table = 'projects'
@@ -385,12 +473,15 @@ class Project(models.Model):
         indexes = [
             models.Index(fields=['project_code']),
             models.Index(fields=['status']),
-            models.Index(fields=['start_date', 'end_date']),
+            GistIndex(fields=['date_range'], name='projects_date_range_gist'),
             models.Index(fields=['created_by']),
             models.Index(fields=['responsible_user']),
             models.Index(fields=['municipality']),
             models.Index(fields=['department']),
-            models.Index(fields=['is_active']),
+            # Listado de proyectos: activos por fecha de creación, inactivos por fecha de cambio
+            models.Index(fields=['-created_at'], name='projects_active_created_idx', condition=models.Q(is_active=True)),
+            models.Index(fields=['-updated_at'], name='projects_inactive_updated_idx', condition=models.Q(is_active=False)),
+            GinIndex(fields=['search_vector']),
         ]
 
     def __str__(self):
@@ -451,6 +542,9 @@ class ProjectBeneficiary(models.Model):
     is_active = models.BooleanField(default=True)
     created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, db_column='created_by')
 
+    objects = ActiveManager()
+    all_objects = models.Manager()
+
     class Meta:
         db_table = 'project_beneficiaries'
         unique_together = ('project', 'beneficiary')
@@ -460,7 +554,7 @@ class ProjectBeneficiary(models.Model):
             models.Index(fields=['project']),
             models.Index(fields=['beneficiary']),
             models.Index(fields=['assigned_at']),
-            models.Index(fields=['is_active']),
+            models.Index(fields=['project'], name='project_benef_active_idx', condition=models.Q(is_active=True)),
         ]
 
     def __str__(self):
@@ -471,6 +565,26 @@ class ProjectBeneficiary(models.Model):
 # MODELO DE BENEFICIARIOS
 # =====================================================
 
+class BeneficiaryQuerySet(models.QuerySet):
+    """
+    QuerySet de beneficiarios con atajos para el perfil de censo.
+    """
+
+    # Tablas satélite OneToOne del censo (related_name en cada modelo)
+    CENSUS_RELATIONS = ('health', 'education', 'housing', 'economy')
+
+    def with_census(self):
+        """
+        Carga el beneficiario y sus cuatro tablas satélite en una sola consulta
+        (LEFT JOIN), evitando una consulta extra por cada .health, .education,
+        .housing y .economy.
+        """
+        return self.select_related(*self.CENSUS_RELATIONS)
+
+
+BeneficiaryManager = models.Manager.from_queryset(BeneficiaryQuerySet)
+
+
 class Beneficiary(models.Model):
     """
     Información principal de beneficiarios del censo.
@@ -511,6 +625,10 @@ class Beneficiary(models.Model):
     created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, db_column='created_by')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Mantenido por un trigger de PostgreSQL (ver SearchService)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = BeneficiaryManager()
 
     class Meta:
         db_table = 'beneficiaries'
@@ -518,12 +636,14 @@ class Beneficiary(models.Model):
         verbose_name_plural = 'Beneficiarios'
         indexes = [
             models.Index(fields=['first_name', 'last_name']),
+            # Selectores de beneficiarios: activos ordenados por nombre
+            models.Index(fields=['first_name', 'last_name'], name='beneficiaries_active_name_idx', condition=models.Q(is_active=True)),
             models.Index(fields=['cui_dpi']),
             models.Index(fields=['department']),
             models.Index(fields=['municipality']),
             models.Index(fields=['community']),
             models.Index(fields=['birth_date']),
-            models.Index(fields=['is_active']),
+            GinIndex(fields=['search_vector']),
             models.Index(fields=['created_by']),
             models.Index(fields=['created_at']),
         ]
@@ -706,6 +826,60 @@ class BeneficiaryEconomy(models.Model):
         ]
 
 
+# =====================================================
+# DETECCIÓN DE BENEFICIARIOS DUPLICADOS
+# =====================================================
+
+class BeneficiaryMatchKey(models.Model):
+    """
+    Llaves de bloqueo de un beneficiario para la detección de duplicados.
+    Solo se comparan beneficiarios que comparten al menos una llave.
+    """
+    beneficiary = models.ForeignKey(Beneficiary, on_delete=models.CASCADE, related_name='match_keys')
+    block_key = models.CharField(max_length=200)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'beneficiary_match_keys'
+        verbose_name = 'Llave de Duplicados'
+        verbose_name_plural = 'Llaves de Duplicados'
+        unique_together = ['beneficiary', 'block_key']
+        indexes = [
+            models.Index(fields=['block_key']),
+        ]
+
+    def __str__(self):
+        return f"{self.beneficiary_id} - {self.block_key}"
+
+
+class DuplicateCandidate(models.Model):
+    """
+    Par de beneficiarios que probablemente son la misma persona.
+    Forma la cola de revisión; beneficiary_a siempre tiene el id menor.
+    """
+    beneficiary_a = models.ForeignKey(Beneficiary, on_delete=models.CASCADE, related_name='+')
+    beneficiary_b = models.ForeignKey(Beneficiary, on_delete=models.CASCADE, related_name='+')
+    score = models.DecimalField(max_digits=4, decimal_places=3)
+    reasons = models.JSONField(default=list, blank=True)
+    status = models.CharField(max_length=20, choices=DuplicateStatus.choices, default=DuplicateStatus.PENDIENTE)
+    reviewed_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, db_column='reviewed_by')
+    reviewed_at = models.DateTimeField(blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'beneficiary_duplicate_candidates'
+        verbose_name = 'Posible Duplicado'
+        verbose_name_plural = 'Posibles Duplicados'
+        unique_together = ['beneficiary_a', 'beneficiary_b']
+        indexes = [
+            models.Index(fields=['status', '-score']),
+            models.Index(fields=['beneficiary_b']),
+        ]
+
+    def __str__(self):
+        return f"{self.beneficiary_a_id} ~ {self.beneficiary_b_id} ({self.score})"
+
+
 # =====================================================
 # MODELO DE FASES DE PROYECTOS
 # =====================================================
@@ -733,6 +907,12 @@ class ProjectPhase(models.Model):
     created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, db_column='created_by')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    date_range = date_range_field()
+    # Mantenido por un trigger de PostgreSQL (ver SearchService)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = ActiveManager()
+    all_objects = models.Manager()
 
     class Meta:
         db_table = 'project_phases'
@@ -741,9 +921,10 @@ class ProjectPhase(models.Model):
         indexes = [
             models.Index(fields=['project']),
             models.Index(fields=['status']),
-            models.Index(fields=['start_date', 'end_date']),
+            GistIndex(fields=['project', 'date_range'], name='project_phases_range_gist', condition=models.Q(is_active=True)),
             models.Index(fields=['project', 'phase_number']),
-            models.Index(fields=['is_active']),
+            models.Index(fields=['project'], name='project_phases_active_idx', condition=models.Q(is_active=True)),
+            GinIndex(fields=['search_vector']),
         ]
         unique_together = ['project', 'phase_number']
 
@@ -771,6 +952,11 @@ class DailyActivity(models.Model):
     created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, db_column='created_by')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Mantenido por un trigger de PostgreSQL (ver SearchService)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = ActiveManager()
+    all_objects = models.Manager()
 
     class Meta:
         db_table = 'daily_activities'
@@ -782,7 +968,9 @@ class DailyActivity(models.Model):
             models.Index(fields=['activity_date']),
             models.Index(fields=['activity_type']),
             models.Index(fields=['created_by']),
-            models.Index(fields=['is_active']),
+            models.Index(fields=['project'], name='daily_act_project_active_idx', condition=models.Q(is_active=True)),
+            models.Index(fields=['phase'], name='daily_act_phase_active_idx', condition=models.Q(is_active=True)),
+            GinIndex(fields=['search_vector']),
         ]
 
     def __str__(self):
@@ -805,6 +993,9 @@ class ActivityPhoto(models.Model):
     uploaded_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, db_column='uploaded_by')
     uploaded_at = models.DateTimeField(auto_now_add=True)
 
+    objects = ActiveManager()
+    all_objects = models.Manager()
+
     class Meta:
         db_table = 'activity_photos'
         verbose_name = 'Foto de Actividad'
@@ -812,7 +1003,7 @@ class ActivityPhoto(models.Model):
         indexes = [
             models.Index(fields=['activity']),
             models.Index(fields=['uploaded_by']),
-            models.Index(fields=['is_active']),
+            models.Index(fields=['activity'], name='activity_photos_active_idx', condition=models.Q(is_active=True)),
         ]
 
     def __str__(self):
@@ -836,6 +1027,12 @@ class ProjectEvidence(models.Model):
     created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, db_column='created_by')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    date_range = date_range_field()
+    # Mantenido por un trigger de PostgreSQL (ver SearchService)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = ActiveManager()
+    all_objects = models.Manager()
 
     class Meta:
         db_table = 'project_evidences'
@@ -843,9 +1040,10 @@ class ProjectEvidence(models.Model):
         verbose_name_plural = 'Evidencias de Proyectos'
         indexes = [
             models.Index(fields=['project']),
-            models.Index(fields=['start_date', 'end_date']),
+            GistIndex(fields=['project', 'date_range'], name='project_ev_range_gist', condition=models.Q(is_active=True)),
             models.Index(fields=['created_by']),
-            models.Index(fields=['is_active']),
+            models.Index(fields=['project', '-start_date', '-created_at'], name='project_ev_recent_idx', condition=models.Q(is_active=True)),
+            GinIndex(fields=['search_vector']),
         ]
 
     def __str__(self):
@@ -869,6 +1067,9 @@ class EvidencePhoto(models.Model):
     uploaded_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, db_column='uploaded_by')
     uploaded_at = models.DateTimeField(auto_now_add=True)
 
+    objects = ActiveManager()
+    all_objects = models.Manager()
+
     class Meta:
         db_table = 'evidence_photos'
         verbose_name = 'Foto de Evidencia'
@@ -877,7 +1078,7 @@ class EvidencePhoto(models.Model):
             models.Index(fields=['evidence']),
             models.Index(fields=['uploaded_by']),
             models.Index(fields=['uploaded_at']),
-            models.Index(fields=['is_active']),
+            models.Index(fields=['evidence', 'photo_order'], name='evidence_photos_order_idx', condition=models.Q(is_active=True)),
         ]
 
     def __str__(self):
@@ -898,6 +1099,9 @@ class EvidenceBeneficiary(models.Model):
     notes = models.TextField(blank=True, null=True)
     is_active = models.BooleanField(default=True)
 
+    objects = ActiveManager()
+    all_objects = models.Manager()
+
     class Meta:
         db_table = 'evidence_beneficiaries'
         verbose_name = 'Beneficiario de Evidencia'
@@ -906,7 +1110,7 @@ class EvidenceBeneficiary(models.Model):
             models.Index(fields=['evidence']),
             models.Index(fields=['beneficiary']),
             models.Index(fields=['assigned_at']),
-            models.Index(fields=['is_active']),
+            models.Index(fields=['evidence'], name='evidence_benef_active_idx', condition=models.Q(is_active=True)),
         ]
         unique_together = ['evidence', 'beneficiary']
 
@@ -929,6 +1133,9 @@ class PhaseBeneficiary(models.Model):
     is_active = models.BooleanField(default=True)
     created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, db_column='created_by')
 
+    objects = ActiveManager()
+    all_objects = models.Manager()
+
     class Meta:
         db_table = 'phase_beneficiaries'
         verbose_name = 'Beneficiario de Fase'
@@ -937,7 +1144,7 @@ class PhaseBeneficiary(models.Model):
             models.Index(fields=['phase']),
             models.Index(fields=['beneficiary']),
             models.Index(fields=['assigned_at']),
-            models.Index(fields=['is_active']),
+            models.Index(fields=['phase'], name='phase_benef_active_idx', condition=models.Q(is_active=True)),
         ]
         unique_together = ['phase', 'beneficiary']
 
@@ -962,6 +1169,12 @@ class PhaseEvidence(models.Model):
     created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, db_column='created_by')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    date_range = date_range_field()
+    # Mantenido por un trigger de PostgreSQL (ver SearchService)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = ActiveManager()
+    all_objects = models.Manager()
 
     class Meta:
         db_table = 'phase_evidences'
@@ -969,9 +1182,10 @@ class PhaseEvidence(models.Model):
         verbose_name_plural = 'Evidencias de Fases'
         indexes = [
             models.Index(fields=['phase']),
-            models.Index(fields=['start_date', 'end_date']),
+            GistIndex(fields=['phase', 'date_range'], name='phase_ev_range_gist', condition=models.Q(is_active=True)),
             models.Index(fields=['created_by']),
-            models.Index(fields=['is_active']),
+            models.Index(fields=['phase', '-start_date', '-created_at'], name='phase_ev_recent_idx', condition=models.Q(is_active=True)),
+            GinIndex(fields=['search_vector']),
         ]
 
     def __str__(self):
@@ -995,6 +1209,9 @@ class PhaseEvidencePhoto(models.Model):
     uploaded_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, db_column='uploaded_by')
     uploaded_at = models.DateTimeField(auto_now_add=True)
 
+    objects = ActiveManager()
+    all_objects = models.Manager()
+
     class Meta:
         db_table = 'phase_evidence_photos'
         verbose_name = 'Foto de Evidencia de Fase'
@@ -1003,7 +1220,7 @@ class PhaseEvidencePhoto(models.Model):
             models.Index(fields=['phase_evidence']),
             models.Index(fields=['uploaded_by']),
             models.Index(fields=['uploaded_at']),
-            models.Index(fields=['is_active']),
+            models.Index(fields=['phase_evidence', 'photo_order'], name='phase_ev_photos_order_idx', condition=models.Q(is_active=True)),
         ]
 
     def __str__(self):
@@ -1020,6 +1237,9 @@ class PhaseEvidenceBeneficiary(models.Model):
     notes = models.TextField(blank=True, null=True)
     is_active = models.BooleanField(default=True)
 
+    objects = ActiveManager()
+    all_objects = models.Manager()
+
     class Meta:
         db_table = 'phase_evidence_beneficiaries'
         verbose_name = 'Beneficiario de Evidencia de Fase'
@@ -1028,7 +1248,7 @@ class PhaseEvidenceBeneficiary(models.Model):
             models.Index(fields=['phase_evidence']),
             models.Index(fields=['beneficiary']),
             models.Index(fields=['assigned_at']),
-            models.Index(fields=['is_active']),
+            models.Index(fields=['phase_evidence'], name='phase_ev_benef_active_idx', condition=models.Q(is_active=True)),
         ]
         unique_together = ['phase_evidence', 'beneficiary']
 
@@ -1059,6 +1279,9 @@ class ProjectMaterial(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ActiveManager()
+    all_objects = models.Manager()
+
     class Meta:
         db_table = 'project_materials'
         verbose_name = 'Material de Proyecto'
@@ -1066,7 +1289,7 @@ class ProjectMaterial(models.Model):
         indexes = [
             models.Index(fields=['project']),
             models.Index(fields=['purchase_date']),
-            models.Index(fields=['is_active']),
+            models.Index(fields=['project'], name='project_materials_active_idx', condition=models.Q(is_active=True)),
         ]
 
     def __str__(self):
@@ -1123,6 +1346,9 @@ class BudgetExecution(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ActiveManager()
+    all_objects = models.Manager()
+
     class Meta:
         db_table = 'budget_execution'
         verbose_name = 'Ejecución Presupuestaria'
@@ -1136,7 +1362,8 @@ class BudgetExecution(models.Model):
             models.Index(fields=['category']),
             models.Index(fields=['is_paid']),
             models.Index(fields=['is_approved']),
-            models.Index(fields=['is_active']),
+            models.Index(fields=['project'], name='budget_exec_project_active_idx', condition=models.Q(is_active=True)),
+            models.Index(fields=['phase'], name='budget_exec_phase_active_idx', condition=models.Q(is_active=True)),
             models.Index(fields=['created_by']),
             models.Index(fields=['approved_by']),
         ]
@@ -0,0 +1,9 @@
+"""
+Rutas de WebSocket de la aplicación webAMG.
+"""
+from django.urls import path
+from webAMG.consumers import ProjectEventsConsumer
+
+websocket_urlpatterns = [
+    path('ws/projects/<int:project_id>/', ProjectEventsConsumer.as_asgi()),
+]
@@ -0,0 +1,378 @@
+"""
+Servicio de escritura por lotes de LoginLog y AuditLog.
+
+Los eventos se encolan en memoria y un hilo en segundo plano los guarda con
+bulk_create cada AUDIT_BATCH_SIZE eventos o cada AUDIT_FLUSH_INTERVAL_MS
+milisegundos, lo que ocurra primero. Si la base de datos falla o la cola se
+llena, los eventos se escriben en un archivo de respaldo (JSON por línea) que
+se reintenta en el siguiente guardado exitoso. Cada guardado reclama el
+respaldo renombrándolo a un .replay propio (pid y uuid), así dos workers o un
+flush() que corre junto al hilo no leen los mismos eventos; los .replay de
+procesos que ya no existen se retoman. Si un lote falla se reintenta
+evento por evento: los que la base de datos rechaza (llave foránea a un
+usuario ya eliminado, valor demasiado largo) van a AUDIT_DEAD_LETTER_FILE en
+lugar de volver al respaldo, así no bloquean los guardados siguientes. Al
+cerrar el proceso de forma ordenada se vacía la cola; ante un cierre abrupto
+solo se pierde lo acumulado en la ventana actual (como máximo un lote o un
+intervalo).
+"""
+import atexit
+import glob
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from contextlib import suppress
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import uuid4
+from django.conf import settings
+from django.db import DataError, IntegrityError, close_old_connections, transaction
+from django.utils import timezone
+from webAMG.models import AuditLog, LoginLog
+
+logger = logging.getLogger(__name__)
+
+# Tipo de evento -> (modelo, campo con la fecha del evento)
+EVENT_MODELS = {
+    'login': (LoginLog, 'login_time'),
+    'audit': (AuditLog, 'performed_at'),
+}
+
+
+class AuditService:
+    """Servicio para registrar eventos de login y auditoría por lotes."""
+
+    DEFAULT_BATCH_SIZE = 100
+    DEFAULT_FLUSH_INTERVAL_MS = 500
+    DEFAULT_QUEUE_MAXSIZE = 10000
+
+    _queue: Optional[queue.Queue] = None
+    _thread: Optional[threading.Thread] = None
+    _lock = threading.Lock()
+    _spill_lock = threading.Lock()
+    _stopping = threading.Event()
+    # .replay reclamados por un guardado en curso de este proceso
+    _claimed: set = set()
+
+    # ------------------------------------------------------------------
+    # API pública
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def log_login(user_id: Optional[int], ip_address: str = None, user_agent: str = None,
+                  success: bool = False, failure_reason: str = None) -> None:
+        """
+        Registra un intento de login sin esperar a la base de datos.
+        """
+        AuditService._enqueue('login', {
+            'user_id': user_id,
+            'ip_address': ip_address,
+            'user_agent': user_agent,
+            'success': success,
+            'failure_reason': failure_reason,
+            'login_time': timezone.now(),
+        })
+
+    @staticmethod
+    def log_operation(table_name: str, operation: str, old_data: Any = None, new_data: Any = None,
+                      user_id: Optional[int] = None, ip_address: str = None) -> None:
+        """
+        Registra una operación en audit_log sin esperar a la base de datos.
+        """
+        AuditService._enqueue('audit', {
+            'table_name': table_name,
+            'operation': operation,
+            'old_data': old_data,
+            'new_data': new_data,
+            'user_id': user_id,
+            'ip_address': ip_address,
+            'performed_at': timezone.now(),
+        })
+
+    @staticmethod
+    def flush() -> int:
+        """
+        Guarda de inmediato todo lo que está en la cola (y el archivo de respaldo).
+
+        Returns:
+            Número de eventos procesados de la cola
+        """
+        events = []
+        if AuditService._queue is not None:
+            while True:
+                try:
+                    events.append(AuditService._queue.get_nowait())
+                except queue.Empty:
+                    break
+        AuditService._write(events)
+        return len(events)
+
+    @staticmethod
+    def shutdown(timeout: float = 5.0) -> None:
+        """
+        Detiene el hilo de escritura y vacía la cola. Se registra con atexit.
+        """
+        AuditService._stopping.set()
+        thread = AuditService._thread
+        if thread is not None and thread.is_alive():
+            thread.join(timeout)
+        AuditService.flush()
+
+    # ------------------------------------------------------------------
+    # Cola y hilo de escritura
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _setting(name: str, default):
+        return getattr(settings, name, default)
+
+    @staticmethod
+    def _spill_path() -> str:
+        return str(AuditService._setting(
+            'AUDIT_SPILL_FILE',
+            os.path.join(settings.BASE_DIR, 'logs', 'audit_spill.jsonl')
+        ))
+
+    @staticmethod
+    def _enqueue(kind: str, data: Dict[str, Any]) -> None:
+        AuditService._ensure_started()
+        try:
+            AuditService._queue.put_nowait((kind, data))
+        except queue.Full:
+            # La base de datos no da abasto: el evento va directo al respaldo
+            AuditService._spill([(kind, data)])
+
+    @staticmethod
+    def _ensure_started() -> None:
+        if AuditService._thread is not None and AuditService._thread.is_alive():
+            return
+        with AuditService._lock:
+            if AuditService._thread is not None and AuditService._thread.is_alive():
+                return
+            if AuditService._queue is None:
+                AuditService._queue = queue.Queue(
+                    maxsize=AuditService._setting('AUDIT_QUEUE_MAXSIZE', AuditService.DEFAULT_QUEUE_MAXSIZE)
+                )
+            AuditService._stopping.clear()
+            AuditService._thread = threading.Thread(
+                target=AuditService._run, name='audit-writer', daemon=True
+            )
+            AuditService._thread.start()
+            atexit.register(AuditService.shutdown)
+
+    @staticmethod
+    def _run() -> None:
+        """
+        Bucle del hilo: junta eventos hasta completar un lote o cumplir el intervalo.
+        """
+        batch_size = AuditService._setting('AUDIT_BATCH_SIZE', AuditService.DEFAULT_BATCH_SIZE)
+        interval = AuditService._setting('AUDIT_FLUSH_INTERVAL_MS', AuditService.DEFAULT_FLUSH_INTERVAL_MS) / 1000
+
+        while not AuditService._stopping.is_set():
+            events = []
+            deadline = time.monotonic() + interval
+            while len(events) < batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    events.append(AuditService._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            if not events:
+                continue
+            try:
+                AuditService._write(events)
+            except Exception as e:
+                # El hilo no debe morir: el lote vuelve al respaldo
+                logger.exception(f"Audit writer failed on a batch of {len(events)} events: {e}")
+                try:
+                    AuditService._spill(events)
+                except OSError as spill_error:
+                    logger.error(f"Audit writer lost {len(events)} events: {spill_error}")
+
+    # ------------------------------------------------------------------
+    # Escritura en base de datos y archivo de respaldo
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _write(events: List[tuple]) -> None:
+        """
+        Guarda eventos con un bulk_create por modelo en una sola transacción.
+        Antes reintenta los del archivo de respaldo; lo que no se pudo guardar
+        vuelve al respaldo y los .replay solo se borran cuando sus eventos
+        quedaron guardados o de nuevo en el respaldo.
+        """
+        replay_paths, spilled = AuditService._take_spill()
+        pending = spilled + list(events)
+
+        unsaved = []
+        keep_replays = True
+        try:
+            if pending:
+                close_old_connections()
+                try:
+                    unsaved = AuditService._store(pending)
+                finally:
+                    close_old_connections()
+
+            if unsaved:
+                try:
+                    AuditService._spill(unsaved)
+                except OSError as e:
+                    # Se conservan los .replay para reintentar sus eventos
+                    logger.error(f"Audit writer could not spill {len(unsaved)} events: {e}")
+                    return
+            keep_replays = False
+        finally:
+            AuditService._release(replay_paths, remove=not keep_replays)
+
+    @staticmethod
+    def _store(pending: List[tuple]) -> List[tuple]:
+        """
+        Guarda los eventos; si el lote falla, los reintenta uno por uno.
+
+        Returns:
+            Eventos que deben volver al archivo de respaldo
+        """
+        by_kind: Dict[str, list] = {}
+        for kind, data in pending:
+            by_kind.setdefault(kind, []).append(data)
+        try:
+            with transaction.atomic():
+                for kind, rows in by_kind.items():
+                    model, _ = EVENT_MODELS[kind]
+                    model.objects.bulk_create([model(**data) for data in rows])
+            return []
+        except Exception as e:
+            logger.warning(f"Audit batch of {len(pending)} events failed, retrying one by one: {e}")
+
+        rejected = []
+        for index, (kind, data) in enumerate(pending):
+            model, _ = EVENT_MODELS[kind]
+            try:
+                with transaction.atomic():
+                    model.objects.create(**data)
+            except (DataError, IntegrityError, TypeError, ValueError) as e:
+                # La base de datos rechaza la fila: reintentarla no sirve
+                rejected.append((kind, data, str(e)))
+            except Exception as e:
+                # Base de datos no disponible: el resto vuelve al respaldo
+                logger.error(f"Audit writer could not save {len(pending) - index} events, spilling to file: {e}")
+                AuditService._dead_letter(rejected)
+                return pending[index:]
+        AuditService._dead_letter(rejected)
+        return []
+
+    @staticmethod
+    def _dead_letter(rejected: List[tuple]) -> None:
+        """Aparta en AUDIT_DEAD_LETTER_FILE los eventos que la base de datos rechazó."""
+        if not rejected:
+            return
+        logger.error(f"Audit writer quarantined {len(rejected)} rejected events")
+        path = str(AuditService._setting(
+            'AUDIT_DEAD_LETTER_FILE',
+            os.path.join(settings.BASE_DIR, 'logs', 'audit_dead_letter.jsonl')
+        ))
+        try:
+            with AuditService._spill_lock:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, 'a', encoding='utf-8') as dead_file:
+                    for kind, data, error in rejected:
+                        dead_file.write(json.dumps({'kind': kind, 'data': data, 'error': error}, default=str) + '\n')
+        except OSError as e:
+            logger.error(f"Audit writer could not quarantine {len(rejected)} events: {e}")
+
+    @staticmethod
+    def _spill(events: List[tuple]) -> None:
+        """Agrega eventos al archivo de respaldo (una línea JSON por evento)."""
+        path = AuditService._spill_path()
+        with AuditService._spill_lock:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'a', encoding='utf-8') as spill_file:
+                for kind, data in events:
+                    spill_file.write(json.dumps({'kind': kind, 'data': data}, default=str) + '\n')
+                spill_file.flush()
+                os.fsync(spill_file.fileno())
+
+    @staticmethod
+    def _replay_in_use(replay_path: str, spill_path: str) -> bool:
+        """
+        Indica si un .replay pertenece a un guardado en curso. El nombre lleva
+        el pid del proceso que lo reclamó; el .replay sin pid es del formato
+        anterior y siempre se retoma.
+        """
+        pid = replay_path[len(spill_path) + 1:].split('.', 1)[0]
+        if not pid.isdigit():
+            return False
+        if int(pid) == os.getpid():
+            return replay_path in AuditService._claimed
+        try:
+            os.kill(int(pid), 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            pass
+        return True
+
+    @staticmethod
+    def _take_spill() -> Tuple[List[str], List[tuple]]:
+        """
+        Reclama el archivo de respaldo y los .replay abandonados renombrándolos
+        a "<archivo>.<pid>.<uuid>.replay" y lee sus eventos. Solo uno de los
+        que intentan el renombrado lo logra, así cada evento se lee una vez.
+        Los .replay se liberan (o borran) con _release después del intento de
+        guardado; si el proceso muere antes, otro los retoma.
+
+        Returns:
+            Tupla (rutas de los .replay reclamados, eventos)
+        """
+        path = AuditService._spill_path()
+        replay_paths = []
+        lines = []
+        with AuditService._spill_lock:
+            candidates = [
+                replay for replay in glob.glob(f'{glob.escape(path)}.*replay')
+                if not AuditService._replay_in_use(replay, path)
+            ]
+            for source in candidates + [path]:
+                replay_path = f'{path}.{os.getpid()}.{uuid4().hex}.replay'
+                try:
+                    os.rename(source, replay_path)
+                except FileNotFoundError:
+                    # Otro proceso lo reclamó primero
+                    continue
+                AuditService._claimed.add(replay_path)
+                replay_paths.append(replay_path)
+                with open(replay_path, encoding='utf-8') as spill_file:
+                    lines += spill_file.readlines()
+
+        events = []
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # Línea truncada por un cierre abrupto
+                continue
+            kind, data = record['kind'], record['data']
+            field = EVENT_MODELS[kind][1]
+            if data.get(field):
+                data[field] = datetime.fromisoformat(data[field])
+            events.append((kind, data))
+        return replay_paths, events
+
+    @staticmethod
+    def _release(replay_paths: List[str], remove: bool) -> None:
+        """
+        Libera los .replay reclamados; con remove=False quedan en disco y el
+        siguiente guardado los retoma.
+        """
+        with AuditService._spill_lock:
+            for replay_path in replay_paths:
+                AuditService._claimed.discard(replay_path)
+                if remove:
+                    with suppress(FileNotFoundError):
+                        os.remove(replay_path)
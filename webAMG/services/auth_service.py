@@ -1,12 +1,17 @@
 """
 Servicios de autenticación para el sistema.
 """
-import secrets
 import hashlib
 from datetime import datetime, timedelta
+from django.conf import settings
 from django.utils import timezone
 from django.contrib.auth import authenticate
-from webAMG.models import User, LoginLog, UserSession
+from webAMG.models import User, UserSession
+from webAMG.services.audit_service import AuditService
+from webAMG.sessions import SessionStore
+
+# Filas por UPDATE/DELETE al limpiar user_sessions
+SESSION_SWEEP_BATCH_SIZE = 1000
 
 
 class AuthService:
@@ -49,8 +54,8 @@ class AuthService:
             # Nota: Django usa check_password para contraseñas hasheadas
             if user.check_password(password):
                 # Registrar login exitoso
-                LoginLog.objects.create(
-                    user=user,
+                AuditService.log_login(
+                    user_id=user.id,
                     ip_address=ip_address,
                     user_agent=user_agent,
                     success=True
@@ -60,35 +65,19 @@ class AuthService:
                 user.last_login = timezone.now()
                 user.save(update_fields=['last_login'])
                 
-                # Crear sesión
-                session_token = AuthService._generate_session_token()
-                expires_at = timezone.now() + timedelta(hours=8)  # 8 horas de sesión
-                
-                session = UserSession.objects.create(
-                    user=user,
-                    session_token=session_token,
-                    ip_address=ip_address,
-                    user_agent=user_agent,
-                    expires_at=expires_at
-                )
+                # Crear sesión (la misma que usan las páginas, ver webAMG.sessions)
+                session = SessionStore.create_for_user(user, ip_address, user_agent)
                 
                 return {
                     'success': True,
-                    'user': {
-                        'id': user.id,
-                        'username': user.username,
-                        'email': user.email,
-                        'full_name': user.full_name,
-                        'role': user.role,
-                        'profile_image_url': user.profile_image_url,
-                    },
-                    'session_token': session_token,
-                    'expires_at': expires_at.isoformat()
+                    'user': AuthService.user_payload(user),
+                    'session_token': session.session_key,
+                    'expires_at': session.get_expiry_date().isoformat()
                 }
             else:
                 # Contraseña incorrecta
-                LoginLog.objects.create(
-                    user=user,
+                AuditService.log_login(
+                    user_id=user.id,
                     ip_address=ip_address,
                     user_agent=user_agent,
                     success=False,
@@ -102,8 +91,8 @@ class AuthService:
                 
         except User.DoesNotExist:
             # Usuario no encontrado
-            LoginLog.objects.create(
-                user=None,
+            AuditService.log_login(
+                user_id=None,
                 ip_address=ip_address,
                 user_agent=user_agent,
                 success=False,
@@ -126,25 +115,35 @@ class AuthService:
         Returns:
             dict con resultado de la operación
         """
-        try:
-            session = UserSession.objects.get(session_token=session_token, is_active=True)
-            session.is_active = False
-            session.save(update_fields=['is_active'])
-            
+        if SessionStore().delete(session_token):
             return {
                 'success': True,
                 'message': 'Sesión cerrada exitosamente'
             }
-        except UserSession.DoesNotExist:
-            return {
-                'success': False,
-                'error': 'Sesión no encontrada'
-            }
+        return {
+            'success': False,
+            'error': 'Sesión no encontrada'
+        }
+
+    @staticmethod
+    def user_payload(user) -> dict:
+        """
+        Datos públicos del usuario que devuelven login y verify_session.
+        """
+        return {
+            'id': user.id,
+            'username': user.username,
+            'email': user.email,
+            'full_name': user.full_name,
+            'role': user.role,
+            'profile_image_url': user.profile_image_url,
+        }
 
     @staticmethod
     def verify_session(session_token: str) -> dict:
         """
         Verifica si una sesión es válida y no ha expirado.
+        Usa el motor de sesiones (caché y luego user_sessions).
         
         Args:
             session_token: Token de sesión
@@ -152,50 +151,16 @@ class AuthService:
         Returns:
             dict con información del usuario si la sesión es válida
         """
-        try:
-            session = UserSession.objects.get(
-                session_token=session_token,
-                is_active=True
-            )
-            
-            # Verificar si expiró
-            if session.is_expired():
-                session.is_active = False
-                session.save(update_fields=['is_active'])
-                
-                return {
-                    'valid': False,
-                    'error': 'Sesión expirada'
-                }
-            
-            # Actualizar última actividad
-            session.last_activity = timezone.now()
-            session.save(update_fields=['last_activity'])
-            
-            return {
-                'valid': True,
-                'user': {
-                    'id': session.user.id,
-                    'username': session.user.username,
-                    'email': session.user.email,
-                    'full_name': session.user.full_name,
-                    'role': session.user.role,
-                    'profile_image_url': session.user.profile_image_url,
-                }
-            }
-            
-        except UserSession.DoesNotExist:
+        user = SessionStore(session_token).get_user()
+        if user is None:
             return {
                 'valid': False,
-                'error': 'Sesión no válida'
+                'error': 'Sesión no válida o expirada'
             }
-
-    @staticmethod
-    def _generate_session_token() -> str:
-        """
-        Genera un token de sesión seguro y único.
-        """
-        return secrets.token_urlsafe(64)
+        return {
+            'valid': True,
+            'user': AuthService.user_payload(user)
+        }
 
     @staticmethod
     def get_user_from_session(session_token: str):
@@ -208,25 +173,74 @@ class AuthService:
         Returns:
             User object o None si no es válido
         """
-        result = AuthService.verify_session(session_token)
-        if result['valid']:
-            try:
-                return User.objects.get(id=result['user']['id'])
-            except User.DoesNotExist:
-                return None
-        return None
+        return SessionStore(session_token).get_user()
 
     @staticmethod
-    def clean_expired_sessions() -> int:
+    def _in_batches(queryset, action, batch_size: int) -> int:
         """
-        Limpia las sesiones expiradas de la base de datos.
-        
+        Aplica action a un queryset por lotes de claves primarias, para no
+        bloquear la tabla con un solo UPDATE/DELETE grande.
+
+        Args:
+            queryset: Filas a procesar (deben dejar de cumplir el filtro tras action)
+            action: Función que recibe un queryset filtrado por pk y devuelve el conteo
+            batch_size: Tamaño de cada lote
+
+        Returns:
+            Total de filas procesadas
+        """
+        total = 0
+        while True:
+            pks = list(queryset.order_by().values_list('pk', flat=True)[:batch_size])
+            if not pks:
+                break
+            total += action(UserSession.objects.filter(pk__in=pks))
+            if len(pks) < batch_size:
+                break
+        return total
+
+    @staticmethod
+    def clean_expired_sessions(batch_size: int = SESSION_SWEEP_BATCH_SIZE) -> int:
+        """
+        Desactiva las sesiones activas que ya expiraron.
+
+        Returns:
+            Número de sesiones desactivadas
+        """
+        return AuthService._in_batches(
+            UserSession.objects.filter(expires_at__lt=timezone.now(), is_active=True),
+            lambda batch: batch.update(is_active=False),
+            batch_size
+        )
+
+    @staticmethod
+    def purge_sessions(retention_days: int = None, batch_size: int = SESSION_SWEEP_BATCH_SIZE) -> int:
+        """
+        Elimina las sesiones inactivas que expiraron hace más de retention_days.
+
         Returns:
             Número de sesiones eliminadas
         """
-        count, _ = UserSession.objects.filter(
-            expires_at__lt=timezone.now(),
-            is_active=True
-        ).update(is_active=False)
-        
-        return count
+        if retention_days is None:
+            retention_days = getattr(settings, 'SESSION_RETENTION_DAYS', 30)
+        return AuthService._in_batches(
+            UserSession.objects.filter(
+                expires_at__lt=timezone.now() - timedelta(days=retention_days),
+                is_active=False
+            ),
+            lambda batch: batch.delete()[0],
+            batch_size
+        )
+
+    @staticmethod
+    def sweep_sessions(retention_days: int = None, batch_size: int = SESSION_SWEEP_BATCH_SIZE) -> dict:
+        """
+        Desactiva las sesiones expiradas y luego elimina las antiguas.
+
+        Returns:
+            dict con 'deactivated' y 'deleted'
+        """
+        return {
+            'deactivated': AuthService.clean_expired_sessions(batch_size),
+            'deleted': AuthService.purge_sessions(retention_days, batch_size),
+        }
@@ -0,0 +1,51 @@
+"""
+Servicio de beneficiarios asignados a proyectos.
+
+Reemplaza al filtro de plantilla get_project_beneficiaries, que hacía dos
+consultas por proyecto: las vistas cargan en una sola consulta (join con
+project_beneficiaries) los beneficiarios de todos los proyectos de la página
+y la plantilla los obtiene con {{ beneficiaries_by_project|get_item:project.id }}.
+"""
+from typing import Dict, Iterable, List
+from django.db.models import F
+from webAMG.models import Beneficiary
+
+
+class BeneficiaryService:
+    """Servicio para obtener los beneficiarios de uno o varios proyectos."""
+
+    @staticmethod
+    def for_projects_queryset(project_ids: Iterable[int]):
+        """
+        Beneficiarios activos con asignación activa a los proyectos indicados,
+        ordenados por nombre. Cada fila lleva assigned_project_id; un
+        beneficiario aparece una vez por proyecto.
+        """
+        return Beneficiary.objects.filter(
+            is_active=True,
+            projectbeneficiary__project_id__in=list(project_ids),
+            projectbeneficiary__is_active=True,
+        ).annotate(
+            assigned_project_id=F('projectbeneficiary__project_id')
+        ).order_by('first_name', 'last_name')
+
+    @staticmethod
+    def for_project(project_id: int):
+        """Beneficiarios de un proyecto (queryset perezoso, una consulta)."""
+        return BeneficiaryService.for_projects_queryset([project_id])
+
+    @staticmethod
+    def by_project(project_ids: Iterable[int]) -> Dict[int, List[Beneficiary]]:
+        """
+        Beneficiarios de varios proyectos en una sola consulta.
+
+        Returns:
+            Diccionario project_id -> lista de beneficiarios (vacía si no tiene)
+        """
+        project_ids = list(project_ids)
+        result = {project_id: [] for project_id in project_ids}
+        if not project_ids:
+            return result
+        for beneficiary in BeneficiaryService.for_projects_queryset(project_ids):
+            result[beneficiary.assigned_project_id].append(beneficiary)
+        return result
@@ -0,0 +1,307 @@
+"""
+Servicio de importación masiva del censo de beneficiarios.
+
+Las hojas de censo (CSV o XLSX) se leen fila por fila sin cargarlas completas
+en memoria, se validan por lotes con CensusRowRequest, se descartan los CUI/DPI
+repetidos (dentro del archivo y contra la base de datos) y cada lote se escribe
+con bulk_create dentro de un savepoint. Los errores se reportan por fila.
+"""
+import csv
+import io
+import logging
+import os
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from django.db import DatabaseError, transaction
+from pydantic import TypeAdapter, ValidationError as PydanticValidationError
+from webAMG.api.validators import CensusRowRequest
+from webAMG.models import (
+    Beneficiary,
+    BeneficiaryHealth,
+    BeneficiaryEducation,
+    BeneficiaryHousing,
+    BeneficiaryEconomy,
+)
+from webAMG.services.census_service import CensusService
+
+logger = logging.getLogger(__name__)
+
+# Validador de un lote completo de filas en una sola llamada
+_ROW_BATCH_ADAPTER = TypeAdapter(List[CensusRowRequest])
+
+
+def _normalize_header(name: Any) -> str:
+    """
+    Normaliza un encabezado de columna ("Fecha de nacimiento " -> "fecha_de_nacimiento").
+    """
+    return str(name or '').strip().lower().replace(' ', '_')
+
+
+def _xlsx_cell(value: Any) -> Any:
+    """
+    Convierte una celda de Excel al mismo formato que entrega un CSV.
+    Las fechas se conservan; los números enteros pierden el ".0" de Excel.
+    """
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    return value
+
+
+class CensusImportService:
+    """Servicio para importar hojas de censo por lotes."""
+
+    BATCH_SIZE = 1000
+
+    # Errores incluidos en la respuesta del endpoint de importación
+    MAX_REPORTED_ERRORS = 500
+
+    # Campos de CensusRowRequest que van a la tabla beneficiaries
+    BENEFICIARY_FIELDS = (
+        'department', 'municipality', 'address', 'community', 'first_name', 'last_name',
+        'birth_place', 'birth_date', 'age', 'cui_dpi', 'gender', 'civil_status', 'ethnicity',
+        'linguistic_community', 'household_type', 'total_household_members', 'male_members',
+        'female_members', 'phone', 'mobile_phone', 'email', 'notes',
+    )
+
+    # Modelo de cada tabla satélite, con los mismos campos que el perfil de censo
+    SATELLITE_MODELS = {
+        'health': BeneficiaryHealth,
+        'education': BeneficiaryEducation,
+        'housing': BeneficiaryHousing,
+        'economy': BeneficiaryEconomy,
+    }
+
+    # ------------------------------------------------------------------
+    # Lectura de archivos
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def iter_csv_rows(stream: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Lee un CSV de texto fila por fila. Detecta coma o punto y coma.
+        """
+        stream = iter(stream)
+        first_line = next(stream, '')
+        # Excel en español exporta CSV separado por punto y coma
+        delimiter = ';' if first_line.count(';') > first_line.count(',') else ','
+        header = [_normalize_header(name) for name in next(csv.reader([first_line], delimiter=delimiter), [])]
+        for row in csv.reader(stream, delimiter=delimiter):
+            yield dict(zip(header, row))
+
+    @staticmethod
+    def iter_xlsx_rows(file_obj) -> Iterator[Dict[str, Any]]:
+        """
+        Lee la primera hoja de un XLSX en modo de solo lectura (streaming).
+        """
+        try:
+            from openpyxl import load_workbook
+        except ImportError:
+            raise ValueError('Para importar archivos XLSX instale openpyxl')
+
+        workbook = load_workbook(file_obj, read_only=True, data_only=True)
+        try:
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            header = None
+            for row in rows:
+                if header is None:
+                    header = [_normalize_header(name) for name in row]
+                    continue
+                yield dict(zip(header, (_xlsx_cell(value) for value in row)))
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def iter_file_rows(file_obj, filename: str) -> Iterator[Dict[str, Any]]:
+        """
+        Elige el lector según la extensión del archivo.
+
+        Args:
+            file_obj: Archivo abierto en modo binario
+            filename: Nombre original del archivo
+
+        Returns:
+            Iterador de filas como diccionarios
+        """
+        extension = os.path.splitext(filename)[1].lower()
+        if extension == '.xlsx':
+            return CensusImportService.iter_xlsx_rows(file_obj)
+        if extension == '.csv':
+            text = io.TextIOWrapper(file_obj, encoding='utf-8-sig', newline='')
+            return CensusImportService.iter_csv_rows(text)
+        raise ValueError('Formato no soportado, use CSV o XLSX')
+
+    # ------------------------------------------------------------------
+    # Validación y escritura
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def validate_batch(batch: List[Tuple[int, Dict[str, Any]]]) -> Tuple[List[Tuple[int, CensusRowRequest]], List[Dict[str, Any]]]:
+        """
+        Valida un lote de filas con una sola llamada a pydantic.
+        Si alguna fila falla, se separan sus errores y se vuelve a validar el resto.
+
+        Args:
+            batch: Lista de (número de fila, datos crudos)
+
+        Returns:
+            Tupla (filas válidas, errores por fila)
+        """
+        errors: Dict[int, Dict[str, str]] = {}
+        pending = batch
+        while pending:
+            try:
+                rows = _ROW_BATCH_ADAPTER.validate_python([data for _, data in pending])
+                break
+            except PydanticValidationError as e:
+                failed = set()
+                for error in e.errors():
+                    index = error['loc'][0]
+                    field = '.'.join(str(loc) for loc in error['loc'][1:]) or 'general'
+                    failed.add(index)
+                    errors.setdefault(pending[index][0], {})[field] = error['msg']
+                pending = [item for i, item in enumerate(pending) if i not in failed]
+        else:
+            rows = []
+
+        valid = [(line, row) for (line, _), row in zip(pending, rows)]
+        return valid, [{'row': line, 'errors': errs} for line, errs in sorted(errors.items())]
+
+    @staticmethod
+    def _build_objects(row: CensusRowRequest, created_by=None) -> Tuple[Beneficiary, Dict[str, Dict[str, Any]]]:
+        """
+        Construye el beneficiario y los datos de sus satélites a partir de una fila.
+        Solo se crea un satélite si la fila trae al menos uno de sus campos.
+        """
+        values = row.model_dump()
+        beneficiary = Beneficiary(
+            created_by=created_by,
+            **{
+                field: values[field] for field in CensusImportService.BENEFICIARY_FIELDS
+                if values[field] is not None
+            }
+        )
+        satellites = {}
+        for relation, fields in CensusService.SATELLITE_FIELDS.items():
+            data = {field: values[field] for field in fields if values.get(field) is not None}
+            if data:
+                satellites[relation] = data
+        return beneficiary, satellites
+
+    @staticmethod
+    def _write_rows(built: List[Tuple[Beneficiary, Dict[str, Dict[str, Any]]]]) -> None:
+        """
+        Inserta beneficiarios y satélites con un bulk_create por tabla.
+        """
+        beneficiaries = Beneficiary.objects.bulk_create([beneficiary for beneficiary, _ in built])
+        for relation, model in CensusImportService.SATELLITE_MODELS.items():
+            model.objects.bulk_create([
+                model(beneficiary_id=beneficiary.id, **satellites[relation])
+                for beneficiary, (_, satellites) in zip(beneficiaries, built)
+                if relation in satellites
+            ])
+
+    @staticmethod
+    def write_batch(rows: List[Tuple[int, CensusRowRequest]], created_by=None) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Escribe un lote validado dentro de un savepoint.
+        Si el lote completo falla (por ejemplo, un CUI insertado por otro proceso),
+        se reintenta fila por fila, cada una en su propio savepoint, para
+        reportar exactamente qué filas no se pudieron guardar.
+
+        Returns:
+            Tupla (filas creadas, errores por fila)
+        """
+        built = [CensusImportService._build_objects(row, created_by) for _, row in rows]
+        try:
+            with transaction.atomic():
+                CensusImportService._write_rows(built)
+            return len(built), []
+        except DatabaseError as e:
+            logger.warning(f"Census batch failed, retrying row by row: {e}")
+
+        created = 0
+        errors = []
+        for (line, row), item in zip(rows, built):
+            # El beneficiario pudo recibir un id del intento fallido
+            item[0].pk = None
+            try:
+                with transaction.atomic():
+                    CensusImportService._write_rows([item])
+                created += 1
+            except DatabaseError as e:
+                errors.append({'row': line, 'errors': {'general': str(e).strip()}})
+        return created, errors
+
+    @staticmethod
+    def import_rows(rows: Iterable[Dict[str, Any]], created_by=None,
+                    batch_size: Optional[int] = None, dry_run: bool = False) -> Dict[str, Any]:
+        """
+        Importa filas de censo por lotes.
+        Los números de fila empiezan en 2 (la fila 1 es el encabezado).
+
+        Args:
+            rows: Iterador de filas como diccionarios
+            created_by: Usuario que realiza la importación
+            batch_size: Filas por lote (default: BATCH_SIZE)
+            dry_run: Solo validar y detectar duplicados, sin escribir
+
+        Returns:
+            dict con total, created, duplicates, error_count y errors
+        """
+        batch_size = batch_size or CensusImportService.BATCH_SIZE
+        result = {'total': 0, 'created': 0, 'duplicates': 0, 'error_count': 0, 'errors': []}
+        seen_cuis: Set[str] = set()
+
+        def flush(batch):
+            valid, errors = CensusImportService.validate_batch(batch)
+            result['errors'].extend(errors)
+
+            # Duplicados dentro del archivo y contra la base de datos
+            cuis = {row.cui_dpi for _, row in valid if row.cui_dpi}
+            existing = set(
+                Beneficiary.objects.filter(cui_dpi__in=cuis).values_list('cui_dpi', flat=True)
+            ) if cuis else set()
+            unique = []
+            for line, row in valid:
+                if row.cui_dpi:
+                    if row.cui_dpi in existing or row.cui_dpi in seen_cuis:
+                        result['duplicates'] += 1
+                        result['errors'].append({
+                            'row': line,
+                            'errors': {'cui_dpi': f'CUI/DPI duplicado: {row.cui_dpi}'}
+                        })
+                        continue
+                    seen_cuis.add(row.cui_dpi)
+                unique.append((line, row))
+
+            if dry_run or not unique:
+                return
+            created, errors = CensusImportService.write_batch(unique, created_by)
+            result['created'] += created
+            result['errors'].extend(errors)
+
+        batch = []
+        for line, data in enumerate(rows, start=2):
+            if not any(value not in (None, '') and str(value).strip() for value in data.values()):
+                continue
+            result['total'] += 1
+            batch.append((line, data))
+            if len(batch) >= batch_size:
+                flush(batch)
+                batch = []
+        if batch:
+            flush(batch)
+
+        result['errors'].sort(key=lambda error: error['row'])
+        result['error_count'] = len(result['errors'])
+        logger.info(
+            f"Census import: {result['total']} rows, {result['created']} created, "
+            f"{result['duplicates']} duplicates, {result['error_count']} errors"
+        )
+        return result
@@ -0,0 +1,199 @@
+"""
+Servicio de lectura del perfil de censo de beneficiarios.
+
+Un perfil de censo es el beneficiario junto con sus cuatro tablas satélite
+(salud, educación, vivienda y economía). El listado usa
+Beneficiary.objects.with_census() y la exportación lee la vista
+beneficiary_census_profiles, de modo que cada página cuesta una sola consulta.
+"""
+import csv
+from itertools import islice
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple
+from asgiref.sync import sync_to_async
+from django.db import connection
+from webAMG.models import (
+    Beneficiary,
+    BeneficiaryHealth,
+    BeneficiaryEducation,
+    BeneficiaryHousing,
+    BeneficiaryEconomy,
+)
+
+
+def _satellite_fields(model) -> Tuple[str, ...]:
+    """
+    Campos de una tabla satélite que forman parte del perfil.
+    Se omiten la llave hacia el beneficiario y las marcas de tiempo.
+    """
+    excluded = {'beneficiary', 'created_at', 'updated_at'}
+    return tuple(
+        field.attname for field in model._meta.concrete_fields
+        if field.name not in excluded
+    )
+
+
+class CensusService:
+    """Servicio para listar y exportar perfiles de censo."""
+
+    VIEW_NAME = 'beneficiary_census_profiles'
+
+    # Campos del beneficiario incluidos en el perfil compacto
+    CORE_FIELDS = (
+        'id', 'first_name', 'last_name', 'cui_dpi', 'gender', 'birth_date', 'age',
+        'department', 'municipality', 'community', 'civil_status', 'ethnicity',
+        'linguistic_community', 'household_type', 'total_household_members',
+        'male_members', 'female_members', 'phone', 'mobile_phone', 'is_active',
+    )
+
+    # related_name de cada satélite -> campos que se serializan
+    SATELLITE_FIELDS = {
+        'health': _satellite_fields(BeneficiaryHealth),
+        'education': _satellite_fields(BeneficiaryEducation),
+        'housing': _satellite_fields(BeneficiaryHousing),
+        'economy': _satellite_fields(BeneficiaryEconomy),
+    }
+
+    # Filtros permitidos en listado y exportación (parámetro -> columna)
+    FILTER_FIELDS = ('department', 'municipality', 'community')
+
+    MAX_PAGE_SIZE = 200
+    EXPORT_PAGE_SIZE = 1000
+
+    @staticmethod
+    def serialize_profile(beneficiary: Beneficiary) -> Dict[str, Any]:
+        """
+        Serializa un beneficiario cargado con with_census().
+        Las tablas satélite que no existen se devuelven como None.
+        """
+        data = {}
+        for field in CensusService.CORE_FIELDS:
+            value = getattr(beneficiary, field)
+            data[field] = value.isoformat() if field == 'birth_date' and value else value
+
+        for relation, fields in CensusService.SATELLITE_FIELDS.items():
+            satellite = getattr(beneficiary, relation, None)
+            if satellite is None:
+                data[relation] = None
+            else:
+                data[relation] = {field: getattr(satellite, field) for field in fields}
+
+        return data
+
+    @staticmethod
+    def _clean_filters(filters: Optional[Dict[str, str]]) -> Dict[str, str]:
+        """
+        Descarta filtros vacíos o no permitidos.
+        """
+        filters = filters or {}
+        return {
+            field: filters[field].strip()
+            for field in CensusService.FILTER_FIELDS
+            if filters.get(field) and filters[field].strip()
+        }
+
+    @staticmethod
+    def list_profiles(after_id: int = 0, page_size: int = 50,
+                      filters: Optional[Dict[str, str]] = None,
+                      include_inactive: bool = False) -> Dict[str, Any]:
+        """
+        Obtiene una página de perfiles de censo con paginación por llave (id).
+        Se pide un elemento extra para saber si hay más páginas, así que cada
+        página cuesta exactamente una consulta.
+
+        Args:
+            after_id: Último id de la página anterior (0 para la primera)
+            page_size: Tamaño de página (máximo MAX_PAGE_SIZE)
+            filters: Filtros por department, municipality o community
+            include_inactive: Incluir beneficiarios inactivos
+
+        Returns:
+            dict con items, next_after y has_next
+        """
+        page_size = max(1, min(page_size, CensusService.MAX_PAGE_SIZE))
+
+        queryset = Beneficiary.objects.with_census().filter(id__gt=after_id)
+        if not include_inactive:
+            queryset = queryset.filter(is_active=True)
+        for field, value in CensusService._clean_filters(filters).items():
+            queryset = queryset.filter(**{f'{field}__iexact': value})
+
+        rows = list(queryset.order_by('id')[:page_size + 1])
+        has_next = len(rows) > page_size
+        rows = rows[:page_size]
+
+        return {
+            'items': [CensusService.serialize_profile(b) for b in rows],
+            'next_after': rows[-1].id if has_next else None,
+            'has_next': has_next,
+        }
+
+    @staticmethod
+    def iter_export_rows(filters: Optional[Dict[str, str]] = None,
+                         include_inactive: bool = False,
+                         page_size: Optional[int] = None) -> Iterator[Sequence[Any]]:
+        """
+        Recorre la vista beneficiary_census_profiles por páginas de llave.
+        La primera fila generada son los nombres de columna.
+
+        Yields:
+            Encabezado y luego una tupla por beneficiario
+        """
+        page_size = page_size or CensusService.EXPORT_PAGE_SIZE
+        conditions = ['id > %s']
+        params: List[Any] = []
+        if not include_inactive:
+            conditions.append('is_active = TRUE')
+        for field, value in CensusService._clean_filters(filters).items():
+            # Los nombres de columna vienen de FILTER_FIELDS, nunca del usuario
+            conditions.append(f'UPPER({field}) = UPPER(%s)')
+            params.append(value)
+
+        sql = (
+            f'SELECT * FROM {CensusService.VIEW_NAME} '
+            f'WHERE {" AND ".join(conditions)} '
+            f'ORDER BY id LIMIT %s'
+        )
+
+        last_id = 0
+        header_sent = False
+        with connection.cursor() as cursor:
+            while True:
+                cursor.execute(sql, [last_id, *params, page_size])
+                if not header_sent:
+                    yield [column[0] for column in cursor.description]
+                    header_sent = True
+                rows = cursor.fetchall()
+                yield from rows
+                if len(rows) < page_size:
+                    break
+                last_id = rows[-1][0]
+
+    @staticmethod
+    async def aiter_export_csv(filters: Optional[Dict[str, str]] = None,
+                               include_inactive: bool = False) -> AsyncIterator[str]:
+        """
+        CSV de iter_export_rows para StreamingHttpResponse bajo ASGI (daphne).
+        Con un iterador síncrono Django lee toda la respuesta antes de
+        enviarla; aquí cada página se pide con sync_to_async (en el mismo
+        hilo, que es el dueño del cursor) y se envía en cuanto llega.
+
+        Yields:
+            Líneas CSV de una página (la primera incluye el encabezado)
+        """
+        class Echo:
+            """Buffer que devuelve cada línea escrita por csv.writer."""
+            def write(self, value):
+                return value
+
+        writer = csv.writer(Echo())
+        rows = CensusService.iter_export_rows(filters=filters, include_inactive=include_inactive)
+        next_page = sync_to_async(lambda: list(islice(rows, CensusService.EXPORT_PAGE_SIZE)))
+        try:
+            while True:
+                page = await next_page()
+                if not page:
+                    break
+                yield ''.join(writer.writerow(row) for row in page)
+        finally:
+            # Cierra el cursor aunque el cliente se desconecte a medias
+            await sync_to_async(rows.close)()
@@ -0,0 +1,88 @@
+"""
+Servicio de peticiones condicionales (ETag / Last-Modified) para las vistas JSON.
+
+Las señales actualizan project.updated_at cada vez que cambian las fases,
+evidencias, fotos o beneficiarios del proyecto, así que ese valor basta como
+versión de los datos que devuelven estas vistas. Se obtiene con una sola
+consulta por clave primaria antes de ejecutar la vista; si coincide con
+If-None-Match / If-Modified-Since se responde 304 sin serializar nada.
+"""
+import functools
+import hashlib
+from datetime import datetime
+from typing import Callable, Optional
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition
+from webAMG.models import PhaseEvidence, Project, ProjectEvidence
+
+
+class ConditionalService:
+    """Versiones (updated_at) de los recursos servidos con GET condicional."""
+
+    @staticmethod
+    def project_version(project_id: int) -> Optional[datetime]:
+        """updated_at del proyecto activo; None si no existe."""
+        return Project.objects.filter(pk=project_id).values_list('updated_at', flat=True).first()
+
+    @staticmethod
+    def project_evidence_version(project_id: int, evidence_id: int) -> Optional[datetime]:
+        """updated_at del proyecto de una evidencia activa del proyecto activo."""
+        return ProjectEvidence.objects.filter(
+            pk=evidence_id,
+            project_id=project_id,
+            project__is_active=True,
+        ).values_list('project__updated_at', flat=True).first()
+
+    @staticmethod
+    def phase_evidence_version(project_id: int, phase_id: int, evidence_id: int) -> Optional[datetime]:
+        """updated_at del proyecto de una evidencia activa de una fase activa."""
+        return PhaseEvidence.objects.filter(
+            pk=evidence_id,
+            phase_id=phase_id,
+            phase__is_active=True,
+            phase__project_id=project_id,
+            phase__project__is_active=True,
+        ).values_list('phase__project__updated_at', flat=True).first()
+
+    @staticmethod
+    def make_etag(path: str, version: datetime) -> str:
+        """ETag de una URL en una versión concreta (sin comillas)."""
+        return hashlib.md5(f'{path}:{version.isoformat()}'.encode(), usedforsecurity=False).hexdigest()
+
+
+def conditional_get(version_func: Callable) -> Callable:
+    """
+    Decorador que responde 304 Not Modified cuando el cliente ya tiene la
+    versión actual del recurso, antes de ejecutar la vista.
+
+    Args:
+        version_func: Recibe los argumentos de URL de la vista y devuelve el
+            updated_at que versiona la respuesta (None si el recurso no existe;
+            en ese caso la vista se ejecuta y responde 404)
+
+    Las respuestas llevan ETag, Last-Modified y "Cache-Control: private,
+    no-cache" para que el navegador las guarde y las revalide siempre.
+    """
+    def decorator(view_func):
+        def version(request, *args, **kwargs):
+            # condition() pide el ETag y Last-Modified por separado; una sola consulta
+            if not hasattr(request, '_conditional_version'):
+                request._conditional_version = version_func(*args, **kwargs)
+            return request._conditional_version
+
+        def etag(request, *args, **kwargs):
+            value = version(request, *args, **kwargs)
+            return ConditionalService.make_etag(request.path, value) if value else None
+
+        conditional_view = condition(etag_func=etag, last_modified_func=version)(view_func)
+
+        @functools.wraps(view_func)
+        def wrapped_view(request, *args, **kwargs):
+            response = conditional_view(request, *args, **kwargs)
+            if response.has_header('ETag'):
+                patch_cache_control(response, private=True, no_cache=True)
+            return response
+
+        return wrapped_view
+
+    return decorator
@@ -0,0 +1,115 @@
+"""
+Servicio de datos del panel principal (componentes de ReactPy).
+
+Las consultas usan el ORM asíncrono de Django porque los componentes se
+ejecutan en el event loop de su WebSocket. Las estadísticas son iguales para
+todos los usuarios y se guardan en la caché de Django DASHBOARD_CACHE_TTL
+segundos; las filas de proyectos se piden por lotes (webAMG.core.loaders).
+"""
+from datetime import datetime
+from typing import Any, Dict, Iterable, List
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+from webAMG.models import (
+    Beneficiary,
+    BudgetExecution,
+    DailyActivity,
+    DuplicateCandidate,
+    DuplicateStatus,
+    Project,
+    ProjectStatus,
+)
+
+STATS_CACHE_KEY = 'dashboard_stats'
+
+# Proyectos que cuentan como activos en el panel
+ACTIVE_PROJECT_STATUSES = (ProjectStatus.PLANIFICADO, ProjectStatus.EN_PROGRESO, ProjectStatus.PAUSADO)
+
+PROJECT_ROW_FIELDS = ('id', 'project_name', 'project_code', 'municipality', 'department', 'status', 'progress_percentage', 'start_date')
+
+
+class DashboardService:
+    """Servicio de consultas asíncronas para los componentes del dashboard."""
+
+    @staticmethod
+    def _month_start() -> datetime:
+        now = timezone.localtime()
+        return now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+    @staticmethod
+    async def _compute_stats() -> Dict[str, Any]:
+        month_start = DashboardService._month_start()
+        projects = await Project.objects.aaggregate(
+            active=Count('id', filter=Q(status__in=ACTIVE_PROJECT_STATUSES)),
+            new_this_month=Count('id', filter=Q(created_at__gte=month_start)),
+            budget=Sum('estimated_budget'),
+        )
+        beneficiaries = await Beneficiary.objects.filter(is_active=True).aaggregate(
+            total=Count('id'),
+            new_this_month=Count('id', filter=Q(created_at__gte=month_start)),
+        )
+        spent = await BudgetExecution.objects.aaggregate(total=Sum('total_amount'))
+        activities = await DailyActivity.objects.aaggregate(
+            total=Count('id'),
+            this_month=Count('id', filter=Q(activity_date__gte=month_start.date())),
+        )
+        pending_duplicates = await DuplicateCandidate.objects.filter(status=DuplicateStatus.PENDIENTE).acount()
+
+        budget = projects['budget'] or 0
+        spent_total = spent['total'] or 0
+        return {
+            'active_projects': projects['active'],
+            'new_projects': projects['new_this_month'],
+            'beneficiaries': beneficiaries['total'],
+            'new_beneficiaries': beneficiaries['new_this_month'],
+            'budget_executed': round(spent_total * 100 / budget) if budget else 0,
+            'activities': activities['total'],
+            'activities_this_month': activities['this_month'],
+            'pending_duplicates': pending_duplicates,
+        }
+
+    @staticmethod
+    async def stats() -> Dict[str, Any]:
+        """
+        Estadísticas del panel, compartidas entre conexiones mediante la caché.
+
+        Returns:
+            Diccionario con los totales de proyectos, beneficiarios,
+            presupuesto ejecutado (%), actividades y duplicados pendientes
+        """
+        stats = await cache.aget(STATS_CACHE_KEY)
+        if stats is None:
+            stats = await DashboardService._compute_stats()
+            await cache.aset(STATS_CACHE_KEY, stats, settings.DASHBOARD_CACHE_TTL)
+        return stats
+
+    @staticmethod
+    async def recent_project_ids(limit: int = 5) -> List[int]:
+        """Ids de los proyectos activos modificados más recientemente."""
+        queryset = Project.objects.order_by('-updated_at').values_list('id', flat=True)[:limit]
+        return [project_id async for project_id in queryset]
+
+    @staticmethod
+    def format_project_row(row: Dict[str, Any]) -> Dict[str, Any]:
+        """Convierte una fila de values() en los argumentos de project_row."""
+        return {
+            'project_name': row['project_name'],
+            'location': ', '.join(part for part in (row['municipality'], row['department']) if part),
+            'status': ProjectStatus(row['status']).label,
+            'progress': int(row['progress_percentage'] or 0),
+            'date': row['start_date'].strftime('%d/%m/%Y') if row['start_date'] else '',
+        }
+
+    @staticmethod
+    async def project_rows(project_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Datos de project_row de varios proyectos en una sola consulta.
+
+        Returns:
+            Diccionario project_id -> argumentos de project_row (sin los
+            proyectos que no existen o están inactivos)
+        """
+        queryset = Project.objects.filter(pk__in=list(project_ids)).values(*PROJECT_ROW_FIELDS)
+        return {row['id']: DashboardService.format_project_row(row) async for row in queryset}
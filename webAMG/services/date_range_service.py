@@ -0,0 +1,78 @@
+"""
+Servicio de filtros por rango de fechas.
+
+Project, ProjectPhase, ProjectEvidence y PhaseEvidence tienen la columna
+generada date_range = daterange(start_date, end_date, '[]') con índice GiST.
+Los filtros de las vistas (desde, hasta y año) se combinan en un solo
+predicado "date_range && rango", que usa ese índice en lugar de varias
+ramas OR sobre start_date y end_date.
+"""
+from datetime import date, datetime
+from typing import Optional
+from django.db.backends.postgresql.psycopg_any import DateRange
+
+
+class DateRangeService:
+    """Servicio para filtrar querysets por solapamiento de fechas."""
+
+    MIN_YEAR = 1
+    MAX_YEAR = 2100
+
+    @staticmethod
+    def parse_date(value) -> Optional[date]:
+        """Fecha 'AAAA-MM-DD' de un parámetro GET; None si falta o no es válida."""
+        try:
+            return datetime.strptime(value, '%Y-%m-%d').date() if value else None
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def parse_year(value) -> Optional[int]:
+        """Año de un parámetro GET; None si falta o está fuera de rango."""
+        try:
+            year = int(value) if value else None
+        except (TypeError, ValueError):
+            return None
+        if year is None or not DateRangeService.MIN_YEAR <= year <= DateRangeService.MAX_YEAR:
+            return None
+        return year
+
+    @staticmethod
+    def overlaps(queryset, start: Optional[date] = None, end: Optional[date] = None):
+        """
+        Filas cuyo rango se cruza con [start, end] (ambos incluidos).
+        Un límite en None deja ese lado abierto; las filas sin end_date
+        siguen vigentes y se cruzan con cualquier rango posterior a su inicio.
+        """
+        return queryset.filter(date_range__overlap=DateRange(start, end, '[]'))
+
+    @staticmethod
+    def contains(queryset, day: date):
+        """Filas vigentes en la fecha indicada."""
+        return queryset.filter(date_range__contains=day)
+
+    @staticmethod
+    def in_year(queryset, year: int):
+        """Filas vigentes en algún momento del año."""
+        return DateRangeService.overlaps(queryset, date(year, 1, 1), date(year, 12, 31))
+
+    @staticmethod
+    def filter_queryset(queryset, start_value=None, end_value=None, year_value=None):
+        """
+        Aplica los filtros de fecha de las vistas (valores de request.GET) como
+        un solo solapamiento: el rango pedido recortado al año, si se indica.
+        Los valores inválidos se ignoran.
+        """
+        start = DateRangeService.parse_date(start_value)
+        end = DateRangeService.parse_date(end_value)
+        year = DateRangeService.parse_year(year_value)
+
+        if year is not None:
+            start = max(start, date(year, 1, 1)) if start else date(year, 1, 1)
+            end = min(end, date(year, 12, 31)) if end else date(year, 12, 31)
+
+        if start is None and end is None:
+            return queryset
+        if start and end and start > end:
+            return queryset.none()
+        return DateRangeService.overlaps(queryset, start, end)
@@ -0,0 +1,427 @@
+"""
+Servicio de detección y fusión de beneficiarios duplicados.
+
+Cada beneficiario recibe llaves de bloqueo (nombre fonético + fecha de
+nacimiento, nombre fonético + municipio, fecha + municipio y CUI/DPI). Solo
+los beneficiarios que comparten una llave se comparan entre sí, así que el
+costo depende del tamaño de los bloques y no del tamaño del censo. La
+indexación es incremental: solo procesa beneficiarios nuevos o modificados
+desde su última indexación.
+"""
+import logging
+import re
+import unicodedata
+from datetime import date
+from difflib import SequenceMatcher
+from typing import Any, Dict, List, Optional, Set, Tuple
+from django.db import transaction
+from django.db.models import F, Max, Q
+from django.utils import timezone
+from webAMG.models import (
+    Beneficiary,
+    BeneficiaryMatchKey,
+    DuplicateCandidate,
+    DuplicateStatus,
+    ProjectBeneficiary,
+    PhaseBeneficiary,
+    EvidenceBeneficiary,
+    PhaseEvidenceBeneficiary,
+    BeneficiaryHealth,
+    BeneficiaryEducation,
+    BeneficiaryHousing,
+    BeneficiaryEconomy,
+)
+
+logger = logging.getLogger(__name__)
+
+# Reglas fonéticas para nombres en español, aplicadas en orden
+_PHONETIC_RULES = (
+    (re.compile(r'h'), ''),
+    (re.compile(r'qu'), 'k'),
+    (re.compile(r'c(?=[ei])'), 's'),
+    (re.compile(r'g(?=[ei])'), 'j'),
+    (re.compile(r'gu(?=[ei])'), 'g'),
+    (re.compile(r'c'), 'k'),
+    (re.compile(r'z'), 's'),
+    (re.compile(r'v'), 'b'),
+    (re.compile(r'll'), 'y'),
+    (re.compile(r'i(?=[aeou])'), 'y'),
+    (re.compile(r'w'), 'gu'),
+    (re.compile(r'(.)\1+'), r'\1'),
+)
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """
+    Minúsculas, sin tildes y solo letras y espacios ("  José  Pérez" -> "jose perez").
+    """
+    if not text:
+        return ''
+    text = unicodedata.normalize('NFKD', text)
+    text = ''.join(c for c in text if not unicodedata.combining(c)).lower()
+    return ' '.join(re.sub(r'[^a-z ]', ' ', text).split())
+
+
+def phonetic_key(word: str) -> str:
+    """
+    Llave fonética de una palabra normalizada (Vásquez, Vasques y Basquez
+    producen la misma llave).
+    """
+    for pattern, replacement in _PHONETIC_RULES:
+        word = pattern.sub(replacement, word)
+    return word
+
+
+def _first_token(text: Optional[str]) -> str:
+    tokens = normalize_text(text).split()
+    return tokens[0] if tokens else ''
+
+
+class DuplicateService:
+    """Servicio para indexar, puntuar y fusionar beneficiarios duplicados."""
+
+    # Puntaje mínimo para enviar un par a la cola de revisión
+    MATCH_THRESHOLD = 0.8
+
+    # Bloques más grandes que esto no discriminan y se omiten
+    MAX_BLOCK_SIZE = 50
+
+    BATCH_SIZE = 500
+
+    # Campos que se cargan para puntuar un par
+    SCORE_FIELDS = ('id', 'first_name', 'last_name', 'birth_date', 'municipality', 'cui_dpi')
+
+    # Tablas de relación que apuntan al beneficiario -> campo del padre
+    LINK_MODELS = (
+        (ProjectBeneficiary, 'project_id'),
+        (PhaseBeneficiary, 'phase_id'),
+        (EvidenceBeneficiary, 'evidence_id'),
+        (PhaseEvidenceBeneficiary, 'phase_evidence_id'),
+    )
+
+    SATELLITE_MODELS = (BeneficiaryHealth, BeneficiaryEducation, BeneficiaryHousing, BeneficiaryEconomy)
+
+    # Campos del beneficiario conservado que se completan con los del duplicado
+    FILL_FIELDS = (
+        'cui_dpi', 'birth_date', 'birth_place', 'address', 'community', 'gender',
+        'phone', 'mobile_phone', 'email',
+    )
+
+    # ------------------------------------------------------------------
+    # Llaves y puntaje (sin base de datos)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def block_keys(first_name: str, last_name: str, birth_date: Optional[date],
+                   municipality: Optional[str], cui_dpi: Optional[str]) -> Set[str]:
+        """
+        Llaves de bloqueo de un beneficiario.
+        Solo se usa el primer nombre y el primer apellido, porque es común
+        registrar a la misma persona con o sin su segundo nombre.
+        """
+        keys = set()
+        name = f"{phonetic_key(_first_token(first_name))}_{phonetic_key(_first_token(last_name))}"
+        place = normalize_text(municipality).replace(' ', '_')
+
+        if birth_date:
+            keys.add(f"nd:{name}:{birth_date.isoformat()}")
+        if place:
+            keys.add(f"nm:{name}:{place}")
+        if birth_date and place:
+            # Atrapa errores de escritura que la llave fonética no corrige
+            keys.add(f"dm:{birth_date.isoformat()}:{place}")
+        if cui_dpi:
+            keys.add(f"c:{cui_dpi}")
+        return keys
+
+    @staticmethod
+    def score_pair(a, b) -> Tuple[float, List[str]]:
+        """
+        Puntúa la probabilidad de que dos beneficiarios sean la misma persona.
+
+        Returns:
+            Tupla (puntaje entre 0 y 1, campos que coinciden)
+        """
+        if a.cui_dpi and b.cui_dpi:
+            # Dos CUI distintos son dos personas distintas
+            return (1.0, ['cui_dpi']) if a.cui_dpi == b.cui_dpi else (0.0, [])
+
+        name_a = normalize_text(f"{a.first_name} {a.last_name}")
+        name_b = normalize_text(f"{b.first_name} {b.last_name}")
+        name_score = max(
+            SequenceMatcher(None, name_a, name_b).ratio(),
+            SequenceMatcher(None, phonetic_key(name_a), phonetic_key(name_b)).ratio(),
+        )
+
+        reasons = ['nombre'] if name_score >= 0.85 else []
+
+        # Dato faltante en uno de los dos: no suma ni resta
+        date_score = 0.5
+        if a.birth_date and b.birth_date:
+            date_score = 1.0 if a.birth_date == b.birth_date else 0.0
+            if date_score:
+                reasons.append('fecha_nacimiento')
+
+        place_score = 0.5
+        if a.municipality and b.municipality:
+            place_score = 1.0 if normalize_text(a.municipality) == normalize_text(b.municipality) else 0.0
+            if place_score:
+                reasons.append('municipio')
+
+        score = 0.6 * name_score + 0.25 * date_score + 0.15 * place_score
+        return round(score, 3), reasons
+
+    # ------------------------------------------------------------------
+    # Indexación incremental
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def pending_queryset():
+        """
+        Beneficiarios activos sin llaves o modificados después de indexarse.
+        """
+        return Beneficiary.objects.filter(is_active=True).annotate(
+            indexed_at=Max('match_keys__created_at')
+        ).filter(
+            Q(indexed_at__isnull=True) | Q(updated_at__gt=F('indexed_at'))
+        )
+
+    @staticmethod
+    def index_batch(beneficiaries: List[Beneficiary]) -> int:
+        """
+        Reemplaza las llaves de un lote y encola los pares candidatos.
+        Todas las comparaciones del lote se resuelven con una consulta de
+        llaves y una de beneficiarios.
+
+        Returns:
+            Número de pares nuevos encolados (sin contar los que ya existían)
+        """
+        keys_by_id = {
+            b.id: DuplicateService.block_keys(b.first_name, b.last_name, b.birth_date, b.municipality, b.cui_dpi)
+            for b in beneficiaries
+        }
+        batch_ids = list(keys_by_id)
+        all_keys = set().union(*keys_by_id.values())
+
+        with transaction.atomic():
+            BeneficiaryMatchKey.objects.filter(beneficiary_id__in=batch_ids).delete()
+            BeneficiaryMatchKey.objects.bulk_create([
+                BeneficiaryMatchKey(beneficiary_id=beneficiary_id, block_key=key)
+                for beneficiary_id, keys in keys_by_id.items()
+                for key in keys
+            ])
+
+            blocks: Dict[str, List[int]] = {}
+            for key, beneficiary_id in BeneficiaryMatchKey.objects.filter(
+                block_key__in=all_keys
+            ).values_list('block_key', 'beneficiary_id'):
+                blocks.setdefault(key, []).append(beneficiary_id)
+
+            pairs = set()
+            for beneficiary_id, keys in keys_by_id.items():
+                for key in keys:
+                    members = blocks.get(key, [])
+                    if len(members) > DuplicateService.MAX_BLOCK_SIZE:
+                        continue
+                    for other_id in members:
+                        if other_id != beneficiary_id:
+                            pairs.add((min(beneficiary_id, other_id), max(beneficiary_id, other_id)))
+
+            if not pairs:
+                return 0
+
+            involved = {beneficiary_id for pair in pairs for beneficiary_id in pair}
+            # Los pares ya revisados (o ya en cola) no se duplican ni se cuentan
+            pairs -= set(DuplicateCandidate.objects.filter(
+                beneficiary_a_id__in=involved, beneficiary_b_id__in=involved
+            ).values_list('beneficiary_a_id', 'beneficiary_b_id'))
+            if not pairs:
+                return 0
+
+            people = Beneficiary.objects.filter(id__in=involved, is_active=True).only(*DuplicateService.SCORE_FIELDS).in_bulk()
+
+            candidates = []
+            for a_id, b_id in pairs:
+                if a_id not in people or b_id not in people:
+                    continue
+                score, reasons = DuplicateService.score_pair(people[a_id], people[b_id])
+                if score >= DuplicateService.MATCH_THRESHOLD:
+                    candidates.append(DuplicateCandidate(
+                        beneficiary_a_id=a_id,
+                        beneficiary_b_id=b_id,
+                        score=score,
+                        reasons=reasons
+                    ))
+
+            # ignore_conflicts cubre los pares que otro proceso encoló entre tanto
+            DuplicateCandidate.objects.bulk_create(candidates, ignore_conflicts=True)
+        return len(candidates)
+
+    @staticmethod
+    def index_pending(batch_size: Optional[int] = None, rebuild: bool = False) -> Dict[str, int]:
+        """
+        Indexa por lotes los beneficiarios pendientes.
+
+        Args:
+            batch_size: Beneficiarios por lote (default: BATCH_SIZE)
+            rebuild: Borrar todas las llaves y reindexar el censo completo
+
+        Returns:
+            dict con indexed y candidates
+        """
+        batch_size = batch_size or DuplicateService.BATCH_SIZE
+        if rebuild:
+            BeneficiaryMatchKey.objects.all().delete()
+
+        result = {'indexed': 0, 'candidates': 0}
+        last_id = 0
+        while True:
+            batch = list(
+                DuplicateService.pending_queryset()
+                .filter(id__gt=last_id)
+                .only(*DuplicateService.SCORE_FIELDS)
+                .order_by('id')[:batch_size]
+            )
+            if not batch:
+                break
+            result['candidates'] += DuplicateService.index_batch(batch)
+            result['indexed'] += len(batch)
+            last_id = batch[-1].id
+
+        logger.info(f"Duplicate index: {result['indexed']} beneficiaries, {result['candidates']} new candidates")
+        return result
+
+    # ------------------------------------------------------------------
+    # Cola de revisión y fusión
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def dismiss(candidate: DuplicateCandidate, user=None) -> None:
+        """
+        Marca un par como personas distintas; no vuelve a encolarse.
+        """
+        candidate.status = DuplicateStatus.DESCARTADO
+        candidate.reviewed_by = user
+        candidate.reviewed_at = timezone.now()
+        candidate.save(update_fields=['status', 'reviewed_by', 'reviewed_at'])
+
+    @staticmethod
+    def link_querysets(model, parent: str, keep_id: int, drop_id: int):
+        """
+        Filas de una tabla de relación que la fusión borra y reasigna. Usa
+        all_objects: las relaciones de proyectos inactivos también se mueven,
+        si no volverían al duplicado al reactivar el proyecto.
+
+        Returns:
+            Tupla (filas del duplicado que el conservado ya tiene, todas las
+            filas del duplicado)
+        """
+        # Si ambos estaban en el mismo proyecto/fase/evidencia, sobra la fila del duplicado
+        conflicts = model.all_objects.filter(
+            beneficiary_id=drop_id,
+            **{f'{parent}__in': model.all_objects.filter(beneficiary_id=keep_id).values(parent)}
+        )
+        return conflicts, model.all_objects.filter(beneficiary_id=drop_id)
+
+    @staticmethod
+    def merge(candidate: DuplicateCandidate, keep_id: int, user=None) -> Beneficiary:
+        """
+        Fusiona un par de duplicados en el beneficiario keep_id.
+        Las relaciones con proyectos, fases y evidencias se reasignan con un
+        DELETE y un UPDATE por tabla; el duplicado queda inactivo. Como esos
+        UPDATE no disparan señales, los proyectos afectados se tocan aquí para
+        invalidar sus fragmentos en caché y sus ETag.
+
+        Args:
+            candidate: Par de la cola de revisión
+            keep_id: Id del beneficiario que se conserva (uno de los dos del par)
+            user: Usuario que realiza la fusión
+
+        Returns:
+            Beneficiario conservado
+
+        Raises:
+            ValueError: Si keep_id no es del par o el par ya fue revisado
+        """
+        if keep_id not in (candidate.beneficiary_a_id, candidate.beneficiary_b_id):
+            raise ValueError('El beneficiario a conservar debe pertenecer al par')
+        from webAMG.signals import beneficiary_project_ids, touch_projects
+
+        drop_id = candidate.beneficiary_b_id if keep_id == candidate.beneficiary_a_id else candidate.beneficiary_a_id
+
+        with transaction.atomic():
+            # El bloqueo del par serializa dos fusiones del mismo par: la segunda
+            # ve el estado ya revisado y no desactiva al otro beneficiario
+            candidate = DuplicateCandidate.objects.select_for_update().get(id=candidate.id)
+            if candidate.status != DuplicateStatus.PENDIENTE:
+                raise ValueError('El par ya fue revisado')
+
+            # Los beneficiarios se bloquean por id, sin importar cuál se conserva,
+            # para que fusiones concurrentes no se bloqueen mutuamente
+            locked = {
+                beneficiary_id: Beneficiary.objects.select_for_update().get(id=beneficiary_id)
+                for beneficiary_id in sorted((keep_id, drop_id))
+            }
+            keep, drop = locked[keep_id], locked[drop_id]
+            # Antes de reasignar: las filas en conflicto se borran y ya no se encontrarían
+            project_ids = beneficiary_project_ids([keep_id, drop_id])
+
+            for model, parent in DuplicateService.LINK_MODELS:
+                conflicts, links = DuplicateService.link_querysets(model, parent, keep_id, drop_id)
+                conflicts.delete()
+                links.update(beneficiary_id=keep_id)
+
+            for model in DuplicateService.SATELLITE_MODELS:
+                if not model.objects.filter(beneficiary_id=keep_id).exists():
+                    model.objects.filter(beneficiary_id=drop_id).update(beneficiary_id=keep_id)
+
+            touch_projects(project_ids)
+
+            for field in DuplicateService.FILL_FIELDS:
+                if not getattr(keep, field) and getattr(drop, field):
+                    setattr(keep, field, getattr(drop, field))
+            keep.save()
+
+            drop.is_active = False
+            drop.notes = f"{drop.notes or ''}\nFusionado con el beneficiario #{keep_id}".strip()
+            drop.save(update_fields=['is_active', 'notes', 'updated_at'])
+            BeneficiaryMatchKey.objects.filter(beneficiary_id=drop_id).delete()
+
+            # Los otros pares del duplicado se recalculan al reindexar al conservado
+            DuplicateCandidate.objects.filter(
+                Q(beneficiary_a_id=drop_id) | Q(beneficiary_b_id=drop_id),
+                status=DuplicateStatus.PENDIENTE
+            ).exclude(id=candidate.id).delete()
+
+            candidate.status = DuplicateStatus.FUSIONADO
+            candidate.reviewed_by = user
+            candidate.reviewed_at = timezone.now()
+            candidate.save(update_fields=['status', 'reviewed_by', 'reviewed_at'])
+
+        logger.info(f"Beneficiary {drop_id} merged into {keep_id}")
+        return keep
+
+    @staticmethod
+    def serialize_candidate(candidate: DuplicateCandidate) -> Dict[str, Any]:
+        """
+        Serializa un par de la cola con los datos mínimos para compararlos.
+        """
+        def person(b: Beneficiary) -> Dict[str, Any]:
+            return {
+                'id': b.id,
+                'full_name': b.full_name,
+                'cui_dpi': b.cui_dpi,
+                'birth_date': b.birth_date.isoformat() if b.birth_date else None,
+                'municipality': b.municipality,
+                'community': b.community,
+            }
+
+        return {
+            'id': candidate.id,
+            'score': float(candidate.score),
+            'reasons': candidate.reasons,
+            'status': candidate.status,
+            'beneficiary_a': person(candidate.beneficiary_a),
+            'beneficiary_b': person(candidate.beneficiary_b),
+            'created_at': candidate.created_at.isoformat() if candidate.created_at else None,
+        }
@@ -0,0 +1,219 @@
+"""
+Servicio de particiones mensuales de audit_log y login_log.
+
+Cada tabla está particionada por rango de su fecha (meses en UTC), con
+particiones "<tabla>_yAAAAmMM" y una partición "<tabla>_default" para filas
+fuera de rango. Las particiones vencidas se eliminan con DROP TABLE (sin
+DELETE masivo) y opcionalmente se archivan antes en CSV comprimido con gzip.
+"""
+import gzip
+import logging
+import os
+import re
+from datetime import datetime, timezone as dt_timezone
+from typing import Dict, List, Optional
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+class PartitionService:
+    """Servicio para crear, rotar y archivar particiones de logs."""
+
+    # Tabla -> columna de partición (ver migración 0012_partition_audit_logs)
+    TABLES = {
+        'audit_log': 'performed_at',
+        'login_log': 'login_time',
+    }
+
+    DEFAULT_MONTHS_AHEAD = 3
+    DEFAULT_RETENTION_MONTHS = 12
+
+    # ------------------------------------------------------------------
+    # Meses y nombres
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def month_start(value: datetime) -> datetime:
+        """Primer instante del mes (UTC) que contiene a value."""
+        value = value.astimezone(dt_timezone.utc)
+        return datetime(value.year, value.month, 1, tzinfo=dt_timezone.utc)
+
+    @staticmethod
+    def add_months(month: datetime, months: int) -> datetime:
+        """Suma (o resta) meses a un inicio de mes."""
+        index = month.year * 12 + month.month - 1 + months
+        return month.replace(year=index // 12, month=index % 12 + 1)
+
+    @staticmethod
+    def partition_name(table: str, month: datetime) -> str:
+        return f'{table}_y{month.year:04d}m{month.month:02d}'
+
+    @staticmethod
+    def parse_partition_name(table: str, name: str) -> Optional[datetime]:
+        """
+        Mes de una partición a partir de su nombre.
+
+        Returns:
+            Inicio del mes o None si el nombre no es de una partición mensual
+        """
+        match = re.fullmatch(rf'{re.escape(table)}_y(\d{{4}})m(\d{{2}})', name)
+        if not match:
+            return None
+        return datetime(int(match.group(1)), int(match.group(2)), 1, tzinfo=dt_timezone.utc)
+
+    @staticmethod
+    def expired(table: str, names: List[str], retention_months: int,
+                now: Optional[datetime] = None) -> List[str]:
+        """
+        Particiones cuyo mes completo quedó fuera de la retención.
+        Con retención 12 en octubre de 2026 vencen septiembre de 2025 y anteriores.
+        """
+        cutoff = PartitionService.add_months(
+            PartitionService.month_start(now or timezone.now()), -retention_months
+        )
+        months = [(PartitionService.parse_partition_name(table, name), name) for name in names]
+        return [name for month, name in sorted(m for m in months if m[0]) if month < cutoff]
+
+    @staticmethod
+    def _check_table(table: str) -> str:
+        if table not in PartitionService.TABLES:
+            raise ValueError(f'Tabla no particionada: {table}')
+        return PartitionService.TABLES[table]
+
+    # ------------------------------------------------------------------
+    # Operaciones en base de datos
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def list_partitions(table: str) -> List[str]:
+        """Nombres de las particiones mensuales de la tabla, de la más antigua a la más reciente."""
+        PartitionService._check_table(table)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT child.relname
+                FROM pg_inherits
+                JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+                JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                WHERE parent.relname = %s
+                """,
+                [table]
+            )
+            names = [row[0] for row in cursor.fetchall()]
+        return sorted(name for name in names if PartitionService.parse_partition_name(table, name))
+
+    @staticmethod
+    def create_partition(table: str, month: datetime) -> None:
+        """
+        Crea la partición de un mes. Si la partición default ya tiene filas de
+        ese mes, se desprende, se mueven las filas y se vuelve a adjuntar.
+        """
+        column = PartitionService._check_table(table)
+        quote = connection.ops.quote_name
+        name = PartitionService.partition_name(table, month)
+        default = f'{table}_default'
+        start = month
+        end = PartitionService.add_months(month, 1)
+        bounds = f"FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT EXISTS (SELECT 1 FROM {quote(default)} WHERE {quote(column)} >= %s AND {quote(column)} < %s)',
+                [start, end]
+            )
+            if not cursor.fetchone()[0]:
+                cursor.execute(f'CREATE TABLE {quote(name)} PARTITION OF {quote(table)} FOR VALUES {bounds}')
+                return
+
+            cursor.execute(f'ALTER TABLE {quote(table)} DETACH PARTITION {quote(default)}')
+            cursor.execute(f'CREATE TABLE {quote(name)} PARTITION OF {quote(table)} FOR VALUES {bounds}')
+            cursor.execute(
+                f'WITH moved AS (DELETE FROM {quote(default)} WHERE {quote(column)} >= %s AND {quote(column)} < %s RETURNING *) '
+                f'INSERT INTO {quote(name)} SELECT * FROM moved',
+                [start, end]
+            )
+            logger.info(f"Moved {cursor.rowcount} rows from {default} to {name}")
+            cursor.execute(f'ALTER TABLE {quote(table)} ATTACH PARTITION {quote(default)} DEFAULT')
+
+    @staticmethod
+    def ensure_partitions(table: str, months_ahead: Optional[int] = None, dry_run: bool = False) -> List[str]:
+        """
+        Crea las particiones del mes actual y de los months_ahead siguientes que falten.
+
+        Returns:
+            Nombres de las particiones creadas (o por crear con dry_run)
+        """
+        if months_ahead is None:
+            months_ahead = getattr(settings, 'LOG_PARTITION_MONTHS_AHEAD', PartitionService.DEFAULT_MONTHS_AHEAD)
+        existing = set(PartitionService.list_partitions(table))
+        current = PartitionService.month_start(timezone.now())
+
+        created = []
+        for offset in range(months_ahead + 1):
+            month = PartitionService.add_months(current, offset)
+            name = PartitionService.partition_name(table, month)
+            if name in existing:
+                continue
+            if not dry_run:
+                PartitionService.create_partition(table, month)
+            created.append(name)
+        return created
+
+    @staticmethod
+    def archive_partition(table: str, name: str, archive_dir: str) -> str:
+        """
+        Copia una partición a "<archive_dir>/<partición>.csv.gz" con COPY.
+        Se escribe primero a un archivo temporal para no dejar archivos a medias.
+
+        Returns:
+            Ruta del archivo generado
+        """
+        PartitionService._check_table(table)
+        os.makedirs(archive_dir, exist_ok=True)
+        path = os.path.join(archive_dir, f'{name}.csv.gz')
+        partial_path = f'{path}.part'
+
+        with connection.cursor() as cursor, gzip.open(partial_path, 'wt', encoding='utf-8') as archive:
+            cursor.copy_expert(
+                f'COPY {connection.ops.quote_name(name)} TO STDOUT WITH (FORMAT csv, HEADER)',
+                archive
+            )
+        os.replace(partial_path, path)
+        return path
+
+    @staticmethod
+    def drop_partition(table: str, name: str) -> None:
+        PartitionService._check_table(table)
+        if PartitionService.parse_partition_name(table, name) is None:
+            raise ValueError(f'{name} no es una partición mensual de {table}')
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE {connection.ops.quote_name(name)}')
+
+    @staticmethod
+    def expire_partitions(table: str, retention_months: Optional[int] = None,
+                          archive_dir: Optional[str] = None, dry_run: bool = False) -> Dict[str, List[str]]:
+        """
+        Elimina las particiones vencidas, archivándolas antes si se indica archive_dir.
+        Una partición solo se elimina si su archivo se generó sin errores.
+
+        Returns:
+            Diccionario con 'dropped' (particiones) y 'archived' (rutas de archivo)
+        """
+        if retention_months is None:
+            retention_months = getattr(settings, 'LOG_RETENTION_MONTHS', PartitionService.DEFAULT_RETENTION_MONTHS)
+        names = PartitionService.expired(table, PartitionService.list_partitions(table), retention_months)
+
+        result = {'dropped': [], 'archived': []}
+        for name in names:
+            if dry_run:
+                result['dropped'].append(name)
+                continue
+            if archive_dir:
+                result['archived'].append(PartitionService.archive_partition(table, name, archive_dir))
+            PartitionService.drop_partition(table, name)
+            result['dropped'].append(name)
+            logger.info(f"Dropped expired partition {name}")
+        return result
@@ -0,0 +1,102 @@
+"""
+Servicio de hashing de contraseñas con bcrypt.
+
+bcrypt tarda decenas de milisegundos por verificación. Bajo Daphne (ASGI) las
+vistas síncronas comparten un solo hilo, así que cada login bloqueaba al resto
+de páginas. Aquí el trabajo de bcrypt corre en un pool de hilos acotado
+(PASSWORD_HASH_WORKERS): las vistas asíncronas esperan sin bloquear el event
+loop y una ráfaga de logins nunca usa más de ese número de hilos.
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+import bcrypt
+from django.conf import settings
+
+_THREAD_PREFIX = 'password-hash'
+
+
+class PasswordService:
+    """Servicio para generar y verificar hashes bcrypt en un pool acotado."""
+
+    DEFAULT_ROUNDS = 10
+    DEFAULT_WORKERS = 4
+
+    _executor = None
+    _executor_lock = threading.Lock()
+
+    @staticmethod
+    def rounds() -> int:
+        """Costo configurado para los hashes nuevos."""
+        return getattr(settings, 'PASSWORD_HASH_ROUNDS', PasswordService.DEFAULT_ROUNDS)
+
+    @staticmethod
+    def _get_executor() -> ThreadPoolExecutor:
+        if PasswordService._executor is None:
+            with PasswordService._executor_lock:
+                if PasswordService._executor is None:
+                    PasswordService._executor = ThreadPoolExecutor(
+                        max_workers=getattr(settings, 'PASSWORD_HASH_WORKERS', PasswordService.DEFAULT_WORKERS),
+                        thread_name_prefix=_THREAD_PREFIX
+                    )
+        return PasswordService._executor
+
+    # ------------------------------------------------------------------
+    # Operaciones de bcrypt (bloqueantes)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def hash_password(raw_password: str) -> str:
+        """Genera un hash bcrypt con el costo configurado."""
+        salt = bcrypt.gensalt(rounds=PasswordService.rounds())
+        return bcrypt.hashpw(raw_password.encode('utf-8'), salt).decode('utf-8')
+
+    @staticmethod
+    def verify_password(raw_password: str, password_hash: str) -> bool:
+        """Verifica una contraseña; un hash vacío o inválido nunca coincide."""
+        if raw_password is None or not password_hash:
+            return False
+        try:
+            return bcrypt.checkpw(raw_password.encode('utf-8'), password_hash.encode('utf-8'))
+        except ValueError:
+            return False
+
+    @staticmethod
+    def needs_rehash(password_hash: str) -> bool:
+        """
+        Indica si el hash se generó con un costo distinto al configurado
+        ("$2b$10$..." tiene costo 10).
+        """
+        try:
+            return int(password_hash.split('$')[2]) != PasswordService.rounds()
+        except (AttributeError, IndexError, ValueError):
+            return True
+
+    # ------------------------------------------------------------------
+    # Ejecución en el pool
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def run(func, *args):
+        """
+        Ejecuta func en el pool y espera el resultado (para código síncrono).
+        Si ya se está en un hilo del pool, se ejecuta directamente.
+        """
+        if threading.current_thread().name.startswith(_THREAD_PREFIX):
+            return func(*args)
+        return PasswordService._get_executor().submit(func, *args).result()
+
+    @staticmethod
+    async def arun(func, *args):
+        """Ejecuta func en el pool sin bloquear el event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(PasswordService._get_executor(), func, *args)
+
+    @staticmethod
+    def hash_many(raw_passwords: List[str]) -> List[str]:
+        """
+        Genera varios hashes en paralelo en el pool (altas masivas de usuarios).
+        Se usan como máximo PASSWORD_HASH_WORKERS hilos.
+        """
+        return list(PasswordService._get_executor().map(PasswordService.hash_password, raw_passwords))
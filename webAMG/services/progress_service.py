@@ -0,0 +1,313 @@
+"""
+Servicio de cálculo del porcentaje de avance de proyectos y fases.
+
+El avance se guarda en las columnas progress_percentage para que los listados
+lo lean directamente, sin recorrer fases ni evidencias por cada fila.
+Las señales de webAMG.signals lo recalculan de forma incremental y el comando
+recompute_progress lo recalcula en bloque.
+"""
+from collections import defaultdict
+from datetime import date, timedelta
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from django.utils import timezone
+from webAMG.models import (
+    Project,
+    ProjectPhase,
+    ProjectEvidence,
+    PhaseEvidence,
+    ProjectStatus,
+    PhaseStatus,
+)
+
+
+DateRange = Tuple[date, Optional[date]]
+
+
+class ProgressService:
+    """Servicio para derivar y guardar el avance de proyectos y fases."""
+
+    # Una fase o proyecto abierto nunca se muestra al 100% hasta que se completa
+    MAX_OPEN_PROGRESS = 99.0
+    # Peso del tiempo transcurrido frente a la cobertura de evidencias
+    TIME_WEIGHT = 0.5
+
+    # -------------------------------------------------
+    # Cálculo puro (sin consultas a la base de datos)
+    # -------------------------------------------------
+
+    @staticmethod
+    def _to_decimal(value: float) -> Decimal:
+        """
+        Convierte un porcentaje a Decimal con dos decimales.
+        """
+        value = min(max(value, 0.0), 100.0)
+        return Decimal(str(value)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+
+    @staticmethod
+    def elapsed_ratio(start: date, end: Optional[date], today: date) -> Optional[float]:
+        """
+        Fracción del periodo [start, end] que ya transcurrió.
+        Retorna None si el periodo no tiene fecha de fin.
+        """
+        if end is None:
+            return None
+        if today < start:
+            return 0.0
+        total_days = (end - start).days + 1
+        elapsed_days = (min(today, end) - start).days + 1
+        return elapsed_days / total_days
+
+    @staticmethod
+    def coverage_ratio(start: date, end: Optional[date], ranges: Iterable[DateRange], today: date) -> float:
+        """
+        Fracción de días del periodo [start, end] cubiertos por al menos una evidencia.
+        Los rangos de evidencias se recortan al periodo y se unen antes de contar.
+        """
+        window_end = end or max(today, start)
+        clipped = []
+        for range_start, range_end in ranges:
+            range_end = range_end or range_start
+            range_start = max(range_start, start)
+            range_end = min(range_end, window_end)
+            if range_start <= range_end:
+                clipped.append((range_start, range_end))
+
+        if not clipped:
+            return 0.0
+
+        clipped.sort()
+        covered_days = 0
+        current_start, current_end = clipped[0]
+        for range_start, range_end in clipped[1:]:
+            if range_start <= current_end + timedelta(days=1):
+                current_end = max(current_end, range_end)
+            else:
+                covered_days += (current_end - current_start).days + 1
+                current_start, current_end = range_start, range_end
+        covered_days += (current_end - current_start).days + 1
+
+        total_days = (window_end - start).days + 1
+        return covered_days / total_days
+
+    @staticmethod
+    def _open_progress(start, end, ranges, today, count_time: bool) -> float:
+        """
+        Avance de un periodo abierto: combina tiempo transcurrido y cobertura de evidencias.
+        """
+        coverage = ProgressService.coverage_ratio(start, end, ranges, today)
+        elapsed = ProgressService.elapsed_ratio(start, end, today) if count_time else None
+
+        if elapsed is None:
+            ratio = coverage
+        else:
+            weight = ProgressService.TIME_WEIGHT
+            ratio = elapsed * weight + coverage * (1 - weight)
+
+        return min(ratio * 100, ProgressService.MAX_OPEN_PROGRESS)
+
+    @staticmethod
+    def phase_progress(status: str, start: date, end: Optional[date],
+                       ranges: Iterable[DateRange], today: date) -> Decimal:
+        """
+        Calcula el avance de una fase a partir de su estado, fechas y evidencias.
+        """
+        if status == PhaseStatus.COMPLETADA:
+            return ProgressService._to_decimal(100)
+        if status in (PhaseStatus.PENDIENTE, PhaseStatus.CANCELADA):
+            return ProgressService._to_decimal(0)
+        return ProgressService._to_decimal(
+            ProgressService._open_progress(start, end, ranges, today, count_time=True)
+        )
+
+    @staticmethod
+    def project_progress(status: str, start: date, end: Optional[date],
+                         phases: Sequence[Tuple[str, date, Optional[date], Decimal]],
+                         ranges: Iterable[DateRange], today: date) -> Decimal:
+        """
+        Calcula el avance de un proyecto.
+
+        Con fases, es el promedio del avance de las fases no canceladas,
+        ponderado por su duración en días. Sin fases, se deriva de las fechas
+        del proyecto y de la cobertura de sus evidencias.
+
+        Args:
+            phases: Tuplas (status, start_date, end_date, progress_percentage)
+            ranges: Rangos de fechas de las evidencias del proyecto
+        """
+        if status == ProjectStatus.COMPLETADO:
+            return ProgressService._to_decimal(100)
+        if status == ProjectStatus.PLANIFICADO:
+            return ProgressService._to_decimal(0)
+
+        counted = [p for p in phases if p[0] != PhaseStatus.CANCELADA]
+        if counted:
+            total_weight = 0
+            weighted = 0.0
+            for _, phase_start, phase_end, phase_progress in counted:
+                weight = ((phase_end or phase_start) - phase_start).days + 1
+                total_weight += weight
+                weighted += float(phase_progress) * weight
+            return ProgressService._to_decimal(
+                min(weighted / total_weight, ProgressService.MAX_OPEN_PROGRESS)
+            )
+
+        # El tiempo solo cuenta mientras el proyecto está en ejecución
+        count_time = status == ProjectStatus.EN_PROGRESO
+        return ProgressService._to_decimal(
+            ProgressService._open_progress(start, end, ranges, today, count_time)
+        )
+
+    # -------------------------------------------------
+    # Actualización incremental
+    # -------------------------------------------------
+
+    @staticmethod
+    def recompute_phase(phase_id: int, today: Optional[date] = None) -> Optional[Decimal]:
+        """
+        Recalcula y guarda el avance de una fase.
+
+        Returns:
+            El nuevo avance, o None si la fase ya no existe
+        """
+        today = today or timezone.localdate()
+        phase = ProjectPhase.objects.filter(pk=phase_id).values(
+            'status', 'start_date', 'end_date'
+        ).first()
+        if phase is None:
+            return None
+
+        ranges = PhaseEvidence.objects.filter(
+            phase_id=phase_id, is_active=True
+        ).values_list('start_date', 'end_date')
+
+        progress = ProgressService.phase_progress(
+            phase['status'], phase['start_date'], phase['end_date'], ranges, today
+        )
+        # update() evita disparar de nuevo post_save y no toca updated_at
+        ProjectPhase.objects.filter(pk=phase_id).update(progress_percentage=progress)
+        return progress
+
+    @staticmethod
+    def recompute_project(project_id: int, today: Optional[date] = None) -> Optional[Decimal]:
+        """
+        Recalcula y guarda el avance de un proyecto a partir de los valores
+        ya guardados en sus fases.
+
+        Returns:
+            El nuevo avance, o None si el proyecto ya no existe
+        """
+        today = today or timezone.localdate()
+        project = Project.objects.filter(pk=project_id).values(
+            'status', 'start_date', 'end_date'
+        ).first()
+        if project is None:
+            return None
+
+        phases = list(ProjectPhase.objects.filter(
+            project_id=project_id, is_active=True
+        ).values_list('status', 'start_date', 'end_date', 'progress_percentage'))
+
+        ranges = []
+        if not any(p[0] != PhaseStatus.CANCELADA for p in phases):
+            ranges = list(ProjectEvidence.objects.filter(
+                project_id=project_id, is_active=True
+            ).values_list('start_date', 'end_date'))
+
+        progress = ProgressService.project_progress(
+            project['status'], project['start_date'], project['end_date'],
+            phases, ranges, today
+        )
+        Project.objects.filter(pk=project_id).update(progress_percentage=progress)
+        return progress
+
+    @staticmethod
+    def on_phase_changed(phase_id: int, project_id: int) -> None:
+        """
+        Recalcula una fase y el proyecto al que pertenece.
+        """
+        ProgressService.recompute_phase(phase_id)
+        ProgressService.recompute_project(project_id)
+
+    # -------------------------------------------------
+    # Recálculo en bloque
+    # -------------------------------------------------
+
+    @staticmethod
+    def recompute_all(project_ids: Optional[List[int]] = None, batch_size: int = 200,
+                      today: Optional[date] = None) -> Dict[str, int]:
+        """
+        Recalcula el avance de todos los proyectos y fases por lotes.
+        Cada lote usa un número fijo de consultas, sin importar cuántas fases
+        o evidencias tenga cada proyecto.
+
+        Args:
+            project_ids: Limitar el recálculo a estos proyectos (opcional)
+            batch_size: Número de proyectos por lote
+            today: Fecha de referencia (por defecto, hoy en la zona local)
+
+        Returns:
+            dict con el número de proyectos y fases actualizados
+        """
+        today = today or timezone.localdate()
+        queryset = Project.objects.order_by('pk')
+        if project_ids:
+            queryset = queryset.filter(pk__in=project_ids)
+
+        all_ids = list(queryset.values_list('pk', flat=True))
+        updated = {'projects': 0, 'phases': 0}
+
+        for offset in range(0, len(all_ids), batch_size):
+            batch_ids = all_ids[offset:offset + batch_size]
+
+            projects = list(Project.objects.filter(pk__in=batch_ids).only(
+                'id', 'status', 'start_date', 'end_date', 'progress_percentage'
+            ))
+            phases = list(ProjectPhase.objects.filter(project_id__in=batch_ids).only(
+                'id', 'project_id', 'status', 'start_date', 'end_date',
+                'progress_percentage', 'is_active'
+            ))
+
+            phase_ranges = defaultdict(list)
+            for phase_id, start, end in PhaseEvidence.objects.filter(
+                phase__project_id__in=batch_ids, is_active=True
+            ).values_list('phase_id', 'start_date', 'end_date'):
+                phase_ranges[phase_id].append((start, end))
+
+            project_ranges = defaultdict(list)
+            for project_id, start, end in ProjectEvidence.objects.filter(
+                project_id__in=batch_ids, is_active=True
+            ).values_list('project_id', 'start_date', 'end_date'):
+                project_ranges[project_id].append((start, end))
+
+            phases_by_project = defaultdict(list)
+            changed_phases = []
+            for phase in phases:
+                progress = ProgressService.phase_progress(
+                    phase.status, phase.start_date, phase.end_date,
+                    phase_ranges[phase.id], today
+                )
+                if progress != phase.progress_percentage:
+                    phase.progress_percentage = progress
+                    changed_phases.append(phase)
+                if phase.is_active:
+                    phases_by_project[phase.project_id].append(
+                        (phase.status, phase.start_date, phase.end_date, progress)
+                    )
+
+            changed_projects = []
+            for project in projects:
+                progress = ProgressService.project_progress(
+                    project.status, project.start_date, project.end_date,
+                    phases_by_project[project.id], project_ranges[project.id], today
+                )
+                if progress != project.progress_percentage:
+                    project.progress_percentage = progress
+                    changed_projects.append(project)
+
+            ProjectPhase.objects.bulk_update(changed_phases, ['progress_percentage'])
+            Project.objects.bulk_update(changed_projects, ['progress_percentage'])
+            updated['phases'] += len(changed_phases)
+            updated['projects'] += len(changed_projects)
+
+        return updated
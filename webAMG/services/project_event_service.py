@@ -0,0 +1,107 @@
+"""
+Servicio del bus de eventos de proyectos (Channels).
+
+Cada proyecto tiene un grupo de Channels (project_<id>); las señales publican
+en él un evento compacto cuando cambian sus fases, evidencias, fotos o
+asignaciones de beneficiarios, y ProjectEventsConsumer lo reenvía a las
+páginas de project_detail abiertas, que actualizan el DOM sin recargar.
+
+Los eventos se envían al confirmarse la transacción (transaction.on_commit),
+así nadie recibe cambios que luego se revierten. Con InMemoryChannelLayer
+solo llegan a los clientes del mismo proceso; con varios workers hace falta
+una capa compartida (CHANNEL_REDIS_URL).
+"""
+import logging
+from typing import Any, Dict, Iterable, Optional
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.db import transaction
+from webAMG.models import (
+    Beneficiary,
+    EvidenceBeneficiary,
+    EvidencePhoto,
+    PhaseBeneficiary,
+    PhaseEvidence,
+    PhaseEvidenceBeneficiary,
+    PhaseEvidencePhoto,
+    ProjectBeneficiary,
+    ProjectEvidence,
+    ProjectPhase,
+)
+
+logger = logging.getLogger(__name__)
+
+# Modelo -> (entidad del evento, campos que viajan en data)
+EVENT_FIELDS = {
+    ProjectPhase: ('phase', ('phase_number', 'phase_name', 'description', 'start_date', 'end_date', 'status')),
+    ProjectEvidence: ('evidence', ('start_date', 'end_date', 'description')),
+    EvidencePhoto: ('photo', ('evidence_id', 'photo_url', 'caption', 'photo_order')),
+    EvidenceBeneficiary: ('evidence_beneficiary', ('evidence_id', 'beneficiary_id')),
+    ProjectBeneficiary: ('beneficiary_assignment', ('beneficiary_id',)),
+    PhaseBeneficiary: ('phase_beneficiary', ('phase_id', 'beneficiary_id')),
+    PhaseEvidence: ('phase_evidence', ('phase_id', 'start_date', 'end_date', 'description')),
+    PhaseEvidencePhoto: ('phase_evidence_photo', ('phase_evidence_id', 'photo_url', 'caption', 'photo_order')),
+    PhaseEvidenceBeneficiary: ('phase_evidence_beneficiary', ('phase_evidence_id', 'beneficiary_id')),
+    Beneficiary: ('beneficiary', ('first_name', 'last_name', 'cui_dpi', 'community')),
+}
+
+
+class ProjectEventService:
+    """Servicio para publicar cambios de un proyecto en su grupo de Channels."""
+
+    CREATED = 'created'
+    UPDATED = 'updated'
+    DELETED = 'deleted'
+
+    @staticmethod
+    def group_name(project_id: int) -> str:
+        """Grupo de Channels de un proyecto."""
+        return f'project_{project_id}'
+
+    @staticmethod
+    def _json_value(value: Any) -> Any:
+        # La capa de Redis serializa con msgpack: fechas como texto ISO 8601
+        return value.isoformat() if hasattr(value, 'isoformat') else value
+
+    @staticmethod
+    def build_event(instance, action: str) -> Optional[Dict[str, Any]]:
+        """
+        Evento compacto de una fila: {'entity', 'action', 'id', 'data'}.
+        Desactivar una fila (is_active=False) se publica como 'deleted'.
+
+        Returns:
+            Diccionario del evento o None si el modelo no publica eventos
+        """
+        if type(instance) not in EVENT_FIELDS:
+            return None
+        entity, fields = EVENT_FIELDS[type(instance)]
+        if action != ProjectEventService.DELETED and getattr(instance, 'is_active', True) is False:
+            action = ProjectEventService.DELETED
+
+        data = {field: ProjectEventService._json_value(getattr(instance, field)) for field in fields}
+        if isinstance(instance, ProjectPhase):
+            data['status_display'] = instance.get_status_display()
+        return {'entity': entity, 'action': action, 'id': instance.pk, 'data': data}
+
+    @staticmethod
+    def send(project_ids: Iterable[int], event: Dict[str, Any]) -> None:
+        """Envía el evento a los grupos de los proyectos de inmediato."""
+        channel_layer = get_channel_layer()
+        if channel_layer is None:
+            return
+        for project_id in project_ids:
+            try:
+                async_to_sync(channel_layer.group_send)(
+                    ProjectEventService.group_name(project_id),
+                    {'type': 'project.event', 'event': {**event, 'project_id': project_id}},
+                )
+            except Exception as e:
+                # Un fallo del bus no debe afectar la escritura ya confirmada
+                logger.warning(f"Project event for project {project_id} not sent: {e}")
+
+    @staticmethod
+    def publish(project_ids: Iterable[int], event: Dict[str, Any]) -> None:
+        """Envía el evento a los grupos de los proyectos cuando se confirme la transacción."""
+        project_ids = list(project_ids)
+        if project_ids:
+            transaction.on_commit(lambda: ProjectEventService.send(project_ids, event))
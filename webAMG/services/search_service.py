@@ -0,0 +1,173 @@
+"""
+Servicio de búsqueda de texto completo.
+
+Proyectos, fases, evidencias, actividades diarias y beneficiarios tienen una
+columna search_vector (tsvector con índice GIN) que un trigger de PostgreSQL
+mantiene al día con la configuración es_unaccent (español sin tildes), así que
+también cubre las inserciones masivas que no disparan señales de Django.
+La búsqueda global une los seis tipos en una sola consulta ordenada por rango.
+"""
+import re
+from typing import Any, Dict, Iterable, List, Optional
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import CharField, F, IntegerField, Value
+from django.db.models.functions import Cast, Coalesce, Concat, Substr
+from webAMG.models import (
+    Project,
+    ProjectPhase,
+    ProjectEvidence,
+    PhaseEvidence,
+    DailyActivity,
+    Beneficiary,
+)
+
+# Palabras de la búsqueda: letras (con tildes) y dígitos
+_TERM_RE = re.compile(r'\w+', re.UNICODE)
+
+
+class SearchService:
+    """Servicio de búsqueda global con tsvector."""
+
+    CONFIG = 'es_unaccent'
+
+    DEFAULT_LIMIT = 20
+    MAX_LIMIT = 100
+
+    # Máximo de palabras que se toman de la búsqueda
+    MAX_TERMS = 8
+
+    TYPES = ('project', 'phase', 'project_evidence', 'phase_evidence', 'activity', 'beneficiary')
+
+    @staticmethod
+    def build_query(text: str) -> Optional[SearchQuery]:
+        """
+        Construye un tsquery de prefijos ("agua pot" -> "agua:* & pot:*").
+        Solo se usan palabras alfanuméricas, así que la entrada del usuario
+        nunca llega al tsquery con operadores propios.
+
+        Returns:
+            SearchQuery o None si la búsqueda no tiene palabras
+        """
+        terms = _TERM_RE.findall((text or '').replace('_', ' '))[:SearchService.MAX_TERMS]
+        if not terms:
+            return None
+        return SearchQuery(
+            ' & '.join(f'{term}:*' for term in terms),
+            config=SearchService.CONFIG,
+            search_type='raw'
+        )
+
+    @staticmethod
+    def filter_queryset(queryset, text: str):
+        """
+        Filtra un queryset de un modelo con search_vector y lo ordena por rango.
+        Si la búsqueda no tiene palabras, devuelve el queryset sin cambios.
+        """
+        query = SearchService.build_query(text)
+        if query is None:
+            return queryset
+        return queryset.filter(search_vector=query).annotate(
+            search_rank=SearchRank(F('search_vector'), query)
+        ).order_by('-search_rank')
+
+    @staticmethod
+    def _typed_queryset(kind: str, query: SearchQuery, include_inactive: bool):
+        """
+        Queryset de un tipo con las columnas comunes de la búsqueda global:
+        kind, id, title, subtitle, project_id y rank.
+        """
+        text = CharField()
+        if kind == 'project':
+            queryset = Project.all_objects.annotate(
+                title=Cast('project_name', text),
+                subtitle=Cast('project_code', text),
+                project_ref=F('id'),
+            )
+        elif kind == 'phase':
+            queryset = ProjectPhase.all_objects.annotate(
+                title=Cast('phase_name', text),
+                subtitle=Cast('project__project_name', text),
+                project_ref=F('project_id'),
+            )
+        elif kind == 'project_evidence':
+            queryset = ProjectEvidence.all_objects.annotate(
+                title=Substr('description', 1, 200),
+                subtitle=Cast('project__project_name', text),
+                project_ref=F('project_id'),
+            )
+        elif kind == 'phase_evidence':
+            queryset = PhaseEvidence.all_objects.annotate(
+                title=Substr('description', 1, 200),
+                subtitle=Cast('phase__phase_name', text),
+                project_ref=F('phase__project_id'),
+            )
+        elif kind == 'activity':
+            queryset = DailyActivity.all_objects.annotate(
+                title=Substr('description', 1, 200),
+                subtitle=Cast('activity_type', text),
+                project_ref=Coalesce('project_id', 'phase__project_id'),
+            )
+        else:
+            queryset = Beneficiary.objects.annotate(
+                title=Concat('first_name', Value(' '), 'last_name', output_field=text),
+                subtitle=Cast('municipality', text),
+                project_ref=Value(None, output_field=IntegerField()),
+            )
+
+        # Los modelos con borrado lógico parten de all_objects; aquí se decide si se ocultan
+        if not include_inactive:
+            queryset = queryset.filter(is_active=True)
+
+        return queryset.filter(search_vector=query).annotate(
+            kind=Value(kind, output_field=text),
+            rank=SearchRank(F('search_vector'), query),
+        ).values('kind', 'id', 'title', 'subtitle', 'project_ref', 'rank')
+
+    @staticmethod
+    def build_search(text: str, types: Optional[Iterable[str]] = None,
+                     include_inactive: bool = False, limit: Optional[int] = None):
+        """
+        Construye la consulta global (UNION ALL de los tipos pedidos).
+
+        Returns:
+            QuerySet de diccionarios o None si la búsqueda no tiene palabras
+        """
+        query = SearchService.build_query(text)
+        kinds = [kind for kind in (types or SearchService.TYPES) if kind in SearchService.TYPES]
+        if query is None or not kinds:
+            return None
+
+        limit = max(1, min(limit or SearchService.DEFAULT_LIMIT, SearchService.MAX_LIMIT))
+        querysets = [SearchService._typed_queryset(kind, query, include_inactive) for kind in kinds]
+        combined = querysets[0].union(*querysets[1:], all=True) if len(querysets) > 1 else querysets[0]
+        return combined.order_by('-rank')[:limit]
+
+    @staticmethod
+    def search(text: str, types: Optional[Iterable[str]] = None,
+               include_inactive: bool = False, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Búsqueda global ordenada por relevancia.
+
+        Args:
+            text: Texto a buscar
+            types: Tipos a incluir (default: todos, ver TYPES)
+            include_inactive: Incluir registros inactivos
+            limit: Máximo de resultados (máximo MAX_LIMIT)
+
+        Returns:
+            Lista de resultados con type, id, title, subtitle, project_id y rank
+        """
+        combined = SearchService.build_search(text, types, include_inactive, limit)
+        if combined is None:
+            return []
+        return [
+            {
+                'type': row['kind'],
+                'id': row['id'],
+                'title': row['title'],
+                'subtitle': row['subtitle'],
+                'project_id': row['project_ref'],
+                'rank': round(row['rank'], 4),
+            }
+            for row in combined
+        ]
@@ -0,0 +1,109 @@
+"""
+Servicio de borrado lógico (soft delete) de proyectos.
+
+Desactivar o reactivar un proyecto propaga is_active a todas sus tablas
+hijas desde la aplicación, dentro de una transacción y con un solo UPDATE
+por tabla (sin recorrer filas ni depender de triggers de PostgreSQL).
+Los modelos afectados usan ActiveManager como manager por defecto, así que
+las filas inactivas desaparecen de las consultas sin filtrar is_active en
+cada vista; all_objects las incluye.
+"""
+from functools import reduce
+from operator import or_
+from typing import Dict
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from webAMG.models import (
+    Project,
+    ProjectPhase,
+    ProjectBeneficiary,
+    ProjectMaterial,
+    ProjectEvidence,
+    EvidencePhoto,
+    EvidenceBeneficiary,
+    PhaseBeneficiary,
+    PhaseEvidence,
+    PhaseEvidencePhoto,
+    PhaseEvidenceBeneficiary,
+    DailyActivity,
+    ActivityPhoto,
+    BudgetExecution,
+)
+
+
+class ProjectStateError(ValueError):
+    """El proyecto no existe o ya está en el estado pedido."""
+
+
+# Modelo -> rutas hasta el id del proyecto (una fila sigue al proyecto si
+# cualquiera de las rutas coincide; las actividades y gastos pueden colgar
+# del proyecto o de una de sus fases)
+CASCADE = (
+    (ProjectPhase, ('project_id',)),
+    (ProjectBeneficiary, ('project_id',)),
+    (ProjectMaterial, ('project_id',)),
+    (ProjectEvidence, ('project_id',)),
+    (EvidencePhoto, ('evidence__project_id',)),
+    (EvidenceBeneficiary, ('evidence__project_id',)),
+    (PhaseBeneficiary, ('phase__project_id',)),
+    (PhaseEvidence, ('phase__project_id',)),
+    (PhaseEvidencePhoto, ('phase_evidence__phase__project_id',)),
+    (PhaseEvidenceBeneficiary, ('phase_evidence__phase__project_id',)),
+    (DailyActivity, ('project_id', 'phase__project_id')),
+    (ActivityPhoto, ('activity__project_id', 'activity__phase__project_id')),
+    (BudgetExecution, ('project_id', 'phase__project_id')),
+)
+
+
+class SoftDeleteService:
+    """Servicio para desactivar y reactivar proyectos con todos sus datos."""
+
+    @staticmethod
+    def _children(model, lookups, project_id: int):
+        """Filas de una tabla hija que pertenecen al proyecto (activas o no)."""
+        return model.all_objects.filter(reduce(or_, (Q(**{lookup: project_id}) for lookup in lookups)))
+
+    @staticmethod
+    def set_project_active(project_id: int, is_active: bool) -> Dict[str, int]:
+        """
+        Cambia el estado del proyecto y lo propaga a sus tablas hijas.
+        El UPDATE del proyecto solo afecta a la fila si el estado cambia, así
+        que dos peticiones simultáneas no propagan dos veces.
+
+        Returns:
+            Filas cambiadas por tabla (incluye 'projects')
+
+        Raises:
+            ProjectStateError: Si el proyecto no existe o ya tenía ese estado
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            updated = Project.all_objects.filter(pk=project_id).exclude(is_active=is_active).update(
+                is_active=is_active,
+                deactivated_at=None if is_active else now,
+                updated_at=now,
+            )
+            if not updated:
+                if Project.all_objects.filter(pk=project_id).exists():
+                    raise ProjectStateError(
+                        'El proyecto ya está activo' if is_active else 'El proyecto ya está inactivo'
+                    )
+                raise ProjectStateError('Proyecto no encontrado')
+
+            counts = {Project._meta.db_table: updated}
+            for model, lookups in CASCADE:
+                counts[model._meta.db_table] = SoftDeleteService._children(model, lookups, project_id).exclude(
+                    is_active=is_active
+                ).update(is_active=is_active)
+        return counts
+
+    @staticmethod
+    def deactivate_project(project_id: int) -> Dict[str, int]:
+        """Desactiva un proyecto y oculta todos sus datos relacionados."""
+        return SoftDeleteService.set_project_active(project_id, False)
+
+    @staticmethod
+    def activate_project(project_id: int) -> Dict[str, int]:
+        """Reactiva un proyecto y vuelve visibles todos sus datos relacionados."""
+        return SoftDeleteService.set_project_active(project_id, True)
@@ -0,0 +1,72 @@
+"""
+Servicio de precompilación de plantillas.
+
+Con el cargador en caché (settings.TEMPLATES), cada plantilla se compila la
+primera vez que se pide en cada proceso. warm() compila al arrancar todas las
+plantillas del proyecto (las de Django y paquetes externos no), así la
+primera petición de cada worker no paga la compilación.
+"""
+import logging
+from pathlib import Path
+from typing import List
+from django.conf import settings
+from django.template import TemplateDoesNotExist, TemplateSyntaxError, engines
+
+logger = logging.getLogger(__name__)
+
+
+class TemplateService:
+    """Servicio para listar y precompilar las plantillas del proyecto."""
+
+    @staticmethod
+    def _engine():
+        return engines['django'].engine
+
+    @staticmethod
+    def template_dirs() -> List[Path]:
+        """
+        Directorios de plantillas del proyecto que usan los cargadores: los
+        que están dentro de BASE_DIR, salvo paquetes instalados (un virtualenv
+        dentro del proyecto).
+        """
+        base_dir = Path(settings.BASE_DIR).resolve()
+        dirs = []
+        for loader in TemplateService._engine().template_loaders:
+            for source in getattr(loader, 'loaders', [loader]):
+                for directory in source.get_dirs():
+                    directory = Path(directory).resolve()
+                    if (
+                        directory.is_dir()
+                        and base_dir in directory.parents
+                        and 'site-packages' not in directory.parts
+                        and directory not in dirs
+                    ):
+                        dirs.append(directory)
+        return dirs
+
+    @staticmethod
+    def template_names() -> List[str]:
+        """Nombres de todas las plantillas .html del proyecto, como los pide get_template."""
+        names = []
+        for directory in TemplateService.template_dirs():
+            names.extend(path.relative_to(directory).as_posix() for path in sorted(directory.rglob('*.html')))
+        return list(dict.fromkeys(names))
+
+    @staticmethod
+    def warm() -> int:
+        """
+        Compila y guarda en el cargador en caché las plantillas del proyecto.
+
+        Returns:
+            Número de plantillas compiladas
+        """
+        engine = TemplateService._engine()
+        compiled = 0
+        for name in TemplateService.template_names():
+            try:
+                engine.get_template(name)
+                compiled += 1
+            except (TemplateDoesNotExist, TemplateSyntaxError) as e:
+                logger.warning(f"Template warmup failed for {name}: {e}")
+        logger.info(f"Templates warmed: {compiled}")
+        return compiled
@@ -0,0 +1,344 @@
+"""
+Servicio de gestión de usuarios compartido por la página de usuarios y la API.
+"""
+import re
+from typing import Any, Dict, List, Optional, Tuple
+from django.core.cache import cache
+from django.core.paginator import Page, Paginator
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
+from webAMG.authentication import user_cache_key
+from webAMG.models import User, UserRole
+from webAMG.services.password_service import PasswordService
+from webAMG.sessions import invalidate_user_sessions
+
+# Mensajes para las violaciones de los índices únicos de users
+DUPLICATE_MESSAGES = {
+    'username': 'El nombre de usuario ya existe',
+    'email': 'El email ya está registrado',
+}
+
+
+class DuplicateUserError(ValueError):
+    """El username o el email ya están registrados."""
+
+    def __init__(self, field: str):
+        self.field = field
+        super().__init__(DUPLICATE_MESSAGES[field])
+
+
+# users_username_key / users_email_key (UNIQUE de la columna) o los
+# users_<campo>_<hash>_uniq que crea Django al alterar el campo
+DUPLICATE_CONSTRAINT_RE = re.compile(r'\busers_(username|email)_(?:key|[0-9a-f]+_uniq)\b')
+
+
+def _duplicate_field(error: IntegrityError) -> Optional[str]:
+    """
+    Campo que causó la violación de unicidad, o None si la restricción no es
+    la de username o email (llaves foráneas, NOT NULL, otros índices).
+    """
+    diag = getattr(error.__cause__, 'diag', None)
+    name = getattr(diag, 'constraint_name', None) or str(error)
+    match = DUPLICATE_CONSTRAINT_RE.search(name)
+    return match.group(1) if match else None
+
+
+class UserService:
+    """Servicio para listar, crear y actualizar usuarios."""
+
+    DEFAULT_PAGE_SIZE = 20
+    MAX_PAGE_SIZE = 100
+
+    ROLES = tuple(UserRole.values)
+
+    @staticmethod
+    def parse_filters(params) -> Dict[str, Any]:
+        """
+        Lee los filtros de la lista de usuarios desde request.GET.
+        Los valores inválidos se ignoran en lugar de fallar.
+        """
+        try:
+            page_size = int(params.get('page_size', UserService.DEFAULT_PAGE_SIZE))
+        except (TypeError, ValueError):
+            page_size = UserService.DEFAULT_PAGE_SIZE
+
+        role = (params.get('role') or '').strip()
+        is_active = (params.get('is_active') or '').strip().lower()
+
+        return {
+            'page': params.get('page', 1),
+            'page_size': max(1, min(page_size, UserService.MAX_PAGE_SIZE)),
+            'search': (params.get('search') or '').strip(),
+            'role': role if role in UserService.ROLES else '',
+            'is_active': {'true': True, 'false': False}.get(is_active),
+        }
+
+    @staticmethod
+    def filter_users(search: str = '', role: str = '', is_active: Optional[bool] = None):
+        """
+        Queryset de usuarios filtrado, del más reciente al más antiguo.
+        password_hash no se carga.
+        """
+        queryset = User.objects.defer('password_hash')
+
+        if search:
+            queryset = queryset.filter(
+                Q(username__icontains=search) |
+                Q(email__icontains=search) |
+                Q(full_name__icontains=search)
+            )
+        if role:
+            queryset = queryset.filter(role=role)
+        if is_active is not None:
+            queryset = queryset.filter(is_active=is_active)
+
+        return queryset.order_by('-created_at', '-id')
+
+    @staticmethod
+    def list_users(params) -> Page:
+        """
+        Página de usuarios según los filtros de request.GET
+        (page, page_size, search, role, is_active).
+
+        Returns:
+            Page de Django; los filtros aplicados quedan en page.filters
+        """
+        filters = UserService.parse_filters(params)
+        queryset = UserService.filter_users(filters['search'], filters['role'], filters['is_active'])
+        page = Paginator(queryset, filters['page_size']).get_page(filters['page'])
+        page.filters = filters
+        return page
+
+    @staticmethod
+    def serialize(user: User) -> Dict[str, Any]:
+        return {
+            'id': user.id,
+            'username': user.username,
+            'email': user.email,
+            'full_name': user.full_name,
+            'role': user.role,
+            'is_active': user.is_active,
+            'created_at': user.created_at.isoformat() if user.created_at else None,
+            'last_login': user.last_login.isoformat() if user.last_login else None
+        }
+
+    @staticmethod
+    def create_user(username: str, email: str, password: str, full_name: str,
+                    role: str = UserRole.USUARIO, phone: str = None, is_active: bool = True) -> User:
+        """
+        Crea un usuario con un solo INSERT. La unicidad de username y email la
+        garantizan los índices únicos, sin consultas previas.
+
+        Raises:
+            DuplicateUserError: Si el username o el email ya existen
+        """
+        user = User(
+            username=username,
+            email=email,
+            full_name=full_name,
+            phone=phone,
+            role=role,
+            is_active=is_active,
+        )
+        user.set_password(password)
+        try:
+            with transaction.atomic():
+                user.save(force_insert=True)
+        except IntegrityError as e:
+            field = _duplicate_field(e)
+            if field is None:
+                raise
+            raise DuplicateUserError(field)
+        return user
+
+    @staticmethod
+    def update_user(user: User, password: str = None, **fields) -> User:
+        """
+        Actualiza un usuario. Si el nuevo username o email ya pertenecen a
+        otro usuario, el UPDATE falla por el índice único.
+
+        Raises:
+            DuplicateUserError: Si el username o el email ya existen
+        """
+        for field, value in fields.items():
+            setattr(user, field, value)
+        if password:
+            user.set_password(password)
+        try:
+            with transaction.atomic():
+                user.save()
+        except IntegrityError as e:
+            field = _duplicate_field(e)
+            if field is None:
+                raise
+            raise DuplicateUserError(field)
+        return user
+
+    # ------------------------------------------------------------------
+    # Operaciones masivas
+    # ------------------------------------------------------------------
+    # Para dar un resultado por elemento, los duplicados de todo el lote se
+    # buscan con una sola consulta antes de escribir; si otra petición gana
+    # la carrera, el índice único hace fallar la transacción completa.
+
+    @staticmethod
+    def _error(index: int, errors: Dict[str, str]) -> Dict[str, Any]:
+        return {'index': index, 'success': False, 'errors': errors}
+
+    @staticmethod
+    def bulk_create_users(items: List[Tuple[int, Any]]) -> List[Dict[str, Any]]:
+        """
+        Crea varios usuarios: las contraseñas se hashean en paralelo en el pool
+        de PasswordService y las filas se insertan con un bulk_create en una
+        sola transacción.
+
+        Args:
+            items: Lista de (índice, CreateUserRequest) ya validados
+
+        Returns:
+            Resultado por elemento: {'index', 'success', 'user' | 'errors'}
+
+        Raises:
+            DuplicateUserError: Si el índice único falla al insertar (ningún usuario se crea)
+        """
+        usernames = [item.username for _, item in items]
+        emails = [item.email for _, item in items]
+        taken = list(User.objects.filter(Q(username__in=usernames) | Q(email__in=emails)).values_list('username', 'email'))
+        taken_usernames = {username for username, _ in taken}
+        taken_emails = {email for _, email in taken}
+
+        results = []
+        pending = []
+        for index, item in items:
+            if item.username in taken_usernames:
+                results.append(UserService._error(index, {'username': DUPLICATE_MESSAGES['username']}))
+                continue
+            if item.email in taken_emails:
+                results.append(UserService._error(index, {'email': DUPLICATE_MESSAGES['email']}))
+                continue
+            # También se rechazan los repetidos dentro del mismo lote
+            taken_usernames.add(item.username)
+            taken_emails.add(item.email)
+            pending.append((index, item))
+
+        hashes = PasswordService.hash_many([item.password for _, item in pending])
+        users = [
+            User(
+                username=item.username,
+                email=item.email,
+                full_name=item.full_name,
+                role=item.role or UserRole.USUARIO,
+                is_active=True,
+                password_hash=password_hash,
+            )
+            for (_, item), password_hash in zip(pending, hashes)
+        ]
+
+        if users:
+            try:
+                with transaction.atomic():
+                    User.objects.bulk_create(users)
+            except IntegrityError as e:
+                field = _duplicate_field(e)
+                if field is None:
+                    raise
+                raise DuplicateUserError(field)
+
+        results += [
+            {'index': index, 'success': True, 'user': UserService.serialize(user)}
+            for (index, _), user in zip(pending, users)
+        ]
+        return sorted(results, key=lambda result: result['index'])
+
+    @staticmethod
+    def bulk_update_users(items: List[Tuple[int, Any]]) -> List[Dict[str, Any]]:
+        """
+        Actualiza varios usuarios con un bulk_update en una sola transacción.
+        Como bulk_update no envía post_save, aquí se invalida la caché de usuarios.
+
+        Args:
+            items: Lista de (índice, BulkUpdateUserRequest) ya validados
+
+        Returns:
+            Resultado por elemento: {'index', 'success', 'user' | 'errors'}
+
+        Raises:
+            DuplicateUserError: Si el índice único falla al actualizar (ningún usuario cambia)
+        """
+        users = User.objects.defer('password_hash').in_bulk([item.id for _, item in items])
+        emails = {item.email for _, item in items if item.email}
+        email_owners = dict(User.objects.filter(email__in=emails).values_list('email', 'id'))
+
+        now = timezone.now()
+        results = []
+        pending = []
+        changed_fields = set()
+        for index, item in items:
+            user = users.pop(item.id, None)
+            if user is None:
+                results.append(UserService._error(index, {'id': 'Usuario no encontrado o repetido en la lista'}))
+                continue
+            if item.email and email_owners.get(item.email, item.id) != item.id:
+                results.append(UserService._error(index, {'email': DUPLICATE_MESSAGES['email']}))
+                continue
+
+            fields = item.model_dump(exclude={'id'}, exclude_none=True)
+            for field, value in fields.items():
+                setattr(user, field, value)
+            user.updated_at = now
+            if item.email:
+                email_owners[item.email] = item.id
+            changed_fields.update(fields)
+            pending.append((index, user))
+
+        if pending and changed_fields:
+            try:
+                with transaction.atomic():
+                    User.objects.bulk_update([user for _, user in pending], sorted(changed_fields) + ['updated_at'])
+            except IntegrityError as e:
+                field = _duplicate_field(e)
+                if field is None:
+                    raise
+                raise DuplicateUserError(field)
+            cache.delete_many([user_cache_key(user.id) for _, user in pending])
+            invalidate_user_sessions([user.id for _, user in pending])
+
+        results += [
+            {'index': index, 'success': True, 'user': UserService.serialize(user)}
+            for index, user in pending
+        ]
+        return sorted(results, key=lambda result: result['index'])
+
+    @staticmethod
+    def bulk_delete_users(ids: List[int], acting_user_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Elimina varios usuarios con un solo delete() en una transacción
+        (las relaciones se resuelven una vez para todo el lote).
+
+        Args:
+            ids: IDs a eliminar
+            acting_user_id: Usuario que ejecuta la operación (no puede eliminarse)
+
+        Returns:
+            Resultado por elemento: {'index', 'success', 'id' | 'errors'}
+        """
+        existing = set(User.objects.filter(id__in=ids).values_list('id', flat=True))
+
+        results = []
+        pending = []
+        for index, user_id in enumerate(ids):
+            if user_id == acting_user_id:
+                results.append(UserService._error(index, {'id': 'No puedes eliminar tu propio usuario'}))
+            elif user_id not in existing:
+                results.append(UserService._error(index, {'id': 'Usuario no encontrado o repetido en la lista'}))
+            else:
+                existing.discard(user_id)
+                pending.append((index, user_id))
+
+        if pending:
+            with transaction.atomic():
+                User.objects.filter(id__in=[user_id for _, user_id in pending]).delete()
+
+        results += [{'index': index, 'success': True, 'id': user_id} for index, user_id in pending]
+        return sorted(results, key=lambda result: result['index'])
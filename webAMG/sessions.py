@@ -0,0 +1,222 @@
+"""
+Motor de sesiones de Django respaldado por la tabla user_sessions.
+
+Las páginas (django.contrib.auth) y la API (api_require_auth) comparten la
+misma fila de UserSession: la llave de sesión de Django es el session_token y
+la cookie de sesión es la misma cookie session_token de la API.
+
+Cada sesión se guarda también en la caché junto con las columnas del usuario
+(USER_FIELDS), así que autenticar una petición cuesta una sola lectura de
+caché. La base de datos solo se consulta cuando la entrada no está en caché
+(una consulta con JOIN a users) y en ese momento se actualiza last_activity.
+Al guardar o eliminar un usuario se descartan de la caché sus sesiones
+(invalidate_user_sessions), así un usuario desactivado o con otro rol no
+conserva los datos anteriores. Con una caché por proceso (LocMemCache) eso
+solo alcanza al proceso que hizo el cambio: en los demás, un logout o un
+cambio de usuario tarda hasta SESSION_CACHE_TTL segundos en verse.
+"""
+import hashlib
+import secrets
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.sessions.backends.base import CreateError, SessionBase, UpdateError
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from webAMG.authentication import USER_FIELDS
+from webAMG.models import User, UserSession
+
+# Segundos que una sesión (con su usuario) permanece en la caché
+DEFAULT_SESSION_CACHE_TTL = 30
+
+# Columnas que se leen de user_sessions junto con las del usuario
+_SESSION_COLUMNS = ('id', 'expires_at', 'session_data')
+
+
+def session_cache_key(session_key):
+    """Llave de caché de una sesión; el token no se guarda en claro."""
+    return 'user_session:' + hashlib.sha256(session_key.encode()).hexdigest()
+
+
+def invalidate_user_sessions(user_ids):
+    """Descarta de la caché las sesiones vigentes de los usuarios (una consulta)."""
+    tokens = UserSession.objects.filter(
+        user_id__in=list(user_ids),
+        is_active=True,
+        expires_at__gt=timezone.now(),
+    ).values_list('session_token', flat=True)
+    cache.delete_many([session_cache_key(token) for token in tokens])
+
+
+def get_session_user(request):
+    """Usuario de la petición a partir de request.session (AnonymousUser si no hay)."""
+    if not hasattr(request, '_cached_user'):
+        request._cached_user = request.session.get_user() or AnonymousUser()
+    return request._cached_user
+
+
+async def aget_session_user(request):
+    """Versión asíncrona de get_session_user para request.auser()."""
+    return await sync_to_async(get_session_user)(request)
+
+
+class SessionStore(SessionBase):
+    """
+    Sesión de Django guardada en user_sessions (session_data) con la caché
+    como camino rápido.
+    """
+
+    def __init__(self, session_key=None):
+        super().__init__(session_key)
+        # Columnas USER_FIELDS del dueño de la sesión, cargadas con la sesión
+        self._user_values = None
+        # Datos del cliente que se guardan al crear la sesión
+        self.ip_address = None
+        self.user_agent = None
+
+    @classmethod
+    def create_for_user(cls, user, ip_address=None, user_agent=None):
+        """
+        Crea una sesión ya autenticada (login de la API). Los datos son los
+        mismos que guarda django.contrib.auth.login, así que la sesión sirve
+        también para las páginas.
+        """
+        store = cls()
+        store.ip_address = ip_address
+        store.user_agent = user_agent
+        store[SESSION_KEY] = user._meta.pk.value_to_string(user)
+        store[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+        store[HASH_SESSION_KEY] = ''
+        store.create()
+        return store
+
+    @staticmethod
+    def _cache_ttl():
+        return getattr(settings, 'SESSION_CACHE_TTL', DEFAULT_SESSION_CACHE_TTL)
+
+    def _get_new_session_key(self):
+        # La unicidad la garantiza el índice único de session_token (ver create)
+        return secrets.token_urlsafe(64)
+
+    def _load_payload(self):
+        """
+        Sesión desde la caché o, si no está, desde la base de datos.
+
+        Returns:
+            Diccionario con data, expires_at y user (valores de USER_FIELDS o None)
+        """
+        key = session_cache_key(self.session_key)
+        payload = cache.get(key)
+        if payload is None:
+            payload = self._payload_from_db()
+            if payload is None:
+                return None
+            cache.set(key, payload, self._cache_ttl())
+        if payload['expires_at'] <= timezone.now():
+            return None
+        return payload
+
+    def _payload_from_db(self):
+        now = timezone.now()
+        row = UserSession.objects.filter(
+            session_token=self.session_key,
+            is_active=True,
+            expires_at__gt=now,
+        ).values_list(*_SESSION_COLUMNS, *(f'user__{field}' for field in USER_FIELDS)).first()
+        if row is None:
+            return None
+
+        pk, expires_at, data = row[:len(_SESSION_COLUMNS)]
+        user_values = list(row[len(_SESSION_COLUMNS):])
+        is_active = user_values[USER_FIELDS.index('is_active')]
+        UserSession.objects.filter(pk=pk).update(last_activity=now)
+        return {
+            'data': data or {},
+            'expires_at': expires_at,
+            'user': user_values if is_active else None,
+        }
+
+    def load(self):
+        payload = self._load_payload() if self.session_key else None
+        if payload is None:
+            self._session_key = None
+            self._user_values = None
+            return {}
+        self._user_values = payload['user']
+        return dict(payload['data'])
+
+    def get_user(self):
+        """
+        Usuario dueño de la sesión, armado con los valores cargados junto con
+        la sesión (sin otra consulta ni lectura de caché).
+
+        Returns:
+            User o None si la sesión no existe, expiró o no está autenticada
+        """
+        self._get_session()
+        if self._user_values is None:
+            return None
+        return User.from_db('default', USER_FIELDS, self._user_values)
+
+    def exists(self, session_key):
+        return UserSession.objects.filter(session_token=session_key).exists()
+
+    def create(self):
+        while True:
+            self._session_key = self._get_new_session_key()
+            try:
+                self.save(must_create=True)
+            except CreateError:
+                continue
+            self.modified = True
+            return
+
+    def save(self, must_create=False):
+        if self.session_key is None:
+            return self.create()
+
+        data = self._get_session(no_load=must_create)
+        user_id = data.get(SESSION_KEY)
+        values = {
+            'session_data': data,
+            'user_id': int(user_id) if user_id else None,
+            'expires_at': self.get_expiry_date(),
+        }
+
+        if must_create:
+            try:
+                with transaction.atomic():
+                    UserSession.objects.create(
+                        session_token=self._session_key,
+                        ip_address=self.ip_address,
+                        user_agent=self.user_agent,
+                        **values
+                    )
+            except IntegrityError:
+                raise CreateError
+        elif not UserSession.objects.filter(session_token=self._session_key, is_active=True).update(**values):
+            raise UpdateError
+
+        # La siguiente lectura vuelve a cargar la sesión con su usuario
+        cache.delete(session_cache_key(self._session_key))
+
+    def delete(self, session_key=None):
+        """
+        Cierra la sesión: la fila queda inactiva (sweep_sessions la elimina después).
+
+        Returns:
+            Número de sesiones cerradas (0 o 1)
+        """
+        if session_key is None:
+            if self.session_key is None:
+                return 0
+            session_key = self.session_key
+        cache.delete(session_cache_key(session_key))
+        return UserSession.objects.filter(session_token=session_key, is_active=True).update(is_active=False)
+
+    @classmethod
+    def clear_expired(cls):
+        from webAMG.services.auth_service import AuthService
+        AuthService.sweep_sessions()
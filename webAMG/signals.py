@@ -0,0 +1,183 @@
+"""
+Señales de la aplicación webAMG.
+Mantienen actualizado el avance (progress_percentage) de proyectos y fases
+cuando cambian las fases o sus evidencias, actualizan project.updated_at
+(clave de la caché de fragmentos de project_detail) y publican el cambio en el
+bus de eventos del proyecto cuando cambian sus filas relacionadas, e invalidan
+la caché de usuarios del backend de autenticación.
+"""
+from typing import List
+from django.db.models import Q
+from django.db.models.signals import post_save, post_delete, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+from webAMG.authentication import invalidate_cached_user
+from webAMG.models import (
+    Beneficiary,
+    EvidenceBeneficiary,
+    EvidencePhoto,
+    PhaseBeneficiary,
+    PhaseEvidence,
+    PhaseEvidenceBeneficiary,
+    PhaseEvidencePhoto,
+    Project,
+    ProjectBeneficiary,
+    ProjectEvidence,
+    ProjectPhase,
+    User,
+)
+from webAMG.services.progress_service import ProgressService
+from webAMG.services.project_event_service import ProjectEventService
+from webAMG.sessions import invalidate_user_sessions
+
+
+# Campos que influyen en el cálculo del avance
+PROGRESS_FIELDS = {'status', 'start_date', 'end_date', 'is_active'}
+
+
+def _affects_progress(update_fields) -> bool:
+    """
+    Indica si un guardado puede cambiar el avance.
+    Los guardados parciales como save(update_fields=['updated_at']) se ignoran.
+    """
+    return not update_fields or bool(PROGRESS_FIELDS & set(update_fields))
+
+
+@receiver(post_save, sender=Project)
+def update_progress_on_project_save(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Recalcula el avance cuando cambian el estado o las fechas del proyecto."""
+    if raw or not _affects_progress(update_fields):
+        return
+    ProgressService.recompute_project(instance.pk)
+
+
+@receiver(post_save, sender=ProjectPhase)
+def update_progress_on_phase_save(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Recalcula la fase guardada y su proyecto."""
+    if raw or not _affects_progress(update_fields):
+        return
+    ProgressService.on_phase_changed(instance.pk, instance.project_id)
+
+
+@receiver(post_delete, sender=ProjectPhase)
+def update_progress_on_phase_delete(sender, instance, **kwargs):
+    """Recalcula el proyecto cuando se elimina una de sus fases."""
+    ProgressService.recompute_project(instance.project_id)
+
+
+@receiver(post_save, sender=PhaseEvidence)
+@receiver(post_delete, sender=PhaseEvidence)
+def update_progress_on_phase_evidence_change(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Recalcula la fase de la evidencia y su proyecto."""
+    if raw or not _affects_progress(update_fields):
+        return
+    project_id = ProjectPhase.all_objects.filter(pk=instance.phase_id).values_list(
+        'project_id', flat=True
+    ).first()
+    if project_id is not None:
+        ProgressService.on_phase_changed(instance.phase_id, project_id)
+
+
+@receiver(post_save, sender=ProjectEvidence)
+@receiver(post_delete, sender=ProjectEvidence)
+def update_progress_on_project_evidence_change(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Recalcula el proyecto de la evidencia."""
+    if raw or not _affects_progress(update_fields):
+        return
+    ProgressService.recompute_project(instance.project_id)
+
+
+# Modelo -> (ruta desde Project, campo de la instancia con su valor). Se usa
+# el id del padre para que también funcione en post_delete
+PROJECT_TOUCH = {
+    ProjectPhase: ('pk', 'project_id'),
+    ProjectEvidence: ('pk', 'project_id'),
+    ProjectBeneficiary: ('pk', 'project_id'),
+    EvidencePhoto: ('evidences', 'evidence_id'),
+    EvidenceBeneficiary: ('evidences', 'evidence_id'),
+    PhaseEvidence: ('phases', 'phase_id'),
+    PhaseBeneficiary: ('phases', 'phase_id'),
+    PhaseEvidencePhoto: ('phases__evidences', 'phase_evidence_id'),
+    PhaseEvidenceBeneficiary: ('phases__evidences', 'phase_evidence_id'),
+}
+
+
+def touch_projects(project_ids: List[int]) -> int:
+    """Actualiza updated_at de los proyectos, sin disparar señales."""
+    if not project_ids:
+        return 0
+    return Project.all_objects.filter(pk__in=project_ids).update(updated_at=timezone.now())
+
+
+def beneficiary_project_ids(beneficiary_ids: List[int]) -> List[int]:
+    """Proyectos (activos o no) donde participan los beneficiarios, directamente o en fases y evidencias."""
+    return list(Project.all_objects.filter(
+        Q(pk__in=ProjectBeneficiary.all_objects.filter(beneficiary_id__in=beneficiary_ids).values('project_id'))
+        | Q(pk__in=PhaseBeneficiary.all_objects.filter(beneficiary_id__in=beneficiary_ids).values('phase__project_id'))
+        | Q(pk__in=EvidenceBeneficiary.all_objects.filter(
+            beneficiary_id__in=beneficiary_ids
+        ).values('evidence__project_id'))
+        | Q(pk__in=PhaseEvidenceBeneficiary.all_objects.filter(
+            beneficiary_id__in=beneficiary_ids
+        ).values('phase_evidence__phase__project_id'))
+    ).values_list('pk', flat=True))
+
+
+def touch_and_publish(project_ids: List[int], instance, action: str) -> None:
+    """Invalida la caché de los proyectos y publica el cambio en su grupo de Channels."""
+    touch_projects(project_ids)
+    event = ProjectEventService.build_event(instance, action)
+    if event is not None:
+        ProjectEventService.publish(project_ids, event)
+
+
+def touch_project_on_change(sender, instance, raw=False, created=False, signal=None, **kwargs):
+    """Invalida los fragmentos en caché del proyecto al que pertenece la fila y avisa a sus clientes."""
+    if raw:
+        return
+    lookup, field = PROJECT_TOUCH[sender]
+    value = getattr(instance, field)
+    if value is None:
+        return
+    if lookup == 'pk':
+        project_ids = [value]
+    else:
+        project_ids = list(Project.all_objects.filter(**{lookup: value}).values_list('pk', flat=True))
+
+    if signal is post_delete:
+        action = ProjectEventService.DELETED
+    else:
+        action = ProjectEventService.CREATED if created else ProjectEventService.UPDATED
+    touch_and_publish(project_ids, instance, action)
+
+
+for model in PROJECT_TOUCH:
+    post_save.connect(touch_project_on_change, sender=model, dispatch_uid=f'touch_project_{model.__name__}')
+    post_delete.connect(touch_project_on_change, sender=model, dispatch_uid=f'touch_project_{model.__name__}_delete')
+
+
+@receiver(post_save, sender=Beneficiary)
+def touch_projects_on_beneficiary_save(sender, instance, raw=False, **kwargs):
+    """Los datos del beneficiario aparecen en los proyectos, fases y evidencias donde participa."""
+    if raw:
+        return
+    touch_and_publish(beneficiary_project_ids([instance.pk]), instance, ProjectEventService.UPDATED)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_cache(sender, instance, **kwargs):
+    """Descarta el usuario de la caché de get_user cuando cambia."""
+    invalidate_cached_user(instance.pk)
+
+
+@receiver(post_save, sender=User)
+@receiver(pre_delete, sender=User)
+def invalidate_user_session_cache(sender, instance, raw=False, **kwargs):
+    """
+    Las sesiones en caché llevan los datos del usuario (is_active, role).
+    Al eliminar se usa pre_delete: después las sesiones ya no existen.
+    """
+    if raw:
+        return
+    invalidate_user_sessions([instance.pk])
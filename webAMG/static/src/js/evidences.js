@@ -1058,7 +1058,11 @@ document.addEventListener('DOMContentLoaded', function() {
             .then(data => {
                 if (data.success) {
                     closeDeleteEvidenceModal();
-                    location.reload();
+                    if (window.ProjectEvents) {
+                        window.ProjectEvents.refresh('evidences');
+                    } else {
+                        location.reload();
+                    }
                 } else {
                     alert(data.message || 'Error al eliminar la evidencia');
                 }
@@ -1127,10 +1131,11 @@ document.addEventListener('DOMContentLoaded', function() {
     }
 });
 
-// Inicializar las fotos de evidencias al cargar la página
-document.addEventListener('DOMContentLoaded', function() {
+// Configura el grid de fotos de cada evidencia dentro de root (también se usa
+// al reemplazar la lista de evidencias con project_events.js)
+function initEvidencePhotoGrids(root = document) {
     // Para cada evidencia, configurar el grid de fotos dinámicamente
-    document.querySelectorAll('[id^="evidence-photos-"]').forEach(function(container) {
+    root.querySelectorAll('[id^="evidence-photos-"]').forEach(function(container) {
         const photos = container.querySelectorAll('.evidence-photo');
         const totalPhotos = photos.length;
         
@@ -1181,6 +1186,11 @@ document.addEventListener('DOMContentLoaded', function() {
         console.log(`  - Columnas: ${columns}`);
         console.log(`  - Botones navegación: ${navButtons.length > 0 ? 'mostrados' : 'ocultos'}`);
     });
+}
+
+// Inicializar las fotos de evidencias al cargar la página
+document.addEventListener('DOMContentLoaded', function() {
+    initEvidencePhotoGrids();
 });
 
 // Logs de depuración para el formulario de edición de evidencia
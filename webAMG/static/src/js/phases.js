@@ -284,7 +284,11 @@ document.addEventListener('DOMContentLoaded', function() {
             .then(data => {
                 if (data.success) {
                     closeEditPhaseModal();
-                    location.reload();
+                    if (window.ProjectEvents) {
+                        window.ProjectEvents.refresh('phases');
+                    } else {
+                        location.reload();
+                    }
                 } else {
                     alert(data.message || 'Error al actualizar la fase');
                 }
@@ -345,7 +349,11 @@ document.addEventListener('DOMContentLoaded', function() {
             .then(data => {
                 if (data.success) {
                     closePhaseEditEvidenceModal();
-                    location.reload();
+                    if (window.ProjectEvents) {
+                        window.ProjectEvents.refresh('phases');
+                    } else {
+                        location.reload();
+                    }
                 } else {
                     alert(data.message || 'Error al actualizar la evidencia');
                 }
@@ -382,7 +390,11 @@ document.addEventListener('DOMContentLoaded', function() {
             .then(data => {
                 if (data.success) {
                     closeDeletePhaseEvidenceModal();
-                    location.reload();
+                    if (window.ProjectEvents) {
+                        window.ProjectEvents.refresh('phases');
+                    } else {
+                        location.reload();
+                    }
                 } else {
                     alert(data.message || 'Error al eliminar la evidencia');
                 }
@@ -416,7 +428,11 @@ document.addEventListener('DOMContentLoaded', function() {
             .then(data => {
                 if (data.success) {
                     closeDeletePhaseModal();
-                    location.reload();
+                    if (window.ProjectEvents) {
+                        window.ProjectEvents.refresh('phases');
+                    } else {
+                        location.reload();
+                    }
                 } else {
                     alert(data.message || 'Error al eliminar la fase');
                 }
@@ -1191,7 +1207,11 @@ document.getElementById('phaseEvidenceBeneficiariesSearch')?.addEventListener('i
             })
             .then(data => {
                 if (data.success) {
-                    location.reload();
+                    if (window.ProjectEvents) {
+                        window.ProjectEvents.refresh('phases');
+                    } else {
+                        location.reload();
+                    }
                 } else {
                     alert(data.message || 'Error al agregar la evidencia');
                 }
@@ -0,0 +1,226 @@
+// Actualizaciones en tiempo real de project_detail (WebSocket /ws/projects/<id>/)
+// El servidor publica un evento compacto por cada cambio del proyecto; las
+// ediciones de fases se aplican sobre la tarjeta y los demás cambios vuelven a
+// pedir solo la sección afectada (servida desde la caché de fragmentos).
+(function() {
+    const script = document.currentScript;
+    const projectId = script && script.dataset.projectId;
+    if (!projectId) {
+        return;
+    }
+
+    const PHASE_STATUS_CLASSES = {
+        pendiente: 'bg-gray-100 text-gray-700',
+        en_progreso: 'bg-yellow-100 text-yellow-700',
+        completada: 'bg-green-100 text-green-700',
+        cancelada: 'bg-red-100 text-red-700'
+    };
+    const SECTIONS = {
+        beneficiaries: 'project-beneficiaries-list',
+        phases: 'project-phases-list',
+        evidences: 'project-evidences-list'
+    };
+    const REFRESH_DELAY = 300;
+    const MAX_RETRY_DELAY = 30000;
+
+    let socket = null;
+    let retryDelay = 1000;
+    let refreshTimer = null;
+    const pendingSections = new Set();
+
+    function formatDate(value) {
+        if (!value) {
+            return '';
+        }
+        const [year, month, day] = value.slice(0, 10).split('-');
+        return `${day}/${month}/${year}`;
+    }
+
+    // Vuelve a pedir la página y reemplaza solo las secciones pendientes
+    function refreshSections() {
+        const sections = Array.from(pendingSections);
+        pendingSections.clear();
+        fetch(window.location.href, {
+            headers: { 'X-Requested-With': 'XMLHttpRequest' },
+            credentials: 'same-origin'
+        })
+        .then(response => {
+            if (!response.ok) {
+                throw new Error(`HTTP ${response.status}`);
+            }
+            return response.text();
+        })
+        .then(html => {
+            const doc = new DOMParser().parseFromString(html, 'text/html');
+            sections.forEach(section => {
+                const current = document.getElementById(SECTIONS[section]);
+                const updated = doc.getElementById(SECTIONS[section]);
+                if (!current || !updated) {
+                    return;
+                }
+                current.replaceWith(updated);
+                if (section === 'evidences') {
+                    if (typeof initEvidencePhotoGrids === 'function') {
+                        initEvidencePhotoGrids(updated);
+                    }
+                    if (typeof applyProjectEvidenceFilters === 'function') {
+                        applyProjectEvidenceFilters();
+                    }
+                }
+            });
+        })
+        .catch(error => {
+            console.error('Error al actualizar la sección del proyecto:', error);
+        });
+    }
+
+    function scheduleRefresh(section) {
+        pendingSections.add(section);
+        clearTimeout(refreshTimer);
+        refreshTimer = setTimeout(refreshSections, REFRESH_DELAY);
+    }
+
+    // Los formularios actualizan su sección al guardar sin esperar el evento:
+    // con varios workers el evento puede no llegar a esta conexión
+    window.ProjectEvents = {
+        refresh(...sections) {
+            sections.forEach(scheduleRefresh);
+        }
+    };
+
+    function patchPhase(event) {
+        const card = document.querySelector(`[data-phase-card="${event.id}"]`);
+        if (!card) {
+            scheduleRefresh('phases');
+            return;
+        }
+        const data = event.data;
+
+        const name = card.querySelector('[data-field="phase_name"]');
+        if (name) {
+            name.textContent = data.phase_name;
+        }
+
+        const dates = card.querySelector('[data-field="dates"]');
+        if (dates) {
+            let text = formatDate(data.start_date);
+            if (data.end_date && data.end_date !== data.start_date) {
+                text += ` - ${formatDate(data.end_date)}`;
+            }
+            dates.textContent = text;
+        }
+
+        const status = card.querySelector('[data-field="status"]');
+        if (status) {
+            const badge = document.createElement('span');
+            badge.className = `px-2 py-1 rounded-full text-xs font-medium ${PHASE_STATUS_CLASSES[data.status] || PHASE_STATUS_CLASSES.pendiente}`;
+            badge.textContent = data.status_display;
+            status.replaceChildren(badge);
+        }
+
+        const description = card.querySelector('[data-field="description"]');
+        if (description) {
+            description.textContent = data.description || '';
+            description.classList.toggle('hidden', !data.description);
+        }
+
+        // El modal de edición toma los valores del botón
+        const editButton = card.querySelector(`button[data-phase-id="${event.id}"]`);
+        if (editButton) {
+            editButton.dataset.phaseName = data.phase_name;
+            editButton.dataset.description = data.description || '';
+            editButton.dataset.startDate = data.start_date ? data.start_date.slice(0, 10) : '';
+            editButton.dataset.endDate = data.end_date ? data.end_date.slice(0, 10) : '';
+            editButton.dataset.status = data.status;
+        }
+    }
+
+    function removePhase(event) {
+        const card = document.querySelector(`[data-phase-card="${event.id}"]`);
+        if (card) {
+            card.remove();
+        }
+        // Sin fases hay que mostrar el mensaje de lista vacía del servidor
+        if (!document.querySelector('[data-phase-card]')) {
+            scheduleRefresh('phases');
+        }
+    }
+
+    function removeEvidence(event) {
+        const card = document.querySelector(`.evidence-card[data-evidence-id="${event.id}"]`);
+        if (card) {
+            card.remove();
+        } else {
+            scheduleRefresh('evidences');
+        }
+    }
+
+    function handleEvent(event) {
+        switch (event.entity) {
+            case 'phase':
+                if (event.action === 'updated') {
+                    patchPhase(event);
+                } else if (event.action === 'deleted') {
+                    removePhase(event);
+                } else {
+                    scheduleRefresh('phases');
+                }
+                break;
+            case 'phase_beneficiary':
+            case 'phase_evidence':
+            case 'phase_evidence_photo':
+            case 'phase_evidence_beneficiary':
+                // Solo cambian los contadores de la tarjeta de la fase
+                scheduleRefresh('phases');
+                break;
+            case 'evidence':
+                if (event.action === 'deleted') {
+                    removeEvidence(event);
+                } else {
+                    scheduleRefresh('evidences');
+                }
+                break;
+            case 'photo':
+            case 'evidence_beneficiary':
+                scheduleRefresh('evidences');
+                break;
+            case 'beneficiary_assignment':
+            case 'beneficiary':
+                scheduleRefresh('beneficiaries');
+                break;
+            default:
+                break;
+        }
+    }
+
+    function connect() {
+        if (!('WebSocket' in window)) {
+            return;
+        }
+        const scheme = window.location.protocol === 'https:' ? 'wss' : 'ws';
+        socket = new WebSocket(`${scheme}://${window.location.host}/ws/projects/${projectId}/`);
+
+        socket.addEventListener('open', () => {
+            retryDelay = 1000;
+        });
+
+        socket.addEventListener('message', message => {
+            try {
+                handleEvent(JSON.parse(message.data));
+            } catch (error) {
+                console.error('Evento de proyecto inválido:', error);
+            }
+        });
+
+        socket.addEventListener('close', close => {
+            // 4403: sin sesión o sin acceso al proyecto, no reintentar
+            if (close.code === 4403) {
+                return;
+            }
+            setTimeout(connect, retryDelay);
+            retryDelay = Math.min(retryDelay * 2, MAX_RETRY_DELAY);
+        });
+    }
+
+    connect();
+})();
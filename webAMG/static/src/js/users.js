@@ -94,21 +94,6 @@ function toggleDeletePassword() {
     }
 }
 
-// Filter users by username
-function filterUsers() {
-    const searchInput = document.getElementById('searchInput').value.toLowerCase();
-    const userRows = document.querySelectorAll('.user-row');
-    
-    userRows.forEach(row => {
-        const username = row.getAttribute('data-username').toLowerCase();
-        if (username.includes(searchInput)) {
-            row.style.display = '';
-        } else {
-            row.style.display = 'none';
-        }
-    });
-}
-
 // Close modals when clicking outside
 document.addEventListener('click', function(event) {
     if (event.target.classList.contains('fixed')) {
@@ -1,11 +1,13 @@
 """
 Template filters para manejo de fechas con zona horaria.
 """
+import logging
 from django import template
 from django.utils import timezone
 from datetime import timezone as dt_timezone
 
 register = template.Library()
+logger = logging.getLogger(__name__)
 
 
 @register.filter
@@ -22,9 +24,7 @@ def localtime_filter(value):
             value = value.replace(tzinfo=dt_timezone.utc)
         
         # Convertir a la zona horaria local
-        local_time = timezone.localtime(value)
-        print(f'localtime_filter: {value} -> {local_time} (tz: {local_time.tzinfo})')
-        return local_time
+        return timezone.localtime(value)
     except Exception as e:
-        print(f'Error en localtime_filter: {e}')
+        logger.warning(f'localtime_filter failed for {value!r}: {e}')
         return value
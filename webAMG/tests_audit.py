@@ -0,0 +1,137 @@
+"""
+Tests para la escritura por lotes de LoginLog y AuditLog.
+"""
+import json
+import os
+import queue
+import tempfile
+from contextlib import nullcontext
+from datetime import datetime
+from unittest import mock
+from django.db import IntegrityError
+from django.test import SimpleTestCase, override_settings
+from webAMG.models import LoginLog
+from webAMG.services.audit_service import AuditService
+
+
+def login_event(user_id):
+    return ('login', {
+        'user_id': user_id, 'ip_address': '10.0.0.1', 'user_agent': 'test',
+        'success': True, 'failure_reason': None,
+        'login_time': datetime(2026, 1, 5, 8, 30),
+    })
+
+
+class AuditServiceSpillTestCase(SimpleTestCase):
+    """Tests del archivo de respaldo, sin base de datos."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.spill_file = os.path.join(self.tmpdir.name, 'audit_spill.jsonl')
+        self.dead_letter_file = os.path.join(self.tmpdir.name, 'audit_dead_letter.jsonl')
+        override = override_settings(AUDIT_SPILL_FILE=self.spill_file, AUDIT_DEAD_LETTER_FILE=self.dead_letter_file)
+        override.enable()
+        self.addCleanup(override.disable)
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def test_failed_write_spills_events(self):
+        """Si la base de datos falla, los eventos quedan en el archivo de respaldo."""
+        event = ('login', {
+            'user_id': 7, 'ip_address': '10.0.0.1', 'user_agent': 'test',
+            'success': False, 'failure_reason': 'Contraseña incorrecta',
+            'login_time': datetime(2026, 1, 5, 8, 30),
+        })
+
+        # SimpleTestCase bloquea las consultas, así que bulk_create falla
+        AuditService._write([event])
+
+        self.assertTrue(os.path.exists(self.spill_file))
+        replay_paths, events = AuditService._take_spill()
+        self.assertEqual(events, [event])
+        self.assertFalse(os.path.exists(self.spill_file))
+        self.assertTrue(all(os.path.exists(replay_path) for replay_path in replay_paths))
+
+    def test_take_spill_skips_truncated_lines(self):
+        """Una línea cortada por un cierre abrupto no impide leer las demás."""
+        AuditService._spill([('audit', {
+            'table_name': 'projects', 'operation': 'UPDATE', 'old_data': {'x': 1},
+            'new_data': {'x': 2}, 'user_id': None, 'ip_address': None,
+            'performed_at': datetime(2026, 1, 5, 9, 0),
+        })])
+        with open(self.spill_file, 'a', encoding='utf-8') as spill_file:
+            spill_file.write('{"kind": "login", "da')
+
+        _, events = AuditService._take_spill()
+
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0][1]['performed_at'], datetime(2026, 1, 5, 9, 0))
+        self.assertEqual(events[0][1]['new_data'], {'x': 2})
+
+    def test_rejected_event_is_quarantined(self):
+        """Un evento que la base de datos rechaza va al dead letter y no bloquea el respaldo."""
+        AuditService._spill([login_event(99)])
+        rejected = IntegrityError('login_log_user_id_fkey')
+
+        with mock.patch('webAMG.services.audit_service.transaction.atomic', nullcontext), \
+                mock.patch.object(LoginLog.objects, 'bulk_create', side_effect=rejected), \
+                mock.patch.object(LoginLog.objects, 'create', side_effect=[rejected, None]) as create:
+            AuditService._write([login_event(7)])
+
+        self.assertEqual(create.call_count, 2)
+        self.assertEqual(os.listdir(self.tmpdir.name), ['audit_dead_letter.jsonl'])
+        with open(self.dead_letter_file, encoding='utf-8') as dead_file:
+            records = [json.loads(line) for line in dead_file]
+        self.assertEqual([record['data']['user_id'] for record in records], [99])
+
+    def test_replay_is_kept_when_spill_fails(self):
+        """Si no se puede volver a escribir el respaldo, el .replay no se borra."""
+        AuditService._spill([login_event(7)])
+
+        with mock.patch.object(AuditService, '_store', side_effect=lambda pending: pending), \
+                mock.patch.object(AuditService, '_spill', side_effect=OSError('disco lleno')):
+            AuditService._write([])
+
+        replay_paths, events = AuditService._take_spill()
+        self.assertEqual(len(replay_paths), 1)
+        self.assertEqual(events, [login_event(7)])
+
+    def test_claimed_replay_is_read_once(self):
+        """Un .replay reclamado por otro guardado en curso no se vuelve a leer."""
+        AuditService._spill([login_event(7)])
+        first_paths, first = AuditService._take_spill()
+        self.addCleanup(AuditService._release, first_paths, remove=True)
+
+        second_paths, second = AuditService._take_spill()
+
+        self.assertEqual(first, [login_event(7)])
+        self.assertEqual((second_paths, second), ([], []))
+
+    def test_abandoned_replay_is_recovered(self):
+        """Los .replay de un proceso que ya no existe (o del formato anterior) se retoman."""
+        AuditService._spill([login_event(7)])
+        os.rename(self.spill_file, f'{self.spill_file}.replay')
+
+        with mock.patch.object(AuditService, '_store', return_value=[]) as store:
+            AuditService._write([])
+            AuditService._write([])
+
+        self.assertEqual([call.args[0] for call in store.call_args_list], [[login_event(7)]])
+        self.assertEqual(os.listdir(self.tmpdir.name), [])
+
+    def test_writer_thread_survives_errors(self):
+        """Un error inesperado al guardar no detiene el hilo: el lote va al respaldo."""
+        self.addCleanup(setattr, AuditService, '_queue', AuditService._queue)
+        AuditService._queue = queue.Queue()
+        AuditService._queue.put(login_event(7))
+
+        def write(events):
+            AuditService._stopping.set()
+            raise RuntimeError('fallo inesperado')
+
+        with mock.patch.object(AuditService, '_write', side_effect=write), \
+                self.assertLogs('webAMG.services.audit_service', 'ERROR'):
+            AuditService._run()
+        AuditService._stopping.clear()
+
+        _, events = AuditService._take_spill()
+        self.assertEqual(events, [login_event(7)])
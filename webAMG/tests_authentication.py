@@ -0,0 +1,85 @@
+"""
+Tests para el backend de autenticación.
+"""
+import asyncio
+from datetime import timedelta
+from unittest import mock
+from django.core.cache import cache
+from django.db.models.query import QuerySet
+from django.test import SimpleTestCase
+from django.utils import timezone
+from webAMG.authentication import (
+    CustomUserBackend,
+    USER_FIELDS,
+    _lookup_queryset,
+    _pick_user,
+    user_cache_key,
+)
+from webAMG.models import User
+from webAMG.services.password_service import PasswordService
+
+
+class CustomUserBackendTestCase(SimpleTestCase):
+    """Tests del backend sin base de datos."""
+
+    def tearDown(self):
+        cache.clear()
+
+    def _cache_user(self, **fields):
+        now = timezone.now()
+        values = {
+            'id': 7, 'username': 'ana', 'email': 'ana@example.org', 'full_name': 'Ana López',
+            'role': 'usuario', 'is_active': True, 'profile_image_url': None, 'phone': None,
+            'last_login': now, 'created_at': now, 'updated_at': now, **fields,
+        }
+        cache.set(user_cache_key(values['id']), [values[field] for field in USER_FIELDS])
+        return values
+
+    def test_lookup_is_one_case_insensitive_query(self):
+        """Username y email se buscan en una sola consulta con UPPER()."""
+        sql = str(_lookup_queryset('Admin@Example.org').query)
+        self.assertIn('UPPER("users"."username"::text) = UPPER(', sql)
+        self.assertIn('UPPER("users"."email"::text) = UPPER(', sql)
+        self.assertIn(' OR ', sql)
+
+    def test_pick_user_prefers_exact_username(self):
+        """Si el texto coincide con un username y con un email, gana el username."""
+        by_email = User(id=1, username='ana', email='juan@example.org')
+        by_username = User(id=2, username='Juan@example.org', email='otro@example.org')
+        self.assertIs(_pick_user([by_email, by_username], 'juan@example.org'), by_username)
+        self.assertIs(_pick_user([by_email], 'JUAN@example.org'), by_email)
+        self.assertIsNone(_pick_user([], 'nadie'))
+
+    def test_get_user_from_cache_defers_password(self):
+        """Un usuario en caché no consulta la base de datos y difiere password_hash."""
+        values = self._cache_user()
+
+        user = CustomUserBackend().get_user(7)
+
+        self.assertEqual(user.username, 'ana')
+        self.assertEqual(user.updated_at, values['updated_at'])
+        self.assertIn('password_hash', user.get_deferred_fields())
+
+    def test_cached_user_keeps_each_column(self):
+        """Cada valor en caché vuelve a su columna (from_db usa el orden del modelo)."""
+        values = self._cache_user(
+            profile_image_url='https://example.org/ana.png', phone='5555-1234',
+            last_login=timezone.now() - timedelta(days=1),
+        )
+
+        user = CustomUserBackend().get_user(7)
+
+        for field in USER_FIELDS:
+            self.assertEqual(getattr(user, field), values[field], field)
+
+    def test_acheck_password_loads_deferred_hash_async(self):
+        """acheck_password de un usuario del backend lee el hash sin refresh_from_db síncrono."""
+        self._cache_user(role='administrador')
+        user = CustomUserBackend().get_user(7)
+        stored = User(id=7, password_hash=PasswordService.hash_password('Secreta123!'))
+
+        with mock.patch.object(QuerySet, 'aget', mock.AsyncMock(return_value=stored)) as aget, \
+                mock.patch.object(PasswordService, 'needs_rehash', return_value=False):
+            self.assertTrue(asyncio.run(user.acheck_password('Secreta123!')))
+
+        aget.assert_called_with(pk=7)
@@ -0,0 +1,73 @@
+"""
+Tests para el perfil de censo de beneficiarios.
+"""
+import asyncio
+from datetime import date
+from unittest import mock
+from django.test import SimpleTestCase
+from webAMG.models import Beneficiary, BeneficiaryHealth, BeneficiaryEconomy
+from webAMG.services.census_service import CensusService
+
+
+class CensusProfileTestCase(SimpleTestCase):
+    """Tests del read model del censo, sin base de datos."""
+
+    def test_with_census_joins_all_satellites(self):
+        """with_census() carga las cuatro tablas satélite en la misma consulta."""
+        queryset = Beneficiary.objects.with_census()
+        self.assertEqual(
+            set(queryset.query.select_related),
+            {'health', 'education', 'housing', 'economy'}
+        )
+        sql = str(queryset.query)
+        for table in ('beneficiary_health', 'beneficiary_education', 'beneficiary_housing', 'beneficiary_economy'):
+            self.assertIn(f'LEFT OUTER JOIN "{table}"', sql)
+
+    def test_serialize_profile_is_compact(self):
+        """El perfil incluye los satélites existentes y None para los faltantes."""
+        beneficiary = Beneficiary(
+            id=7,
+            first_name='Ana',
+            last_name='López',
+            birth_date=date(1990, 5, 1),
+            department='Sololá',
+            municipality='Panajachel',
+        )
+        beneficiary.health = BeneficiaryHealth(is_pregnant=True)
+        beneficiary.economy = BeneficiaryEconomy(homemaker=True)
+        # Así deja select_related() los satélites que no existen
+        beneficiary._state.fields_cache['education'] = None
+        beneficiary._state.fields_cache['housing'] = None
+
+        data = CensusService.serialize_profile(beneficiary)
+
+        self.assertEqual(data['id'], 7)
+        self.assertEqual(data['birth_date'], '1990-05-01')
+        self.assertTrue(data['health']['is_pregnant'])
+        self.assertTrue(data['economy']['homemaker'])
+        self.assertIsNone(data['education'])
+        self.assertIsNone(data['housing'])
+        self.assertNotIn('created_at', data['health'])
+        self.assertNotIn('beneficiary_id', data['health'])
+
+    def test_export_csv_is_async_by_page(self):
+        """La exportación se entrega por páginas con un iterador asíncrono y cierra el cursor."""
+        closed = []
+
+        def rows(filters=None, include_inactive=False):
+            try:
+                yield ['id', 'first_name']
+                for pk in range(1, 4):
+                    yield (pk, f'Persona {pk}')
+            finally:
+                closed.append(True)
+
+        async def consume():
+            return [chunk async for chunk in CensusService.aiter_export_csv()]
+
+        with mock.patch.object(CensusService, 'iter_export_rows', side_effect=rows), \
+                mock.patch.object(CensusService, 'EXPORT_PAGE_SIZE', 2):
+            chunks = asyncio.run(consume())
+
+        self.assertEqual(chunks, ['id,first_name\r\n1,Persona 1\r\n', '2,Persona 2\r\n3,Persona 3\r\n'])
+        self.assertEqual(closed, [True])
@@ -0,0 +1,48 @@
+"""
+Tests para la importación masiva del censo de beneficiarios.
+"""
+import io
+from datetime import date
+from django.test import SimpleTestCase
+from webAMG.services.census_import_service import CensusImportService
+
+
+class CensusImportValidationTestCase(SimpleTestCase):
+    """Tests de lectura y validación, sin base de datos."""
+
+    def test_csv_reader_accepts_semicolon_and_normalizes_header(self):
+        """Los CSV de Excel en español usan punto y coma."""
+        stream = io.StringIO('First Name;Last_Name;Department\nAna;López;Sololá\n')
+        rows = list(CensusImportService.iter_csv_rows(stream))
+        self.assertEqual(rows, [{'first_name': 'Ana', 'last_name': 'López', 'department': 'Sololá'}])
+
+    def test_validate_batch_reports_errors_per_row(self):
+        """Una fila inválida no descarta las demás filas del lote."""
+        base = {'first_name': 'Ana', 'last_name': 'López', 'department': 'Sololá', 'municipality': 'Panajachel'}
+        batch = [
+            (2, dict(base, cui_dpi='1234 56789 0101', birth_date='1990-05-01', has_diabetes='Sí')),
+            (3, dict(base, cui_dpi='123')),
+            (4, dict(base, ethnicity='Maya', id='99')),
+        ]
+
+        valid, errors = CensusImportService.validate_batch(batch)
+
+        self.assertEqual([line for line, _ in valid], [2, 4])
+        self.assertEqual(valid[0][1].cui_dpi, '1234567890101')
+        self.assertEqual(valid[0][1].birth_date, date(1990, 5, 1))
+        self.assertTrue(valid[0][1].has_diabetes)
+        self.assertEqual(valid[1][1].ethnicity, 'maya')
+        self.assertEqual(errors, [{'row': 3, 'errors': {'cui_dpi': errors[0]['errors']['cui_dpi']}}])
+
+    def test_build_objects_only_creates_present_satellites(self):
+        """Solo se crean las tablas satélite con datos en la fila."""
+        valid, _ = CensusImportService.validate_batch([(2, {
+            'first_name': 'Ana', 'last_name': 'López', 'department': 'Sololá',
+            'municipality': 'Panajachel', 'has_electricity': 'x', 'years_of_study': '',
+        })])
+
+        beneficiary, satellites = CensusImportService._build_objects(valid[0][1])
+
+        self.assertEqual(beneficiary.first_name, 'Ana')
+        self.assertEqual(beneficiary.total_household_members, 0)
+        self.assertEqual(satellites, {'housing': {'has_electricity': True}})
@@ -0,0 +1,43 @@
+"""
+Tests para las peticiones condicionales (ETag / Last-Modified).
+"""
+from datetime import datetime, timezone
+from django.http import JsonResponse
+from django.test import RequestFactory, SimpleTestCase
+from webAMG.services.conditional_service import ConditionalService, conditional_get
+
+
+class ConditionalGetTestCase(SimpleTestCase):
+    """Tests del decorador conditional_get, sin base de datos."""
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.calls = []
+        self.version = datetime(2026, 10, 19, 15, 30, tzinfo=timezone.utc)
+
+        @conditional_get(lambda project_id: self.version if project_id == 1 else None)
+        def view(request, project_id):
+            self.calls.append(project_id)
+            return JsonResponse({'project_id': project_id})
+
+        self.view = view
+
+    def test_unchanged_resource_returns_304_without_running_view(self):
+        response = self.view(self.factory.get('/p/1/'), project_id=1)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('private', response['Cache-Control'])
+        self.assertIn('no-cache', response['Cache-Control'])
+
+        response = self.view(self.factory.get('/p/1/', HTTP_IF_NONE_MATCH=response['ETag']), project_id=1)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(self.calls, [1])
+
+    def test_changed_resource_runs_view(self):
+        old_etag = f'"{ConditionalService.make_etag("/p/1/", datetime(2026, 1, 1, tzinfo=timezone.utc))}"'
+        response = self.view(self.factory.get('/p/1/', HTTP_IF_NONE_MATCH=old_etag), project_id=1)
+        self.assertEqual(response.status_code, 200)
+
+    def test_missing_resource_skips_validators(self):
+        response = self.view(self.factory.get('/p/2/'), project_id=2)
+        self.assertFalse(response.has_header('ETag'))
+        self.assertEqual(self.calls, [2])
@@ -0,0 +1,81 @@
+"""
+Tests para la capa de datos de los componentes del dashboard.
+"""
+import asyncio
+from datetime import date
+from decimal import Decimal
+from django.test import SimpleTestCase
+from webAMG.core.loaders import BatchLoader
+from webAMG.services.dashboard_service import DashboardService
+
+
+class BatchLoaderTestCase(SimpleTestCase):
+    """Tests del agrupamiento y la memoización de BatchLoader, sin base de datos."""
+
+    def setUp(self):
+        self.calls = []
+
+        async def batch(keys):
+            self.calls.append(list(keys))
+            return {key: key * 10 for key in keys if key != 404}
+
+        self.loader = BatchLoader(batch)
+
+    def test_concurrent_loads_share_one_batch(self):
+        async def run():
+            return await asyncio.gather(*(self.loader.load(key) for key in (1, 2, 3, 2)))
+
+        self.assertEqual(asyncio.run(run()), [10, 20, 30, 20])
+        self.assertEqual(self.calls, [[1, 2, 3]])
+
+    def test_results_are_memoized(self):
+        async def run():
+            first = await self.loader.load_many([1, 404])
+            second = await self.loader.load_many([1, 404])
+            return first, second
+
+        self.assertEqual(asyncio.run(run()), ([10, None], [10, None]))
+        self.assertEqual(self.calls, [[1, 404]])
+
+    def test_errors_are_not_memoized(self):
+        attempts = []
+
+        async def failing(keys):
+            attempts.append(list(keys))
+            if len(attempts) == 1:
+                raise RuntimeError('sin conexión')
+            return {key: key for key in keys}
+
+        loader = BatchLoader(failing)
+
+        async def run():
+            with self.assertRaises(RuntimeError):
+                await loader.load(1)
+            return await loader.load(1)
+
+        self.assertEqual(asyncio.run(run()), 1)
+        self.assertEqual(attempts, [[1], [1]])
+
+
+class DashboardServiceTestCase(SimpleTestCase):
+    """Tests del formato de las filas de proyecto."""
+
+    def test_format_project_row(self):
+        row = DashboardService.format_project_row({
+            'id': 1,
+            'project_name': 'Centro Comunitario',
+            'project_code': 'PROJ-001',
+            'municipality': 'San Lucas Tolimán',
+            'department': None,
+            'status': 'en_progreso',
+            'progress_percentage': Decimal('75.40'),
+            'start_date': date(2025, 3, 1),
+        })
+
+        self.assertEqual(row, {
+            'project_name': 'Centro Comunitario',
+            'location': 'San Lucas Tolimán',
+            'status': 'En Progreso',
+            'progress': 75,
+            'date': '01/03/2025',
+        })
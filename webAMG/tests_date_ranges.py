@@ -0,0 +1,45 @@
+"""
+Tests para los filtros por rango de fechas (DateRangeService).
+"""
+from datetime import date
+from django.test import SimpleTestCase
+from webAMG.models import Project, ProjectEvidence
+from webAMG.services.date_range_service import DateRangeService
+
+
+class DateRangeServiceTestCase(SimpleTestCase):
+    """Tests de los filtros de fecha, sin base de datos."""
+
+    @staticmethod
+    def _where(queryset):
+        return str(queryset.query).split(' WHERE ', 1)[1]
+
+    def test_filters_become_one_overlap(self):
+        """Desde, hasta y año se combinan en un solo && sobre date_range."""
+        where = self._where(DateRangeService.filter_queryset(
+            ProjectEvidence.objects.filter(project_id=3), '2024-06-01', '2025-03-31', '2025'
+        ))
+        self.assertEqual(where.count('&&'), 1)
+        self.assertIn('"date_range"', where)
+        self.assertIn('2025-01-01', where)
+        self.assertIn('2025-03-31', where)
+        self.assertNotIn('"start_date"', where)
+        self.assertNotIn(' OR ', where)
+
+    def test_invalid_values_are_ignored(self):
+        queryset = Project.objects.all()
+        self.assertEqual(
+            str(DateRangeService.filter_queryset(queryset, 'ayer', '', '99999').query), str(queryset.query)
+        )
+
+    def test_empty_range(self):
+        """Un rango invertido, o fuera del año, no devuelve filas."""
+        queryset = Project.objects.all()
+        self.assertFalse(DateRangeService.filter_queryset(queryset, '2025-05-01', '2025-04-01'))
+        self.assertFalse(DateRangeService.filter_queryset(queryset, '2024-01-01', '2024-12-31', '2025'))
+
+    def test_parse(self):
+        self.assertEqual(DateRangeService.parse_date('2025-02-28'), date(2025, 2, 28))
+        self.assertIsNone(DateRangeService.parse_date('2025-02-30'))
+        self.assertEqual(DateRangeService.parse_year('2025'), 2025)
+        self.assertIsNone(DateRangeService.parse_year('0'))
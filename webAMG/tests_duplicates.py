@@ -0,0 +1,109 @@
+"""
+Tests para la detección de beneficiarios duplicados.
+"""
+from datetime import date, timedelta
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+from webAMG.models import Beneficiary, DuplicateCandidate, DuplicateStatus, Project, ProjectBeneficiary
+from webAMG.services.duplicate_service import DuplicateService, phonetic_key, normalize_text
+
+
+class DuplicateScoringTestCase(SimpleTestCase):
+    """Tests de llaves y puntaje, sin base de datos."""
+
+    def test_phonetic_key_groups_spelling_variants(self):
+        """Las variantes comunes de un apellido producen la misma llave."""
+        keys = {phonetic_key(normalize_text(name)) for name in ('Vásquez', 'Vasques', 'Basquez')}
+        self.assertEqual(len(keys), 1)
+        self.assertEqual(phonetic_key('cecilia'), phonetic_key('sesilia'))
+
+    def test_block_keys_share_block_across_variants(self):
+        """Dos registros de la misma persona comparten al menos una llave."""
+        a = DuplicateService.block_keys('José Luis', 'Vásquez', date(1980, 2, 3), 'San Juan La Laguna', None)
+        b = DuplicateService.block_keys('Jose', 'Basquez López', date(1980, 2, 3), 'San Juan la Laguna', None)
+        self.assertTrue(a & b)
+
+    def test_score_pair(self):
+        """El CUI decide cuando ambos lo tienen; si no, nombre, fecha y municipio."""
+        a = Beneficiary(first_name='María', last_name='Tuy', birth_date=date(1975, 1, 1), municipality='Sololá')
+        b = Beneficiary(first_name='Maria', last_name='Tui', birth_date=date(1975, 1, 1), municipality='Solola')
+        score, reasons = DuplicateService.score_pair(a, b)
+        self.assertGreaterEqual(score, DuplicateService.MATCH_THRESHOLD)
+        self.assertEqual(reasons, ['nombre', 'fecha_nacimiento', 'municipio'])
+
+        a.cui_dpi, b.cui_dpi = '1234567890101', '1234567890102'
+        self.assertEqual(DuplicateService.score_pair(a, b), (0.0, []))
+
+        b.birth_date = date(1990, 6, 6)
+        b.cui_dpi = None
+        score, _ = DuplicateService.score_pair(a, b)
+        self.assertLess(score, DuplicateService.MATCH_THRESHOLD)
+
+    def test_merge_links_include_inactive_rows(self):
+        """La fusión borra y reasigna también las relaciones inactivas."""
+        for model, parent in DuplicateService.LINK_MODELS:
+            conflicts, links = DuplicateService.link_querysets(model, parent, 1, 2)
+            for queryset in (conflicts, links):
+                where = str(queryset.query).split(' WHERE ', 1)[1]
+                self.assertNotIn('is_active', where, model.__name__)
+
+
+class DuplicateMergeTestCase(TestCase):
+    """Tests de la indexación y la fusión con base de datos."""
+
+    def test_merge_moves_links_of_inactive_projects(self):
+        """Las relaciones con un proyecto inactivo pasan al beneficiario conservado."""
+        keep = Beneficiary.objects.create(first_name='María', last_name='Tuy', department='Sololá', municipality='Sololá')
+        drop = Beneficiary.objects.create(first_name='Maria', last_name='Tui', department='Sololá', municipality='Sololá')
+        project = Project.objects.create(project_name='Agua potable', start_date=date(2025, 1, 6))
+        ProjectBeneficiary.objects.create(project=project, beneficiary=drop)
+        Project.all_objects.filter(pk=project.pk).update(is_active=False)
+        ProjectBeneficiary.all_objects.filter(project=project).update(is_active=False)
+        candidate = DuplicateCandidate.objects.create(beneficiary_a=keep, beneficiary_b=drop, score=0.9)
+
+        DuplicateService.merge(candidate, keep.id)
+
+        self.assertEqual(
+            list(ProjectBeneficiary.all_objects.filter(project=project).values_list('beneficiary_id', flat=True)),
+            [keep.id]
+        )
+        candidate.refresh_from_db()
+        self.assertEqual(candidate.status, DuplicateStatus.FUSIONADO)
+
+    def test_merge_touches_affected_projects(self):
+        """Los proyectos de ambos beneficiarios quedan con updated_at posterior a la fusión."""
+        keep = Beneficiary.objects.create(first_name='Juan', last_name='Xoc', department='Sololá', municipality='Sololá')
+        drop = Beneficiary.objects.create(first_name='Juan', last_name='Xoc', department='Sololá', municipality='Sololá')
+        project = Project.objects.create(project_name='Letrinas', start_date=date(2025, 2, 3))
+        ProjectBeneficiary.objects.create(project=project, beneficiary=drop)
+        before = timezone.now()
+        Project.all_objects.filter(pk=project.pk).update(updated_at=before - timedelta(days=1))
+        candidate = DuplicateCandidate.objects.create(beneficiary_a=keep, beneficiary_b=drop, score=0.9)
+
+        DuplicateService.merge(candidate, keep.id)
+
+        project.refresh_from_db()
+        self.assertGreaterEqual(project.updated_at, before)
+
+    def test_reindex_does_not_count_existing_pairs(self):
+        """Un par ya encolado no vuelve a contarse como candidato nuevo."""
+        first = Beneficiary.objects.create(first_name='Ana', last_name='Coj', department='Sololá', municipality='Sololá')
+        second = Beneficiary.objects.create(first_name='Ana', last_name='Coj', department='Sololá', municipality='Sololá')
+
+        self.assertEqual(DuplicateService.index_batch([first, second]), 1)
+        self.assertEqual(DuplicateService.index_batch([first, second]), 0)
+        self.assertEqual(DuplicateCandidate.objects.count(), 1)
+
+    def test_merge_of_reviewed_pair_is_rejected(self):
+        """Una segunda fusión del mismo par (con el otro conservado) no desactiva a ambos."""
+        first = Beneficiary.objects.create(first_name='Rosa', last_name='Ajú', department='Sololá', municipality='Sololá')
+        second = Beneficiary.objects.create(first_name='Rosa', last_name='Ajú', department='Sololá', municipality='Sololá')
+        candidate = DuplicateCandidate.objects.create(beneficiary_a=first, beneficiary_b=second, score=0.9)
+        stale = DuplicateCandidate.objects.get(id=candidate.id)
+
+        DuplicateService.merge(candidate, first.id)
+        with self.assertRaises(ValueError):
+            DuplicateService.merge(stale, second.id)
+
+        first.refresh_from_db()
+        self.assertTrue(first.is_active)
@@ -0,0 +1,22 @@
+"""
+Tests para la caché de fragmentos de project_detail.
+"""
+from django.template.loader import get_template
+from django.test import SimpleTestCase
+from webAMG.models import Project
+from webAMG.signals import PROJECT_TOUCH
+
+
+class ProjectDetailFragmentCacheTestCase(SimpleTestCase):
+    """Tests de las claves de caché y de su invalidación, sin base de datos."""
+
+    def test_sections_are_keyed_by_updated_at(self):
+        source = get_template('dashboard/project_detail.html').template.source
+        for fragment in ('project_detail_beneficiaries', 'project_detail_phases', 'project_detail_evidences'):
+            self.assertIn(f'{{% cache fragment_cache_ttl {fragment} project.id project.updated_at', source)
+
+    def test_touch_lookups_resolve(self):
+        """Cada ruta de PROJECT_TOUCH es un filtro válido sobre Project."""
+        for model, (lookup, field) in PROJECT_TOUCH.items():
+            self.assertTrue(hasattr(model, field), model.__name__)
+            self.assertIn('WHERE', str(Project.all_objects.filter(**{lookup: 1}).query))
@@ -0,0 +1,35 @@
+"""
+Tests para los índices de las vistas y el comando index_advisor.
+"""
+from django.apps import apps
+from django.test import SimpleTestCase
+from webAMG.management.commands.index_advisor import summarize_plan
+
+
+class IndexAdvisorTestCase(SimpleTestCase):
+    """Tests del resumen de planes y de la definición de índices, sin base de datos."""
+
+    def test_summarize_plan(self):
+        plan = (
+            "Limit  (cost=0.15..8.17 rows=20 width=100)\n"
+            "  ->  Index Scan using projects_active_created_idx on projects  (cost=0.15..80.15 rows=200 width=100)\n"
+        )
+        self.assertEqual(summarize_plan(plan), {
+            'indexes': ['projects_active_created_idx'], 'seq_scans': [], 'sorts': [],
+        })
+
+        plan = (
+            "Sort  (cost=25.00..25.50 rows=200 width=100)\n"
+            "  Sort Key: first_name, last_name\n"
+            "  ->  Seq Scan on beneficiaries  (cost=0.00..20.00 rows=200 width=100)\n"
+            "        Filter: is_active\n"
+        )
+        summary = summarize_plan(plan)
+        self.assertEqual(summary['seq_scans'], ['beneficiaries'])
+        self.assertEqual(len(summary['sorts']), 1)
+
+    def test_no_boolean_is_active_indexes(self):
+        """is_active solo aparece como condición de índices parciales, no como columna indexada sola."""
+        for model in apps.get_app_config('webAMG').get_models():
+            for index in model._meta.indexes:
+                self.assertNotEqual(list(index.fields), ['is_active'], f'{model.__name__}: {index.name}')
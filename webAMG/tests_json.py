@@ -0,0 +1,47 @@
+"""
+Tests para la serialización JSON de las APIs (APIJsonResponse).
+"""
+import json
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from django.core.serializers.json import DjangoJSONEncoder
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from webAMG.api import APIJsonResponse, dumps_json
+
+
+class APIJsonResponseTestCase(SimpleTestCase):
+    """Tests de APIJsonResponse frente a JsonResponse, sin base de datos."""
+
+    def test_native_types(self):
+        value = uuid.uuid4()
+        data = {
+            'date': date(2025, 3, 1),
+            'datetime': datetime(2025, 3, 1, 14, 5, 9, tzinfo=timezone.utc),
+            'decimal': Decimal('1850.50'),
+            'uuid': value,
+            'lazy': gettext_lazy('Proyecto'),
+            1: 'clave int',
+        }
+        self.assertEqual(json.loads(dumps_json(data)), {
+            'date': '2025-03-01',
+            'datetime': '2025-03-01T14:05:09+00:00',
+            'decimal': '1850.50',
+            'uuid': str(value),
+            'lazy': 'Proyecto',
+            '1': 'clave int',
+        })
+
+    def test_matches_json_response_for_plain_values(self):
+        data = {'success': True, 'items': [{'id': 1, 'name': 'Cerro de Oro', 'budget': Decimal('10.00')}]}
+        self.assertEqual(json.loads(dumps_json(data)), json.loads(json.dumps(data, cls=DjangoJSONEncoder)))
+
+    def test_response(self):
+        response = APIJsonResponse({'success': False}, status=404)
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(json.loads(response.content), {'success': False})
+        with self.assertRaises(TypeError):
+            APIJsonResponse([1, 2])
+        self.assertEqual(json.loads(APIJsonResponse([1, 2], safe=False).content), [1, 2])
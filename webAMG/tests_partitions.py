@@ -0,0 +1,25 @@
+"""
+Tests para el cálculo de particiones mensuales de logs.
+"""
+from datetime import datetime, timezone
+from django.test import SimpleTestCase
+from webAMG.services.partition_service import PartitionService
+
+
+class PartitionServiceTestCase(SimpleTestCase):
+    """Tests de nombres y retención, sin base de datos."""
+
+    def test_month_arithmetic_crosses_years(self):
+        """Los meses se calculan en UTC y cruzan el cambio de año."""
+        month = PartitionService.month_start(datetime(2026, 1, 15, 3, 0, tzinfo=timezone.utc))
+        self.assertEqual(PartitionService.add_months(month, -1), datetime(2025, 12, 1, tzinfo=timezone.utc))
+        self.assertEqual(PartitionService.add_months(month, 13), datetime(2027, 2, 1, tzinfo=timezone.utc))
+        self.assertEqual(PartitionService.partition_name('audit_log', month), 'audit_log_y2026m01')
+
+    def test_expired_keeps_retention_window_and_ignores_default(self):
+        """Solo vencen los meses completos fuera de la retención."""
+        names = ['login_log_default', 'login_log_y2025m10', 'login_log_y2025m09', 'login_log_y2025m08']
+        expired = PartitionService.expired(
+            'login_log', names, retention_months=12, now=datetime(2026, 10, 19, tzinfo=timezone.utc)
+        )
+        self.assertEqual(expired, ['login_log_y2025m08', 'login_log_y2025m09'])
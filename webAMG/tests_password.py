@@ -0,0 +1,36 @@
+"""
+Tests para el hashing de contraseñas en el pool de PasswordService.
+"""
+from django.test import SimpleTestCase, override_settings
+from webAMG.models import User
+from webAMG.services.password_service import PasswordService
+
+
+@override_settings(PASSWORD_HASH_ROUNDS=4)
+class PasswordServiceTestCase(SimpleTestCase):
+    """Tests de verificación y rehash, sin base de datos."""
+
+    def test_check_password_runs_in_pool(self):
+        """check_password verifica en los hilos del pool."""
+        user = User()
+        user.set_password('Secreta123')
+        self.assertTrue(user.password_hash.startswith('$2b$04$'))
+        self.assertTrue(user.check_password('Secreta123'))
+        self.assertFalse(user.check_password('otra'))
+        self.assertFalse(User(password_hash='sha256-legado').check_password('Secreta123'))
+
+    def test_check_password_rehashes_when_cost_changes(self):
+        """Un hash con otro costo se regenera tras un login correcto."""
+        user = User()
+        user.set_password('Secreta123')
+        with self.settings(PASSWORD_HASH_ROUNDS=5):
+            self.assertTrue(PasswordService.needs_rehash(user.password_hash))
+            self.assertTrue(user.check_password('Secreta123'))
+            self.assertTrue(user.password_hash.startswith('$2b$05$'))
+            self.assertFalse(PasswordService.needs_rehash(user.password_hash))
+
+    async def test_acheck_password(self):
+        """La versión asíncrona no bloquea el event loop y valida igual."""
+        user = User(password_hash=await PasswordService.arun(PasswordService.hash_password, 'Secreta123'))
+        self.assertTrue(await user.acheck_password('Secreta123'))
+        self.assertFalse(await user.acheck_password('otra'))
@@ -0,0 +1,84 @@
+"""
+Tests para el cálculo del porcentaje de avance de proyectos y fases.
+"""
+from datetime import date
+from decimal import Decimal
+from django.test import SimpleTestCase
+from webAMG.models import PhaseStatus, ProjectStatus
+from webAMG.services.progress_service import ProgressService
+
+
+class ProgressCalculationTestCase(SimpleTestCase):
+    """Tests del cálculo puro, sin base de datos."""
+
+    def setUp(self):
+        self.start = date(2026, 1, 1)
+        self.end = date(2026, 1, 10)
+
+    def test_coverage_merges_overlapping_ranges(self):
+        """Los rangos que se solapan o se tocan no se cuentan dos veces."""
+        ranges = [
+            (date(2026, 1, 1), date(2026, 1, 3)),
+            (date(2026, 1, 2), date(2026, 1, 4)),
+            (date(2026, 1, 5), date(2026, 1, 5)),
+        ]
+        ratio = ProgressService.coverage_ratio(self.start, self.end, ranges, self.end)
+        self.assertAlmostEqual(ratio, 0.5)
+
+    def test_coverage_clips_ranges_to_period(self):
+        """Las evidencias fuera del periodo no suman cobertura."""
+        ranges = [(date(2025, 12, 1), date(2026, 1, 2)), (date(2026, 2, 1), date(2026, 2, 5))]
+        ratio = ProgressService.coverage_ratio(self.start, self.end, ranges, self.end)
+        self.assertAlmostEqual(ratio, 0.2)
+
+    def test_phase_status_overrides_dates(self):
+        """Las fases completadas valen 100 y las pendientes o canceladas 0."""
+        ranges = [(self.start, self.end)]
+        self.assertEqual(
+            ProgressService.phase_progress(PhaseStatus.COMPLETADA, self.start, self.end, [], self.start),
+            Decimal('100.00')
+        )
+        self.assertEqual(
+            ProgressService.phase_progress(PhaseStatus.PENDIENTE, self.start, self.end, ranges, self.end),
+            Decimal('0.00')
+        )
+        self.assertEqual(
+            ProgressService.phase_progress(PhaseStatus.CANCELADA, self.start, self.end, ranges, self.end),
+            Decimal('0.00')
+        )
+
+    def test_open_phase_blends_time_and_coverage(self):
+        """Una fase en progreso combina tiempo transcurrido y cobertura."""
+        ranges = [(date(2026, 1, 1), date(2026, 1, 2))]
+        progress = ProgressService.phase_progress(
+            PhaseStatus.EN_PROGRESO, self.start, self.end, ranges, date(2026, 1, 5)
+        )
+        # 50% de tiempo transcurrido y 20% de cobertura
+        self.assertEqual(progress, Decimal('35.00'))
+
+    def test_open_phase_never_reaches_100(self):
+        """Una fase abierta se queda por debajo de 100 aunque esté cubierta."""
+        progress = ProgressService.phase_progress(
+            PhaseStatus.EN_PROGRESO, self.start, self.end, [(self.start, self.end)], date(2026, 3, 1)
+        )
+        self.assertEqual(progress, Decimal('99.00'))
+
+    def test_project_weights_phases_by_duration(self):
+        """El avance del proyecto pondera cada fase por su duración."""
+        phases = [
+            (PhaseStatus.COMPLETADA, date(2026, 1, 1), date(2026, 1, 3), Decimal('100')),
+            (PhaseStatus.PENDIENTE, date(2026, 1, 4), date(2026, 1, 12), Decimal('0')),
+            (PhaseStatus.CANCELADA, date(2026, 1, 13), date(2026, 3, 1), Decimal('0')),
+        ]
+        progress = ProgressService.project_progress(
+            ProjectStatus.EN_PROGRESO, self.start, None, phases, [], self.end
+        )
+        self.assertEqual(progress, Decimal('25.00'))
+
+    def test_paused_project_without_phases_uses_coverage_only(self):
+        """Un proyecto pausado no avanza con el paso del tiempo."""
+        ranges = [(date(2026, 1, 1), date(2026, 1, 3))]
+        progress = ProgressService.project_progress(
+            ProjectStatus.PAUSADO, self.start, self.end, [], ranges, date(2026, 2, 1)
+        )
+        self.assertEqual(progress, Decimal('30.00'))
@@ -0,0 +1,63 @@
+"""
+Tests para los eventos en tiempo real de proyectos (Channels).
+"""
+import asyncio
+from datetime import date
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from channels.testing import WebsocketCommunicator
+from django.test import SimpleTestCase, override_settings
+from webAMG.consumers import ProjectEventsConsumer
+from webAMG.models import ProjectEvidence, ProjectPhase
+from webAMG.services.project_event_service import ProjectEventService
+
+
+@override_settings(CHANNEL_LAYERS={'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}})
+class ProjectEventServiceTestCase(SimpleTestCase):
+    """Tests del formato de los eventos y de su publicación, sin base de datos."""
+
+    def test_phase_event_is_compact(self):
+        phase = ProjectPhase(
+            id=7, project_id=1, phase_number=2, phase_name='Excavación',
+            start_date=date(2025, 3, 1), end_date=None, status='en_progreso',
+        )
+        event = ProjectEventService.build_event(phase, ProjectEventService.UPDATED)
+
+        self.assertEqual(event['entity'], 'phase')
+        self.assertEqual(event['action'], 'updated')
+        self.assertEqual(event['id'], 7)
+        self.assertEqual(event['data']['start_date'], '2025-03-01')
+        self.assertIsNone(event['data']['end_date'])
+        self.assertEqual(event['data']['status_display'], phase.get_status_display())
+
+    def test_deactivated_row_is_deleted(self):
+        evidence = ProjectEvidence(id=3, project_id=1, start_date=date(2025, 3, 1), is_active=False)
+        event = ProjectEventService.build_event(evidence, ProjectEventService.UPDATED)
+        self.assertEqual(event['action'], 'deleted')
+
+    def test_send_to_project_group(self):
+        """publish() delega en send() al confirmarse la transacción."""
+        layer = get_channel_layer()
+        channel = async_to_sync(layer.new_channel)()
+        async_to_sync(layer.group_add)(ProjectEventService.group_name(1), channel)
+
+        event = {'entity': 'phase', 'action': 'deleted', 'id': 7, 'data': {}}
+        ProjectEventService.send([1], event)
+
+        message = async_to_sync(layer.receive)(channel)
+        self.assertEqual(message['type'], 'project.event')
+        self.assertEqual(message['event'], {**event, 'project_id': 1})
+
+    def test_consumer_rejects_with_4403_after_accept(self):
+        """Sin sesión se acepta y se cierra con 4403, para que el cliente no reintente."""
+        async def run():
+            communicator = WebsocketCommunicator(ProjectEventsConsumer.as_asgi(), '/ws/projects/1/')
+            communicator.scope['url_route'] = {'args': (), 'kwargs': {'project_id': 1}}
+            connected, _ = await communicator.connect(timeout=5)
+            closed = await communicator.receive_output(timeout=5)
+            await communicator.disconnect()
+            return connected, closed
+
+        connected, closed = asyncio.run(run())
+        self.assertTrue(connected)
+        self.assertEqual(closed, {'type': 'websocket.close', 'code': 4403})
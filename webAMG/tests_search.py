@@ -0,0 +1,31 @@
+"""
+Tests para la búsqueda de texto completo.
+"""
+from django.test import SimpleTestCase
+from webAMG.models import Project
+from webAMG.services.search_service import SearchService
+
+
+class SearchQueryTestCase(SimpleTestCase):
+    """Tests de construcción de consultas, sin base de datos."""
+
+    def test_build_query_uses_prefixes_and_drops_operators(self):
+        """Los operadores de tsquery del usuario se descartan."""
+        query = SearchService.build_query("agua' | !potable & (San")
+        self.assertEqual(query.get_source_expressions()[-1].value, 'agua:* & potable:* & San:*')
+        self.assertIsNone(SearchService.build_query(' !&| '))
+
+    def test_filter_queryset_uses_search_vector(self):
+        """El filtro usa la columna indexada y no un icontains."""
+        queryset = SearchService.filter_queryset(Project.objects.all(), 'escuela')
+        sql = str(queryset.query)
+        self.assertIn('"projects"."search_vector" @@', sql)
+        self.assertNotIn('UPPER', sql)
+
+    def test_global_search_is_one_ranked_union(self):
+        """Todos los tipos se resuelven en una sola consulta ordenada por rango."""
+        sql = str(SearchService.build_search('escuela').query)
+        self.assertEqual(sql.count('UNION ALL'), len(SearchService.TYPES) - 1)
+        self.assertIn('es_unaccent', sql)
+        self.assertIn('ORDER BY', sql)
+        self.assertIsNone(SearchService.build_search('escuela', types=['desconocido']))
@@ -0,0 +1,85 @@
+"""
+Tests para el sanitizador de entradas y los headers de seguridad.
+"""
+from django.conf import settings
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from webAMG.api.exceptions import BadRequestError
+from webAMG.api.security import InputSanitizer, SecurityHeaders
+from webAMG.management.commands.benchmark_sanitizer import legacy_sanitize_string
+from webAMG.middleware import SecurityHeadersMiddleware
+
+
+class InputSanitizerTestCase(SimpleTestCase):
+    """Tests de las expresiones compiladas, sin base de datos."""
+
+    def test_matches_previous_implementation(self):
+        """Las alternaciones compiladas dan el mismo resultado que los patrones por separado."""
+        samples = [
+            '  Proyecto de agua potable  ',
+            'Hola <script>alert(1)</script>mundo',
+            '<a href="javascript:void(0)" onclick = "x()">enlace</a>',
+            '<IFRAME src="x"></iframe>texto<embed src="y"></embed>',
+            'Nota: reunión a las 9:00; asistieron 12 personas',
+        ]
+        for sample in samples:
+            self.assertEqual(InputSanitizer.sanitize_string(sample), legacy_sanitize_string(sample))
+
+    def test_removal_does_not_leave_new_script(self):
+        """Quitar un bloque que forma otro vuelve a limpiar el resultado."""
+        value = InputSanitizer.sanitize_string('<scr<script></script>ipt>alert(1)</script>ok')
+        self.assertNotIn('<script', value.lower())
+
+    def test_deep_nesting_is_rejected(self):
+        """Un anidamiento más profundo que MAX_XSS_PASSES se rechaza sin seguir limpiando."""
+        depth = InputSanitizer.MAX_XSS_PASSES + 1
+        value = '<scr' * depth + '<script></script>' + 'ipt></script>' * depth
+        with self.assertRaises(BadRequestError):
+            InputSanitizer.sanitize_string(value)
+
+    def test_sql_injection_is_rejected(self):
+        """Cualquiera de los patrones de SQL Injection se detecta en una pasada."""
+        for sample in ["1' OR '1'='1", 'x; DROP TABLE users', 'a UNION  SELECT password', "admin'--"]:
+            with self.assertRaises(BadRequestError):
+                InputSanitizer.sanitize_string(sample)
+
+    def test_allow_html_keeps_markup(self):
+        self.assertEqual(InputSanitizer.sanitize_string('<b>x</b>', allow_html=True), '<b>x</b>')
+
+
+class SecurityHeadersMiddlewareTestCase(SimpleTestCase):
+    """Tests de las políticas de headers por ruta."""
+
+    def _response(self, path, status=200, render=None):
+        request = RequestFactory().get(path)
+
+        def view(request):
+            return HttpResponse(render(request) if render else '', status=status)
+
+        return SecurityHeadersMiddleware(view)(request)
+
+    def test_page_gets_csp(self):
+        response = self._response('/dashboard/')
+        self.assertEqual(response['Content-Security-Policy'], SecurityHeaders.CSP)
+        self.assertEqual(response['X-Frame-Options'], 'DENY')
+        self.assertNotIn('Cache-Control', response)
+
+    def test_api_has_no_csp(self):
+        """Las respuestas JSON de la API no llevan CSP, pero sí el resto de headers."""
+        response = self._response('/api/v1/projects/')
+        self.assertNotIn('Content-Security-Policy', response)
+        self.assertEqual(response['X-Content-Type-Options'], 'nosniff')
+
+    @override_settings(SECURITY_STATIC_MAX_AGE=3600)
+    def test_static_gets_cache_control_only_when_found(self):
+        static_path = '/' + settings.STATIC_URL.lstrip('/') + 'css/app.css'
+        self.assertEqual(self._response(static_path)['Cache-Control'], 'public, max-age=3600')
+        self.assertNotIn('Cache-Control', self._response(static_path, status=404))
+
+    @override_settings(SECURITY_CSP_NONCE=True)
+    def test_nonce_only_when_template_uses_it(self):
+        """El nonce entra en la CSP solo si la respuesta lo usó."""
+        response = self._response('/dashboard/', render=lambda request: f'<script nonce="{request.csp_nonce}">')
+        nonce = response.content.decode().split('"')[1]
+        self.assertIn(f"'nonce-{nonce}'", response['Content-Security-Policy'])
+        self.assertEqual(self._response('/dashboard/')['Content-Security-Policy'], SecurityHeaders.CSP)
@@ -0,0 +1,118 @@
+"""
+Tests para la limpieza de sesiones de usuario.
+"""
+from datetime import timedelta
+from unittest import mock
+from django.contrib.auth import SESSION_KEY
+from django.core.cache import cache
+from django.test import RequestFactory, SimpleTestCase
+from django.utils import timezone
+from webAMG.authentication import USER_FIELDS
+from webAMG.middleware import SessionAuthenticationMiddleware
+from webAMG.services.auth_service import AuthService
+from webAMG.models import User, UserSession
+from webAMG.sessions import SessionStore, session_cache_key
+from webAMG.signals import invalidate_user_session_cache
+
+
+class FakeSessionQuerySet:
+    """Queryset mínimo: cada lote procesado deja de cumplir el filtro."""
+
+    def __init__(self, pks):
+        self.pks = list(pks)
+
+    def order_by(self, *fields):
+        return self
+
+    def values_list(self, *fields, flat=False):
+        return self.pks
+
+
+class SessionSweepTestCase(SimpleTestCase):
+    """Tests del procesamiento por lotes, sin base de datos."""
+
+    def test_in_batches_processes_until_short_batch(self):
+        """Se procesan lotes de batch_size hasta que quedan menos filas."""
+        queryset = FakeSessionQuerySet(range(1, 8))
+        batches = []
+
+        def action(batch):
+            pks = batch.query.where.children[0].rhs
+            batches.append(sorted(pks))
+            queryset.pks = [pk for pk in queryset.pks if pk not in pks]
+            return len(pks)
+
+        total = AuthService._in_batches(queryset, action, batch_size=3)
+
+        self.assertEqual(total, 7)
+        self.assertEqual(batches, [[1, 2, 3], [4, 5, 6], [7]])
+
+
+class SessionStoreCacheTestCase(SimpleTestCase):
+    """Tests del camino rápido en caché, sin base de datos."""
+
+    token = 'token-de-prueba-1234567890'
+
+    def tearDown(self):
+        cache.clear()
+
+    def _cache_session(self, expires_at, **fields):
+        now = timezone.now()
+        values = {
+            'id': 7, 'username': 'ana', 'email': 'ana@example.org', 'full_name': 'Ana López',
+            'role': 'usuario', 'is_active': True, 'profile_image_url': None, 'phone': None,
+            'last_login': now, 'created_at': now, 'updated_at': now, **fields,
+        }
+        cache.set(session_cache_key(self.token), {
+            'data': {SESSION_KEY: '7', 'flash': 'hola'},
+            'expires_at': expires_at,
+            'user': [values[field] for field in USER_FIELDS],
+        })
+        return values
+
+    def test_cached_session_authenticates_page_and_api(self):
+        """Una sesión en caché da el usuario sin consultas, para páginas y API."""
+        self._cache_session(timezone.now() + timedelta(hours=1))
+
+        request = RequestFactory().get('/')
+        request.session = SessionStore(self.token)
+        SessionAuthenticationMiddleware(lambda r: None).process_request(request)
+
+        self.assertEqual(request.user.username, 'ana')
+        self.assertEqual(request.session['flash'], 'hola')
+        self.assertEqual(AuthService.verify_session(self.token)['user']['id'], 7)
+
+    def test_session_user_keeps_each_column(self):
+        """El usuario de la sesión y su payload de la API traen cada valor en su columna."""
+        values = self._cache_session(
+            timezone.now() + timedelta(hours=1),
+            profile_image_url='https://example.org/ana.png', phone='5555-1234',
+            last_login=timezone.now() - timedelta(days=1),
+        )
+
+        user = SessionStore(self.token).get_user()
+
+        for field in USER_FIELDS:
+            self.assertEqual(getattr(user, field), values[field], field)
+        payload = AuthService.verify_session(self.token)['user']
+        self.assertEqual(payload['profile_image_url'], 'https://example.org/ana.png')
+
+    def test_expired_cached_session_is_anonymous(self):
+        """Una sesión vencida en caché no autentica y queda vacía."""
+        self._cache_session(timezone.now() - timedelta(seconds=1))
+
+        store = SessionStore(self.token)
+
+        self.assertIsNone(store.get_user())
+        self.assertIsNone(store.session_key)
+        self.assertFalse(AuthService.verify_session(self.token)['valid'])
+
+    def test_user_save_evicts_cached_sessions(self):
+        """Al guardar el usuario sus sesiones salen de la caché (is_active y role nuevos)."""
+        self._cache_session(timezone.now() + timedelta(hours=1))
+
+        with mock.patch.object(UserSession.objects, 'filter', return_value=FakeSessionQuerySet([self.token])) as sessions:
+            invalidate_user_session_cache(User, User(id=7, is_active=False))
+
+        self.assertEqual(sessions.call_args.kwargs['user_id__in'], [7])
+        self.assertIsNone(cache.get(session_cache_key(self.token)))
@@ -0,0 +1,38 @@
+"""
+Tests para el borrado lógico de proyectos (ActiveManager y SoftDeleteService).
+"""
+from django.apps import apps
+from django.test import SimpleTestCase
+from webAMG.models import ActiveManager, DailyActivity, Project, ProjectPhase
+from webAMG.services.soft_delete_service import CASCADE, SoftDeleteService
+
+
+class SoftDeleteTestCase(SimpleTestCase):
+    """Tests de managers y de la cascada, sin base de datos."""
+
+    @staticmethod
+    def _where(queryset):
+        return str(queryset.query).split(' WHERE ', 1)[1]
+
+    def test_default_manager_hides_inactive_rows(self):
+        """objects (y las relaciones inversas) filtran is_active; all_objects no."""
+        self.assertIsInstance(Project._default_manager, ActiveManager)
+        self.assertIn('"is_active"', self._where(Project.objects.all()))
+        self.assertNotIn('WHERE', str(Project.all_objects.all().query))
+        self.assertIn('"is_active"', self._where(Project(pk=1).phases.all()))
+
+    def test_cascade_covers_every_soft_delete_model(self):
+        """Cada modelo con ActiveManager (salvo Project) sigue el estado del proyecto."""
+        soft_delete_models = {
+            model for model in apps.get_app_config('webAMG').get_models()
+            if isinstance(model._default_manager, ActiveManager)
+        }
+        self.assertEqual(soft_delete_models - {Project}, {model for model, _ in CASCADE})
+
+    def test_children_match_any_path_to_project(self):
+        """Las actividades del proyecto o de sus fases se actualizan con un solo filtro."""
+        lookups = dict(CASCADE)[DailyActivity]
+        where = self._where(SoftDeleteService._children(DailyActivity, lookups, 7))
+        self.assertIn(' OR ', where)
+        self.assertIn(f'"{ProjectPhase._meta.db_table}"."project_id" = 7', where)
+        self.assertNotIn('"is_active"', where)
@@ -0,0 +1,36 @@
+"""
+Tests para el cargador de plantillas en caché y su precompilación.
+"""
+import io
+from contextlib import redirect_stdout
+from datetime import datetime
+from django.template import engines
+from django.template.loaders.cached import Loader as CachedLoader
+from django.test import SimpleTestCase
+from webAMG.services.template_service import TemplateService
+from webAMG.templatetags.timezone_filters import localtime_filter
+from webAMG.templatetags.webAMG_extras import join_ids
+
+
+class TemplateServiceTestCase(SimpleTestCase):
+    """Tests de la configuración de plantillas, sin base de datos."""
+
+    def test_cached_loader(self):
+        loaders = engines['django'].engine.template_loaders
+        self.assertEqual(len(loaders), 1)
+        self.assertIsInstance(loaders[0], CachedLoader)
+
+    def test_warm_compiles_project_templates_only(self):
+        names = TemplateService.template_names()
+        self.assertIn('dashboard/project_detail.html', names)
+        self.assertIn('base_dashboard.html', names)
+        self.assertFalse([name for name in names if name.startswith('admin/')])
+        self.assertEqual(TemplateService.warm(), len(names))
+
+    def test_filters_do_not_write_to_stdout(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.assertEqual(join_ids([3, 5]), '3,5')
+            self.assertEqual(join_ids('3,5'), '3,5')
+            localtime_filter(datetime(2025, 3, 1, 12, 0))
+        self.assertEqual(output.getvalue(), '')
@@ -0,0 +1,50 @@
+"""
+Tests para los filtros de plantilla de webAMG y la carga de beneficiarios.
+"""
+import inspect
+from datetime import date, datetime
+from itertools import product
+from django.db.models import Manager, QuerySet
+from django.template import engines
+from django.test import SimpleTestCase
+from webAMG.models import Beneficiary, Project
+from webAMG.services.beneficiary_service import BeneficiaryService
+
+SAMPLE_VALUES = (None, '', '1,2', 1, [1, 2], {1: [2]}, date(2025, 1, 1), datetime(2025, 1, 1, 12, 0), Project(id=1))
+
+
+class TemplateFilterQueryGuardTestCase(SimpleTestCase):
+    """
+    Ningún filtro de la aplicación consulta la base de datos: SimpleTestCase
+    falla con cualquier consulta, y un QuerySet devuelto sería una consulta
+    diferida dentro de la plantilla.
+    """
+
+    def _app_filters(self):
+        libraries = engines['django'].engine.libraries
+        for name, module in libraries.items():
+            if module.startswith('webAMG.'):
+                library = engines['django'].engine.template_libraries[name]
+                yield from library.filters.items()
+
+    def test_filters_do_not_query(self):
+        filters = dict(self._app_filters())
+        self.assertIn('join_ids', filters)
+        for name, function in filters.items():
+            arity = len([
+                parameter for parameter in inspect.signature(function).parameters.values()
+                if parameter.default is parameter.empty
+            ])
+            for args in product(SAMPLE_VALUES, repeat=arity):
+                try:
+                    result = function(*args)
+                except (TypeError, ValueError, AttributeError, KeyError):
+                    continue
+                self.assertNotIsInstance(result, (QuerySet, Manager), f'{name}{args}')
+
+    def test_beneficiaries_by_project_is_one_join(self):
+        sql = str(BeneficiaryService.for_projects_queryset([1, 2]).query)
+        self.assertIn('JOIN', sql)
+        self.assertIn(f'"{Beneficiary._meta.db_table}"."is_active"', sql)
+        self.assertEqual(sql.count('SELECT'), 1)
+        self.assertEqual(BeneficiaryService.by_project([]), {})
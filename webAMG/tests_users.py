@@ -0,0 +1,79 @@
+"""
+Tests para el servicio de gestión de usuarios.
+"""
+from django.db import IntegrityError
+from django.http import QueryDict
+from django.test import SimpleTestCase
+from webAMG.services.user_service import UserService, _duplicate_field
+
+
+class UserServiceTestCase(SimpleTestCase):
+    """Tests de filtros y errores de unicidad, sin base de datos."""
+
+    def test_parse_filters_ignores_invalid_values(self):
+        """Rol, estado y tamaño de página inválidos no rompen la lista."""
+        filters = UserService.parse_filters(QueryDict('search=%20ana%20&role=root&is_active=TRUE&page_size=500'))
+        self.assertEqual(filters['search'], 'ana')
+        self.assertEqual(filters['role'], '')
+        self.assertIs(filters['is_active'], True)
+        self.assertEqual(filters['page_size'], UserService.MAX_PAGE_SIZE)
+
+        filters = UserService.parse_filters(QueryDict('is_active=quizas&page_size=x'))
+        self.assertIsNone(filters['is_active'])
+        self.assertEqual(filters['page_size'], UserService.DEFAULT_PAGE_SIZE)
+
+    def test_filter_users_builds_one_query(self):
+        """La búsqueda es un solo WHERE con OR, sin cargar password_hash."""
+        sql = str(UserService.filter_users('ana', 'usuario', False).query)
+        self.assertEqual(sql.count(' OR '), 2)
+        self.assertNotIn('password_hash', sql)
+        self.assertIn('ORDER BY "users"."created_at" DESC', sql)
+
+    def test_duplicate_field_from_constraint_name(self):
+        """El campo duplicado se obtiene del nombre del índice único."""
+        error = IntegrityError('duplicate key value violates unique constraint "users_email_key"')
+        self.assertEqual(_duplicate_field(error), 'email')
+        error = IntegrityError('duplicate key value violates unique constraint "users_username_key"')
+        self.assertEqual(_duplicate_field(error), 'username')
+        error = IntegrityError('duplicate key value violates unique constraint "users_email_4b85f2a1_uniq"')
+        self.assertEqual(_duplicate_field(error), 'email')
+
+    def test_other_integrity_errors_are_not_duplicates(self):
+        """Las demás restricciones no se reportan como username duplicado."""
+        for message in (
+            'null value in column "full_name" of relation "users" violates not-null constraint',
+            'insert or update on table "users" violates foreign key constraint "users_created_by_fkey"',
+            'duplicate key value violates unique constraint "users_pkey"',
+        ):
+            self.assertIsNone(_duplicate_field(IntegrityError(message)))
+
+
+class BulkUserValidationTestCase(SimpleTestCase):
+    """Tests de la validación por elemento de las operaciones masivas."""
+
+    def test_invalid_items_do_not_discard_the_rest(self):
+        """Cada elemento inválido trae sus errores y los válidos siguen."""
+        from webAMG.api import CreateUserRequest, validate_request_list
+
+        base = {'full_name': 'Ana López', 'password': 'Segura123'}
+        valid, errors = validate_request_list([
+            dict(base, username='ana', email='ANA@example.org'),
+            dict(base, username='x', email='x@example.org'),
+            dict(base, username='luis', email='luis@example.org', role='root'),
+            dict(base, username='marta', email='marta@example.org'),
+        ], CreateUserRequest)
+
+        self.assertEqual([index for index, _ in valid], [0, 3])
+        self.assertEqual(valid[0][1].email, 'ana@example.org')
+        self.assertEqual([error['index'] for error in errors], [1, 2])
+        self.assertIn('username', errors[0]['errors'])
+        self.assertIn('role', errors[1]['errors'])
+
+    def test_list_limits(self):
+        """Una lista vacía o demasiado larga se rechaza completa."""
+        from webAMG.api import CreateUserRequest, ValidationError, validate_request_list
+
+        with self.assertRaises(ValidationError):
+            validate_request_list([], CreateUserRequest)
+        with self.assertRaises(ValidationError):
+            validate_request_list([{}] * 3, CreateUserRequest, max_items=2)
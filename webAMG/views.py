@@ -2,12 +2,14 @@
 Vistas para APIs y endpoints de la aplicación.
 Este módulo contiene todas las vistas que devuelven JSON o manejan datos.
 """
-from django.http import JsonResponse, HttpResponse
+from django.http import HttpResponse
 from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.csrf import ensure_csrf_cookie
 import json
+from webAMG.api import APIJsonResponse
 from webAMG.services.auth_service import AuthService
+from webAMG.sessions import SessionStore
 
 
 @require_http_methods(["GET"])
@@ -16,7 +18,7 @@ def health_check(request):
     Endpoint de verificación de salud de la API.
     Retorna el estado del servidor.
     """
-    return JsonResponse({
+    return APIJsonResponse({
         "status": "healthy",
         "message": "API is running",
         "service": "WebAMG API"
@@ -28,7 +30,7 @@ def api_info(request):
     """
     Endpoint con información sobre la API.
     """
-    return JsonResponse({
+    return APIJsonResponse({
         "name": "WebAMG API",
         "version": "1.0.0",
         "endpoints": {
@@ -51,13 +53,13 @@ def example_api(request):
     """
     try:
         data = json.loads(request.body)
-        return JsonResponse({
+        return APIJsonResponse({
             "success": True,
             "message": "Data received successfully",
             "data": data
         })
     except json.JSONDecodeError:
-        return JsonResponse({
+        return APIJsonResponse({
             "success": False,
             "message": "Invalid JSON data"
         }, status=400)
@@ -83,7 +85,7 @@ def api_login(request):
         password = data.get('password')
         
         if not username or not password:
-            return JsonResponse({
+            return APIJsonResponse({
                 'success': False,
                 'error': 'Se requieren username y password'
             }, status=400)
@@ -96,13 +98,17 @@ def api_login(request):
         result = AuthService.login(username, password, ip_address, user_agent)
         
         if result['success']:
-            response = JsonResponse({
+            response = APIJsonResponse({
                 'success': True,
                 'message': 'Login exitoso',
                 'user': result['user'],
                 'expires_at': result['expires_at']
             })
             
+            # session_token es también la cookie de sesión de Django; sin esto,
+            # SessionMiddleware borraría la cookie si la petición traía una sesión vencida
+            request.session = SessionStore(result['session_token'])
+            
             # Establecer cookie con el token de sesión
             response.set_cookie(
                 'session_token',
@@ -114,18 +120,18 @@ def api_login(request):
             
             return response
         else:
-            return JsonResponse({
+            return APIJsonResponse({
                 'success': False,
                 'error': result['error']
             }, status=401)
             
     except json.JSONDecodeError:
-        return JsonResponse({
+        return APIJsonResponse({
             'success': False,
             'error': 'JSON inválido'
         }, status=400)
     except Exception as e:
-        return JsonResponse({
+        return APIJsonResponse({
             'success': False,
             'error': str(e)
         }, status=500)
@@ -140,7 +146,7 @@ def api_logout(request):
     session_token = request.COOKIES.get('session_token') or request.headers.get('X-Session-Token')
     
     if not session_token:
-        return JsonResponse({
+        return APIJsonResponse({
             'success': False,
             'error': 'No hay sesión activa'
         }, status=400)
@@ -149,7 +155,7 @@ def api_logout(request):
     result = AuthService.logout(session_token)
     
     if result['success']:
-        response = JsonResponse({
+        response = APIJsonResponse({
             'success': True,
             'message': 'Logout exitoso'
         })
@@ -159,7 +165,7 @@ def api_logout(request):
         
         return response
     else:
-        return JsonResponse({
+        return APIJsonResponse({
             'success': False,
             'error': result['error']
         }, status=400)
@@ -174,7 +180,7 @@ def api_verify_session(request):
     session_token = request.COOKIES.get('session_token') or request.headers.get('X-Session-Token')
     
     if not session_token:
-        return JsonResponse({
+        return APIJsonResponse({
             'valid': False,
             'error': 'No hay sesión activa'
         })
@@ -182,7 +188,7 @@ def api_verify_session(request):
     # Verificar sesión
     result = AuthService.verify_session(session_token)
     
-    return JsonResponse(result)
+    return APIJsonResponse(result)
 
 
 @require_http_methods(["GET"])
@@ -192,7 +198,7 @@ def api_current_user(request):
     """
     # Verificar si hay usuario en el request (del middleware)
     if hasattr(request, 'user_data'):
-        return JsonResponse({
+        return APIJsonResponse({
             'success': True,
             'user': request.user_data
         })
@@ -201,7 +207,7 @@ def api_current_user(request):
         session_token = request.COOKIES.get('session_token') or request.headers.get('X-Session-Token')
         
         if not session_token:
-            return JsonResponse({
+            return APIJsonResponse({
                 'success': False,
                 'error': 'No autenticado'
             }, status=401)
@@ -209,12 +215,12 @@ def api_current_user(request):
         result = AuthService.verify_session(session_token)
         
         if result['valid']:
-            return JsonResponse({
+            return APIJsonResponse({
                 'success': True,
                 'user': result['user']
             })
         else:
-            return JsonResponse({
+            return APIJsonResponse({
                 'success': False,
                 'error': result['error']
             }, status=401)
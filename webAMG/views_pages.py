@@ -3,9 +3,9 @@ Vistas para renderizar páginas HTML de la aplicación.
 Este módulo contiene todas las vistas que renderizan plantillas HTML.
 """
 from django.shortcuts import render, redirect, get_object_or_404
-from django.http import JsonResponse
 from django.views.generic import TemplateView
-from django.contrib.auth import authenticate, login, logout
+from asgiref.sync import sync_to_async
+from django.contrib.auth import alogin, logout
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.views.decorators.csrf import ensure_csrf_cookie
@@ -15,6 +15,8 @@ from django.utils import timezone
 from datetime import datetime
 import re
 from .forms import LoginForm
+from webAMG.api import APIJsonResponse
+from webAMG.services.conditional_service import ConditionalService, conditional_get
 
 
 def validate_location_name(text):
@@ -48,31 +50,28 @@ def index(request):
 # =====================================================
 
 @ensure_csrf_cookie
-def login_page(request):
+async def login_page(request):
     """
     Vista de la página de login.
+    Es asíncrona para que bcrypt corra en el pool de PasswordService sin
+    bloquear el hilo que comparten las vistas síncronas bajo Daphne.
     """
     if request.method == 'POST':
         form = LoginForm(request, data=request.POST)
-        if form.is_valid():
-            username = form.cleaned_data.get('username')
-            password = form.cleaned_data.get('password')
-            user = authenticate(request, username=username, password=password)
-            
-            if user is not None:
-                if user.is_active:
-                    login(request, user)
-                    messages.success(request, f'Bienvenido, {user.full_name}!')
-                    next_url = request.GET.get('next', '/dashboard/')
-                    return redirect(next_url)
-                else:
-                    messages.error(request, 'Su cuenta está inactiva. Contacte al administrador.')
-            else:
-                messages.error(request, 'Usuario o contraseña incorrectos.')
+        # ais_valid autentica una sola vez; antes se verificaba la contraseña
+        # en el formulario y otra vez en la vista
+        if await form.ais_valid():
+            user = form.get_user()
+            await alogin(request, user)
+            messages.success(request, f'Bienvenido, {user.full_name}!')
+            next_url = request.GET.get('next', '/dashboard/')
+            return redirect(next_url)
+        else:
+            messages.error(request, 'Usuario o contraseña incorrectos.')
     else:
         form = LoginForm()
     
-    return render(request, "auth/login.html", {'form': form})
+    return await sync_to_async(render)(request, "auth/login.html", {'form': form})
 
 
 @login_required
@@ -163,8 +162,21 @@ def dashboard_users(request):
         messages.error(request, 'No tienes permisos para acceder a esta sección.')
         return redirect('dashboard')
     
-    users = request.user.__class__.objects.all()
-    return render(request, "dashboard/users.html", {'user': request.user, 'users': users})
+    from webAMG.models import UserRole
+    from webAMG.services.user_service import UserService
+    
+    # Misma lista paginada y filtrada que GET /api/v1/users/
+    users_page = UserService.list_users(request.GET)
+    query = request.GET.copy()
+    query.pop('page', None)
+    
+    return render(request, "dashboard/users.html", {
+        'user': request.user,
+        'users': users_page,
+        'filters': users_page.filters,
+        'filter_query': query.urlencode(),
+        'roles': UserRole.choices,
+    })
 
 
 @login_required
@@ -200,30 +212,22 @@ def user_create(request):
             messages.error(request, 'Rol inválido.')
             return redirect('dashboard_users')
         
-        # Verificar si el usuario ya existe
-        User = request.user.__class__
-        if User.objects.filter(username=username).exists():
-            messages.error(request, 'El nombre de usuario ya existe.')
-            return redirect('dashboard_users')
-        
-        if User.objects.filter(email=email).exists():
-            messages.error(request, 'El email ya está registrado.')
-            return redirect('dashboard_users')
+        from webAMG.services.user_service import DuplicateUserError, UserService
         
-        # Crear el usuario
+        # Crear el usuario; username y email repetidos los detecta el índice único
         try:
-            user = User.objects.create(
+            UserService.create_user(
                 username=username,
                 email=email,
+                password=password,
                 full_name=full_name,
-                password_hash='',  # Se establecerá después
                 phone=phone,
                 role=role,
-                is_active=True,  # Siempre activo por defecto
+                is_active=is_active,
             )
-            user.set_password(password)
-            user.save()
             messages.success(request, f'Usuario {username} creado exitosamente.')
+        except DuplicateUserError as e:
+            messages.error(request, f'{e}.')
         except Exception as e:
             messages.error(request, f'Error al crear usuario: {str(e)}')
         
@@ -261,39 +265,32 @@ def user_edit(request):
             messages.error(request, 'Rol inválido.')
             return redirect('dashboard_users')
         
+        if password and len(password) < 6:
+            messages.error(request, 'La contraseña debe tener al menos 6 caracteres.')
+            return redirect('dashboard_users')
+        
+        from webAMG.services.user_service import DuplicateUserError, UserService
+        
         User = request.user.__class__
         try:
             user = User.objects.get(id=user_id)
             
-            # Verificar si el username ya existe para otro usuario
-            if User.objects.filter(username=username).exclude(id=user_id).exists():
-                messages.error(request, 'El nombre de usuario ya existe.')
-                return redirect('dashboard_users')
-            
-            # Verificar si el email ya existe para otro usuario
-            if User.objects.filter(email=email).exclude(id=user_id).exists():
-                messages.error(request, 'El email ya está registrado.')
-                return redirect('dashboard_users')
-            
-            # Actualizar el usuario
-            user.username = username
-            user.email = email
-            user.full_name = full_name
-            user.phone = phone
-            user.role = role
-            user.is_active = is_active
-            
-            # Actualizar contraseña si se proporcionó
-            if password and len(password) >= 6:
-                user.set_password(password)
-            elif password and len(password) < 6:
-                messages.error(request, 'La contraseña debe tener al menos 6 caracteres.')
-                return redirect('dashboard_users')
-            
-            user.save()
+            # Username y email repetidos los detecta el índice único al guardar
+            UserService.update_user(
+                user,
+                password=password or None,
+                username=username,
+                email=email,
+                full_name=full_name,
+                phone=phone,
+                role=role,
+                is_active=is_active,
+            )
             messages.success(request, f'Usuario {username} actualizado exitosamente.')
         except User.DoesNotExist:
             messages.error(request, 'Usuario no encontrado.')
+        except DuplicateUserError as e:
+            messages.error(request, f'{e}.')
         except Exception as e:
             messages.error(request, f'Error al actualizar usuario: {str(e)}')
         
@@ -303,13 +300,15 @@ def user_edit(request):
 
 
 @login_required
-def user_delete(request):
+async def user_delete(request):
     """
     Vista para eliminar un usuario.
     Solo accesible para usuarios con rol 'administrador'.
-    Revalida la contraseña del administrador antes de eliminar.
+    Revalida la contraseña del administrador antes de eliminar; es asíncrona
+    para que esa verificación de bcrypt no bloquee otras peticiones.
     """
-    if request.user.role != 'administrador':
+    current_user = await request.auser()
+    if current_user.role != 'administrador':
         messages.error(request, 'No tienes permisos para eliminar usuarios.')
         return redirect('dashboard')
     
@@ -317,9 +316,6 @@ def user_delete(request):
         user_id = request.POST.get('user_id')
         admin_password = request.POST.get('admin_password')
         
-        # Depuración
-        print(f"DEBUG: user_id={user_id}, admin_password={admin_password}")
-        
         if not user_id:
             messages.error(request, 'ID de usuario no proporcionado.')
             return redirect('dashboard_users')
@@ -328,22 +324,22 @@ def user_delete(request):
             messages.error(request, 'Debes ingresar tu contraseña de administrador para eliminar un usuario.')
             return redirect('dashboard_users')
         
-        User = request.user.__class__
+        User = current_user.__class__
         try:
-            user = User.objects.get(id=user_id)
+            user = await User.objects.aget(id=user_id)
             
             # Prevenir autoeliminación
-            if user.id == request.user.id:
+            if user.id == current_user.id:
                 messages.error(request, 'No puedes eliminar tu propio usuario.')
                 return redirect('dashboard_users')
             
             # Validar contraseña del administrador
-            if not request.user.check_password(admin_password):
+            if not await current_user.acheck_password(admin_password):
                 messages.error(request, 'La contraseña del administrador es incorrecta. Por seguridad, intenta de nuevo en 3 segundos.')
                 return redirect('dashboard_users')
             
             username = user.username
-            user.delete()
+            await user.adelete()
             messages.success(request, f'Usuario {username} eliminado exitosamente.')
         except User.DoesNotExist:
             messages.error(request, 'Usuario no encontrado.')
@@ -395,11 +391,10 @@ def project_create_page(request):
             department = request.POST.get('department')
             status = request.POST.get('status', ProjectStatus.PLANIFICADO)
             has_phases = request.POST.get('has_phases') == 'on'
-            progress_percentage = request.POST.get('progress_percentage', 0)
             
             # Validar código de proyecto si se proporciona
             if project_code:
-                existing_project = Project.objects.filter(project_code=project_code).first()
+                existing_project = Project.all_objects.filter(project_code=project_code).first()
                 if existing_project:
                     messages.error(request, f'El código de proyecto "{project_code}" ya está en uso. Por favor, use otro código.')
                     return render(request, "dashboard/project_create.html", {
@@ -470,7 +465,6 @@ def project_create_page(request):
                 department=department,
                 status=status,
                 has_phases=has_phases,
-                progress_percentage=progress_percentage,
                 created_by=request.user,
                 responsible_user=request.user
             )
@@ -505,14 +499,21 @@ def project_list_page(request):
     Por defecto muestra solo proyectos activos (is_active=True).
     """
     from webAMG.models import Project
+    from webAMG.services.date_range_service import DateRangeService
     
     # Por defecto, solo mostrar proyectos activos
     show_inactive = request.GET.get('show_inactive', 'false').lower() == 'true'
     
     if show_inactive:
-        projects = Project.objects.filter(is_active=False).order_by('-updated_at')
+        projects = Project.all_objects.filter(is_active=False).order_by('-updated_at')
     else:
-        projects = Project.objects.filter(is_active=True).order_by('-created_at') 
+        projects = Project.objects.order_by('-created_at')
+
+    # Solo las columnas que usa la tabla; el avance ya viene calculado en progress_percentage
+    projects = projects.only(
+        'id', 'project_name', 'project_code', 'cover_image_url', 'municipality',
+        'department', 'status', 'start_date', 'progress_percentage'
+    )
     
     # Filtros
     search_query = request.GET.get('search', '')
@@ -524,55 +525,15 @@ def project_list_page(request):
     filter_year = request.GET.get('filter_year', '')
  
     if search_query:
-        projects = projects.filter(
-            models.Q(project_name__icontains=search_query) |
-            models.Q(project_code__icontains=search_query) |
-            models.Q(location__icontains=search_query)
-        )
+        # Búsqueda de texto completo sobre search_vector (índice GIN), ordenada por relevancia
+        from webAMG.services.search_service import SearchService
+        projects = SearchService.filter_queryset(projects, search_query)
  
     if status_filter:
         projects = projects.filter(status=status_filter)
  
-    # Filtro por rango de fechas
-    if filter_start_date or filter_end_date:
-        from django.db.models import Q
- 
-        try:
-            if filter_start_date and filter_end_date:
-                # Filtro por rango completo: proyectos que empiezan o terminan en el rango
-                start_date = datetime.strptime(filter_start_date, '%Y-%m-%d').date()
-                end_date = datetime.strptime(filter_end_date, '%Y-%m-%d').date()
-                projects = projects.filter(
-                    Q(start_date__gte=start_date, start_date__lte=end_date) |
-                    Q(end_date__gte=start_date, end_date__lte=end_date) |
-                    Q(start_date__lte=start_date, end_date__gte=end_date)
-                )
-            elif filter_start_date:
-                # Solo fecha de inicio: proyectos que incluyen o empiezan después de esa fecha
-                start_date = datetime.strptime(filter_start_date, '%Y-%m-%d').date()
-                projects = projects.filter(
-                    Q(start_date__lte=start_date, end_date__gte=start_date) |
-                    Q(start_date__gte=start_date)
-                )
-            elif filter_end_date:
-                # Solo fecha de fin: proyectos que incluyen o terminan antes de esa fecha
-                end_date = datetime.strptime(filter_end_date, '%Y-%m-%d').date()
-                projects = projects.filter(
-                    Q(start_date__lte=end_date, end_date__gte=end_date) |
-                    Q(end_date__lte=end_date)
-                )
-        except ValueError:
-            print('Error al procesar fechas del filtro')
-            pass 
- 
-    # Filtro por año
-    if filter_year:
-        try:
-            year = int(filter_year)
-            if year > 0 and year <= 2100:
-                projects = projects.filter(start_date__year=year)
-        except ValueError:
-            pass 
+    # Filtro por rango de fechas y año (un solo predicado sobre date_range)
+    projects = DateRangeService.filter_queryset(projects, filter_start_date, filter_end_date, filter_year)
  
     # Filtro por departamento
     if filter_department:
@@ -583,12 +544,12 @@ def project_list_page(request):
         projects = projects.filter(municipality__icontains=filter_municipality)
  
     # Obtener listas únicas de departamentos y municipios
-    departments = Project.objects.values_list('department', flat=True).distinct().exclude(department='').exclude(department=None).order_by('department')
-    municipalities = Project.objects.values_list('municipality', flat=True).distinct().exclude(municipality='').exclude(municipality=None).order_by('municipality')
+    departments = Project.all_objects.values_list('department', flat=True).distinct().exclude(department='').exclude(department=None).order_by('department')
+    municipalities = Project.all_objects.values_list('municipality', flat=True).distinct().exclude(municipality='').exclude(municipality=None).order_by('municipality')
  
     # Si hay un departamento seleccionado, filtrar municipios por ese departamento
     if filter_department:
-        municipalities = Project.objects.filter(department=filter_department).values_list('municipality', flat=True).distinct().exclude(municipality='').exclude(municipality=None).order_by('municipality')
+        municipalities = Project.all_objects.filter(department=filter_department).values_list('municipality', flat=True).distinct().exclude(municipality='').exclude(municipality=None).order_by('municipality')
  
     context = {
         'user': request.user,
@@ -613,99 +574,27 @@ def project_detail_page(request, project_id):
     """
     Vista para ver detalles de un proyecto específico.
     """
-    from webAMG.models import Project, ProjectBeneficiary, Beneficiary, ProjectEvidence, ProjectPhase, PhaseBeneficiary
+    from django.conf import settings
+    from django.utils.functional import SimpleLazyObject
+    from webAMG.models import Project, Beneficiary, ProjectEvidence, ProjectPhase, PhaseBeneficiary
+    from webAMG.services.beneficiary_service import BeneficiaryService
+    from webAMG.services.date_range_service import DateRangeService
 
     project = get_object_or_404(Project, id=project_id)
 
-    print(f'=== DEBUG: Detalles del proyecto {project_id} ===')
-    print(f'Nombre del proyecto: {project.project_name}')
-
-    # Obtener los beneficiarios del proyecto usando el modelo intermedio
-    beneficiary_assignments = ProjectBeneficiary.objects.filter(project=project)
-    print(f'Asignaciones de beneficiarios encontradas: {beneficiary_assignments.count()}')
-
-    beneficiary_ids = beneficiary_assignments.values_list('beneficiary_id', flat=True)
-    print(f'IDs de beneficiarios: {beneficiary_ids}')
-
-    beneficiaries = Beneficiary.objects.filter(
-        id__in=beneficiary_ids,
-        is_active=True
-    ).order_by('first_name', 'last_name')
-
-    print(f'Beneficiarios encontrados: {beneficiaries.count()}')
-    for b in beneficiaries:
-        print(f'  - {b.id}: {b.first_name} {b.last_name}')
-
-    # Obtener las evidencias del proyecto (solo si no tiene fases) con filtros de fechas
-    evidences = ProjectEvidence.objects.filter(project=project)
-
-    # Obtener años únicos de las evidencias para el filtro
-    evidence_years = list(set(evidence.start_date.year for evidence in evidences))
-    evidence_years.sort(reverse=True)
+    # Las consultas quedan perezosas: con las secciones en la caché de
+    # fragmentos ({% cache %} por project.updated_at y filtros) no se ejecutan
+    beneficiaries = BeneficiaryService.for_project(project.id)
 
-    # Aplicar filtros de fechas si se proporcionan
+    # Evidencias del proyecto (solo si no tiene fases) con filtros de fechas
     filter_start_date = request.GET.get('filter_start_date')
     filter_end_date = request.GET.get('filter_end_date')
     filter_year = request.GET.get('filter_year')
 
-    # Lógica de filtrado por rango de fechas
-    # Una evidencia se incluye si su rango de fechas (start_date a end_date) intersecta con el rango del filtro
-    if filter_start_date or filter_end_date:
-        from django.db.models import Q
-
-        try:
-            if filter_start_date and filter_end_date:
-                # Ambas fechas proporcionadas: filtro por rango completo
-                start_date = datetime.strptime(filter_start_date, '%Y-%m-%d').date()
-                end_date = datetime.strptime(filter_end_date, '%Y-%m-%d').date()
-
-                # Una evidencia está en el rango si cumple alguna de estas condiciones:
-                # 1. Empieza en el rango (start_date está entre filtro_start y filtro_end)
-                # 2. Termina en el rango (end_date está entre filtro_start y filtro_end)
-                # 3. Abarca todo el rango (empieza antes y termina después)
-                evidences = evidences.filter(
-                    Q(start_date__gte=start_date, start_date__lte=end_date) |
-                    Q(end_date__gte=start_date, end_date__lte=end_date) |
-                    Q(start_date__lte=start_date, end_date__gte=end_date)
-                )
-                print(f'Filtro: rango de {start_date} a {end_date}')
-
-            elif filter_start_date:
-                # Solo fecha de inicio: evidencias que incluyen esa fecha o empiezan después
-                start_date = datetime.strptime(filter_start_date, '%Y-%m-%d').date()
-                evidences = evidences.filter(
-                    Q(start_date__lte=start_date, end_date__gte=start_date) |
-                    Q(start_date__gte=start_date)
-                )
-                print(f'Filtro: evidencias que incluyen o empiezan después de {start_date}')
-
-            elif filter_end_date:
-                # Solo fecha de fin: evidencias que incluyen esa fecha o terminan antes
-                end_date = datetime.strptime(filter_end_date, '%Y-%m-%d').date()
-                evidences = evidences.filter(
-                    Q(start_date__lte=end_date, end_date__gte=end_date) |
-                    Q(end_date__lte=end_date)
-                )
-                print(f'Filtro: evidencias que incluyen o terminan antes de {end_date}')
-
-        except ValueError:
-            print('Error al procesar fechas del filtro')
-            pass
-
-    if filter_year:
-        try:
-            year = int(filter_year)
-            if year > 0 and year <= 2100:
-                evidences = evidences.filter(start_date__year=year)
-                print(f'Filtro: año {year}')
-            else:
-                print(f'Filtro de año inválido: {year} (debe ser positivo y <= 2100)')
-        except ValueError:
-            print(f'Filtro de año no válido: {filter_year}')
-            pass
-
+    # Una evidencia se incluye si su rango de fechas se cruza con el del filtro (y con el año)
+    evidences = ProjectEvidence.objects.filter(project=project).select_related('created_by').prefetch_related('photos')
+    evidences = DateRangeService.filter_queryset(evidences, filter_start_date, filter_end_date, filter_year)
     evidences = evidences.order_by('-start_date', '-created_at')
-    print(f'Evidencias encontradas: {evidences.count()}')
 
     # Obtener las fases del proyecto
     phases = ProjectPhase.objects.filter(project=project)
@@ -719,72 +608,17 @@ def project_detail_page(request, project_id):
     # Filtro por nombre de fase
     if filter_phase_name:
         phases = phases.filter(phase_name__icontains=filter_phase_name)
-        print(f'Filtro: nombre de fase contiene "{filter_phase_name}"')
-
-    # Lógica de filtrado por rango de fechas para fases
-    if filter_phase_start or filter_phase_end:
-        from django.db.models import Q
-
-        try:
-            if filter_phase_start and filter_phase_end:
-                # Ambas fechas proporcionadas: filtro por rango completo
-                start_date = datetime.strptime(filter_phase_start, '%Y-%m-%d').date()
-                end_date = datetime.strptime(filter_phase_end, '%Y-%m-%d').date()
-
-                # Una fase está en el rango si cumple alguna de estas condiciones:
-                # 1. Empieza en el rango (start_date está entre filtro_start y filtro_end)
-                # 2. Termina en el rango (end_date está entre filtro_start y filtro_end)
-                # 3. Abarca todo el rango (empieza antes y termina después)
-                phases = phases.filter(
-                    Q(start_date__gte=start_date, start_date__lte=end_date) |
-                    Q(end_date__gte=start_date, end_date__lte=end_date) |
-                    Q(start_date__lte=start_date, end_date__gte=end_date)
-                )
-                print(f'Filtro fases: rango de {start_date} a {end_date}')
-
-            elif filter_phase_start:
-                # Solo fecha de inicio: fases que incluyen esa fecha o empiezan después
-                start_date = datetime.strptime(filter_phase_start, '%Y-%m-%d').date()
-                phases = phases.filter(
-                    Q(start_date__lte=start_date, end_date__gte=start_date) |
-                    Q(start_date__gte=start_date)
-                )
-                print(f'Filtro fases: que incluyen o empiezan después de {start_date}')
-
-            elif filter_phase_end:
-                # Solo fecha de fin: fases que incluyen esa fecha o terminan antes
-                end_date = datetime.strptime(filter_phase_end, '%Y-%m-%d').date()
-                phases = phases.filter(
-                    Q(start_date__lte=end_date, end_date__gte=end_date) |
-                    Q(end_date__lte=end_date)
-                )
-                print(f'Filtro fases: que incluyen o terminan antes de {end_date}')
-
-        except ValueError:
-            print('Error al procesar fechas del filtro de fases')
-            pass
-
-    # Filtro por año de fase
-    if filter_phase_year:
-        try:
-            year = int(filter_phase_year)
-            if year > 0 and year <= 2100:
-                phases = phases.filter(start_date__year=year)
-                print(f'Filtro fases: año {year}')
-            else:
-                print(f'Filtro de año inválido para fases: {year} (debe ser positivo y <= 2100)')
-        except ValueError:
-            print(f'Filtro de año no válido para fases: {filter_phase_year}')
-            pass
 
+    # Filtro por rango de fechas y año de fase
+    phases = DateRangeService.filter_queryset(phases, filter_phase_start, filter_phase_end, filter_phase_year)
     phases = phases.order_by('phase_number')
-    print(f'Fases encontradas después de filtros: {phases.count()}')
 
-    # Obtener los IDs de beneficiarios de cada fase
-    phases_beneficiaries = {}
-    for phase in phases:
-        phase_beneficiaries_assignments = PhaseBeneficiary.objects.filter(phase=phase)
-        phases_beneficiaries[phase.id] = list(phase_beneficiaries_assignments.values_list('beneficiary_id', flat=True))
+    # IDs de beneficiarios de cada fase, en una sola consulta y solo si se renderizan las fases
+    def get_phases_beneficiaries():
+        phases_beneficiaries = {}
+        for phase_id, beneficiary_id in PhaseBeneficiary.objects.filter(phase__in=phases).values_list('phase_id', 'beneficiary_id'):
+            phases_beneficiaries.setdefault(phase_id, []).append(beneficiary_id)
+        return phases_beneficiaries
 
     # Obtener todos los beneficiarios para el modal
     all_beneficiaries = Beneficiary.objects.filter(is_active=True).order_by('first_name', 'last_name')
@@ -794,10 +628,10 @@ def project_detail_page(request, project_id):
         'project': project,
         'project_beneficiaries': beneficiaries,
         'evidences': evidences,
-        'evidence_years': evidence_years,
         'phases': phases,
-        'phases_beneficiaries': phases_beneficiaries,
+        'phases_beneficiaries': SimpleLazyObject(get_phases_beneficiaries),
         'all_beneficiaries': all_beneficiaries,
+        'fragment_cache_ttl': settings.PROJECT_DETAIL_CACHE_TTL,
         'filter_start_date': filter_start_date,
         'filter_end_date': filter_end_date,
         'filter_year': filter_year,
@@ -890,7 +724,7 @@ def project_edit_page(request, project_id):
             project.department = department or project.department
             project.status = request.POST.get('status', project.status)
             project.has_phases = request.POST.get('has_phases') == 'on'
-            project.progress_percentage = request.POST.get('progress_percentage', 0) or project.progress_percentage
+            # progress_percentage lo calcula ProgressService (webAMG.signals)
             
             # Eliminar imagen de portada si se marca el checkbox
             if request.POST.get('remove_cover_image'):
@@ -964,6 +798,7 @@ def project_delete_page(request, project_id):
     Requiere validación de contraseña y rol de administrador.
     """
     from webAMG.models import Project
+    from webAMG.services.soft_delete_service import SoftDeleteService
     
     project = get_object_or_404(Project, id=project_id)
     
@@ -994,10 +829,8 @@ def project_delete_page(request, project_id):
         try:
             project_name = project.project_name 
 
-            # Soft delete: marcar como inactivo en lugar de eliminar
-            # El trigger de PostgreSQL propagará el estado a todas las tablas relacionadas
-            project.is_active = False
-            project.save()
+            # Soft delete: el proyecto y todas sus tablas relacionadas quedan inactivos
+            SoftDeleteService.deactivate_project(project.id)
             
             messages.success(request, f'Proyecto "{project_name}" desactivado exitosamente. Todos sus datos relacionados también se han ocultado.')
             return redirect('project_list')
@@ -1019,8 +852,9 @@ def project_activate_page(request, project_id):
     Requiere rol de administrador.
     """
     from webAMG.models import Project
+    from webAMG.services.soft_delete_service import SoftDeleteService
     
-    project = get_object_or_404(Project, id=project_id)
+    project = get_object_or_404(Project.all_objects, id=project_id)
     
     # Verificar que el usuario sea administrador
     if not request.user.is_admin():
@@ -1054,10 +888,8 @@ def project_activate_page(request, project_id):
         try:
             project_name = project.project_name 
 
-            # Reactivar: marcar como activo
-            # El trigger de PostgreSQL propagará el estado a todas las tablas relacionadas
-            project.is_active = True
-            project.save()
+            # Reactivar: el proyecto y todas sus tablas relacionadas vuelven a estar activos
+            SoftDeleteService.activate_project(project.id)
             
             messages.success(request, f'Proyecto "{project_name}" reactivado exitosamente. Todos sus datos relacionados son nuevamente visibles.')
             return redirect('project_detail', project_id=project.id)
@@ -1288,14 +1120,14 @@ def phase_edit(request, project_id, phase_id):
             if not phase_name:
                 error_msg = 'Debe especificar el nombre de la fase.'
                 if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                    return JsonResponse({'success': False, 'message': error_msg}, status=400)
+                    return APIJsonResponse({'success': False, 'message': error_msg}, status=400)
                 messages.error(request, error_msg)
                 return redirect('phase_detail', project_id=project_id, phase_id=phase_id)
 
             if not start_date:
                 error_msg = 'Debe especificar la fecha de inicio.'
                 if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                    return JsonResponse({'success': False, 'message': error_msg}, status=400)
+                    return APIJsonResponse({'success': False, 'message': error_msg}, status=400)
                 messages.error(request, error_msg)
                 return redirect('phase_detail', project_id=project_id, phase_id=phase_id)
 
@@ -1310,7 +1142,7 @@ def phase_edit(request, project_id, phase_id):
             if end_date < start_date:
                 error_msg = 'La fecha de fin debe ser posterior o igual a la fecha de inicio.'
                 if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                    return JsonResponse({'success': False, 'message': error_msg}, status=400)
+                    return APIJsonResponse({'success': False, 'message': error_msg}, status=400)
                 messages.error(request, error_msg)
                 return redirect('phase_detail', project_id=project_id, phase_id=phase_id)
 
@@ -1344,7 +1176,7 @@ def phase_edit(request, project_id, phase_id):
 
             # Respuesta AJAX o redirección normal
             if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                return JsonResponse({
+                return APIJsonResponse({
                     'success': True,
                     'message': f'Fase "{phase_name}" actualizada exitosamente.'
                 })
@@ -1355,7 +1187,7 @@ def phase_edit(request, project_id, phase_id):
         except Exception as e:
             error_msg = f'Error al actualizar la fase: {str(e)}'
             if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                return JsonResponse({'success': False, 'message': error_msg}, status=500)
+                return APIJsonResponse({'success': False, 'message': error_msg}, status=500)
             messages.error(request, error_msg)
             return redirect('phase_detail', project_id=project_id, phase_id=phase_id)
 
@@ -1422,7 +1254,6 @@ def phase_delete(request, project_id, phase_id):
     """
     Vista para eliminar una fase.
     """
-    from django.http import JsonResponse
     from webAMG.models import Project, ProjectPhase
 
     project = get_object_or_404(Project, id=project_id)
@@ -1436,7 +1267,7 @@ def phase_delete(request, project_id, phase_id):
 
         if not password:
             if request.headers.get('x-requested-with') == 'XMLHttpRequest':
-                return JsonResponse({'success': False, 'message': 'Debe ingresar su contraseña para confirmar la eliminación.'}, status=400)
+                return APIJsonResponse({'success': False, 'message': 'Debe ingresar su contraseña para confirmar la eliminación.'}, status=400)
             messages.error(request, 'Debe ingresar su contraseña para confirmar la eliminación.')
             return redirect('project_detail', project_id=project_id)
 
@@ -1452,12 +1283,12 @@ def phase_delete(request, project_id, phase_id):
 
             phase.delete()
             if request.headers.get('x-requested-with') == 'XMLHttpRequest':
-                return JsonResponse({'success': True, 'message': f'Fase "{phase.phase_name}" eliminada exitosamente.'})
+                return APIJsonResponse({'success': True, 'message': f'Fase "{phase.phase_name}" eliminada exitosamente.'})
             messages.success(request, f'Fase "{phase.phase_name}" eliminada exitosamente.')
             return redirect('project_detail', project_id=project_id)
         else:
             if request.headers.get('x-requested-with') == 'XMLHttpRequest':
-                return JsonResponse({'success': False, 'message': 'Contraseña incorrecta.'}, status=400)
+                return APIJsonResponse({'success': False, 'message': 'Contraseña incorrecta.'}, status=400)
             messages.error(request, 'Contraseña incorrecta.')
             return redirect('project_detail', project_id=project_id)
 
@@ -1491,7 +1322,7 @@ def phase_evidence_add(request, project_id, phase_id):
             # Validar fechas
             if not start_date:
                 if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                    return JsonResponse({'success': False, 'message': 'Debe especificar la fecha de inicio.'}, status=400)
+                    return APIJsonResponse({'success': False, 'message': 'Debe especificar la fecha de inicio.'}, status=400)
                 messages.error(request, 'Debe especificar la fecha de inicio.')
                 return redirect('phase_detail', project_id=project_id, phase_id=phase_id)
 
@@ -1501,13 +1332,13 @@ def phase_evidence_add(request, project_id, phase_id):
 
             if end_date < start_date:
                 if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                    return JsonResponse({'success': False, 'message': 'La fecha de fin debe ser posterior o igual a la fecha de inicio.'}, status=400)
+                    return APIJsonResponse({'success': False, 'message': 'La fecha de fin debe ser posterior o igual a la fecha de inicio.'}, status=400)
                 messages.error(request, 'La fecha de fin debe ser posterior o igual a la fecha de inicio.')
                 return redirect('phase_detail', project_id=project_id, phase_id=phase_id)
 
             if not description:
                 if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                    return JsonResponse({'success': False, 'message': 'Debe proporcionar una descripción de la evidencia.'}, status=400)
+                    return APIJsonResponse({'success': False, 'message': 'Debe proporcionar una descripción de la evidencia.'}, status=400)
                 messages.error(request, 'Debe proporcionar una descripción de la evidencia.')
                 return redirect('phase_detail', project_id=project_id, phase_id=phase_id)
 
@@ -1576,14 +1407,14 @@ def phase_evidence_add(request, project_id, phase_id):
                     )
 
             if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                return JsonResponse({'success': True, 'message': f'Evidencia agregada exitosamente a la fase "{phase.phase_name}".'})
+                return APIJsonResponse({'success': True, 'message': f'Evidencia agregada exitosamente a la fase "{phase.phase_name}".'})
             
             messages.success(request, f'Evidencia agregada exitosamente a la fase "{phase.phase_name}".')
             return redirect('phase_detail', project_id=project_id, phase_id=phase_id)
 
         except Exception as e:
             if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                return JsonResponse({'success': False, 'message': f'Error al agregar la evidencia: {str(e)}'}, status=500)
+                return APIJsonResponse({'success': False, 'message': f'Error al agregar la evidencia: {str(e)}'}, status=500)
             messages.error(request, f'Error al agregar la evidencia: {str(e)}')
 
     return redirect('phase_detail', project_id=project_id, phase_id=phase_id)
@@ -1728,7 +1559,7 @@ def phase_evidence_edit(request, project_id, phase_id, evidence_id):
                     pass
 
             if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                return JsonResponse({
+                return APIJsonResponse({
                     'success': True,
                     'message': 'Evidencia actualizada exitosamente.'
                 })
@@ -1742,7 +1573,7 @@ def phase_evidence_edit(request, project_id, phase_id, evidence_id):
             traceback.print_exc()
 
             if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                return JsonResponse({'success': False, 'message': f'Error al actualizar la evidencia: {str(e)}'}, status=500)
+                return APIJsonResponse({'success': False, 'message': f'Error al actualizar la evidencia: {str(e)}'}, status=500)
 
             messages.error(request, f'Error al actualizar la evidencia: {str(e)}')
 
@@ -1765,7 +1596,7 @@ def phase_evidence_delete(request, project_id, phase_id, evidence_id):
 
         if not password:
             if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                return JsonResponse({'success': False, 'message': 'Debe ingresar su contraseña para confirmar la eliminación.'}, status=400)
+                return APIJsonResponse({'success': False, 'message': 'Debe ingresar su contraseña para confirmar la eliminación.'}, status=400)
             messages.error(request, 'Debe ingresar su contraseña para confirmar la eliminación.')
             return redirect('phase_detail', project_id=project_id, phase_id=phase_id)
 
@@ -1788,7 +1619,7 @@ def phase_evidence_delete(request, project_id, phase_id, evidence_id):
 
                 # Respuesta AJAX o redirección normal
                 if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                    return JsonResponse({
+                    return APIJsonResponse({
                         'success': True,
                         'message': 'Evidencia eliminada exitosamente.'
                     })
@@ -1798,17 +1629,18 @@ def phase_evidence_delete(request, project_id, phase_id, evidence_id):
 
             except Exception as e:
                 if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                    return JsonResponse({'success': False, 'message': f'Error al eliminar la evidencia: {str(e)}'}, status=500)
+                    return APIJsonResponse({'success': False, 'message': f'Error al eliminar la evidencia: {str(e)}'}, status=500)
                 messages.error(request, f'Error al eliminar la evidencia: {str(e)}')
         else:
             if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                return JsonResponse({'success': False, 'message': 'Contraseña incorrecta.'}, status=400)
+                return APIJsonResponse({'success': False, 'message': 'Contraseña incorrecta.'}, status=400)
             messages.error(request, 'Contraseña incorrecta.')
 
     return redirect('phase_detail', project_id=project_id, phase_id=phase_id)
 
 
 @login_required
+@conditional_get(ConditionalService.phase_evidence_version)
 def phase_evidence_photos(request, project_id, phase_id, evidence_id):
     """
     Vista para obtener las fotos de una evidencia de fase (JSON).
@@ -1831,10 +1663,11 @@ def phase_evidence_photos(request, project_id, phase_id, evidence_id):
         for photo in photos
     ]
 
-    return JsonResponse({'photos': photos_data})
+    return APIJsonResponse({'photos': photos_data})
 
 
 @login_required
+@conditional_get(ConditionalService.phase_evidence_version)
 def phase_evidence_beneficiaries(request, project_id, phase_id, evidence_id):
     """
     Vista para obtener los beneficiarios de una evidencia de fase (JSON).
@@ -1858,7 +1691,7 @@ def phase_evidence_beneficiaries(request, project_id, phase_id, evidence_id):
         for eb in evidence_beneficiaries
     ]
 
-    return JsonResponse({'beneficiaries': beneficiaries_data})
+    return APIJsonResponse({'beneficiaries': beneficiaries_data})
 
 
 # =====================================================
@@ -1979,7 +1812,6 @@ def project_evidence_delete(request, project_id, evidence_id):
     Vista para eliminar una evidencia de proyecto.
     """
     import os
-    from django.http import JsonResponse
     from django.conf import settings
     from webAMG.models import Project, ProjectEvidence, EvidencePhoto
 
@@ -2000,12 +1832,12 @@ def project_evidence_delete(request, project_id, evidence_id):
             # Eliminar la evidencia (esto también eliminará los registros de fotos y beneficiarios en cascada)
             evidence.delete()
             if request.headers.get('x-requested-with') == 'XMLHttpRequest':
-                return JsonResponse({'success': True, 'message': 'Evidencia eliminada exitosamente.'})
+                return APIJsonResponse({'success': True, 'message': 'Evidencia eliminada exitosamente.'})
             messages.success(request, 'Evidencia eliminada exitosamente.')
             return redirect('project_detail', project_id=project_id)
         else:
             if request.headers.get('x-requested-with') == 'XMLHttpRequest':
-                return JsonResponse({'success': False, 'message': 'Contraseña incorrecta.'}, status=400)
+                return APIJsonResponse({'success': False, 'message': 'Contraseña incorrecta.'}, status=400)
             messages.error(request, 'Contraseña incorrecta.')
 
     context = {
@@ -2016,11 +1848,11 @@ def project_evidence_delete(request, project_id, evidence_id):
 
 
 @login_required
+@conditional_get(ConditionalService.project_evidence_version)
 def project_evidence_photos(request, project_id, evidence_id):
     """
     Vista para obtener las fotos de una evidencia de proyecto (JSON).
     """
-    from django.http import JsonResponse
     from webAMG.models import Project, ProjectEvidence, EvidencePhoto
     
     project = get_object_or_404(Project, id=project_id)
@@ -2038,15 +1870,15 @@ def project_evidence_photos(request, project_id, evidence_id):
         for photo in photos
     ]
     
-    return JsonResponse({'photos': photos_data})
+    return APIJsonResponse({'photos': photos_data})
 
 
 @login_required
+@conditional_get(ConditionalService.project_evidence_version)
 def project_evidence_beneficiaries(request, project_id, evidence_id):
     """
     Vista para obtener los beneficiarios de una evidencia de proyecto (JSON).
     """
-    from django.http import JsonResponse
     from webAMG.models import Project, ProjectEvidence, EvidenceBeneficiary
     
     project = get_object_or_404(Project, id=project_id)
@@ -2065,20 +1897,20 @@ def project_evidence_beneficiaries(request, project_id, evidence_id):
         for eb in evidence_beneficiaries
     ]
     
-    return JsonResponse({'beneficiaries': beneficiaries_data})
+    return APIJsonResponse({'beneficiaries': beneficiaries_data})
 
 
 @login_required
+@conditional_get(ConditionalService.project_version)
 def project_timestamp_ajax(request, project_id):
     """
     Vista AJAX para obtener el timestamp del proyecto.
     """
-    from django.http import JsonResponse
     from webAMG.models import Project
     
     project = get_object_or_404(Project, id=project_id)
     
-    return JsonResponse({
+    return APIJsonResponse({
         'created_at': project.created_at.isoformat() if project.created_at else None,
         'updated_at': project.updated_at.isoformat() if project.updated_at else None,
     })